@@ -0,0 +1,43 @@
+import demo_eigen_wrapper
+import numpy as np
+import pytest
+
+# ================================================================================
+# BM tests for batched operations of the demo_eigen_wrapper package
+#
+# Many small matrix products are performed either one by one (paying a call to the
+# wrapper for each of them), or in a single batched call (optionally split among
+# several threads).
+# ================================================================================
+
+# Amount of products performed
+ITEMS = 10000
+
+# Size of the square matrices involved
+SIZES = [3, 16]
+
+
+def _one_by_one(stack_1, stack_2):
+    return [
+        demo_eigen_wrapper.multiply_matrices(mat_1, mat_2)
+        for mat_1, mat_2 in zip(stack_1, stack_2)
+    ]
+
+
+@pytest.mark.benchmark(group="batched_multiply_matrices")
+@pytest.mark.parametrize("mode", ["one_by_one", "batched", "batched_4_threads"])
+@pytest.mark.parametrize("size", SIZES)
+def test_batched_multiply_matrices(benchmark, size, mode):
+    """BM test to measure the time consumed by the demo_eigen_wrapper package when
+    performing many small matrix products."""
+
+    stack_1 = np.random.default_rng(1).random((ITEMS, size, size))
+    stack_2 = np.random.default_rng(2).random((ITEMS, size, size))
+
+    if mode == "one_by_one":
+        benchmark(_one_by_one, stack_1, stack_2)
+    else:
+        threads = 4 if mode == "batched_4_threads" else 1
+        benchmark(
+            demo_eigen_wrapper.batched_multiply_matrices, stack_1, stack_2, threads
+        )
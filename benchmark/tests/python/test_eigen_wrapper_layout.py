@@ -0,0 +1,63 @@
+import demo_eigen_wrapper
+import numpy as np
+import pytest
+
+# ================================================================================
+# BM tests for the memory layout of the matrices given to the demo_eigen_wrapper
+#
+# C-contiguous matrices (such as the ones received by the servers) are operated by
+# the row-major bindings, which return C-ordered results. Any other matrix is
+# operated by the column-major bindings, which return F-ordered results: as the
+# previous bindings did for all matrices. The "c_strided" layout reproduces that
+# case with C-ordered (but not contiguous) matrices. The time measured includes
+# converting the result into C order, as needed for streaming it, and the amount
+# of bytes copied by such conversion is reported.
+# ================================================================================
+
+# Size of the square matrices involved
+SIZES = [1024, 2048]
+
+
+def _c_contiguous(mat):
+    return mat
+
+
+def _c_strided(mat):
+    # Same values and order... within a larger buffer (i.e. rows are not contiguous)
+    buffer = np.empty((mat.shape[0], mat.shape[1] + 1), dtype=mat.dtype)
+    buffer[:, :-1] = mat
+    return buffer[:, :-1]
+
+
+LAYOUTS = {"c_contiguous": _c_contiguous, "c_strided": _c_strided}
+
+OPERATIONS = {
+    "add": demo_eigen_wrapper.add_matrices,
+    "multiply": demo_eigen_wrapper.multiply_matrices,
+}
+
+
+def _operate(operation, mat_1, mat_2):
+    # Perform the operation... and retrieve its result in C order
+    return np.ascontiguousarray(operation(mat_1, mat_2))
+
+
+@pytest.mark.benchmark(group="matrix_layout")
+@pytest.mark.parametrize("layout", LAYOUTS.keys())
+@pytest.mark.parametrize("op", OPERATIONS.keys())
+@pytest.mark.parametrize("size", SIZES)
+def test_matrix_layout(benchmark, size, op, layout):
+    """BM test to measure the time consumed by the demo_eigen_wrapper package when
+    operating matrices with different memory layouts."""
+
+    mat_1 = LAYOUTS[layout](np.random.default_rng(1).random((size, size)))
+    mat_2 = LAYOUTS[layout](np.random.default_rng(2).random((size, size)))
+    operation = OPERATIONS[op]
+
+    # Bytes copied for converting the result into C order (if it is not already)
+    result = operation(mat_1, mat_2)
+    benchmark.extra_info["conversion_bytes"] = (
+        0 if result.flags.c_contiguous else result.nbytes
+    )
+
+    benchmark.pedantic(_operate, args=(operation, mat_1, mat_2), rounds=3)
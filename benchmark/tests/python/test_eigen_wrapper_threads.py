@@ -0,0 +1,61 @@
+from concurrent import futures
+import time
+
+import demo_eigen_wrapper
+import numpy as np
+import pytest
+
+# ================================================================================
+# BM tests for concurrent calls to the demo_eigen_wrapper package
+#
+# The wrapper releases the GIL while Eigen performs the operations, so several
+# threads (such as the workers of the Python servers) multiply matrices in parallel.
+# Each thread performs the same amount of multiplications: ideally, the time
+# consumed does not depend on the amount of threads (up to the amount of cores).
+# The speedup with respect to performing all multiplications serially is reported.
+# ================================================================================
+
+# Size of the square matrices involved
+SIZE = 512
+
+# Amount of multiplications performed by each thread
+CALLS_PER_THREAD = 4
+
+# Amount of concurrent threads
+THREADS = [1, 2, 4, 8]
+
+
+def _multiply(mat_1, mat_2):
+    for _ in range(CALLS_PER_THREAD):
+        demo_eigen_wrapper.multiply_matrices(mat_1, mat_2)
+
+
+def _run_threads(executor, threads, mat_1, mat_2):
+    calls = [executor.submit(_multiply, mat_1, mat_2) for _ in range(threads)]
+    for call in calls:
+        call.result()
+
+
+@pytest.mark.benchmark(group="concurrent_multiply_matrices")
+@pytest.mark.parametrize("threads", THREADS)
+def test_concurrent_multiply_matrices(benchmark, threads):
+    """BM test to measure the time consumed by several threads multiplying
+    matrices concurrently through the demo_eigen_wrapper package."""
+
+    mat_1 = np.random.default_rng(1).random((SIZE, SIZE))
+    mat_2 = np.random.default_rng(2).random((SIZE, SIZE))
+
+    # Time needed for performing all multiplications serially
+    start = time.perf_counter()
+    for _ in range(threads):
+        _multiply(mat_1, mat_2)
+    serial = time.perf_counter() - start
+
+    with futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        benchmark.pedantic(
+            _run_threads, args=(executor, threads, mat_1, mat_2), rounds=5
+        )
+
+    # No statistics are collected when benchmarking is disabled (i.e. smoke tests)
+    if benchmark.stats:
+        benchmark.extra_info["speedup"] = serial / benchmark.stats.stats.mean
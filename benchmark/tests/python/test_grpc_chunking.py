@@ -0,0 +1,92 @@
+from concurrent import futures
+
+import grpc
+import numpy as np
+import pytest
+
+from ansys.eigen.python.grpc.client import DemoGRPCClient
+import ansys.eigen.python.grpc.constants as constants
+from ansys.eigen.python.grpc.generated.grpcdemo_pb2_grpc import (
+    add_GRPCDemoServicer_to_server,
+)
+from ansys.eigen.python.grpc.server import GRPCDemoServicer, _server_options
+
+# ================================================================================
+# BM tests for the chunk size of the streamed messages
+#
+# These tests deploy the server locally, allowing for long messages. The client
+# adds matrices decomposed in chunks of several fixed sizes, of the size tuned from
+# the throughput of the previous calls ("auto"), or within a single message (both
+# ends allowing for it). The throughput (operand bytes per second) is reported
+# within the extra_info of each result.
+# ================================================================================
+
+# Maximum length of the messages allowed by the server (and the single-message client)
+MAX_MESSAGE_LENGTH = 1024 * 1024 * 128
+
+# Size of the (square) matrices involved
+SIZES = [512, 1024, 2048]
+
+CHUNK_SIZES = {
+    "64KB": constants.MIN_CHUNKSIZE,
+    "512KB": 1024 * 512,
+    "3MB": constants.MAX_CHUNKSIZE,
+    "auto": "auto",
+    "single": MAX_MESSAGE_LENGTH - constants.MESSAGE_OVERHEAD,
+}
+
+
+@pytest.fixture(scope="module")
+def server_port():
+    # Same configuration as in the serve() method, allowing for long messages
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=10),
+        options=_server_options(MAX_MESSAGE_LENGTH),
+    )
+    add_GRPCDemoServicer_to_server(
+        GRPCDemoServicer(max_message_length=MAX_MESSAGE_LENGTH), server
+    )
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+
+    yield port
+
+    server.stop(None)
+
+
+@pytest.mark.benchmark(group="chunking_add_matrices")
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES.keys())
+@pytest.mark.parametrize("sz", SIZES)
+def test_chunking_add_matrices(benchmark, server_port, sz, chunk_size):
+    """BM test to measure the time consumed by the addition of two matrices, depending
+    on the size of the chunks in which they are decomposed."""
+
+    if chunk_size == "single":
+        client = DemoGRPCClient(
+            port=server_port,
+            chunk_size=CHUNK_SIZES[chunk_size],
+            max_message_length=MAX_MESSAGE_LENGTH,
+        )
+    else:
+        client = DemoGRPCClient(port=server_port, chunk_size=CHUNK_SIZES[chunk_size])
+
+    rng = np.random.default_rng(1)
+    mat_1 = rng.random((sz, sz))
+    mat_2 = rng.random((sz, sz))
+
+    # Warm up calls let the client learn the limits of the server (and the tuner
+    # measure every candidate chunk size)
+    benchmark.pedantic(
+        client.add_matrices, args=(mat_1, mat_2), rounds=5, warmup_rounds=10
+    )
+
+    # No statistics are collected when benchmarking is disabled (i.e. smoke tests)
+    if benchmark.stats:
+        benchmark.extra_info["throughput_bytes_per_second"] = (
+            mat_1.nbytes + mat_2.nbytes
+        ) / benchmark.stats.stats.mean
+
+    if client._tuner is not None:
+        benchmark.extra_info["tuned_chunk_size"] = max(
+            client._tuner._throughputs, key=client._tuner._mean_throughput
+        )
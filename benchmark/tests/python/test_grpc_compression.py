@@ -0,0 +1,79 @@
+from concurrent import futures
+
+import grpc
+import numpy as np
+import pytest
+
+from ansys.eigen.python.grpc.client import DemoGRPCClient
+from ansys.eigen.python.grpc.generated.grpcdemo_pb2_grpc import (
+    add_GRPCDemoServicer_to_server,
+)
+from ansys.eigen.python.grpc.server import GRPCDemoServicer
+
+from .test_tools import BANDWIDTHS, throttled_proxy
+
+# ================================================================================
+# BM tests for the compression of the streamed messages
+#
+# These tests deploy the server locally, behind a proxy which limits the bandwidth
+# of each direction of the connection (as if the link was slower than loopback).
+# The client adds matrices whose messages are either not compressed or compressed
+# (with gzip or deflate) in both directions, as long as the policy deems them
+# compressible. The throughput (operand bytes per second) is reported within the
+# extra_info of each result.
+# ================================================================================
+
+# Size of the (square) matrices involved
+SIZES = [256, 1024]
+
+COMPRESSIONS = ["none", "gzip", "deflate"]
+
+PAYLOADS = {
+    "integer": lambda rng, sz: rng.integers(0, 10, (sz, sz), dtype=np.int32),
+    "sparse": lambda rng, sz: rng.random((sz, sz)) * (rng.random((sz, sz)) > 0.9),
+    "random": lambda rng, sz: rng.random((sz, sz)),
+}
+
+
+@pytest.fixture(scope="module")
+def server_port():
+    # Same configuration as in the serve() method
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    add_GRPCDemoServicer_to_server(GRPCDemoServicer(), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+
+    yield port
+
+    server.stop(None)
+
+
+@pytest.fixture(scope="module", params=BANDWIDTHS.keys())
+def proxy_port(request, server_port):
+    port, close = throttled_proxy(server_port, BANDWIDTHS[request.param])
+
+    yield port
+
+    close()
+
+
+@pytest.mark.benchmark(group="compression_add_matrices")
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+@pytest.mark.parametrize("payload", PAYLOADS.keys())
+@pytest.mark.parametrize("sz", SIZES)
+def test_compression_add_matrices(benchmark, proxy_port, sz, payload, compression):
+    """BM test to measure the time consumed by the addition of two matrices over a
+    link with a limited bandwidth, either compressing the messages or not."""
+
+    client = DemoGRPCClient(port=proxy_port, timeout=60, compression=compression)
+    rng = np.random.default_rng(1)
+    mat_1 = PAYLOADS[payload](rng, sz)
+    mat_2 = PAYLOADS[payload](rng, sz)
+
+    benchmark.pedantic(client.add_matrices, args=(mat_1, mat_2), rounds=3)
+
+    # No statistics are collected when benchmarking is disabled (i.e. smoke tests)
+    if benchmark.stats:
+        benchmark.extra_info["throughput_bytes_per_second"] = (
+            mat_1.nbytes + mat_2.nbytes
+        ) / benchmark.stats.stats.mean
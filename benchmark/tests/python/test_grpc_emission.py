@@ -0,0 +1,72 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from ansys.eigen.python.grpc.server import GRPCDemoServicer
+
+# ================================================================================
+# BM tests for the emission of chunked messages on the server side
+#
+# These tests do not require a running server: they consume the stream of messages
+# generated by the servicer directly. Besides the time consumed, the peak of memory
+# allocated while serializing the chunks is measured with tracemalloc.
+# ================================================================================
+
+# Size of the square matrices and vectors involved
+SIZE = 2048
+
+
+class _DummyContext:
+    """Provides a minimal replacement of the gRPC context."""
+
+    def invocation_metadata(self):
+        return ()
+
+    def send_initial_metadata(self, md):
+        pass
+
+    def set_compression(self, compression):
+        pass
+
+
+def _consume(stream):
+    # Consume the stream of messages... and return the amount of messages
+    return sum(1 for _ in stream)
+
+
+def _measure_peak(stream):
+    # Measure the peak of memory allocated while consuming the stream of messages
+    tracemalloc.start()
+    _consume(stream)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak
+
+
+ARRAYS = {
+    "c_matrix": lambda: np.random.default_rng(1).random((SIZE, SIZE)),
+    "f_matrix": lambda: np.asfortranarray(
+        np.random.default_rng(1).random((SIZE, SIZE))
+    ),
+    "c_vector": lambda: np.random.default_rng(1).random(SIZE * SIZE),
+    "flipped_vector": lambda: np.flip(np.random.default_rng(1).random(SIZE * SIZE)),
+}
+
+
+@pytest.mark.benchmark(group="emit_chunks")
+@pytest.mark.parametrize("layout", ARRAYS.keys())
+def test_emit_chunks(benchmark, layout):
+    """BM test to measure the time and memory consumed by the server when
+    serializing a large array in several chunks."""
+
+    servicer = GRPCDemoServicer()
+    arg = ARRAYS[layout]()
+    send = servicer._send_matrices if arg.ndim == 2 else servicer._send_vectors
+
+    # Report the peak of memory allocated (it should not exceed a single chunk)
+    benchmark.extra_info["nbytes"] = arg.nbytes
+    benchmark.extra_info["tracemalloc_peak"] = _measure_peak(send(_DummyContext(), arg))
+
+    benchmark(lambda: _consume(send(_DummyContext(), arg)))
@@ -0,0 +1,134 @@
+import asyncio
+from concurrent import futures
+import threading
+import time
+import tracemalloc
+
+import grpc
+import numpy as np
+import pytest
+
+from ansys.eigen.python.grpc.client import DemoGRPCClient
+from ansys.eigen.python.grpc.generated.grpcdemo_pb2_grpc import (
+    add_GRPCDemoServicer_to_server,
+)
+from ansys.eigen.python.grpc.server import AsyncGRPCDemoServicer, GRPCDemoServicer
+
+# ================================================================================
+# Load tests for the thread-pool-based and the asyncio-based Python servers
+#
+# These tests deploy the servers locally. Many clients perform concurrent vector
+# additions, streaming their operands slowly (as if they were on a slow network).
+# The thread-pool-based server can only process as many calls as workers it has,
+# while the asyncio-based one processes all of them concurrently. The achieved
+# concurrency and the peak of memory allocated (tracemalloc) are reported.
+# ================================================================================
+
+# Amount of concurrent calls to the server
+CONCURRENT_CALLS = 50
+
+# Amount of vectors added in each call, and delay between each of them (in seconds)
+OPERANDS = 4
+DELAY = 0.05
+
+# Size of the vectors (128KB each, above the default 64KB HTTP/2 window)
+SIZE = 16384
+
+# Disable the dynamic growth of the HTTP/2 flow-control windows (as on a link with a
+# low bandwidth-delay product). Otherwise, on a loopback link, calls waiting for a
+# worker thread would have all their messages buffered in advance.
+SERVER_OPTIONS = [("grpc.http2.bdp_probe", 0)]
+
+
+def _deploy_threaded_server():
+    # Same configuration as in the serve() method
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=10), options=SERVER_OPTIONS
+    )
+    add_GRPCDemoServicer_to_server(GRPCDemoServicer(), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+
+    return port, lambda: server.stop(None)
+
+
+def _deploy_asyncio_server():
+    # Run an event loop in a background thread
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    # Same configuration as in the serve_async() method
+    async def start_server():
+        server = grpc.aio.server(options=SERVER_OPTIONS)
+        add_GRPCDemoServicer_to_server(AsyncGRPCDemoServicer(), server)
+        port = server.add_insecure_port("127.0.0.1:0")
+        await server.start()
+        return server, port
+
+    server, port = asyncio.run_coroutine_threadsafe(start_server(), loop).result()
+
+    def stop():
+        asyncio.run_coroutine_threadsafe(server.stop(None), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+    return port, stop
+
+
+SERVERS = {"threads": _deploy_threaded_server, "asyncio": _deploy_asyncio_server}
+
+
+def _slow_add_vectors(client, *args):
+    # Build the stream of messages as the client does... but delay each message
+    md, chunks = client._generate_md("vectors", "vec", *args)
+
+    def slow_stream():
+        for msg in client._generate_vector_stream(chunks, *args):
+            time.sleep(DELAY)
+            yield msg
+
+    response_iterator = client._stub.AddVectors(slow_stream(), metadata=md)
+    return client._read_nparray_from_vector(response_iterator)[0]
+
+
+def _run_concurrent_calls(client, vectors):
+    with futures.ThreadPoolExecutor(max_workers=CONCURRENT_CALLS) as executor:
+        calls = [
+            executor.submit(_slow_add_vectors, client, *vectors)
+            for _ in range(CONCURRENT_CALLS)
+        ]
+        return [call.result() for call in calls]
+
+
+@pytest.mark.benchmark(group="concurrent_calls")
+@pytest.mark.parametrize("server_type", SERVERS.keys())
+def test_concurrent_add_vectors(benchmark, server_type):
+    """Load test to measure the time consumed by many concurrent (and slow)
+    vector additions, depending on the type of server deployed."""
+
+    port, stop = SERVERS[server_type]()
+    client = DemoGRPCClient(ip="127.0.0.1", port=port, timeout=5)
+    vectors = [np.random.default_rng(i).random(SIZE) for i in range(OPERANDS)]
+
+    try:
+        # Measure the peak of memory allocated during one of the runs
+        tracemalloc.start()
+        results = _run_concurrent_calls(client, vectors)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        np.testing.assert_allclose(results[0], sum(vectors))
+
+        benchmark.pedantic(_run_concurrent_calls, args=(client, vectors), rounds=3)
+    finally:
+        stop()
+
+    # Each call lasts at least OPERANDS * DELAY seconds: the concurrency achieved
+    # is the ratio between the time needed if calls were serialized and the actual time
+    # (no statistics are collected when benchmarking is disabled, i.e. smoke tests)
+    if benchmark.stats:
+        benchmark.extra_info["concurrency"] = (
+            CONCURRENT_CALLS * OPERANDS * DELAY / benchmark.stats.stats.mean
+        )
+    benchmark.extra_info["tracemalloc_peak"] = peak
@@ -0,0 +1,93 @@
+from concurrent import futures
+
+import grpc
+import numpy as np
+import pytest
+
+from ansys.eigen.python.grpc.client import DemoGRPCClient
+from ansys.eigen.python.grpc.generated.grpcdemo_pb2_grpc import (
+    add_GRPCDemoServicer_to_server,
+)
+from ansys.eigen.python.grpc.server import GRPCDemoServicer
+
+from .test_tools import BANDWIDTHS, throttled_proxy
+
+# ================================================================================
+# BM tests for the reduced-precision transport of the streamed messages
+#
+# These tests deploy the server locally, behind a proxy which limits the bandwidth
+# of each direction of the connection. The client adds and multiplies matrices
+# whose operands and results are transmitted with full precision (float64) or with
+# a reduced one (float32 or float16), computed in float64 (or natively in float32).
+# The throughput (operand bytes per second), the bytes transmitted per call and the
+# maximum relative error introduced are reported within the extra_info of each result.
+# ================================================================================
+
+# Size of the (square) matrices involved
+SIZES = [256, 1024]
+
+# Transport and compute precisions compared
+PRECISIONS = {
+    "float64": (None, "float64"),
+    "float32": ("float32", "float64"),
+    "float32-native": ("float32", "float32"),
+    "float16": ("float16", "float64"),
+}
+
+OPERATIONS = ["add_matrices", "multiply_matrices"]
+
+
+@pytest.fixture(scope="module")
+def server_port():
+    # Same configuration as in the serve() method
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    add_GRPCDemoServicer_to_server(GRPCDemoServicer(), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+
+    yield port
+
+    server.stop(None)
+
+
+@pytest.fixture(scope="module", params=BANDWIDTHS.keys())
+def proxy_port(request, server_port):
+    port, close = throttled_proxy(server_port, BANDWIDTHS[request.param])
+
+    yield port
+
+    close()
+
+
+@pytest.mark.benchmark(group="precision_matrices")
+@pytest.mark.parametrize("precision", PRECISIONS.keys())
+@pytest.mark.parametrize("operation", OPERATIONS)
+@pytest.mark.parametrize("sz", SIZES)
+def test_precision_matrices(benchmark, proxy_port, sz, operation, precision):
+    """BM test to measure the time consumed by an operation over two matrices over a
+    link with a limited bandwidth, transmitting them with full or reduced precision."""
+
+    transport_dtype, compute_dtype = PRECISIONS[precision]
+    client = DemoGRPCClient(
+        port=proxy_port,
+        timeout=60,
+        transport_dtype=transport_dtype,
+        compute_dtype=compute_dtype,
+    )
+
+    # Keep the values within the normal range of float16
+    rng = np.random.default_rng(1)
+    mat_1 = rng.random((sz, sz)) + 0.5
+    mat_2 = rng.random((sz, sz)) + 0.5
+
+    benchmark.pedantic(getattr(client, operation), args=(mat_1, mat_2), rounds=3)
+
+    # No statistics are collected when benchmarking is disabled (i.e. smoke tests)
+    if benchmark.stats:
+        benchmark.extra_info["throughput_bytes_per_second"] = (
+            mat_1.nbytes + mat_2.nbytes
+        ) / benchmark.stats.stats.mean
+
+    itemsize = np.dtype(transport_dtype or np.float64).itemsize
+    benchmark.extra_info["transmitted_bytes"] = 3 * sz * sz * itemsize
+    benchmark.extra_info["max_relative_error"] = client.transport_error or 0.0
@@ -0,0 +1,78 @@
+from concurrent import futures
+import time
+
+import grpc
+import numpy as np
+import pytest
+
+from ansys.eigen.python.grpc.client import DemoGRPCClient
+from ansys.eigen.python.grpc.generated.grpcdemo_pb2_grpc import (
+    add_GRPCDemoServicer_to_server,
+)
+from ansys.eigen.python.grpc.server import GRPCDemoServicer
+
+# ================================================================================
+# BM tests for the multiplication of large matrices
+#
+# These tests deploy the server locally. The product of two matrices is either
+# computed and sent by row blocks (as MultiplyMatrices does), or computed as a
+# whole before being sent (as an operation on inline operands does). Besides the
+# total time, the time until the first chunk of the product is received (i.e. the
+# time-to-first-byte) is reported within the extra_info of each result.
+# ================================================================================
+
+# Size of the (square) matrices involved
+SIZES = [512, 1024, 2048]
+
+MODES = ["row_blocks", "whole"]
+
+
+@pytest.fixture(scope="module")
+def product_client():
+    # Same configuration as in the serve() method
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    add_GRPCDemoServicer_to_server(GRPCDemoServicer(), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+
+    yield DemoGRPCClient(port=port, timeout=60)
+
+    server.stop(None)
+
+
+def _call(client, mode, mat_1, mat_2):
+    if mode == "row_blocks":
+        md, chunks = client._generate_md("matrices", "mat", mat_1, mat_2)
+        method = client._stub.MultiplyMatrices
+    else:
+        md, chunks, _ = client._generate_operate_md(
+            "matrices", "mat", "multiply", mat_1, mat_2
+        )
+        method = client._stub.OperateMatrices
+
+    return method(client._generate_matrix_stream(chunks, mat_1, mat_2), metadata=md)
+
+
+@pytest.mark.benchmark(group="product_multiply_matrices")
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("sz", SIZES)
+def test_product_multiply_matrices(benchmark, product_client, sz, mode):
+    """BM test to measure the time consumed by the multiplication of two large matrices,
+    and the time until the first chunk of the product is received."""
+
+    mat_1 = np.random.default_rng(1).random((sz, sz))
+    mat_2 = np.random.default_rng(2).random((sz, sz))
+    first_chunk = []
+
+    def multiply():
+        start = time.perf_counter()
+        received = False
+        for msg in _call(product_client, mode, mat_1, mat_2):
+            # Skip the header message (if any), which is sent before the product
+            if msg.matrix_as_chunk and not received:
+                first_chunk.append(time.perf_counter() - start)
+                received = True
+
+    benchmark.pedantic(multiply, rounds=3)
+
+    benchmark.extra_info["time_to_first_chunk"] = float(np.mean(first_chunk))
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+import ansys.eigen.python.grpc.generated.grpcdemo_pb2 as grpcdemo_pb2
+from ansys.eigen.python.grpc.server import GRPCDemoServicer
+
+# ================================================================================
+# BM tests for the reassembly of chunked messages on the server side
+#
+# These tests do not require a running server: they feed the servicer with the
+# chunk messages directly. The size of each chunk is kept constant, so that the
+# time consumed per byte should remain flat regardless of the amount of chunks.
+# ================================================================================
+
+# Number of elements (float64) per chunk: 64KB
+CHUNK_ELEMS = 8192
+
+# Amount of chunks in which the vector is decomposed
+NCHUNKS = [1, 2, 4, 8, 16, 32, 64, 128, 256]
+NCHUNKS_IDS = [f"{i:03d}" for i in NCHUNKS]
+
+
+def _build_vector_stream(nchunks):
+    # Generate the vector, decompose it into chunks and build the messages
+    vector = np.random.default_rng(1).random(nchunks * CHUNK_ELEMS)
+    md = {"full-vectors": "1", "vec1-messages": str(nchunks)}
+    msgs = [
+        grpcdemo_pb2.Vector(
+            data_type=grpcdemo_pb2.DataType.Value("DOUBLE"),
+            vector_size=vector.size,
+            vector_as_chunk=chunk.tobytes(),
+        )
+        for chunk in np.split(vector, nchunks)
+    ]
+
+    return vector, md, msgs
+
+
+@pytest.mark.benchmark(group="reassemble_vectors")
+@pytest.mark.parametrize("nchunks", NCHUNKS, ids=NCHUNKS_IDS)
+def test_reassemble_vectors_chunks(benchmark, nchunks):
+    """BM test to measure the time consumed by the server when reassembling
+    a vector sent in several chunks of constant size."""
+
+    servicer = GRPCDemoServicer()
+    vector, md, msgs = _build_vector_stream(nchunks)
+
+    # Report the size of the message, so that the per-byte cost can be computed
+    benchmark.extra_info["nbytes"] = vector.nbytes
+
+    # The stream of messages is consumed on each round... provide a new one every time
+    _, _, vector_list = benchmark(lambda: servicer._get_vectors(iter(msgs), md))
+
+    np.testing.assert_array_equal(vector_list[0], vector)
@@ -0,0 +1,96 @@
+from concurrent import futures
+import multiprocessing
+import sys
+
+import grpc
+import numpy as np
+import pytest
+
+from ansys.eigen.python.grpc.client import DemoGRPCClient
+from ansys.eigen.python.grpc.generated.grpcdemo_pb2_grpc import (
+    add_GRPCDemoServicer_to_server,
+)
+from ansys.eigen.python.grpc.server import GRPCDemoServicer
+
+# ================================================================================
+# BM tests for the addition of many operands
+#
+# These tests deploy the server locally, in a separate process. The client adds
+# many matrices either with a streamed addition (the server adds each matrix into
+# the result as soon as its chunks are received) or with an operation on inline
+# operands (the server buffers all of them before adding them). The peak of the
+# resident memory of the server process (VmHWM) during the additions is reported.
+# ================================================================================
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="Requires the Linux /proc interface"
+)
+
+# Shape of the matrices added (4MB each)
+SHAPE = (1024, 512)
+
+# Amount of matrices added in each call
+OPERANDS = [2, 10, 50]
+
+MODES = {
+    "streamed": lambda client, *mats: client.add_matrices(*mats),
+    "buffered": lambda client, *mats: client.operate_matrices("add", *mats),
+}
+
+
+def _serve(queue):
+    # Same configuration as in the serve() method
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    add_GRPCDemoServicer_to_server(GRPCDemoServicer(), server)
+    queue.put(server.add_insecure_port("127.0.0.1:0"))
+    server.start()
+    server.wait_for_termination()
+
+
+@pytest.fixture(scope="module")
+def server_process():
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(target=_serve, args=(queue,), daemon=True)
+    process.start()
+
+    yield process.pid, queue.get(timeout=30)
+
+    process.terminate()
+    process.join()
+
+
+def _memory_kb(pid, field):
+    with open("/proc/%d/status" % pid) as status:
+        for line in status:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+
+
+def _reset_peak(pid):
+    # Reset the peak of resident memory (VmHWM) to the current one
+    with open("/proc/%d/clear_refs" % pid, "w") as clear_refs:
+        clear_refs.write("5")
+
+
+@pytest.mark.benchmark(group="reduction_add_matrices")
+@pytest.mark.parametrize("mode", MODES.keys())
+@pytest.mark.parametrize("operands", OPERANDS)
+def test_reduction_add_matrices(benchmark, server_process, operands, mode):
+    """BM test to measure the time consumed and the peak of memory of the server when
+    adding many matrices, either streamed or buffered by the server."""
+
+    pid, port = server_process
+    client = DemoGRPCClient(port=port, timeout=60)
+    mats = [np.random.default_rng(i).random(SHAPE) for i in range(operands)]
+
+    # Warm up, and measure the peak of memory from the memory in use afterwards
+    MODES[mode](client, *mats)
+    _reset_peak(pid)
+    baseline = _memory_kb(pid, "VmRSS")
+
+    benchmark.pedantic(MODES[mode], args=(client, *mats), rounds=3)
+
+    peak = _memory_kb(pid, "VmHWM") - baseline
+    benchmark.extra_info["operand_bytes"] = mats[0].nbytes
+    benchmark.extra_info["peak_memory_bytes"] = 1024 * max(peak, 0)
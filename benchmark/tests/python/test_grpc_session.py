@@ -0,0 +1,78 @@
+from concurrent import futures
+
+import grpc
+import pytest
+
+from ansys.eigen.python.grpc.client import DemoGRPCClient
+from ansys.eigen.python.grpc.generated.grpcdemo_pb2_grpc import (
+    add_GRPCDemoServicer_to_server,
+)
+from ansys.eigen.python.grpc.server import GRPCDemoServicer
+
+from .test_tools import vec_generator
+
+# ================================================================================
+# BM tests for operations performed within a session
+#
+# These tests deploy the server locally. Each round performs several additions of
+# small vectors: either one call per addition (as the rest of client methods do),
+# one after the other within a session, or pipelined within a session (all of them
+# are requested before waiting for any result). The session avoids setting up a
+# call per operation, which dominates the time consumed for small vectors.
+# ================================================================================
+
+# Size of the vectors involved
+SIZES = [2, 8, 64]
+
+# Amount of additions performed in each round
+OPERATIONS = 50
+
+
+@pytest.fixture(scope="module")
+def session_client():
+    # Same configuration as in the serve() method
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    add_GRPCDemoServicer_to_server(GRPCDemoServicer(), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+
+    yield DemoGRPCClient(port=port, timeout=5)
+
+    server.stop(None)
+
+
+def _per_call(client, session, vec_1, vec_2):
+    for _ in range(OPERATIONS):
+        client.add_vectors(vec_1, vec_2)
+
+
+def _session(client, session, vec_1, vec_2):
+    for _ in range(OPERATIONS):
+        session.add_vectors(vec_1, vec_2)
+
+
+def _session_pipelined(client, session, vec_1, vec_2):
+    results = [session.submit("add_vectors", vec_1, vec_2) for _ in range(OPERATIONS)]
+    for result in results:
+        result.result()
+
+
+MODES = {
+    "per_call": _per_call,
+    "session": _session,
+    "session_pipelined": _session_pipelined,
+}
+
+
+@pytest.mark.benchmark(group="session_add_vectors")
+@pytest.mark.parametrize("mode", MODES.keys())
+@pytest.mark.parametrize("sz", SIZES)
+def test_session_add_vectors(benchmark, session_client, sz, mode):
+    """BM test to measure the time consumed by several additions of small vectors,
+    either with a call per addition or within a session."""
+
+    vec_1 = vec_generator(sz)
+    vec_2 = vec_generator(sz)
+
+    with session_client.session() as session:
+        benchmark(MODES[mode], session_client, session, vec_1, vec_2)
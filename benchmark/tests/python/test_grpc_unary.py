@@ -0,0 +1,75 @@
+from concurrent import futures
+
+import grpc
+import pytest
+
+from ansys.eigen.python.grpc.client import DemoGRPCClient
+from ansys.eigen.python.grpc.generated.grpcdemo_pb2_grpc import (
+    add_GRPCDemoServicer_to_server,
+)
+from ansys.eigen.python.grpc.server import GRPCDemoServicer
+
+from .test_tools import mat_generator, vec_generator
+
+# ================================================================================
+# BM tests for the unary calls performing operations with small operands
+#
+# These tests deploy the server locally. The client performs operations with small
+# operands either by unary calls (all operands within a single message, as it does
+# by default) or by streaming calls (as it does for larger operands), so that the
+# latency of both kinds of calls can be compared.
+# ================================================================================
+
+# Size of the vectors and matrices involved
+SIZES = [2, 8, 64]
+
+CALLS = ["unary", "streaming"]
+
+
+@pytest.fixture(scope="module")
+def local_port():
+    # Same configuration as in the serve() method
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    add_GRPCDemoServicer_to_server(GRPCDemoServicer(), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+
+    yield port
+
+    server.stop(None)
+
+
+def _client(port, call):
+    client = DemoGRPCClient(port=port, timeout=5)
+    client._unary_calls = call == "unary"
+    return client
+
+
+@pytest.mark.benchmark(group="unary_add_vectors")
+@pytest.mark.parametrize("call", CALLS)
+@pytest.mark.parametrize("sz", SIZES)
+def test_unary_add_vectors(benchmark, local_port, sz, call):
+    """BM test to measure the time consumed by the addition of two small vectors,
+    either by a unary call or by a streaming call."""
+
+    client = _client(local_port, call)
+
+    vec_1 = vec_generator(sz)
+    vec_2 = vec_generator(sz)
+
+    benchmark(client.add_vectors, vec_1, vec_2)
+
+
+@pytest.mark.benchmark(group="unary_multiply_matrices")
+@pytest.mark.parametrize("call", CALLS)
+@pytest.mark.parametrize("sz", SIZES)
+def test_unary_multiply_matrices(benchmark, local_port, sz, call):
+    """BM test to measure the time consumed by the multiplication of two small
+    matrices, either by a unary call or by a streaming call."""
+
+    client = _client(local_port, call)
+
+    mat_1 = mat_generator(sz)
+    mat_2 = mat_generator(sz)
+
+    benchmark(client.multiply_matrices, mat_1, mat_2)
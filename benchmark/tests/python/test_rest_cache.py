@@ -0,0 +1,71 @@
+import json
+import threading
+
+import numpy as np
+import pytest
+import requests
+from werkzeug.serving import make_server
+
+from ansys.eigen.python.rest.payloads import BINARY_MIMETYPE, encode_array
+from ansys.eigen.python.rest.server import DEFAULT_CACHE_BUDGET, create_app
+
+# ================================================================================
+# BM tests for the cache of decoded arrays of the REST server
+#
+# These tests deploy the Flask server locally (in a background thread), with or
+# without its cache of decoded arrays, post two matrices and then repeatedly
+# request operations on them (i.e. on hot IDs). The hit ratio of the cache is
+# reported within the extra_info of each result.
+# ================================================================================
+
+# Size of the (square) matrices involved
+SIZES = [64, 512, 1024]
+
+CACHE_BUDGETS = {"cached": DEFAULT_CACHE_BUDGET, "uncached": 0}
+
+
+@pytest.fixture(scope="module", params=CACHE_BUDGETS.keys())
+def server(request):
+    app = create_app(cache_budget=CACHE_BUDGETS[request.param])
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield "http://127.0.0.1:" + str(server.server_port), app
+
+    server.shutdown()
+    thread.join()
+
+
+def post_matrix(url, mat):
+    body, headers = encode_array(mat, BINARY_MIMETYPE)
+    response = requests.post(url + "/Matrices", data=body, headers=headers)
+    return json.loads(response.text)["matrix"]["id"]
+
+
+@pytest.mark.benchmark(group="cache_ops_matrices")
+@pytest.mark.parametrize("ops", ["add", "multiply"])
+@pytest.mark.parametrize("sz", SIZES)
+def test_cache_ops_matrices(benchmark, server, sz, ops):
+    """BM test to measure the time consumed by repeated operations on the same two
+    (stored) matrices, depending on whether the server caches the decoded arrays."""
+    url, app = server
+    cache = app.extensions["array_cache"]
+
+    rng = np.random.default_rng(1)
+    ids = {"id1": post_matrix(url, rng.random((sz, sz)))}
+    ids["id2"] = post_matrix(url, rng.random((sz, sz)))
+
+    def operation():
+        response = requests.get(
+            url + "/" + ops + "/Matrices",
+            json=ids,
+            headers={"Accept": BINARY_MIMETYPE},
+        )
+        assert response.status_code == 200
+
+    hits, misses = cache.hits, cache.misses
+    benchmark(operation)
+
+    lookups = cache.hits - hits + cache.misses - misses
+    benchmark.extra_info["hit_ratio"] = (cache.hits - hits) / lookups
@@ -0,0 +1,97 @@
+import json
+import sqlite3
+
+import numpy as np
+import pytest
+
+from ansys.eigen.python.rest.restdb.db import insert_array, load_array
+from ansys.eigen.python.rest.server import create_app
+
+from .test_tools import SIZES, SIZES_IDS, mat_generator
+
+# ================================================================================
+# BM tests for the storage of the arrays in the REST server's database
+#
+# These tests compare inserting and loading matrices stored as raw bytes (BLOB,
+# current schema) against storing them as JSON text (schema of version 0), on a
+# database file of the same kind as the one of the server.
+# ================================================================================
+
+# Schema of the database before storing the arrays as raw bytes (version 0)
+LEGACY_SCHEMA = """
+CREATE TABLE eigen_db (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  eigen_type TEXT NOT NULL,
+  eigen_value TEXT NOT NULL
+);
+"""
+
+STORAGES = ["json", "blob"]
+
+
+def insert_json(db, eigen_type, array):
+    cur = db.execute(
+        "INSERT INTO eigen_db(eigen_type, eigen_value) VALUES (?, ?)",
+        (eigen_type, json.dumps(array.tolist())),
+    )
+    db.commit()
+    return cur.lastrowid
+
+
+def load_json(db, id, eigen_type):
+    row = db.execute(
+        "SELECT eigen_value FROM eigen_db WHERE id = ? AND eigen_type = ?",
+        (id, eigen_type),
+    ).fetchone()
+    return np.array(json.loads(row[0]), dtype=np.float64)
+
+
+@pytest.fixture(scope="module")
+def databases(tmp_path_factory):
+    # The current schema is built by the app (within its context)
+    app = create_app()
+    path = tmp_path_factory.mktemp("db")
+
+    with app.app_context():
+        blob_db = sqlite3.connect(path / "blob.sqlite")
+        blob_db.row_factory = sqlite3.Row
+        with app.open_resource("restdb/schema.sql") as f:
+            blob_db.executescript(f.read().decode("utf8"))
+
+        json_db = sqlite3.connect(path / "json.sqlite")
+        json_db.executescript(LEGACY_SCHEMA)
+
+        yield {
+            "json": (json_db, insert_json, load_json),
+            "blob": (blob_db, insert_array, load_array),
+        }
+
+        blob_db.close()
+        json_db.close()
+
+
+@pytest.mark.benchmark(group="db_insert_matrices")
+@pytest.mark.parametrize("storage", STORAGES)
+@pytest.mark.parametrize("sz", SIZES, ids=SIZES_IDS)
+def test_db_insert_matrices(benchmark, databases, sz, storage):
+    """BM test to measure the time consumed by inserting a matrix into the database,
+    depending on how it is stored."""
+    db, insert, _ = databases[storage]
+    mat = mat_generator(sz)
+
+    benchmark(insert, db, "MATRIX", mat)
+
+
+@pytest.mark.benchmark(group="db_load_matrices")
+@pytest.mark.parametrize("storage", STORAGES)
+@pytest.mark.parametrize("sz", SIZES, ids=SIZES_IDS)
+def test_db_load_matrices(benchmark, databases, sz, storage):
+    """BM test to measure the time consumed by loading a matrix from the database,
+    depending on how it is stored."""
+    db, insert, load = databases[storage]
+    mat = mat_generator(sz)
+    id = insert(db, "MATRIX", mat)
+
+    loaded = benchmark(load, db, id, "MATRIX")
+
+    np.testing.assert_array_equal(loaded, mat)
@@ -0,0 +1,78 @@
+import json
+import threading
+
+import numpy as np
+import pytest
+import requests
+from werkzeug.serving import make_server
+
+from ansys.eigen.python.rest.payloads import BINARY_MIMETYPE, encode_array
+from ansys.eigen.python.rest.server import DEFAULT_MEMO_BUDGET, create_app
+
+# ================================================================================
+# BM tests for the memo of operation results of the REST server
+#
+# These tests deploy the Flask server locally (in a background thread), with or
+# without its memo of results, post two matrices and then repeatedly request the
+# same operation on them. Clients may also revalidate the result they hold (i.e.
+# send its ETag back), in which case the server answers "304 Not Modified".
+# ================================================================================
+
+# Size of the (square) matrices involved
+SIZES = [64, 512, 1024]
+
+MEMO_BUDGETS = {"memoized": DEFAULT_MEMO_BUDGET, "not_memoized": 0}
+
+
+@pytest.fixture(scope="module", params=MEMO_BUDGETS.keys())
+def server(request):
+    app = create_app(memo_budget=MEMO_BUDGETS[request.param])
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield "http://127.0.0.1:" + str(server.server_port), app
+
+    server.shutdown()
+    thread.join()
+
+
+def post_matrix(url, mat):
+    body, headers = encode_array(mat, BINARY_MIMETYPE)
+    response = requests.post(url + "/Matrices", data=body, headers=headers)
+    return json.loads(response.text)["matrix"]["id"]
+
+
+@pytest.mark.benchmark(group="memo_ops_matrices")
+@pytest.mark.parametrize("revalidate", [False, True])
+@pytest.mark.parametrize("ops", ["add", "multiply"])
+@pytest.mark.parametrize("sz", SIZES)
+def test_memo_ops_matrices(benchmark, server, sz, ops, revalidate):
+    """BM test to measure the time consumed by repeated operations on the same two
+    (stored) matrices, depending on whether the server memoizes the results and on
+    whether the client revalidates the result it holds."""
+    url, app = server
+    memo = app.extensions["result_memo"]
+
+    rng = np.random.default_rng(1)
+    ids = {"id1": post_matrix(url, rng.random((sz, sz)))}
+    ids["id2"] = post_matrix(url, rng.random((sz, sz)))
+
+    headers = {"Accept": BINARY_MIMETYPE}
+    response = requests.get(url + "/" + ops + "/Matrices", json=ids, headers=headers)
+    if revalidate:
+        headers["If-None-Match"] = response.headers["ETag"]
+
+    def operation():
+        response = requests.get(
+            url + "/" + ops + "/Matrices", json=ids, headers=headers
+        )
+        assert response.status_code == (304 if revalidate else 200)
+
+    hits, misses = memo.hits, memo.misses
+    benchmark(operation)
+
+    lookups = memo.hits - hits + memo.misses - misses
+    benchmark.extra_info["hit_ratio"] = (
+        (memo.hits - hits) / lookups if lookups else None
+    )
@@ -0,0 +1,81 @@
+import threading
+
+import numpy as np
+import pytest
+from werkzeug.serving import make_server
+
+from ansys.eigen.python.rest.client import DemoRESTClient
+from ansys.eigen.python.rest.server import create_app
+
+# ================================================================================
+# BM tests for the format of the REST payloads
+#
+# These tests deploy the Flask server locally (in a background thread) and compare
+# adding and multiplying matrices exchanged as JSON lists, raw little-endian buffers
+# and .npy files. The throughput (operand bytes per second) is reported within the
+# extra_info of each result.
+# ================================================================================
+
+# Size of the (square) matrices involved
+SIZES = [128, 512, 1024]
+
+PAYLOAD_FORMATS = ["json", "binary", "npy"]
+
+
+@pytest.fixture(scope="module")
+def server_port():
+    app = create_app()
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server.server_port
+
+    server.shutdown()
+    thread.join()
+
+
+@pytest.mark.benchmark(group="payloads_add_matrices")
+@pytest.mark.parametrize("payload_format", PAYLOAD_FORMATS)
+@pytest.mark.parametrize("sz", SIZES)
+def test_payloads_add_matrices(benchmark, server_port, sz, payload_format):
+    """BM test to measure the time consumed by the addition of two matrices, depending
+    on the format in which they are exchanged with the server."""
+    client = DemoRESTClient(
+        "http://127.0.0.1", server_port, payload_format=payload_format
+    )
+
+    rng = np.random.default_rng(1)
+    mat_1 = rng.random((sz, sz))
+    mat_2 = rng.random((sz, sz))
+
+    benchmark.pedantic(client.add, args=(mat_1, mat_2), rounds=3, warmup_rounds=1)
+
+    # No statistics are collected when benchmarking is disabled (i.e. smoke tests)
+    if benchmark.stats:
+        benchmark.extra_info["throughput_bytes_per_second"] = (
+            mat_1.nbytes + mat_2.nbytes
+        ) / benchmark.stats.stats.mean
+
+
+@pytest.mark.benchmark(group="payloads_multiply_matrices")
+@pytest.mark.parametrize("payload_format", PAYLOAD_FORMATS)
+@pytest.mark.parametrize("sz", SIZES)
+def test_payloads_multiply_matrices(benchmark, server_port, sz, payload_format):
+    """BM test to measure the time consumed by the multiplication of two matrices,
+    depending on the format in which they are exchanged with the server."""
+    client = DemoRESTClient(
+        "http://127.0.0.1", server_port, payload_format=payload_format
+    )
+
+    rng = np.random.default_rng(1)
+    mat_1 = rng.random((sz, sz))
+    mat_2 = rng.random((sz, sz))
+
+    benchmark.pedantic(client.multiply, args=(mat_1, mat_2), rounds=3, warmup_rounds=1)
+
+    # No statistics are collected when benchmarking is disabled (i.e. smoke tests)
+    if benchmark.stats:
+        benchmark.extra_info["throughput_bytes_per_second"] = (
+            mat_1.nbytes + mat_2.nbytes
+        ) / benchmark.stats.stats.mean
@@ -0,0 +1,85 @@
+import threading
+
+import numpy as np
+import pytest
+from werkzeug.serving import make_server
+
+from ansys.eigen.python.rest.client import DemoRESTClient
+from ansys.eigen.python.rest.server import create_app
+
+# ================================================================================
+# BM tests for the amount of requests per operation
+#
+# These tests deploy the Flask server locally (in a background thread) and compare
+# adding and multiplying vectors and matrices storing the operands in the server
+# first (three requests per operation, each writing to the database) against
+# sending them along with the operation requested (a single request). The amount
+# of requests per operation is reported within the extra_info of each result.
+# ================================================================================
+
+# Size of the vectors and (square) matrices involved
+SIZES = [4, 64, 512]
+
+MODES = {"stored": True, "stateless": False}
+
+
+@pytest.fixture(scope="module")
+def server_port():
+    app = create_app()
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server.server_port
+
+    server.shutdown()
+    thread.join()
+
+
+def run_operation(benchmark, server_port, mode, operation, arg1, arg2):
+    client = DemoRESTClient("http://127.0.0.1", server_port, store_operands=MODES[mode])
+
+    benchmark(getattr(client, operation), arg1, arg2)
+
+    benchmark.extra_info["requests_per_operation"] = 3 if MODES[mode] else 1
+
+
+@pytest.mark.benchmark(group="roundtrips_add_vectors")
+@pytest.mark.parametrize("mode", MODES.keys())
+@pytest.mark.parametrize("sz", SIZES)
+def test_roundtrips_add_vectors(benchmark, server_port, sz, mode):
+    """BM test to measure the time consumed by the addition of two vectors, depending
+    on whether they are stored in the server or not."""
+    rng = np.random.default_rng(1)
+    run_operation(
+        benchmark, server_port, mode, "add", rng.random(sz * sz), rng.random(sz * sz)
+    )
+
+
+@pytest.mark.benchmark(group="roundtrips_add_matrices")
+@pytest.mark.parametrize("mode", MODES.keys())
+@pytest.mark.parametrize("sz", SIZES)
+def test_roundtrips_add_matrices(benchmark, server_port, sz, mode):
+    """BM test to measure the time consumed by the addition of two matrices, depending
+    on whether they are stored in the server or not."""
+    rng = np.random.default_rng(1)
+    run_operation(
+        benchmark, server_port, mode, "add", rng.random((sz, sz)), rng.random((sz, sz))
+    )
+
+
+@pytest.mark.benchmark(group="roundtrips_multiply_matrices")
+@pytest.mark.parametrize("mode", MODES.keys())
+@pytest.mark.parametrize("sz", SIZES)
+def test_roundtrips_multiply_matrices(benchmark, server_port, sz, mode):
+    """BM test to measure the time consumed by the multiplication of two matrices,
+    depending on whether they are stored in the server or not."""
+    rng = np.random.default_rng(1)
+    run_operation(
+        benchmark,
+        server_port,
+        mode,
+        "multiply",
+        rng.random((sz, sz)),
+        rng.random((sz, sz)),
+    )
@@ -1,6 +1,9 @@
 """ Tools for BM tests """
 
 from random import random, seed
+import socket
+import threading
+import time
 
 import numpy as np
 
@@ -24,9 +27,13 @@ MAX = 10.0
 SIZES = [pow(2, n) for n in range(1, NVALUES)]
 SIZES_IDS = [f"{i:05d}" for i in SIZES]
 
+# Simulated bandwidths of each direction of a link (in bytes per second)
+BANDWIDTHS = {"100Mbps": 100 * 1000 * 1000 // 8, "1Gbps": 1000 * 1000 * 1000 // 8}
+
 # Initialize our seed
 seed(1)
 
+
 # Create the random value generator
 def gen_value():
     return MIN + (random() * (MAX - MIN))
@@ -53,3 +60,39 @@ def vec_generator_list(vec_length):
 # Auxiliary function to generate random square matrices (as a list)
 def mat_generator_list(mat_size):
     return [[gen_value() for _ in range(0, mat_size)] for _ in range(0, mat_size)]
+
+
+# Auxiliary function to forward the data of one direction of a throttled link
+def _pump(src, dst, bandwidth):
+    # Forward the data, waiting as long as the simulated link would take to transmit it
+    try:
+        while True:
+            data = src.recv(64 * 1024)
+            if not data:
+                break
+            dst.sendall(data)
+            time.sleep(len(data) / bandwidth)
+        dst.shutdown(socket.SHUT_WR)
+    except OSError:
+        pass
+
+
+# Auxiliary function to deploy a local proxy which limits the bandwidth of the link
+def throttled_proxy(target_port, bandwidth):
+    listener = socket.create_server(("127.0.0.1", 0))
+
+    def accept():
+        while True:
+            try:
+                client, _ = listener.accept()
+            except OSError:
+                return
+            server = socket.create_connection(("127.0.0.1", target_port))
+            for src, dst in ((client, server), (server, client)):
+                threading.Thread(
+                    target=_pump, args=(src, dst, bandwidth), daemon=True
+                ).start()
+
+    threading.Thread(target=accept, daemon=True).start()
+
+    return listener.getsockname()[1], listener.close
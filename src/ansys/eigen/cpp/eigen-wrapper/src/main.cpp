@@ -1,17 +1,83 @@
+#include <pybind11/complex.h>
 #include <pybind11/eigen.h>
+#include <pybind11/numpy.h>
+
+#include <algorithm>
+#include <cstdint>
+#include <stdexcept>
+#include <string>
+#include <thread>
+#include <type_traits>
+#include <utility>
+#include <vector>
 
 #define STRINGIFY(x) #x
 #define MACRO_STRINGIFY(x) STRINGIFY(x)
 
 namespace py = pybind11;
 
-// It is needed to use type py::EigenDRef<Eigen::MatrixXd> for matrix
-// operations, since numpy arrays are characterized for ordering its values
-// differently to Eigen.
+// Matrix operations are bound for both row-major (RowMatrix<Scalar>) and
+// column-major (Matrix<Scalar>) Eigen matrices. Since numpy arrays are usually
+// ordered differently to Eigen (i.e. in C order), the row-major bindings are
+// the ones registered first: they only accept C-contiguous matrices, which
+// are then neither converted on the way in nor on the way out (the result is
+// returned as a C-ordered numpy array). Any other matrix is handled
+// by the column-major bindings, using py::EigenDRef (i.e. any strides).
 //
 // Ideally, and for performance reasons, we should avoid using Dynamic
 // MAtrixTypes, to take advantage of the vectorization Eigen does when solving
 // matrix operations.
+//
+// All wrapper methods release the GIL (py::call_guard<py::gil_scoped_release>)
+// while Eigen performs the operation. The input numpy arrays remain referenced
+// (i.e. pinned) by the argument casters during the whole call, and the result
+// is converted back into a numpy array once the GIL has been reacquired. Thus,
+// several Python threads (e.g. server workers) may operate concurrently.
+//
+// The "out" variants write the result into a caller-provided (writable) numpy
+// array, and the "inplace" variants accumulate into their first argument, so
+// that no result needs to be allocated by the wrapper. The output may be one
+// of the inputs. Only if it partially overlaps them (e.g. a shifted view of the
+// same buffer) is the result evaluated into a temporary first.
+//
+// All wrapper methods are templated on the type of the coefficients, and bound
+// for double, int32, int64, float and std::complex<double>. The bindings are
+// overloads of the same Python function: the one matching the dtype of the
+// input numpy arrays is chosen, so that no conversion (i.e. copy) is performed.
+// Other dtypes (or Python lists) are converted into float64 arrays, which is
+// the first overload registered. Vector operations are bound for contiguous
+// vectors first (which Eigen vectorizes), and then for vectors with any inner
+// stride (e.g. sliced numpy arrays), so that no dtype needs a conversion.
+//
+// The batched wrapper methods operate stacks of C-contiguous vectors (N, n) or
+// matrices (N, n, m) in a single call, which may be split among several
+// threads. Each item of the stacks is mapped (not copied) as an Eigen object.
+
+template <typename Scalar>
+using Matrix = Eigen::Matrix<Scalar, Eigen::Dynamic, Eigen::Dynamic>;
+
+template <typename Scalar>
+using RowMatrix =
+    Eigen::Matrix<Scalar, Eigen::Dynamic, Eigen::Dynamic, Eigen::RowMajor>;
+
+template <typename Scalar>
+using Vector = Eigen::Matrix<Scalar, Eigen::Dynamic, 1>;
+
+// References to numpy vectors, either contiguous (Eigen::InnerStride<1>) or
+// with any inner stride (Eigen::InnerStride<>)
+template <typename V, typename Stride>
+using VectorRef = Eigen::Ref<V, 0, Stride>;
+
+// Stacks of vectors or matrices, as C-contiguous numpy arrays
+template <typename Scalar>
+using Stack = py::array_t<Scalar, py::array::c_style | py::array::forcecast>;
+
+// References to numpy matrices: C-contiguous row-major matrices, or
+// column-major matrices with any strides.
+template <typename M>
+using MatrixRef = typename std::conditional<
+    std::remove_const<M>::type::IsRowMajor,
+    Eigen::Ref<M, 0, Eigen::OuterStride<>>, py::EigenDRef<M>>::type;
 
 /**
  * @brief Wrapper method to Matrix multiplication carried out by Eigen
@@ -20,10 +86,10 @@ namespace py = pybind11;
  * @param a The first matrix.
  * @param b The second matrix.
  *
- * @return Eigen::MatrixXd
+ * @return M
  */
-Eigen::MatrixXd multiply_matrices(const py::EigenDRef<Eigen::MatrixXd> a,
-                                  const py::EigenDRef<Eigen::MatrixXd> b) {
+template <typename M>
+M multiply_matrices(const MatrixRef<const M> a, const MatrixRef<const M> b) {
     return a * b;
 }
 
@@ -33,25 +99,26 @@ Eigen::MatrixXd multiply_matrices(const py::EigenDRef<Eigen::MatrixXd> a,
  * @param a The first matrix.
  * @param b The second matrix.
  *
- * @return Eigen::MatrixXd
+ * @return M
  */
-Eigen::MatrixXd add_matrices(const py::EigenDRef<Eigen::MatrixXd> a,
-                             const py::EigenDRef<Eigen::MatrixXd> b) {
+template <typename M>
+M add_matrices(const MatrixRef<const M> a, const MatrixRef<const M> b) {
     return a + b;
 }
 
 /**
  * @brief Wrapper method to Vector multiplication (dot product) carried out by
- * Eigen operators.
+ * Eigen operators. As in numpy, no complex conjugate is taken.
  *
  * @param v The first vector.
  * @param w The second vector.
  *
- * @return double
+ * @return Scalar
  */
-double multiply_vectors(const Eigen::Ref<Eigen::VectorXd> v,
-                        const Eigen::Ref<Eigen::VectorXd> w) {
-    return v.dot(w);
+template <typename Scalar, typename Stride>
+Scalar multiply_vectors(const VectorRef<const Vector<Scalar>, Stride> v,
+                        const VectorRef<const Vector<Scalar>, Stride> w) {
+    return v.cwiseProduct(w).sum();
 }
 
 /**
@@ -60,13 +127,485 @@ double multiply_vectors(const Eigen::Ref<Eigen::VectorXd> v,
  * @param v The first vector.
  * @param w The second vector.
  *
- * @return Eigen::VectorXd
+ * @return Vector<Scalar>
  */
-Eigen::VectorXd add_vectors(const Eigen::Ref<Eigen::VectorXd> v,
-                            const Eigen::Ref<Eigen::VectorXd> w) {
+template <typename Scalar, typename Stride>
+Vector<Scalar> add_vectors(const VectorRef<const Vector<Scalar>, Stride> v,
+                           const VectorRef<const Vector<Scalar>, Stride> w) {
     return v + w;
 }
 
+/**
+ * @brief Check that two Eigen objects have the same dimensions.
+ *
+ * @param a The first object.
+ * @param b The second object.
+ * @param what Description of the objects compared, used in the error message.
+ *
+ * @throw std::runtime_error If the dimensions do not match.
+ */
+template <typename A, typename B>
+void check_dimensions(const A& a, const B& b, const std::string& what) {
+    if (a.rows() != b.rows() || a.cols() != b.cols()) {
+        throw std::runtime_error("Dimensions mismatch between " + what + ".");
+    }
+}
+
+/**
+ * @brief Get the range of addresses spanned by the coefficients of an Eigen
+ * object, whatever its strides.
+ *
+ * @param x The (non-empty) object.
+ *
+ * @return std::pair<std::uintptr_t, std::uintptr_t> The first address and the
+ * one past the last coefficient.
+ */
+template <typename X>
+std::pair<std::uintptr_t, std::uintptr_t> memory_range(const X& x) {
+    const auto item = static_cast<std::intptr_t>(sizeof(typename X::Scalar));
+    const std::intptr_t offsets[] = {(x.rows() - 1) * x.rowStride() * item,
+                                     (x.cols() - 1) * x.colStride() * item};
+
+    auto first = reinterpret_cast<std::uintptr_t>(x.data());
+    auto last = first;
+    for (auto offset : offsets) {
+        if (offset < 0) {
+            first += offset;
+        } else {
+            last += offset;
+        }
+    }
+    return {first, last + item};
+}
+
+/**
+ * @brief Check whether the coefficients of two Eigen objects overlap in memory.
+ *
+ * @param a The first object.
+ * @param b The second object.
+ *
+ * @return bool Whether the objects overlap.
+ */
+template <typename A, typename B>
+bool overlap(const A& a, const B& b) {
+    if (a.size() == 0 || b.size() == 0) return false;
+
+    const auto range_a = memory_range(a), range_b = memory_range(b);
+    return range_a.first < range_b.second && range_b.first < range_a.second;
+}
+
+/**
+ * @brief Check whether the coefficients of two Eigen objects overlap in memory
+ * without being exactly the same ones, in which case evaluating a
+ * coefficient-wise operation from one into the other is not safe.
+ *
+ * @param a The first object.
+ * @param b The second object.
+ *
+ * @return bool Whether the objects partially overlap.
+ */
+template <typename A, typename B>
+bool partially_overlap(const A& a, const B& b) {
+    return overlap(a, b) &&
+           (a.data() != b.data() || a.rows() != b.rows() ||
+            a.cols() != b.cols() || a.rowStride() != b.rowStride() ||
+            a.colStride() != b.colStride());
+}
+
+/**
+ * @brief Wrapper method to Matrix multiplication carried out by Eigen
+ * operators, which writes the result into a given matrix.
+ *
+ * @param a The first matrix.
+ * @param b The second matrix.
+ * @param out The matrix in which the result is written.
+ */
+template <typename M>
+void multiply_matrices_out(const MatrixRef<const M> a,
+                           const MatrixRef<const M> b, MatrixRef<M> out) {
+    if (a.cols() != b.rows()) {
+        throw std::runtime_error(
+            "Dimensions mismatch between the matrices multiplied.");
+    }
+    if (out.rows() != a.rows() || out.cols() != b.cols()) {
+        throw std::runtime_error(
+            "Dimensions mismatch between the product and the output matrix.");
+    }
+
+    // The product is only evaluated directly into the output matrix if it
+    // does not overlap any of the operands (not even partially)
+    if (overlap(out, a) || overlap(out, b)) {
+        out = a * b;
+    } else {
+        out.noalias() = a * b;
+    }
+}
+
+/**
+ * @brief Wrapper method to Matrix addition carried out by Eigen operators,
+ * which writes the result into a given matrix.
+ *
+ * @param a The first matrix.
+ * @param b The second matrix.
+ * @param out The matrix in which the result is written.
+ */
+template <typename M>
+void add_matrices_out(const MatrixRef<const M> a, const MatrixRef<const M> b,
+                      MatrixRef<M> out) {
+    check_dimensions(a, b, "the matrices added");
+    check_dimensions(a, out, "the matrices added and the output matrix");
+    if (partially_overlap(out, a) || partially_overlap(out, b)) {
+        out = (a + b).eval();
+    } else {
+        out = a + b;
+    }
+}
+
+/**
+ * @brief Wrapper method to in-place Matrix addition (i.e. a += b) carried out
+ * by Eigen operators.
+ *
+ * @param a The matrix in which the result is accumulated.
+ * @param b The matrix added.
+ */
+template <typename M>
+void add_matrices_inplace(MatrixRef<M> a, const MatrixRef<const M> b) {
+    check_dimensions(a, b, "the matrices added");
+    if (partially_overlap(a, b)) {
+        a += b.eval();
+    } else {
+        a += b;
+    }
+}
+
+/**
+ * @brief Wrapper method to Vector addition carried out by Eigen operators,
+ * which writes the result into a given vector.
+ *
+ * @param v The first vector.
+ * @param w The second vector.
+ * @param out The vector in which the result is written.
+ */
+template <typename Scalar, typename Stride>
+void add_vectors_out(const VectorRef<const Vector<Scalar>, Stride> v,
+                     const VectorRef<const Vector<Scalar>, Stride> w,
+                     VectorRef<Vector<Scalar>, Stride> out) {
+    check_dimensions(v, w, "the vectors added");
+    check_dimensions(v, out, "the vectors added and the output vector");
+    if (partially_overlap(out, v) || partially_overlap(out, w)) {
+        out = (v + w).eval();
+    } else {
+        out = v + w;
+    }
+}
+
+/**
+ * @brief Wrapper method to in-place Vector addition (i.e. v += w) carried out
+ * by Eigen operators.
+ *
+ * @param v The vector in which the result is accumulated.
+ * @param w The vector added.
+ */
+template <typename Scalar, typename Stride>
+void add_vectors_inplace(VectorRef<Vector<Scalar>, Stride> v,
+                         const VectorRef<const Vector<Scalar>, Stride> w) {
+    check_dimensions(v, w, "the vectors added");
+    if (partially_overlap(v, w)) {
+        v += w.eval();
+    } else {
+        v += w;
+    }
+}
+
+
+/**
+ * @brief Run a function over the indices [0, n), splitting them in contiguous
+ * blocks among (at most) the given number of threads.
+ *
+ * @param n The number of indices.
+ * @param threads The maximum number of threads.
+ * @param function The function to run for each index.
+ */
+template <typename Function>
+void parallel_for(py::ssize_t n, py::ssize_t threads, const Function& function) {
+    threads = std::max<py::ssize_t>(1, std::min(threads, n));
+
+    // Run in the calling thread if no additional threads are needed
+    if (threads == 1) {
+        for (py::ssize_t i = 0; i < n; ++i) function(i);
+        return;
+    }
+
+    std::vector<std::thread> workers;
+    for (py::ssize_t t = 0; t < threads; ++t) {
+        workers.emplace_back([&function, n, threads, t]() {
+            for (py::ssize_t i = n * t / threads; i < n * (t + 1) / threads; ++i)
+                function(i);
+        });
+    }
+    for (auto& worker : workers) worker.join();
+}
+
+/**
+ * @brief Check that two stacks have the same shape, with the given number of
+ * dimensions.
+ *
+ * @param a The first stack.
+ * @param b The second stack.
+ * @param ndim The expected number of dimensions.
+ *
+ * @throw std::runtime_error If the shapes are not valid.
+ */
+template <typename Scalar>
+void check_stacks(const Stack<Scalar>& a, const Stack<Scalar>& b,
+                  py::ssize_t ndim) {
+    if (a.ndim() != ndim || b.ndim() != ndim) {
+        throw std::runtime_error("Stacks of " + std::to_string(ndim) +
+                                 " dimensions were expected.");
+    }
+    if (!std::equal(a.shape(), a.shape() + ndim, b.shape())) {
+        throw std::runtime_error("Dimensions mismatch between the stacks.");
+    }
+}
+
+/**
+ * @brief Batched Matrix multiplication carried out by Eigen operators.
+ *
+ * @param a The first stack of (square) matrices, of shape (N, n, n).
+ * @param b The second stack of (square) matrices, of shape (N, n, n).
+ * @param threads The maximum number of threads to use.
+ *
+ * @return Stack<Scalar> The stack of products, of shape (N, n, n).
+ */
+template <typename Scalar>
+Stack<Scalar> batched_multiply_matrices(const Stack<Scalar>& a,
+                                        const Stack<Scalar>& b,
+                                        py::ssize_t threads) {
+    check_stacks(a, b, 3);
+    const py::ssize_t N = a.shape(0), n = a.shape(1), m = a.shape(2);
+    if (n != m) {
+        throw std::runtime_error(
+            "Only stacks of square matrices are allowed for multiplication.");
+    }
+
+    Stack<Scalar> out({N, n, n});
+    const Scalar* a_data = a.data();
+    const Scalar* b_data = b.data();
+    Scalar* out_data = out.mutable_data();
+
+    py::gil_scoped_release release;
+    parallel_for(N, threads, [=](py::ssize_t i) {
+        Eigen::Map<const RowMatrix<Scalar>> a_i(a_data + i * n * n, n, n);
+        Eigen::Map<const RowMatrix<Scalar>> b_i(b_data + i * n * n, n, n);
+        Eigen::Map<RowMatrix<Scalar>> out_i(out_data + i * n * n, n, n);
+        out_i.noalias() = a_i * b_i;
+    });
+
+    return out;
+}
+
+/**
+ * @brief Batched Vector multiplication (dot product) carried out by Eigen
+ * operators. As in numpy, no complex conjugate is taken.
+ *
+ * @param v The first stack of vectors, of shape (N, n).
+ * @param w The second stack of vectors, of shape (N, n).
+ * @param threads The maximum number of threads to use.
+ *
+ * @return Stack<Scalar> The dot products, of shape (N,).
+ */
+template <typename Scalar>
+Stack<Scalar> batched_multiply_vectors(const Stack<Scalar>& v,
+                                       const Stack<Scalar>& w,
+                                       py::ssize_t threads) {
+    check_stacks(v, w, 2);
+    const py::ssize_t N = v.shape(0), n = v.shape(1);
+
+    Stack<Scalar> out(N);
+    const Scalar* v_data = v.data();
+    const Scalar* w_data = w.data();
+    Scalar* out_data = out.mutable_data();
+
+    py::gil_scoped_release release;
+    parallel_for(N, threads, [=](py::ssize_t i) {
+        Eigen::Map<const Vector<Scalar>> v_i(v_data + i * n, n);
+        Eigen::Map<const Vector<Scalar>> w_i(w_data + i * n, n);
+        out_data[i] = v_i.cwiseProduct(w_i).sum();
+    });
+
+    return out;
+}
+
+/**
+ * @brief Batched addition of vectors (N, n) or matrices (N, n, m) carried out
+ * by Eigen operators.
+ *
+ * @param a The first stack.
+ * @param b The second stack.
+ * @param threads The maximum number of threads to use.
+ * @param ndim The number of dimensions of the stacks.
+ *
+ * @return Stack<Scalar> The stack of sums, of the same shape as the inputs.
+ */
+template <typename Scalar>
+Stack<Scalar> batched_add(const Stack<Scalar>& a, const Stack<Scalar>& b,
+                          py::ssize_t threads, py::ssize_t ndim) {
+    check_stacks(a, b, ndim);
+    const py::ssize_t N = a.shape(0), n = a.size() / std::max<py::ssize_t>(N, 1);
+
+    Stack<Scalar> out(std::vector<py::ssize_t>(a.shape(), a.shape() + ndim));
+    const Scalar* a_data = a.data();
+    const Scalar* b_data = b.data();
+    Scalar* out_data = out.mutable_data();
+
+    // Each item of the stacks is added as a (flat) vector
+    py::gil_scoped_release release;
+    parallel_for(N, threads, [=](py::ssize_t i) {
+        Eigen::Map<const Vector<Scalar>> a_i(a_data + i * n, n);
+        Eigen::Map<const Vector<Scalar>> b_i(b_data + i * n, n);
+        Eigen::Map<Vector<Scalar>> out_i(out_data + i * n, n);
+        out_i = a_i + b_i;
+    });
+
+    return out;
+}
+
+/**
+ * @brief Batched Vector addition carried out by Eigen operators.
+ *
+ * @param v The first stack of vectors, of shape (N, n).
+ * @param w The second stack of vectors, of shape (N, n).
+ * @param threads The maximum number of threads to use.
+ *
+ * @return Stack<Scalar> The stack of sums, of shape (N, n).
+ */
+template <typename Scalar>
+Stack<Scalar> batched_add_vectors(const Stack<Scalar>& v,
+                                  const Stack<Scalar>& w, py::ssize_t threads) {
+    return batched_add(v, w, threads, 2);
+}
+
+/**
+ * @brief Batched Matrix addition carried out by Eigen operators.
+ *
+ * @param a The first stack of matrices, of shape (N, n, m).
+ * @param b The second stack of matrices, of shape (N, n, m).
+ * @param threads The maximum number of threads to use.
+ *
+ * @return Stack<Scalar> The stack of sums, of shape (N, n, m).
+ */
+template <typename Scalar>
+Stack<Scalar> batched_add_matrices(const Stack<Scalar>& a,
+                                   const Stack<Scalar>& b,
+                                   py::ssize_t threads) {
+    return batched_add(a, b, threads, 3);
+}
+
+/**
+ * @brief Register the bindings of the matrix wrapper methods for a given type
+ * of Eigen matrix.
+ *
+ * @param m The module in which the bindings are registered.
+ */
+template <typename M>
+void def_matrix_operations(py::module_& m) {
+    m.def("add_matrices", &add_matrices<M>,
+          py::call_guard<py::gil_scoped_release>(), R"pbdoc(
+        Add two matrices
+    )pbdoc");
+
+    m.def("multiply_matrices", &multiply_matrices<M>,
+          py::call_guard<py::gil_scoped_release>(), R"pbdoc(
+        Multiply two matrices
+    )pbdoc");
+
+    m.def("add_matrices", &add_matrices_out<M>, py::arg("a"),
+          py::arg("b"), py::kw_only(), py::arg("out"),
+          py::call_guard<py::gil_scoped_release>(), R"pbdoc(
+        Add two matrices, writing the result into out
+    )pbdoc");
+
+    m.def("multiply_matrices", &multiply_matrices_out<M>, py::arg("a"),
+          py::arg("b"), py::kw_only(), py::arg("out"),
+          py::call_guard<py::gil_scoped_release>(), R"pbdoc(
+        Multiply two matrices, writing the result into out
+    )pbdoc");
+
+    m.def("add_matrices_inplace", &add_matrices_inplace<M>,
+          py::call_guard<py::gil_scoped_release>(), R"pbdoc(
+        Add a matrix into another one (a += b)
+    )pbdoc");
+}
+
+/**
+ * @brief Register the bindings of the vector wrapper methods for a given type
+ * of coefficients and inner stride.
+ *
+ * @param m The module in which the bindings are registered.
+ */
+template <typename Scalar, typename Stride>
+void def_vector_operations(py::module_& m) {
+    m.def("add_vectors", &add_vectors<Scalar, Stride>,
+          py::call_guard<py::gil_scoped_release>(), R"pbdoc(
+        Add two vectors
+    )pbdoc");
+
+    m.def("multiply_vectors", &multiply_vectors<Scalar, Stride>,
+          py::call_guard<py::gil_scoped_release>(), R"pbdoc(
+        Dot product of two vectors
+    )pbdoc");
+
+    m.def("add_vectors", &add_vectors_out<Scalar, Stride>, py::arg("v"),
+          py::arg("w"), py::kw_only(), py::arg("out"),
+          py::call_guard<py::gil_scoped_release>(), R"pbdoc(
+        Add two vectors, writing the result into out
+    )pbdoc");
+
+    m.def("add_vectors_inplace", &add_vectors_inplace<Scalar, Stride>,
+          py::call_guard<py::gil_scoped_release>(), R"pbdoc(
+        Add a vector into another one (v += w)
+    )pbdoc");
+}
+
+/**
+ * @brief Register the bindings of all wrapper methods for a given type of
+ * coefficients.
+ *
+ * @param m The module in which the bindings are registered.
+ */
+template <typename Scalar>
+void def_operations(py::module_& m) {
+    // The contiguous bindings are registered first, so that they are the ones
+    // chosen for contiguous vectors
+    def_vector_operations<Scalar, Eigen::InnerStride<1>>(m);
+    def_vector_operations<Scalar, Eigen::InnerStride<>>(m);
+
+    // The row-major bindings are registered first, so that they are the ones
+    // chosen for C-ordered matrices
+    def_matrix_operations<RowMatrix<Scalar>>(m);
+    def_matrix_operations<Matrix<Scalar>>(m);
+
+    m.def("batched_add_vectors", &batched_add_vectors<Scalar>, py::arg("v"),
+          py::arg("w"), py::arg("threads") = 1, R"pbdoc(
+        Add two stacks of vectors (N, n)
+    )pbdoc");
+
+    m.def("batched_add_matrices", &batched_add_matrices<Scalar>, py::arg("a"),
+          py::arg("b"), py::arg("threads") = 1, R"pbdoc(
+        Add two stacks of matrices (N, n, m)
+    )pbdoc");
+
+    m.def("batched_multiply_vectors", &batched_multiply_vectors<Scalar>,
+          py::arg("v"), py::arg("w"), py::arg("threads") = 1, R"pbdoc(
+        Dot products of two stacks of vectors (N, n)
+    )pbdoc");
+
+    m.def("batched_multiply_matrices", &batched_multiply_matrices<Scalar>,
+          py::arg("a"), py::arg("b"), py::arg("threads") = 1, R"pbdoc(
+        Multiply two stacks of square matrices (N, n, n)
+    )pbdoc");
+}
+
 PYBIND11_MODULE(demo_eigen_wrapper, m) {
     m.doc() = R"pbdoc(
         Pybind11 example eigen-wrapper
@@ -81,23 +620,21 @@ PYBIND11_MODULE(demo_eigen_wrapper, m) {
            add_matrices
            multiply_vectors
            add_vectors
+           add_matrices_inplace
+           add_vectors_inplace
+           batched_multiply_matrices
+           batched_add_matrices
+           batched_multiply_vectors
+           batched_add_vectors
     )pbdoc";
 
-    m.def("add_vectors", &add_vectors, R"pbdoc(
-        Add two Eigen::VectorXd
-    )pbdoc");
-
-    m.def("add_matrices", &add_matrices, R"pbdoc(
-        Add two Eigen::MatrixXd
-    )pbdoc");
-
-    m.def("multiply_vectors", &multiply_vectors, R"pbdoc(
-        Dot product of two Eigen::VectorXd
-    )pbdoc");
-
-    m.def("multiply_matrices", &multiply_matrices, R"pbdoc(
-        Multiply two Eigen::MatrixXd
-    )pbdoc");
+    // The float64 bindings are registered first, since they are the ones used
+    // whenever the input arguments need to be converted
+    def_operations<double>(m);
+    def_operations<int32_t>(m);
+    def_operations<int64_t>(m);
+    def_operations<float>(m);
+    def_operations<std::complex<double>>(m);
 
 #ifdef VERSION_INFO
     m.attr("__version__") = MACRO_STRINGIFY(VERSION_INFO);
@@ -21,8 +21,14 @@ constexpr int MAX_ELEMS_LENGTH = MAX_CHUNK_LENGTH / 8;
 
 ansys::grpc::client::GRPCClient::GRPCClient(const std::string host,
                                             const int port,
-                                            const bool debug_log)
-    : _debug_log(debug_log) {
+                                            const bool debug_log,
+                                            const int protocol_version)
+    : _debug_log(debug_log), _protocol_version(protocol_version) {
+    // Only the protocol versions 1 and 2 are handled
+    if (protocol_version != 1 && protocol_version != 2) {
+        throw std::invalid_argument("Invalid protocol version!");
+    }
+
     // Compile the host and port into the target url
     const std::string target = {host + ":" + std::to_string(port)};
 
@@ -93,7 +99,8 @@ std::vector<double> ansys::grpc::client::GRPCClient::flip_vector(
     // Create the writer for the sequenced/streamed RPC
     auto reader_writer = _stub->FlipVector(&context);
 
-    // Write the vector
+    // Write the header (if needed) and the vector
+    send_header(reader_writer, chunks, vec);
     send_vector(reader_writer, vec, chunks.at(0));
 
     // Finish sending messages
@@ -142,7 +149,8 @@ std::vector<double> ansys::grpc::client::GRPCClient::add_vectors(
     // Create the writer for the sequenced/streamed RPC
     auto reader_writer = _stub->AddVectors(&context);
 
-    // Write the two vectors
+    // Write the header (if needed) and the two vectors
+    send_header(reader_writer, chunks, vec1, vec2);
     send_vector(reader_writer, vec1, chunks.at(0));
     send_vector(reader_writer, vec2, chunks.at(1));
 
@@ -192,7 +200,8 @@ double ansys::grpc::client::GRPCClient::multiply_vectors(
     // Create the writer for the sequenced/streamed RPC
     auto reader_writer = _stub->MultiplyVectors(&context);
 
-    // Write the two vectors
+    // Write the header (if needed) and the two vectors
+    send_header(reader_writer, chunks, vec1, vec2);
     send_vector(reader_writer, vec1, chunks.at(0));
     send_vector(reader_writer, vec2, chunks.at(1));
 
@@ -243,7 +252,8 @@ std::vector<std::vector<double>> ansys::grpc::client::GRPCClient::add_matrices(
     // Create the writer for the sequenced/streamed RPC
     auto reader_writer = _stub->AddMatrices(&context);
 
-    // Write the two matrices
+    // Write the header (if needed) and the two matrices
+    send_header(reader_writer, chunks, mat1, mat2);
     send_matrix(reader_writer, mat1, chunks.at(0));
     send_matrix(reader_writer, mat2, chunks.at(1));
 
@@ -295,7 +305,8 @@ ansys::grpc::client::GRPCClient::multiply_matrices(
     // Create the writer for the sequenced/streamed RPC
     auto reader_writer = _stub->MultiplyMatrices(&context);
 
-    // Write the two matrices
+    // Write the header (if needed) and the two matrices
+    send_header(reader_writer, chunks, mat1, mat2);
     send_matrix(reader_writer, mat1, chunks.at(0));
     send_matrix(reader_writer, mat2, chunks.at(1));
 
@@ -339,10 +350,18 @@ ansys::grpc::client::GRPCClient::define_vecstream_metadata(
     // Initialize the output information
     std::vector<std::vector<int>> chunk_info{};
 
+    // With the protocol version 2, only the version is stated (the header
+    // message describes the vectors instead)
+    if (_protocol_version == 2) {
+        context->AddMetadata("protocol-version", "2");
+    }
+
     // Check whether we are sending a single vector request (i.e. flip_vector)
     // or multiple...
     if (vec2.empty()) {
-        context->AddMetadata("full-vectors", std::to_string(1));
+        if (_protocol_version == 1) {
+            context->AddMetadata("full-vectors", std::to_string(1));
+        }
 
         // Process vectors
         auto chunk1 = set_vector_metadata(context, vec1, "vec1");
@@ -350,7 +369,9 @@ ansys::grpc::client::GRPCClient::define_vecstream_metadata(
         // Return all message chunks
         return std::vector<std::vector<int>>{chunk1};
     } else {
-        context->AddMetadata("full-vectors", std::to_string(2));
+        if (_protocol_version == 1) {
+            context->AddMetadata("full-vectors", std::to_string(2));
+        }
 
         // Process vectors
         auto chunk1 = set_vector_metadata(context, vec1, "vec1");
@@ -391,9 +412,11 @@ std::vector<int> ansys::grpc::client::GRPCClient::set_vector_metadata(
         chunk_steps.push_back(size_vec);
     }
 
-    // Add the number of messages for Vector
-    context->AddMetadata(vec_name + "-messages",
-                         std::to_string(chunk_steps.size()));
+    // Add the number of messages for Vector (protocol version 1 only)
+    if (_protocol_version == 1) {
+        context->AddMetadata(vec_name + "-messages",
+                             std::to_string(chunk_steps.size()));
+    }
 
     // Return the chunked steps
     return chunk_steps;
@@ -407,8 +430,14 @@ ansys::grpc::client::GRPCClient::define_matstream_metadata(
     // Initialize the output information
     std::vector<std::vector<int>> chunk_info{};
 
-    // For matrices, we will always be sending two matrices
-    context->AddMetadata("full-matrices", std::to_string(2));
+    // For matrices, we will always be sending two matrices... With the protocol
+    // version 2, only the version is stated (the header message describes the
+    // matrices instead)
+    if (_protocol_version == 2) {
+        context->AddMetadata("protocol-version", "2");
+    } else {
+        context->AddMetadata("full-matrices", std::to_string(2));
+    }
 
     // Process vectors
     auto chunk1 = set_matrix_metadata(context, mat1, "mat1");
@@ -456,14 +485,105 @@ std::vector<int> ansys::grpc::client::GRPCClient::set_matrix_metadata(
         chunk_steps.push_back(rows_mat);
     }
 
-    // Add the number of messages for Matrix
-    context->AddMetadata(mat_name + "-messages",
-                         std::to_string(chunk_steps.size()));
+    // Add the number of messages for Matrix (protocol version 1 only)
+    if (_protocol_version == 1) {
+        context->AddMetadata(mat_name + "-messages",
+                             std::to_string(chunk_steps.size()));
+    }
 
     // Return the chunked steps
     return chunk_steps;
 }
 
+void ansys::grpc::client::GRPCClient::send_header(
+    std::unique_ptr<::grpc::ClientReaderWriter<
+        grpcdemo::Vector, grpcdemo::Vector>>& reader_writer,
+    const std::vector<std::vector<int>>& chunks,
+    const std::vector<double>& vec1, const std::vector<double>& vec2) {
+    // The header message is only sent in the protocol version 2
+    if (_protocol_version != 2) return;
+
+    // Describe each vector: type, size and amount of partial messages
+    grpcdemo::Vector request;
+    int vec_idx{0};
+    for (auto vec : {&vec1, &vec2}) {
+        if (vec_idx > 0 && vec->empty()) break;
+
+        auto operand = request.mutable_header()->add_operands();
+        operand->set_data_type(grpcdemo::DataType::DOUBLE);
+        operand->add_shape(vec->size());
+        operand->set_chunks(chunks.at(vec_idx).size());
+        vec_idx++;
+    }
+
+    // Write the message
+    reader_writer->Write(request);
+}
+
+void ansys::grpc::client::GRPCClient::send_header(
+    std::unique_ptr<::grpc::ClientReaderWriter<
+        grpcdemo::Matrix, grpcdemo::Matrix>>& reader_writer,
+    const std::vector<std::vector<int>>& chunks,
+    const std::vector<std::vector<double>>& mat1,
+    const std::vector<std::vector<double>>& mat2) {
+    // The header message is only sent in the protocol version 2
+    if (_protocol_version != 2) return;
+
+    // Describe each matrix: type, shape and amount of partial messages
+    grpcdemo::Matrix request;
+    int mat_idx{0};
+    for (auto mat : {&mat1, &mat2}) {
+        auto operand = request.mutable_header()->add_operands();
+        operand->set_data_type(grpcdemo::DataType::DOUBLE);
+        operand->add_shape(mat->size());
+        operand->add_shape(mat->begin()->size());
+        operand->set_chunks(chunks.at(mat_idx).size());
+        mat_idx++;
+    }
+
+    // Write the message
+    reader_writer->Write(request);
+}
+
+bool ansys::grpc::client::GRPCClient::uses_stream_header(
+    ::grpc::ClientContext* context) {
+    // The server answers with the protocol version 2 only if stated
+    auto md = context->GetServerInitialMetadata();
+    auto version = md.find("protocol-version");
+
+    return version != md.end() &&
+           std::string(version->second.data(), version->second.length()) ==
+               "2";
+}
+
+void ansys::grpc::client::GRPCClient::complete_chunk(
+    grpcdemo::Vector* chunk, const grpcdemo::OperandHeader& operand) {
+    // Set the data type and size provided by the header
+    chunk->set_data_type(operand.data_type());
+    chunk->set_vector_size(operand.shape(0));
+}
+
+void ansys::grpc::client::GRPCClient::complete_chunk(
+    grpcdemo::Matrix* chunk, const grpcdemo::OperandHeader& operand) {
+    // Set the data type and shape provided by the header
+    chunk->set_data_type(operand.data_type());
+    chunk->set_matrix_rows(operand.shape(0));
+    chunk->set_matrix_cols(operand.shape(1));
+}
+
+int ansys::grpc::client::GRPCClient::chunk_length(const std::string& bytes,
+                                                  grpcdemo::DataType type) {
+    // Get the step of the bytes array to interpret each type
+    switch (type) {
+        case grpcdemo::DataType::DOUBLE:
+            return bytes.size() / sizeof(double);
+        case grpcdemo::DataType::INTEGER:
+            return bytes.size() / sizeof(int);
+        default:
+            throw std::invalid_argument("Invalid chunk type!");
+    }
+}
+
 std::vector<double> ansys::grpc::client::GRPCClient::deserialize_vector(
     const std::string& bytes, const int length, grpcdemo::DataType type) {
     // Get the step of the bytes array to interpret each type
@@ -598,9 +718,11 @@ void ansys::grpc::client::GRPCClient::send_vector(
         // Initialize the message
         grpcdemo::Vector request;
 
-        // Fill in the message
-        request.set_data_type(grpcdemo::DataType::DOUBLE);
-        request.set_vector_size(vector.size());
+        // Fill in the message (only its payload, if there is a header)
+        if (_protocol_version == 1) {
+            request.set_data_type(grpcdemo::DataType::DOUBLE);
+            request.set_vector_size(vector.size());
+        }
         request.set_vector_as_chunk(
             serialize_vector(vector, processed_idx, chunk_end_idx));
 
@@ -608,7 +730,7 @@ void ansys::grpc::client::GRPCClient::send_vector(
         reader_writer->Write(request);
 
         // Update the processed idx
-        processed_idx += chunk_end_idx;
+        processed_idx = chunk_end_idx;
     }
 }
 
@@ -624,10 +746,12 @@ void ansys::grpc::client::GRPCClient::send_matrix(
         // Initialize the message
         grpcdemo::Matrix request;
 
-        // Fill in the message
-        request.set_data_type(grpcdemo::DataType::DOUBLE);
-        request.set_matrix_rows(matrix.size());
-        request.set_matrix_cols(matrix.begin()->size());
+        // Fill in the message (only its payload, if there is a header)
+        if (_protocol_version == 1) {
+            request.set_data_type(grpcdemo::DataType::DOUBLE);
+            request.set_matrix_rows(matrix.size());
+            request.set_matrix_cols(matrix.begin()->size());
+        }
         request.set_matrix_as_chunk(
             serialize_matrix(matrix, processed_rows, chunk_end_row));
 
@@ -635,7 +759,7 @@ void ansys::grpc::client::GRPCClient::send_matrix(
         reader_writer->Write(request);
 
         // Update the processed rows
-        processed_rows += chunk_end_row;
+        processed_rows = chunk_end_row;
     }
 }
 
@@ -646,48 +770,48 @@ std::vector<double> ansys::grpc::client::GRPCClient::receive_vector(
     // Get the metadata
     auto md = context->GetServerInitialMetadata();
 
-    // Determine how many Vector messages we are expecting
-    auto expected_messages = std::atoi(md.find("vec1-messages")->second.data());
-
-    // Once the client has received the metadata, let us process it
+    // With the protocol version 2, the Vector is described by the header
+    // message (i.e. the first one of the stream) instead
+    const bool with_header = uses_stream_header(context);
     grpcdemo::Vector reply;
+    grpcdemo::OperandHeader operand{};
+    if (with_header) {
+        reader_writer->Read(&reply);
+        operand = reply.header().operands(0);
+    }
+
+    // Determine how many Vector messages we are expecting
+    auto expected_messages =
+        with_header ? operand.chunks()
+                    : std::atoi(md.find("vec1-messages")->second.data());
 
     if (expected_messages == 1) {
-        // Read the single message
+        // Read the single message (and complete it, if needed)
         reader_writer->Read(&reply);
+        if (with_header) complete_chunk(&reply, operand);
 
         // Deserialize it!
         return deserialize_vector(reply.vector_as_chunk(), reply.vector_size(),
                                   reply.data_type());
     } else if (expected_messages > 1) {
-        // Multiple messages to be processed -- Get the vector elements per
-        // message / except for the last message, this has to be read from the
-        // message information: vector_size
-        std::vector<int> vector_sizes{};
-        for (int i = 1; i < expected_messages; i++) {
-            vector_sizes.push_back(MAX_ELEMS_LENGTH);
-        }
-
+        // Multiple messages to be processed -- The vector elements per message
+        // are given by the length of each chunk, since the chunk size is
+        // chosen by the server
+        //
         // Initialize certain variables
         std::vector<double> glued_vector{};
 
         // Read all incoming messages to define the full Matrix message
         for (int msg = 0; msg < expected_messages; msg++) {
-            // Read the reply
+            // Read the reply (and complete it, if needed)
             reader_writer->Read(&reply);
-
-            if (msg == 0) {
-                // First time we are reading the vectors... Load the elems to be
-                // read in the final message!
-                vector_sizes.push_back(reply.vector_size() -
-                                       (expected_messages - 1) *
-                                           MAX_ELEMS_LENGTH);
-            }
+            if (with_header) complete_chunk(&reply, operand);
 
             // Deserialize the incoming vector chunk
-            auto aux_vector =
-                deserialize_vector(reply.vector_as_chunk(),
-                                   vector_sizes.at(msg), reply.data_type());
+            auto aux_vector = deserialize_vector(
+                reply.vector_as_chunk(),
+                chunk_length(reply.vector_as_chunk(), reply.data_type()),
+                reply.data_type());
 
             // Append the aux_vector to the glued_vector
             glued_vector.insert(glued_vector.end(), aux_vector.begin(),
@@ -710,15 +834,25 @@ ansys::grpc::client::GRPCClient::receive_matrix(
     // Get the metadata
     auto md = context->GetServerInitialMetadata();
 
-    // Determine how many Vector messages we are expecting
-    auto expected_messages = std::atoi(md.find("mat1-messages")->second.data());
-
-    // Once the client has received the metadata, let us process it
+    // With the protocol version 2, the Matrix is described by the header
+    // message (i.e. the first one of the stream) instead
+    const bool with_header = uses_stream_header(context);
     grpcdemo::Matrix reply;
+    grpcdemo::OperandHeader operand{};
+    if (with_header) {
+        reader_writer->Read(&reply);
+        operand = reply.header().operands(0);
+    }
+
+    // Determine how many Matrix messages we are expecting
+    auto expected_messages =
+        with_header ? operand.chunks()
+                    : std::atoi(md.find("mat1-messages")->second.data());
 
     if (expected_messages == 1) {
-        // Read the single message
+        // Read the single message (and complete it, if needed)
         reader_writer->Read(&reply);
+        if (with_header) complete_chunk(&reply, operand);
 
         // Deserialize it!
         return deserialize_matrix(reply.matrix_as_chunk(), reply.matrix_rows(),
@@ -727,34 +861,20 @@ ansys::grpc::client::GRPCClient::receive_matrix(
         // Initialize certain variables
         std::vector<std::vector<double>> glued_matrix{};
 
-        // Multiple messages to be processed -- Get the matrix rows per
-        // message / except for the last message, this has to be read from
-        // the message information: matrix_rows
-        std::vector<int> matrix_sizes{};
-
+        // Multiple messages to be processed -- The matrix rows per message are
+        // given by the length of each chunk (made of full rows), since the
+        // chunk size is chosen by the server
         // Read all incoming messages to define the full Matrix message
         for (int msg = 0; msg < expected_messages; msg++) {
-            // Read the reply
+            // Read the reply (and complete it, if needed)
             reader_writer->Read(&reply);
-
-            if (msg == 0) {
-                // First time we are reading the matrices... Load the elems to
-                // be read in the message!
-                int max_rows_per_message =
-                    MAX_ELEMS_LENGTH / reply.matrix_cols();
-
-                for (int i = 1; i < expected_messages; i++) {
-                    matrix_sizes.push_back(max_rows_per_message);
-                }
-
-                matrix_sizes.push_back(reply.matrix_rows() -
-                                       (expected_messages - 1) *
-                                           max_rows_per_message);
-            }
+            if (with_header) complete_chunk(&reply, operand);
 
             // Deserialize the incoming matrix chunk
             auto aux_matrix = deserialize_matrix(
-                reply.matrix_as_chunk(), matrix_sizes.at(msg),
+                reply.matrix_as_chunk(),
+                chunk_length(reply.matrix_as_chunk(), reply.data_type()) /
+                    reply.matrix_cols(),
                 reply.matrix_cols(), reply.data_type());
 
             // Append the aux_matrix to the glued_vector
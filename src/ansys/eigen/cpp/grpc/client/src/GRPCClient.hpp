@@ -33,9 +33,15 @@ class GRPCClient {
      * 50000.
      * @param debug_log whether to show the enhanced debugging logs or not.
      * Default: false.
+     * @param protocol_version the version of the streaming protocol. Version 2
+     * sends a header message describing all the Vector or Matrix messages
+     * first, followed by partial messages carrying their payload only. Version
+     * 1 describes them within the metadata and every partial message instead,
+     * as servers prior to version 2 expect. Default: 2.
      */
     GRPCClient(const std::string host = std::string{"0.0.0.0"},
-               const int port = 50000, const bool debug_log = false);
+               const int port = 50000, const bool debug_log = false,
+               const int protocol_version = 2);
 
     /**
      * @brief Destroy the GRPC Client object.
@@ -116,6 +122,11 @@ class GRPCClient {
      */
     bool _debug_log;
 
+    /**
+     * @brief Version of the streaming protocol used (either 1 or 2).
+     */
+    int _protocol_version;
+
     /**
      * @brief Method in charge of defining the Client Metadata in the
      * bidirectional stream transfer of Vector messages.
@@ -170,6 +181,77 @@ class GRPCClient {
         const std::vector<std::vector<double>>& mat,
         const std::string& mat_name);
 
+    /**
+     * @brief Method in charge of sending the header message describing all the
+     * Vector messages to be streamed (only in the protocol version 2).
+     *
+     * @param reader_writer the writer used for streaming the messages.
+     * @param chunks the chunks of each Vector to be streamed.
+     * @param vec1 the vector to be transmitted.
+     * @param vec2 (optional) the second vector to be transmitted.
+     */
+    void send_header(std::unique_ptr<::grpc::ClientReaderWriter<
+                         grpcdemo::Vector, grpcdemo::Vector>>& reader_writer,
+                     const std::vector<std::vector<int>>& chunks,
+                     const std::vector<double>& vec1,
+                     const std::vector<double>& vec2 = {});
+
+    /**
+     * @brief Method in charge of sending the header message describing all the
+     * Matrix messages to be streamed (only in the protocol version 2).
+     *
+     * @param reader_writer the writer used for streaming the messages.
+     * @param chunks the chunks of each Matrix to be streamed.
+     * @param mat1 the first matrix to be transmitted.
+     * @param mat2 the second matrix to be transmitted.
+     */
+    void send_header(std::unique_ptr<::grpc::ClientReaderWriter<
+                         grpcdemo::Matrix, grpcdemo::Matrix>>& reader_writer,
+                     const std::vector<std::vector<int>>& chunks,
+                     const std::vector<std::vector<double>>& mat1,
+                     const std::vector<std::vector<double>>& mat2);
+
+    /**
+     * @brief Method in charge of determining whether the server answers with
+     * the protocol version 2, in which streams start with a header message.
+     *
+     * @param context the gRPC context.
+     * @return bool
+     */
+    bool uses_stream_header(::grpc::ClientContext* context);
+
+    /**
+     * @brief Method in charge of completing a partial Vector message, which
+     * only carries its payload in the protocol version 2, with the description
+     * provided by the header message.
+     *
+     * @param chunk the partial Vector message to be completed.
+     * @param operand the description of the full Vector message.
+     */
+    void complete_chunk(grpcdemo::Vector* chunk,
+                        const grpcdemo::OperandHeader& operand);
+
+    /**
+     * @brief Method in charge of completing a partial Matrix message, which
+     * only carries its payload in the protocol version 2, with the description
+     * provided by the header message.
+     *
+     * @param chunk the partial Matrix message to be completed.
+     * @param operand the description of the full Matrix message.
+     */
+    void complete_chunk(grpcdemo::Matrix* chunk,
+                        const grpcdemo::OperandHeader& operand);
+
+    /**
+     * @brief Method used to determine the amount of elements within a chunk,
+     * whichever the chunk size chosen by the server.
+     *
+     * @param bytes the chunk of bytes received.
+     * @param type the type of data inside the chunk (e.g. double, int...).
+     * @return int
+     */
+    int chunk_length(const std::string& bytes, grpcdemo::DataType type);
+
     /**
      * @brief Method used to deserialize a Vector message into an
      *  std::vector<double> object.
@@ -289,6 +289,19 @@ ansys::grpc::service::GRPCService::~GRPCService() {
 // GRPCService PRIVATE METHODS
 // ============================================================================
 
+int ansys::grpc::service::GRPCService::chunk_length(
+    const std::string& bytes, grpcdemo::DataType type) {
+    // Get the step of the bytes array to interpret each type
+    switch (type) {
+        case grpcdemo::DataType::DOUBLE:
+            return bytes.size() / sizeof(double);
+        case grpcdemo::DataType::INTEGER:
+            return bytes.size() / sizeof(int);
+        default:
+            throw std::invalid_argument("Invalid chunk type!");
+    }
+}
+
 Eigen::VectorXd ansys::grpc::service::GRPCService::deserialize_vector(
     const std::string& bytes, const int length, grpcdemo::DataType type) {
     // Get the step of the bytes array to interpret each type
@@ -398,6 +411,33 @@ std::string ansys::grpc::service::GRPCService::serialize_matrix(
     return mat_as_str;
 }
 
+bool ansys::grpc::service::GRPCService::uses_stream_header(
+    ::grpc::ServerContext* context) {
+    // The protocol version 2 has to be stated by the client... Otherwise, the
+    // protocol version 1 is used
+    auto md = context->client_metadata();
+    auto version = md.find("protocol-version");
+
+    return version != md.end() &&
+           std::string(version->second.data(), version->second.length()) ==
+               "2";
+}
+
+void ansys::grpc::service::GRPCService::complete_chunk(
+    grpcdemo::Vector* chunk, const grpcdemo::OperandHeader& operand) {
+    // Set the data type and size provided by the header
+    chunk->set_data_type(operand.data_type());
+    chunk->set_vector_size(operand.shape(0));
+}
+
+void ansys::grpc::service::GRPCService::complete_chunk(
+    grpcdemo::Matrix* chunk, const grpcdemo::OperandHeader& operand) {
+    // Set the data type and shape provided by the header
+    chunk->set_data_type(operand.data_type());
+    chunk->set_matrix_rows(operand.shape(0));
+    chunk->set_matrix_cols(operand.shape(1));
+}
+
 std::vector<Eigen::VectorXd> ansys::grpc::service::GRPCService::receive_vectors(
     ::grpc::ServerReaderWriter<grpcdemo::Vector, grpcdemo::Vector>*
         reader_writer,
@@ -405,16 +445,30 @@ std::vector<Eigen::VectorXd> ansys::grpc::service::GRPCService::receive_vectors(
     // Get the metadata
     auto md = context->client_metadata();
 
+    // With the protocol version 2, the full Vector messages are described by
+    // the header message (i.e. the first one of the stream) instead
+    const bool with_header = uses_stream_header(context);
+    grpcdemo::StreamHeader header{};
+    if (with_header) {
+        grpcdemo::Vector header_msg;
+        reader_writer->Read(&header_msg);
+        header = header_msg.header();
+    }
+
     // Determine how many full Vector messages we are expecting
-    auto expected_vectors = std::atoi(md.find("full-vectors")->second.data());
+    auto expected_vectors =
+        with_header ? header.operands_size()
+                    : std::atoi(md.find("full-vectors")->second.data());
     std::vector<Eigen::VectorXd> result_vectors{};
 
     // Now, let us process vector by vector
     for (int vec_i = 1; vec_i <= expected_vectors; ++vec_i) {
         // Find the expected amount of messages for the full Vector
         auto expected_messages =
-            std::atoi(md.find("vec" + std::to_string(vec_i) + "-messages")
-                          ->second.data());
+            with_header
+                ? header.operands(vec_i - 1).chunks()
+                : std::atoi(md.find("vec" + std::to_string(vec_i) + "-messages")
+                                ->second.data());
 
         // Once the server has processed the metadata for this full Vector, let
         // us deserialize it
@@ -423,8 +477,10 @@ std::vector<Eigen::VectorXd> ansys::grpc::service::GRPCService::receive_vectors(
         // Depending on whether it is a multi-message Vector or a single
         // message, proceed as defined
         if (expected_messages == 1) {
-            // Read the single message
+            // Read the single message (and complete it, if needed)
             reader_writer->Read(&request);
+            if (with_header)
+                complete_chunk(&request, header.operands(vec_i - 1));
 
             // Deserialize the vector
             auto vec =
@@ -435,35 +491,26 @@ std::vector<Eigen::VectorXd> ansys::grpc::service::GRPCService::receive_vectors(
             result_vectors.push_back(vec);
 
         } else if (expected_messages > 1) {
-            // Multiple messages to be processed -- Get the vector elements per
-            // message / except for the last message, this has to be read from
-            // the message information: vector_size
-            std::vector<int> vector_sizes{};
-            for (int i = 1; i < expected_messages; i++) {
-                vector_sizes.push_back(MAX_ELEMS_LENGTH);
-            }
-
+            // Multiple messages to be processed -- The vector elements per
+            // message are given by the length of each chunk, since the chunk
+            // size is chosen by the client
+            //
             // Initialize certain variables
             Eigen::VectorXd glued_vector{};
 
             // Read all incoming messages to define the full Vector message
             for (int msg = 0; msg < expected_messages; msg++) {
-                // Read the request
+                // Read the request (and complete it, if needed)
                 reader_writer->Read(&request);
-
-                // Check if it is the first message processed of the chunk
-                if (msg == 0) {
-                    // First time we are reading the vectors... Load the elems
-                    // to be read in the final message!
-                    vector_sizes.push_back(request.vector_size() -
-                                           (expected_messages - 1) *
-                                               MAX_ELEMS_LENGTH);
-                }
+                if (with_header)
+                    complete_chunk(&request, header.operands(vec_i - 1));
 
                 // Deserialize the incoming vector chunk
-                auto aux_vector = deserialize_vector(request.vector_as_chunk(),
-                                                     vector_sizes.at(msg),
-                                                     request.data_type());
+                auto aux_vector = deserialize_vector(
+                    request.vector_as_chunk(),
+                    chunk_length(request.vector_as_chunk(),
+                                 request.data_type()),
+                    request.data_type());
 
                 // Append the aux_vector to the glued_vector
                 if (glued_vector.size() == 0) {
@@ -492,16 +539,30 @@ ansys::grpc::service::GRPCService::receive_matrices(
     // Get the metadata
     auto md = context->client_metadata();
 
+    // With the protocol version 2, the full Matrix messages are described by
+    // the header message (i.e. the first one of the stream) instead
+    const bool with_header = uses_stream_header(context);
+    grpcdemo::StreamHeader header{};
+    if (with_header) {
+        grpcdemo::Matrix header_msg;
+        reader_writer->Read(&header_msg);
+        header = header_msg.header();
+    }
+
     // Determine how many full Matrix messages we are expecting
-    auto expected_matrices = std::atoi(md.find("full-matrices")->second.data());
+    auto expected_matrices =
+        with_header ? header.operands_size()
+                    : std::atoi(md.find("full-matrices")->second.data());
     std::vector<Eigen::MatrixXd> result_matrices{};
 
     // Now, let us process matrix by matrix
     for (int mat_i = 1; mat_i <= expected_matrices; ++mat_i) {
         // Find the expected amount of messages for the full Matrix
         auto expected_messages =
-            std::atoi(md.find("mat" + std::to_string(mat_i) + "-messages")
-                          ->second.data());
+            with_header
+                ? header.operands(mat_i - 1).chunks()
+                : std::atoi(md.find("mat" + std::to_string(mat_i) + "-messages")
+                                ->second.data());
 
         // Once the server has processed the metadata for this full Vector, let
         // us deserialize it
@@ -510,8 +571,10 @@ ansys::grpc::service::GRPCService::receive_matrices(
         // Depending on whether it is a multi-message Matrix or a single
         // message, proceed as defined
         if (expected_messages == 1) {
-            // Read the single message
+            // Read the single message (and complete it, if needed)
             reader_writer->Read(&request);
+            if (with_header)
+                complete_chunk(&request, header.operands(mat_i - 1));
 
             // Deserialize the matrix
             auto mat = deserialize_matrix(
@@ -525,35 +588,22 @@ ansys::grpc::service::GRPCService::receive_matrices(
             // Initialize certain variables
             Eigen::MatrixXd glued_matrix{};
 
-            // Multiple messages to be processed -- Get the matrix rows per
-            // message / except for the last message, this has to be read from
-            // the message information: matrix_rows
-            std::vector<int> matrix_sizes{};
-
+            // Multiple messages to be processed -- The matrix rows per message
+            // are given by the length of each chunk (made of full rows), since
+            // the chunk size is chosen by the client
             // Read all incoming messages to define the full Matrix message
             for (int msg = 0; msg < expected_messages; msg++) {
-                // Read the request
+                // Read the request (and complete it, if needed)
                 reader_writer->Read(&request);
-
-                // Check if it is the first message processed of the chunk
-                if (msg == 0) {
-                    // First time we are reading the matrices... Load the elems
-                    // to be read in the message!
-                    int max_rows_per_message =
-                        MAX_ELEMS_LENGTH / request.matrix_cols();
-
-                    for (int i = 1; i < expected_messages; i++) {
-                        matrix_sizes.push_back(max_rows_per_message);
-                    }
-
-                    matrix_sizes.push_back(request.matrix_rows() -
-                                           (expected_messages - 1) *
-                                               max_rows_per_message);
-                }
+                if (with_header)
+                    complete_chunk(&request, header.operands(mat_i - 1));
 
                 // Deserialize the incoming matrix chunk
                 auto aux_matrix = deserialize_matrix(
-                    request.matrix_as_chunk(), matrix_sizes.at(msg),
+                    request.matrix_as_chunk(),
+                    chunk_length(request.matrix_as_chunk(),
+                                 request.data_type()) /
+                        request.matrix_cols(),
                     request.matrix_cols(), request.data_type());
 
                 // Append the aux_matrix to the glued_matrix
@@ -607,10 +657,23 @@ void ansys::grpc::service::GRPCService::send_vector(
         chunk_steps.push_back(size_vec);
     }
 
-    // Let us create the metadata for our response
-    context->AddInitialMetadata("full-vectors", std::to_string(1));
-    context->AddInitialMetadata("vec1-messages",
-                                std::to_string(chunk_steps.size()));
+    // Let us create the metadata for our response... With the protocol version
+    // 2, the Vector is described by the header message (sent first) instead
+    const bool with_header = uses_stream_header(context);
+    if (with_header) {
+        context->AddInitialMetadata("protocol-version", "2");
+
+        grpcdemo::Vector header_msg;
+        auto operand = header_msg.mutable_header()->add_operands();
+        operand->set_data_type(grpcdemo::DataType::DOUBLE);
+        operand->add_shape(size_vec);
+        operand->set_chunks(chunk_steps.size());
+        reader_writer->Write(header_msg);
+    } else {
+        context->AddInitialMetadata("full-vectors", std::to_string(1));
+        context->AddInitialMetadata("vec1-messages",
+                                    std::to_string(chunk_steps.size()));
+    }
 
     // Loop over the needed chunks --> This will define how many Vector messages
     // are needed for casting the entire Vector message
@@ -619,9 +682,11 @@ void ansys::grpc::service::GRPCService::send_vector(
         // Initialize the message
         grpcdemo::Vector request;
 
-        // Fill in the message
-        request.set_data_type(grpcdemo::DataType::DOUBLE);
-        request.set_vector_size(size_vec);
+        // Fill in the message (only its payload, if there is a header)
+        if (!with_header) {
+            request.set_data_type(grpcdemo::DataType::DOUBLE);
+            request.set_vector_size(size_vec);
+        }
         request.set_vector_as_chunk(
             serialize_vector(vector, processed_idx, chunk_end_idx));
 
@@ -629,7 +694,7 @@ void ansys::grpc::service::GRPCService::send_vector(
         reader_writer->Write(request);
 
         // Update the processed idx
-        processed_idx += chunk_end_idx;
+        processed_idx = chunk_end_idx;
     }
 }
 
@@ -671,10 +736,24 @@ void ansys::grpc::service::GRPCService::send_matrix(
         chunk_steps.push_back(rows_mat);
     }
 
-    // Let us create the metadata for our response
-    context->AddInitialMetadata("full-matrices", std::to_string(1));
-    context->AddInitialMetadata("mat1-messages",
-                                std::to_string(chunk_steps.size()));
+    // Let us create the metadata for our response... With the protocol version
+    // 2, the Matrix is described by the header message (sent first) instead
+    const bool with_header = uses_stream_header(context);
+    if (with_header) {
+        context->AddInitialMetadata("protocol-version", "2");
+
+        grpcdemo::Matrix header_msg;
+        auto operand = header_msg.mutable_header()->add_operands();
+        operand->set_data_type(grpcdemo::DataType::DOUBLE);
+        operand->add_shape(rows_mat);
+        operand->add_shape(cols_mat);
+        operand->set_chunks(chunk_steps.size());
+        reader_writer->Write(header_msg);
+    } else {
+        context->AddInitialMetadata("full-matrices", std::to_string(1));
+        context->AddInitialMetadata("mat1-messages",
+                                    std::to_string(chunk_steps.size()));
+    }
 
     // Loop over the needed chunks --> This will define how many Matrix messages
     // are needed for casting the entire Matrix message
@@ -683,10 +762,12 @@ void ansys::grpc::service::GRPCService::send_matrix(
         // Initialize the message
         grpcdemo::Matrix request;
 
-        // Fill in the message
-        request.set_data_type(grpcdemo::DataType::DOUBLE);
-        request.set_matrix_rows(rows_mat);
-        request.set_matrix_cols(cols_mat);
+        // Fill in the message (only its payload, if there is a header)
+        if (!with_header) {
+            request.set_data_type(grpcdemo::DataType::DOUBLE);
+            request.set_matrix_rows(rows_mat);
+            request.set_matrix_cols(cols_mat);
+        }
         request.set_matrix_as_chunk(
             serialize_matrix(matrix, processed_idx, chunk_end_idx));
 
@@ -694,7 +775,7 @@ void ansys::grpc::service::GRPCService::send_matrix(
         reader_writer->Write(request);
 
         // Update the processed idx
-        processed_idx += chunk_end_idx;
+        processed_idx = chunk_end_idx;
     }
 }
 // ============================================================================
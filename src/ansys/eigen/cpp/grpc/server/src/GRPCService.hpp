@@ -111,6 +111,16 @@ class GRPCService final : public grpcdemo::GRPCDemo::Service {
      */
     bool _debug_log;
 
+    /**
+     * @brief Method used to determine the amount of elements within a chunk,
+     * whichever the chunk size chosen by the client.
+     *
+     * @param bytes the chunk of bytes received.
+     * @param type the type of data inside the chunk (e.g. double, int...).
+     * @return int
+     */
+    int chunk_length(const std::string& bytes, grpcdemo::DataType type);
+
     /**
      * @brief Method used to deserialize a Vector message into an
      * Eigen::VectorXd object.
@@ -160,6 +170,38 @@ class GRPCService final : public grpcdemo::GRPCDemo::Service {
     std::string serialize_matrix(const Eigen::MatrixXd& matrix, const int start,
                                  const int end);
 
+    /**
+     * @brief Method in charge of determining whether the client uses the
+     * protocol version 2, in which streams start with a header message
+     * describing all the Vector or Matrix messages sent.
+     *
+     * @param context the gRPC context.
+     * @return bool
+     */
+    bool uses_stream_header(::grpc::ServerContext* context);
+
+    /**
+     * @brief Method in charge of completing a partial Vector message, which
+     * only carries its payload in the protocol version 2, with the description
+     * provided by the header message.
+     *
+     * @param chunk the partial Vector message to be completed.
+     * @param operand the description of the full Vector message.
+     */
+    void complete_chunk(grpcdemo::Vector* chunk,
+                        const grpcdemo::OperandHeader& operand);
+
+    /**
+     * @brief Method in charge of completing a partial Matrix message, which
+     * only carries its payload in the protocol version 2, with the description
+     * provided by the header message.
+     *
+     * @param chunk the partial Matrix message to be completed.
+     * @param operand the description of the full Matrix message.
+     */
+    void complete_chunk(grpcdemo::Matrix* chunk,
+                        const grpcdemo::OperandHeader& operand);
+
     /**
      * @brief Method in charge of providing a set of Eigen::VectorXd objects
      * from a stream of Vector messages.
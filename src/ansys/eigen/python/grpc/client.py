@@ -1,5 +1,14 @@
 """Python implementation of the gRPC API Eigen Example client."""
 
+import asyncio
+import collections
+from concurrent import futures
+import contextvars
+import itertools
+import queue
+import threading
+import time
+
 import grpc
 import numpy as np
 
@@ -11,7 +20,19 @@ import ansys.eigen.python.grpc.generated.grpcdemo_pb2_grpc as grpcdemo_pb2_grpc
 class DemoGRPCClient:
     """Provides the API Eigen Example client class for interacting via gRPC."""
 
-    def __init__(self, ip="127.0.0.1", port=50051, timeout=1, test=None):
+    def __init__(
+        self,
+        ip="127.0.0.1",
+        port=50051,
+        timeout=1,
+        protocol_version=constants.PROTOCOL_VERSION,
+        compression=None,
+        chunk_size=constants.MAX_CHUNKSIZE,
+        max_message_length=constants.MAX_MESSAGE_LENGTH,
+        transport_dtype=None,
+        compute_dtype="float64",
+        test=None,
+    ):
         """Initialize connection to the API Eigen server.
 
         Parameters
@@ -22,6 +43,32 @@ class DemoGRPCClient:
             Port to connect to. The default is 50051.
         timeout : int, optional
             Number of seconds to wait before returning a timeout in the connection. The default is 1.
+        protocol_version : int, optional
+            Version of the streaming protocol. Version 2 sends a header message describing
+            all vectors or matrices first, followed by chunk messages with their payload only.
+            Version 1 describes them within the metadata and every chunk message instead,
+            as servers prior to version 2 expect. The default is ``constants.PROTOCOL_VERSION``.
+        compression : str, optional
+            Compression algorithm of the streamed messages, both sent and received. Options
+            are the keys of ``constants.COMPRESSIONS``. Small or incompressible messages are
+            never compressed. The default is ``None``, meaning that the messages sent are not
+            compressed, and the ones received are compressed as the server decides.
+        chunk_size : int or str, optional
+            Maximum amount of bytes per chunk of the streamed messages, both sent and
+            received (the server is requested to use it). ``"auto"`` tunes it from the
+            throughput measured in recent calls. The default is ``constants.MAX_CHUNKSIZE``.
+        max_message_length : int, optional
+            Maximum length of the messages sent and received by the channel. Raising it
+            (on both ends) allows for larger chunks, and for sending larger operands within
+            a single message. The default is ``constants.MAX_MESSAGE_LENGTH``.
+        transport_dtype : str, optional
+            Reduced precision with which to transmit floating-point operands and results.
+            Options are the keys of ``constants.TRANSPORT_DTYPES``. Results are returned
+            as float64 anyway. The default is ``None``, meaning no reduction.
+        compute_dtype : str, optional
+            Precision with which the server computes over operands transmitted with a
+            reduced precision. Options are the keys of ``constants.COMPUTE_DTYPES``.
+            The default is ``"float64"``.
         test : object, optional
             Test GRPCDemoStub to connect to. The default is ``None``. This argument is only intended for test purposes.
 
@@ -30,15 +77,25 @@ class DemoGRPCClient:
         IOError
             Error if the client was unable to connect to the server.
         """
-        # For test purposes, provide a stub directly
+        # Operations with small operands are performed by unary calls (while available)
+        self._unary_calls = True
+        self._protocol_version = self._check_protocol_version(protocol_version)
+        self.compression = compression
+        self._configure_chunks(chunk_size, max_message_length)
+        self._configure_transport(transport_dtype, compute_dtype)
+
+        # For test purposes, provide a stub directly (there is no channel then)
         if test is not None:
+            self.channel = None
             self._stub = test
             return
 
         self._stub = None
         self._channel_str = "%s:%d" % (ip, port)
 
-        self.channel = grpc.insecure_channel(self._channel_str)
+        self.channel = grpc.insecure_channel(
+            self._channel_str, options=self._channel_options()
+        )
 
         # Verify connection
         try:
@@ -55,6 +112,28 @@ class DemoGRPCClient:
     # PUBLIC METHODS for Client operations
     # =================================================================================================
 
+    @property
+    def compression(self):
+        """Compression algorithm of the streamed messages, which can be changed between calls."""
+        return self._compression
+
+    @compression.setter
+    def compression(self, compression):
+        # Check the compression algorithm (as if selecting it for an empty message)
+        if compression is not None:
+            constants.select_compression(compression)
+        self._compression = compression
+
+    @property
+    def transport_error(self):
+        """Maximum relative error introduced by the reduced-precision transport in the
+        last operation, on both its operands and its result (``None`` without reduction).
+
+        Each thread (or asyncio task) sees the error of the last operation that it performed
+        (or submitted, within a session), regardless of concurrent operations.
+        """
+        return self._transport_error.get()
+
     def request_greeting(self, name):
         """Method that requests a greeting from the server.
 
@@ -85,17 +164,21 @@ class DemoGRPCClient:
         numpy.ndarray
             Flipped vector.
         """
-        # Generate the metadata and the amount of chunks per vector
+        # Small operands are sent within a single message, in a unary call (unless the
+        # server does not provide it)
+        self._check_operands("vectors", "vec", vector)
+        if self._use_unary_call(vector):
+            result = self._call_unary(self._stub.FlipVectorUnary, "vectors", vector)
+            if result is not None:
+                return result
+
+        # Otherwise, generate the metadata and the amount of chunks per vector
         md, chunks = self._generate_md("vectors", "vec", vector)
 
-        # Build the stream (i.e. generator)
-        vector_gen = self._generate_vector_stream(chunks, vector)
-
-        # Call the server method and retrieve the result
-        response_iterator = self._stub.FlipVector(vector_gen, metadata=md)
-
-        # Now, convert to a numpy.ndarray to continue nominal operations (outside the client)
-        nparray = self._read_nparray_from_vector(response_iterator)
+        # Call the server method with the stream (i.e. generator) and retrieve the result
+        nparray = self._call_stream(
+            self._stub.FlipVector, "vectors", md, chunks, vector
+        )
 
         # Return only the first element (expecting a single vector)
         return nparray[0]
@@ -108,17 +191,19 @@ class DemoGRPCClient:
         numpy.ndarray
             Result of the given numpy.ndarrays.
         """
-        # Generate the metadata and the amount of chunks per vector
+        # Small operands are sent within a single message, in a unary call (unless the
+        # server does not provide it)
+        self._check_operands("vectors", "vec", *args)
+        if self._use_unary_call(*args):
+            result = self._call_unary(self._stub.AddVectorsUnary, "vectors", *args)
+            if result is not None:
+                return result
+
+        # Otherwise, generate the metadata and the amount of chunks per vector
         md, chunks = self._generate_md("vectors", "vec", *args)
 
-        # Build the stream (i.e. generator)
-        vector_iterator = self._generate_vector_stream(chunks, *args)
-
-        # Call the server method and retrieve the result
-        response_iterator = self._stub.AddVectors(vector_iterator, metadata=md)
-
-        # Now, convert to a numpy.ndarray to continue nominal operations (outside the client)
-        nparray = self._read_nparray_from_vector(response_iterator)
+        # Call the server method with the stream (i.e. generator) and retrieve the result
+        nparray = self._call_stream(self._stub.AddVectors, "vectors", md, chunks, *args)
 
         # Return only the first element (expecting a single vector)
         return nparray[0]
@@ -131,17 +216,21 @@ class DemoGRPCClient:
         numpy.ndarray
             Result of the multiplication of numpy.ndarray vectors. Despite returning a numpy.ndarray, the result only contains one value because it is a dot product.
         """
-        # Generate the metadata and the amount of chunks per vector
+        # Small operands are sent within a single message, in a unary call (unless the
+        # server does not provide it)
+        self._check_operands("vectors", "vec", *args)
+        if self._use_unary_call(*args, result_shape=(1,)):
+            result = self._call_unary(self._stub.MultiplyVectorsUnary, "vectors", *args)
+            if result is not None:
+                return result
+
+        # Otherwise, generate the metadata and the amount of chunks per vector
         md, chunks = self._generate_md("vectors", "vec", *args)
 
-        # Build the stream (generator)
-        vector_iterator = self._generate_vector_stream(chunks, *args)
-
-        # Call the server method and retrieve the result
-        response_iterator = self._stub.MultiplyVectors(vector_iterator, metadata=md)
-
-        # Convert to a numpy.ndarray to continue nominal operations (outside the client)
-        nparray = self._read_nparray_from_vector(response_iterator)
+        # Call the server method with the stream (i.e. generator) and retrieve the result
+        nparray = self._call_stream(
+            self._stub.MultiplyVectors, "vectors", md, chunks, *args
+        )
 
         # Return only the first element (expecting a single vector)
         return nparray[0]
@@ -154,17 +243,21 @@ class DemoGRPCClient:
         numpy.ndarray
             Resulting numpy.ndarray of the matrices addition.
         """
-        # Generate the metadata and the amount of chunks per Matrix
+        # Small operands are sent within a single message, in a unary call (unless the
+        # server does not provide it)
+        self._check_operands("matrices", "mat", *args)
+        if self._use_unary_call(*args):
+            result = self._call_unary(self._stub.AddMatricesUnary, "matrices", *args)
+            if result is not None:
+                return result
+
+        # Otherwise, generate the metadata and the amount of chunks per Matrix
         md, chunks = self._generate_md("matrices", "mat", *args)
 
-        # Build the stream (i.e. generator)
-        matrix_iterator = self._generate_matrix_stream(chunks, *args)
-
-        # Call the server method and retrieve the result
-        response_iterator = self._stub.AddMatrices(matrix_iterator, metadata=md)
-
-        # Now, convert to a numpy.ndarray to continue nominal operations (outside the client)
-        nparray = self._read_nparray_from_matrix(response_iterator)
+        # Call the server method with the stream (i.e. generator) and retrieve the result
+        nparray = self._call_stream(
+            self._stub.AddMatrices, "matrices", md, chunks, *args
+        )
 
         # Return only the first element (expecting a single matrix)
         return nparray[0]
@@ -177,85 +270,568 @@ class DemoGRPCClient:
         numpy.ndarray
             Resulting numpy.ndarray of the matrices' multiplication.
         """
-        # Generate the metadata and the amount of chunks per matrix
+        # Small operands are sent within a single message, in a unary call (unless the
+        # server does not provide it)
+        self._check_operands("matrices", "mat", *args)
+        if self._use_unary_call(*args):
+            result = self._call_unary(
+                self._stub.MultiplyMatricesUnary, "matrices", *args
+            )
+            if result is not None:
+                return result
+
+        # Otherwise, generate the metadata and the amount of chunks per matrix
         md, chunks = self._generate_md("matrices", "mat", *args)
 
-        # Build the stream (i.e. generator)
-        matrix_iterator = self._generate_matrix_stream(chunks, *args)
+        # Call the server method with the stream (i.e. generator) and retrieve the result
+        nparray = self._call_stream(
+            self._stub.MultiplyMatrices, "matrices", md, chunks, *args
+        )
+
+        # Return only the first element (expecting a single matrix)
+        return nparray[0]
+
+    def batched_operation(self, operation, *args, threads=1):
+        """Perform an operation over two stacks of vectors or matrices using the Eigen library on the server side.
+
+        Parameters
+        ----------
+        operation : str
+            Operation to perform over each pair of stacked items. Options are
+            ``add_vectors``, ``multiply_vectors``, ``add_matrices`` and ``multiply_matrices``.
+        *args : numpy.ndarray
+            Stacks of vectors, of shape (N, n), or of matrices, of shape (N, n, m).
+        threads : int, optional
+            Number of threads that the server may use for performing the operation.
+            The default is 1.
+
+        Returns
+        -------
+        numpy.ndarray
+            Stack of results: of shape (N,) for the dot products, and of the shape of the
+            given stacks otherwise.
+        """
+        # Generate the metadata, the stacks (as matrices) and the amount of chunks per stack
+        md, chunks, stacks = self._generate_batch_md(operation, threads, *args)
+
+        # Call the server method with the stream (i.e. generator) and retrieve the result
+        nparray = self._call_stream(
+            self._stub.BatchedOperation, "matrices", md, chunks, *stacks
+        )
+
+        # Return only the first element (expecting a single stack)
+        return self._unstack_batch(operation, args[0], nparray[0])
+
+    def upload(self, array):
+        """Store a numpy.ndarray vector or matrix on the server side.
+
+        Stored arrays can then be operated by their handle, without being sent again, by
+        means of ``operate_vectors`` and ``operate_matrices``. The server may evict them
+        (least recently used first) if it runs out of room for new ones.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            Vector or matrix to store.
+
+        Returns
+        -------
+        str
+            Handle to the stored array.
+        """
+        # Generate the metadata and the stream (i.e. generator)
+        errors = []
+        method, md, stream = self._generate_upload(array, errors)
+
+        # Call the server method and retrieve the handle (only the array sent is reduced)
+        handle = method(
+            stream, metadata=md, compression=self._request_compression(array)
+        )
+        self._set_transport_error(errors, [])
+
+        return handle.id
+
+    def release(self, handle):
+        """Release a numpy.ndarray vector or matrix stored on the server side.
+
+        Parameters
+        ----------
+        handle : str
+            Handle to the stored array.
+
+        Returns
+        -------
+        bool
+            ``True`` if the array was stored, ``False`` otherwise (for example, if it
+            was already released or evicted).
+        """
+        return self._stub.ReleaseHandle(grpcdemo_pb2.Handle(id=handle)).released
+
+    def operate_vectors(self, operation, *args):
+        """Perform an operation over numpy.ndarray vectors, or handles to stored vectors, using the Eigen library on the server side.
+
+        Parameters
+        ----------
+        operation : str
+            Operation to perform. Options are ``flip``, ``add`` and ``multiply``.
+        *args : numpy.ndarray or str
+            Vectors, which are sent, or handles to vectors stored with ``upload``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Result of the operation.
+        """
+        # Generate the metadata and the amount of chunks per vector sent
+        md, chunks, inline = self._generate_operate_md(
+            "vectors", "vec", operation, *args
+        )
+
+        # Call the server method with the stream (i.e. generator) and retrieve the result
+        nparray = self._call_stream(
+            self._stub.OperateVectors, "vectors", md, chunks, *inline
+        )
 
-        # Call the server method and retrieve the result
-        response_iterator = self._stub.MultiplyMatrices(matrix_iterator, metadata=md)
+        # Return only the first element (expecting a single vector)
+        return nparray[0]
+
+    def operate_matrices(self, operation, *args):
+        """Perform an operation over numpy.ndarray matrices, or handles to stored matrices, using the Eigen library on the server side.
+
+        Parameters
+        ----------
+        operation : str
+            Operation to perform. Options are ``add`` and ``multiply``.
+        *args : numpy.ndarray or str
+            Matrices, which are sent, or handles to matrices stored with ``upload``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Result of the operation.
+        """
+        # Generate the metadata and the amount of chunks per matrix sent
+        md, chunks, inline = self._generate_operate_md(
+            "matrices", "mat", operation, *args
+        )
 
-        # Convert to a numpy.ndarray to continue nominal operations (outside the client)
-        nparray = self._read_nparray_from_matrix(response_iterator)
+        # Call the server method with the stream (i.e. generator) and retrieve the result
+        nparray = self._call_stream(
+            self._stub.OperateMatrices, "matrices", md, chunks, *inline
+        )
 
         # Return only the first element (expecting a single matrix)
         return nparray[0]
 
+    def pipeline(self):
+        """Start building a pipeline, which is evaluated on the server side in a single call.
+
+        Returns
+        -------
+        Pipeline
+            Empty pipeline, evaluated by this client.
+        """
+        return Pipeline(self)
+
+    def evaluate_pipeline(self, pipeline, *outputs):
+        """Evaluate a pipeline using the Eigen library on the server side.
+
+        Only the operations needed for the outputs are performed, and only the outputs
+        are sent back: intermediate results remain on the server side.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Pipeline to evaluate.
+        *outputs : int
+            Values of the pipeline to send back.
+
+        Returns
+        -------
+        list of numpy.ndarray
+            Requested outputs, in order.
+        """
+        # Generate the metadata (with the pipeline), the operands and the chunks per operand
+        md, chunks, operands = self._generate_pipeline_md(pipeline, *outputs)
+
+        # Call the server method with the stream (i.e. generator) and retrieve the result
+        nparray = self._call_stream(
+            self._stub.Pipeline, "matrices", md, chunks, *operands
+        )
+
+        # Recover the vectors among the outputs
+        return pipeline._unpack(outputs, nparray)
+
+    def session(self):
+        """Open a session, which performs several operations over a long-lived stream.
+
+        Returns
+        -------
+        DemoGRPCSession
+            Session, to be closed once done (or used as a context manager).
+        """
+        return DemoGRPCSession(self)
+
     # =================================================================================================
     # PRIVATE METHODS for Client operations
     # =================================================================================================
 
+    def _check_protocol_version(self, version: int):
+        # Only the handled versions of the streaming protocol are allowed
+        if version not in constants.PROTOCOL_VERSIONS:
+            raise RuntimeError(
+                "Invalid protocol version. Options are: "
+                + ", ".join(str(v) for v in constants.PROTOCOL_VERSIONS)
+            )
+
+        return version
+
+    def _configure_chunks(self, chunk_size, max_message_length: int):
+        # Check the chunk size requested (against the messages allowed by the client),
+        # or set up the tuner
+        constants.check_chunk_size(constants.MIN_CHUNKSIZE, max_message_length)
+        if chunk_size == "auto":
+            self._tuner = ChunkSizeTuner()
+        else:
+            constants.check_chunk_size(chunk_size, max_message_length)
+            self._tuner = None
+        self._chunk_size = chunk_size
+        self._max_message_length = max_message_length
+
+        # Until the server states otherwise, assume it allows for the default messages
+        self._server_max_message_length = constants.MAX_MESSAGE_LENGTH
+
+    def _configure_transport(self, transport_dtype: str, compute_dtype: str):
+        # Check the reduced precision requested (as if transmitting a float64 array)...
+        # and the compute precision
+        constants.transport_dtype(np.empty(0), transport_dtype)
+        if compute_dtype not in constants.COMPUTE_DTYPES:
+            raise RuntimeError(
+                "Invalid compute precision. Options are: "
+                + ", ".join(constants.COMPUTE_DTYPES)
+            )
+        self._transport = transport_dtype
+        self._compute = compute_dtype
+        self._transport_error = contextvars.ContextVar("transport_error", default=None)
+
+    def _channel_options(self):
+        # Raise the maximum length of the messages of the channel (if requested)
+        if self._max_message_length == constants.MAX_MESSAGE_LENGTH:
+            return []
+        return [
+            ("grpc.max_send_message_length", self._max_message_length),
+            ("grpc.max_receive_message_length", self._max_message_length),
+        ]
+
     def _generate_md(self, message_type: str, abbrev: str, *args: np.ndarray):
-        # Initialize the metadata and the chunks list for each full message
-        md = []
+        # Initialize the metadata and the chunks list for each full message. With
+        # protocol version 2, only the version is stated (the header message describes
+        # the full messages instead)
+        if self._protocol_version == 2:
+            md = [("protocol-version", "2")]
+        else:
+            md = [("full-" + message_type, str(len(args)))]
         chunks = []
 
-        # Find how many arguments are transmitting
-        md.append(("full-" + message_type, str(len(args))))
+        # Perform some argument input sanity checks
+        self._check_operands(message_type, abbrev, *args)
+
+        # Select the chunk size of the call (the server is requested to use it as well)
+        chunk_size = self._select_chunk_size(*args)
 
         # Loop over all input arguments
         idx = 1
         for arg in args:
-            # Perform some argument input sanity checks
+            # Determine the chunks needed (a single one if the size is not surpassed)
+            last_idx_chunk = constants.chunk_boundaries(
+                arg, chunk_size, constants.transport_dtype(arg, self._transport)
+            )
+
+            # Append the results
+            if self._protocol_version == 1:
+                md.append((abbrev + str(idx) + "-messages", str(len(last_idx_chunk))))
+            chunks.append(last_idx_chunk)
+
+            # Increase idx by 1
+            idx += 1
+
+        # Request the server to compress its response (if worth it)... and to use the
+        # same chunk size
+        if self._compression is not None:
+            md.append(("compression", self._compression))
+        md.append(("chunk-size", str(chunk_size)))
+
+        # Request the server to transmit its response with the same reduced precision
+        # (if any)... and to compute with the requested one
+        md.extend(self._precision_md())
+
+        # Return the metadata and the chunks list for each vector or matrix
+        return md, chunks
+
+    def _check_operands(self, message_type: str, abbrev: str, *args: np.ndarray):
+        # Perform some argument input sanity checks
+        for arg in args:
             if message_type == "vectors" and abbrev == "vec":
                 self._sanity_check_vector(arg)
             elif message_type == "matrices" and abbrev == "mat":
                 self._sanity_check_matrix(arg)
             else:
-                raise RuntimeError("Invalid usage of _generate_md function.")
-
-            # Check the size of the arrays
-            # If size is surpassed, determine chunks needed
-            if arg.nbytes > constants.MAX_CHUNKSIZE:
-                # Determine how many chunks are needed
-                #
-                # Max amount of elements per chunk
-                max_elems = constants.MAX_CHUNKSIZE // arg.itemsize
-
-                # Bulk number of chunks needed
-                bulk_chunks = arg.size // max_elems
-
-                # The remainder amount of elements (if any)
-                remainder = arg.size % max_elems
-
-                # This list provides the last index up to which to
-                # process in each partial vector or matrix message
-                last_idx_chunk = []
-                for i in range(1, bulk_chunks + 1):
-                    last_idx_chunk.append(i * max_elems)
-
-                # Take into account that if there is a remainder, include
-                # one last partial vector or matrix message
-                if remainder != 0:
-                    last_idx_chunk.append(arg.size)
-
-                # Append the results
-                md.append((abbrev + str(idx) + "-messages", str(len(last_idx_chunk))))
-                chunks.append(last_idx_chunk)
+                raise RuntimeError("Invalid usage of _check_operands function.")
+
+    def _precision_md(self):
+        # Metadata requesting the server to compute and transmit with the precisions of
+        # the client (if a reduced one is used)
+        if self._transport is None:
+            return []
+        return [("transport-dtype", self._transport), ("compute-dtype", self._compute)]
+
+    def _max_chunk_size(self):
+        # Chunks (and the rest of their message) must fit within the messages allowed by
+        # both the client and the server
+        return (
+            min(self._max_message_length, self._server_max_message_length)
+            - constants.MESSAGE_OVERHEAD
+        )
+
+    def _select_chunk_size(self, *args: np.ndarray):
+        # Let the tuner select the chunk size (if requested), given the largest operand as
+        # transmitted... or use the configured one
+        if self._tuner is not None:
+            nbytes = max(
+                (
+                    arg.size * constants.transport_dtype(arg, self._transport).itemsize
+                    for arg in args
+                ),
+                default=0,
+            )
+            return self._tuner.select(self._max_chunk_size(), nbytes)
+        return min(self._chunk_size, self._max_chunk_size())
 
-            else:
-                # Otherwise deal with a single message... Append results.
-                md.append((abbrev + str(idx) + "-messages", str(1)))
-                chunks.append([arg.size])
+    def _record_call(self, md: "list[tuple]", seconds: float, *arrays: np.ndarray):
+        # Feed the tuner with the throughput of the call (if requested)
+        if self._tuner is None:
+            return
+        chunk_size = int(dict(md)["chunk-size"])
+        self._tuner.record(chunk_size, sum(arr.nbytes for arr in arrays), seconds)
+
+    def _request_compression(self, *args: np.ndarray):
+        # Compress the messages sent (if requested, and worth it)
+        compression = constants.select_compression(self._compression or "none", *args)
+        return constants.COMPRESSIONS[compression]
+
+    def _generate_batch_md(self, operation: str, threads: int, *args: np.ndarray):
+        # Check the operation requested and the stacks provided
+        batch_operation = operation.replace("_", "-")
+        if batch_operation not in constants.BATCHED_OPERATIONS:
+            raise RuntimeError(
+                "Invalid operation. Unknown batched operation: " + operation
+            )
+        elif len(args) != 2:
+            raise RuntimeError("Invalid arguments. Only two stacks can be operated.")
 
-            # Increase idx by 1
-            idx += 1
+        ndim = constants.BATCHED_OPERATIONS[batch_operation]
+        for arg in args:
+            if type(arg) is not np.ndarray or arg.ndim != ndim:
+                raise RuntimeError(
+                    "Invalid argument. Only %dD numpy.ndarrays are allowed." % ndim
+                )
+            elif arg.shape != args[0].shape:
+                raise RuntimeError("Invalid arguments. Stacks of different shapes.")
+
+        # Send the matrix stacks as matrices, with the rows of all their items (a view,
+        # if possible): vector stacks are matrices already
+        stacks = [arg.reshape(-1, arg.shape[-1]) for arg in args]
+
+        # Generate the metadata for the stacks... and add the batch details
+        md, chunks = self._generate_md("matrices", "mat", *stacks)
+        md.append(("batch-operation", batch_operation))
+        md.append(("batch-size", str(args[0].shape[0])))
+        md.append(("batch-threads", str(threads)))
+
+        return md, chunks, stacks
+
+    def _generate_pipeline_md(self, pipeline, *outputs: int):
+        # Build the pipeline to send... and its operands, sent as matrices
+        graph, operands = pipeline._build(outputs)
+        operands = [arg.reshape(1, -1) if arg.ndim == 1 else arg for arg in operands]
+
+        # Generate the metadata for the operands... and add the pipeline (binary metadata)
+        md, chunks = self._generate_md("matrices", "mat", *operands)
+        md.append(("pipeline-bin", graph.SerializeToString()))
+
+        return md, chunks, operands
+
+    def _use_unary_call(self, *args: np.ndarray, result_shape: tuple = None):
+        # Unary calls are used if all operands fit within a single message (larger ones
+        # if both ends allow for longer messages)... and so does the result (of the shape
+        # of the first operand, unless stated otherwise), as transmitted by the server
+        limit = max(constants.MAX_CHUNKSIZE, self._max_chunk_size())
+        if result_shape is None:
+            result_shape = args[0].shape if args else ()
+        return (
+            self._unary_calls
+            and sum(arg.nbytes for arg in args) < limit
+            and self._result_nbytes(args, result_shape) < limit
+        )
+
+    def _result_nbytes(self, args: "tuple[np.ndarray]", shape: tuple):
+        # Operands received by the server with a reduced precision are computed with the
+        # requested one (float64 by default)... and the result is transmitted with the
+        # reduced precision requested (if any)
+        if not args:
+            return 0
+        dtype = constants.transport_dtype(args[0], self._transport)
+        if dtype.type in (np.float32, np.float16):
+            compute = self._compute if self._transport is not None else "float64"
+            dtype = np.dtype(constants.COMPUTE_DTYPES[compute])
+        dtype = constants.transport_dtype(np.empty(0, dtype=dtype), self._transport)
+
+        return int(np.prod(shape)) * dtype.itemsize
+
+    def _generate_unary_request(self, message_type: str, *args, errors: list = None):
+        # All operands are sent within a single message (each of them in a single,
+        # self-described chunk)
+        chunks = [[arg.size] for arg in args]
+        if message_type == "vectors":
+            return grpcdemo_pb2.Vectors(
+                vectors=self._generate_vector_stream(
+                    chunks, *args, version=1, errors=errors
+                )
+            )
+        else:
+            return grpcdemo_pb2.Matrices(
+                matrices=self._generate_matrix_stream(
+                    chunks, *args, version=1, errors=errors
+                )
+            )
 
-        # Return the metadata and the chunks list for each vector or matrix
-        return md, chunks
+    def _call_unary(self, method, message_type: str, *args):
+        # Call the server method... or stop using unary calls, if the server does not
+        # provide them (None is returned, so that the operation is streamed instead)
+        errors = []
+        request = self._generate_unary_request(message_type, *args, errors=errors)
+        try:
+            response, call = method.with_call(request, metadata=self._precision_md())
+        except grpc.RpcError as error:
+            if error.code() != grpc.StatusCode.UNIMPLEMENTED:
+                raise
+            self._unary_calls = False
+            return None
+
+        # Gather the error introduced on the operands and on the result (if any)
+        self._set_transport_error(errors, call.trailing_metadata())
+
+        return self._read_single_message(message_type, response)
+
+    def _read_single_message(self, message_type: str, msg):
+        # Parse a full vector or matrix, received within a single message
+        if message_type == "vectors":
+            parser = self._parse_vectors(
+                [("full-vectors", "1"), ("vec1-messages", "1")]
+            )
+        else:
+            parser = self._parse_matrices(
+                [("full-matrices", "1"), ("mat1-messages", "1")]
+            )
+
+        return self._consume_stream(parser, [msg])[0]
+
+    def _generate_session_request(
+        self, request_id: int, operation: str, *args: np.ndarray, errors: list = None
+    ):
+        # Check the operation requested... and its operands (as for the rest of operations)
+        if operation not in constants.PIPELINE_OPERATIONS:
+            raise RuntimeError(
+                "Invalid operation. Unknown session operation: " + operation
+            )
+        elif constants.PIPELINE_OPERATIONS[operation] == 1:
+            self._check_operands("vectors", "vec", *args)
+        else:
+            self._check_operands("matrices", "mat", *args)
+
+        # All operands are sent within a single message
+        if sum(arg.nbytes for arg in args) > constants.MAX_CHUNKSIZE:
+            raise RuntimeError(
+                "Invalid arguments. Operands of a session operation are limited to %d bytes."
+                % constants.MAX_CHUNKSIZE
+            )
+
+        request = grpcdemo_pb2.SessionRequest(
+            request_id=request_id, operation=operation
+        )
+        chunks = [[arg.size] for arg in args]
+        if constants.PIPELINE_OPERATIONS[operation] == 1:
+            request.vectors.extend(
+                self._generate_vector_stream(chunks, *args, version=1, errors=errors)
+            )
+        else:
+            request.matrices.extend(
+                self._generate_matrix_stream(chunks, *args, version=1, errors=errors)
+            )
+
+        return request
+
+    def _read_session_response(self, response):
+        # Raise the server's error (if any)... or parse the result, in a single message
+        if response.error:
+            raise RuntimeError(response.error)
+        elif response.HasField("vector"):
+            return self._read_single_message("vectors", response.vector)
+        else:
+            return self._read_single_message("matrices", response.matrix)
+
+    def _generate_upload(self, array: np.ndarray, errors: list = None):
+        # Matrices are uploaded as such... and anything else as a vector (if valid)
+        if type(array) is np.ndarray and array.ndim == 2:
+            md, chunks = self._generate_md("matrices", "mat", array)
+            stream = self._generate_matrix_stream(chunks, array, errors=errors)
+            return self._stub.UploadMatrix, md, stream
+        else:
+            md, chunks = self._generate_md("vectors", "vec", array)
+            stream = self._generate_vector_stream(chunks, array, errors=errors)
+            return self._stub.UploadVector, md, stream
+
+    def _generate_operate_md(
+        self, message_type: str, abbrev: str, operation: str, *args
+    ):
+        # Send the numpy.ndarrays (in order)... and reference the rest by their handle
+        inline = [arg for arg in args if not isinstance(arg, str)]
+        md, chunks = self._generate_md(message_type, abbrev, *inline)
+        md.append(("operation", operation))
+        md.append(
+            (
+                "operands",
+                ",".join(arg if isinstance(arg, str) else "inline" for arg in args),
+            )
+        )
+
+        return md, chunks, inline
+
+    def _unstack_batch(self, operation: str, stack: np.ndarray, result: np.ndarray):
+        # Recover the shape of the resulting stack (dot products are received as a column)
+        if operation == "multiply_vectors":
+            return result.reshape(stack.shape[0])
+        else:
+            return result.reshape(stack.shape)
+
+    def _generate_vector_stream(
+        self,
+        chunks: "list[list[int]]",
+        *args: np.ndarray,
+        version: int = None,
+        errors: list = None,
+    ):
+        # Use the client's protocol version, unless stated otherwise
+        version = version or self._protocol_version
+
+        # With protocol version 2, the header message comes first
+        if version == 2:
+            for arg in args:
+                self._sanity_check_vector(arg)
+            yield grpcdemo_pb2.Vector(
+                header=constants.stream_header(chunks, *args, transport=self._transport)
+            )
 
-    def _generate_vector_stream(self, chunks: "list[list[int]]", *args: np.ndarray):
         # Loop over all input arguments
         for arg, vector_chunks in zip(args, chunks):
             # Perform some argument input sanity checks
@@ -263,21 +839,43 @@ class DemoGRPCClient:
 
             # If sanity checks are fine... yield the corresponding vector message
             #
-            # Loop over the chunk indices
-            processed_idx = 0
-            for last_idx_chunk in vector_chunks:
-                # Use tmp_idx in yield function and update the processed_idx afterwards
-                tmp_idx = processed_idx
-                processed_idx = last_idx_chunk
+            # Loop over the serialized chunks (a single copy is performed per chunk)
+            # (converted to the reduced precision requested, if any)
+            dtype = constants.transport_dtype(arg, self._transport)
+            for payload in constants.chunk_payloads(arg, vector_chunks, dtype, errors):
+                # Build the message (with its payload only, if there is a header)...
+                # and release the chunk (protobuf holds a copy)
+                if version == 2:
+                    msg = grpcdemo_pb2.Vector(vector_as_chunk=payload)
+                else:
+                    msg = grpcdemo_pb2.Vector(
+                        data_type=constants.NP_DTYPE_TO_DATATYPE[dtype.type],
+                        vector_size=arg.shape[0],
+                        vector_as_chunk=payload,
+                    )
+                del payload
 
                 # Yield!
-                yield grpcdemo_pb2.Vector(
-                    data_type=constants.NP_DTYPE_TO_DATATYPE[arg.dtype.type],
-                    vector_size=arg.shape[0],
-                    vector_as_chunk=arg[tmp_idx:last_idx_chunk].tobytes(),
-                )
+                yield msg
+
+    def _generate_matrix_stream(
+        self,
+        chunks: "list[list[int]]",
+        *args: np.ndarray,
+        version: int = None,
+        errors: list = None,
+    ):
+        # Use the client's protocol version, unless stated otherwise
+        version = version or self._protocol_version
+
+        # With protocol version 2, the header message comes first
+        if version == 2:
+            for arg in args:
+                self._sanity_check_matrix(arg)
+            yield grpcdemo_pb2.Matrix(
+                header=constants.stream_header(chunks, *args, transport=self._transport)
+            )
 
-    def _generate_matrix_stream(self, chunks: "list[list[int]]", *args: np.ndarray):
         # Loop over all input arguments
         for arg, matrix_chunks in zip(args, chunks):
             # Perform some argument input sanity checks.
@@ -285,64 +883,139 @@ class DemoGRPCClient:
 
             # If sanity checks are fine... yield the corresponding matrix message
             #
-            # When dealing with matrices, ravel it to a 1D array (avoids copy)
-            arg_as_vec = arg.ravel()
-
-            # Loop over the chunk indices
-            processed_idx = 0
-            for last_idx_chunk in matrix_chunks:
-                # Use tmp_idx in yield function and update the processed_idx afterwards
-                tmp_idx = processed_idx
-                processed_idx = last_idx_chunk
-
-                # Yield
-                yield grpcdemo_pb2.Matrix(
-                    data_type=constants.NP_DTYPE_TO_DATATYPE[arg.dtype.type],
-                    matrix_rows=arg.shape[0],
-                    matrix_cols=arg.shape[1],
-                    matrix_as_chunk=arg_as_vec[tmp_idx:last_idx_chunk].tobytes(),
-                )
+            # Loop over the serialized chunks (a single copy is performed per chunk,
+            # without raveling the matrix, which copies it if it is not C-contiguous)
+            # (converted to the reduced precision requested, if any)
+            dtype = constants.transport_dtype(arg, self._transport)
+            for payload in constants.chunk_payloads(arg, matrix_chunks, dtype, errors):
+                # Build the message (with its payload only, if there is a header)...
+                # and release the chunk (protobuf holds a copy)
+                if version == 2:
+                    msg = grpcdemo_pb2.Matrix(matrix_as_chunk=payload)
+                else:
+                    msg = grpcdemo_pb2.Matrix(
+                        data_type=constants.NP_DTYPE_TO_DATATYPE[dtype.type],
+                        matrix_rows=arg.shape[0],
+                        matrix_cols=arg.shape[1],
+                        matrix_as_chunk=payload,
+                    )
+                del payload
+
+                # Yield!
+                yield msg
+
+    def _call_stream(
+        self,
+        method,
+        message_type: str,
+        md: "list[tuple]",
+        chunks: "list[list[int]]",
+        *args,
+    ):
+        # Call the server method with the stream (i.e. generator)...
+        start = time.perf_counter()
+        errors = []
+        if message_type == "vectors":
+            stream = self._generate_vector_stream(chunks, *args, errors=errors)
+        else:
+            stream = self._generate_matrix_stream(chunks, *args, errors=errors)
+        response_iterator = method(
+            stream, metadata=md, compression=self._request_compression(*args)
+        )
+
+        # ... and convert the result to numpy.ndarrays
+        if message_type == "vectors":
+            nparray = self._read_nparray_from_vector(response_iterator)
+        else:
+            nparray = self._read_nparray_from_matrix(response_iterator)
+
+        # Measure the throughput of the call (for tuning the chunk size, if requested)...
+        # and the error introduced by the reduced precision (if any)
+        self._record_call(md, time.perf_counter() - start, *args, *nparray)
+        self._set_transport_error(errors, response_iterator.trailing_metadata())
+
+        return nparray
+
+    def _set_transport_error(self, errors: "list[float]", trailing_md):
+        # Gather the error introduced on the operands sent (per chunk)... and the one
+        # introduced on the result (reported by the server, if any)
+        if self._transport is None:
+            return
+        for md in trailing_md or []:
+            if md[0] == "transport-error":
+                errors.append(float(md[1]))
+        self._transport_error.set(max(errors, default=0.0))
 
     def _read_nparray_from_vector(self, response_iterator):
-        # Get the metadata
-        response_md = response_iterator.initial_metadata()
+        # Get the metadata and feed the server's messages to the vectors parser
+        parser = self._parse_vectors(response_iterator.initial_metadata())
+        return self._consume_stream(parser, response_iterator)
 
-        # Parse the server's metadata
-        full_msg, chunks_per_msg = self._parse_server_metadata(response_md)
+    def _read_nparray_from_matrix(self, response_iterator):
+        # Get the metadata and feed the server's messages to the matrices parser
+        parser = self._parse_matrices(response_iterator.initial_metadata())
+        return self._consume_stream(parser, response_iterator)
+
+    def _consume_stream(self, parser, response_iterator):
+        # Prime the parser and send it the server's messages until it is done
+        try:
+            next(parser)
+            for response in response_iterator:
+                parser.send(response)
+        except StopIteration as parser_done:
+            # Reach the end of the stream, which raises the server's error (if any)
+            for _ in response_iterator:
+                pass
+            return parser_done.value
+
+        raise RuntimeError("Unexpected end of the stream of server messages...")
+
+    def _parse_vectors(self, response_md):
+        # Parse the server's metadata (and header message, if any)
+        operands = yield from self._read_operands(response_md, 1)
 
         # Initialize the output list
         resulting_vectors = []
 
         # Start processing messages independently
-        for msg in range(full_msg):
-            # Init the resulting numpy.ndarray to None, its size and its type
+        for data_type, shape, chunks in operands:
+            # Init the resulting numpy.ndarray to None, its size, its type and the
+            # position up to which it has been filled
             result = None
             result_size = 0
             result_dtype = None
+            filled = 0
 
             # Loop over the available chunks per message
-            for chunk_idx in range(chunks_per_msg[msg]):
-                # Read a message
-                vector = next(response_iterator)
+            for chunk_idx in range(chunks):
+                # Wait for the next message
+                vector = yield
 
-                # If it is the first chunk being processed, parse dtype and size
+                # If it is the first chunk being processed, parse dtype and size (which
+                # come with every chunk, unless there is a header)
                 if chunk_idx == 0:
-                    if vector.data_type == grpcdemo_pb2.DataType.Value("INTEGER"):
-                        result_dtype = np.int32
-                    elif vector.data_type == grpcdemo_pb2.DataType.Value("DOUBLE"):
-                        result_dtype = np.float64
+                    if data_type is None:
+                        data_type = vector.data_type
+                        shape = (vector.vector_size,)
 
-                    result_size = vector.vector_size
+                    wire_dtype, result_dtype = self._result_dtype(data_type)
 
-                # Parse the chunk
-                if result is None:
-                    result = np.frombuffer(vector.vector_as_chunk, dtype=result_dtype)
-                else:
-                    tmp = np.frombuffer(vector.vector_as_chunk, dtype=result_dtype)
-                    result = np.concatenate((result, tmp))
+                    result_size = shape[0]
+
+                    # Allocate the resulting vector only once, using the advertised size
+                    result = np.empty(result_size, dtype=result_dtype)
+
+                # Parse the chunk and copy it straight into its slot
+                filled = constants.fill_chunk(
+                    result,
+                    filled,
+                    vector.vector_as_chunk,
+                    "server full Vector",
+                    wire_dtype,
+                )
 
             # Check if the final vector has the desired size
-            if result.size != result_size:
+            if result is None or filled != result_size:
                 raise RuntimeError("Problems reading server full Vector message...")
             else:
                 # If everything is fine, append to resulting_vectors list
@@ -351,71 +1024,79 @@ class DemoGRPCClient:
         # Return the resulting_vectors list
         return resulting_vectors
 
-    def _read_nparray_from_matrix(self, response_iterator):
-        # Get the metadata
-        response_md = response_iterator.initial_metadata()
-
-        # Parse the server's metadata
-        full_msg, chunks_per_msg = self._parse_server_metadata(response_md)
+    def _parse_matrices(self, response_md):
+        # Parse the server's metadata (and header message, if any)
+        operands = yield from self._read_operands(response_md, 2)
 
         # Initialize the output list
         resulting_matrices = []
 
         # Start processing messages independently
-        for msg in range(full_msg):
-            # Init the resulting numpy.ndarray to None, its size (rows,cols), and its type
+        for data_type, shape, chunks in operands:
+            # Init the resulting numpy.ndarray to None, its size (rows,cols), its type
+            # and the position up to which it has been filled
             result = None
             result_rows = 0
             result_cols = 0
             result_dtype = None
+            filled = 0
 
             # Loop over the available chunks per message
-            for chunk_idx in range(chunks_per_msg[msg]):
-                # Read a message
-                matrix = next(response_iterator)
+            for chunk_idx in range(chunks):
+                # Wait for the next message
+                matrix = yield
 
-                # If it is the first chunk being processing, parse dtype and size (rows,cols)
+                # If it is the first chunk being processing, parse dtype and size (rows,cols),
+                # which come with every chunk, unless there is a header
                 if chunk_idx == 0:
-                    if matrix.data_type == grpcdemo_pb2.DataType.Value("INTEGER"):
-                        result_dtype = np.int32
-                    elif matrix.data_type == grpcdemo_pb2.DataType.Value("DOUBLE"):
-                        result_dtype = np.float64
+                    if data_type is None:
+                        data_type = matrix.data_type
+                        shape = (matrix.matrix_rows, matrix.matrix_cols)
 
-                    result_rows = matrix.matrix_rows
-                    result_cols = matrix.matrix_cols
+                    wire_dtype, result_dtype = self._result_dtype(data_type)
 
-                # Parse the chunk
-                if result is None:
-                    result = np.frombuffer(matrix.matrix_as_chunk, dtype=result_dtype)
-                else:
-                    tmp = np.frombuffer(matrix.matrix_as_chunk, dtype=result_dtype)
-                    result = np.concatenate((result, tmp))
+                    result_rows, result_cols = shape
+
+                    # Allocate the resulting matrix only once, using the advertised shape
+                    result = np.empty((result_rows, result_cols), dtype=result_dtype)
+
+                # Parse the chunk and copy it straight into its slot (the matrix is
+                # C-contiguous, so its raveled form is a view over the same memory)
+                filled = constants.fill_chunk(
+                    result.ravel(),
+                    filled,
+                    matrix.matrix_as_chunk,
+                    "server full matrix",
+                    wire_dtype,
+                )
 
             # Check if the final matrix has the desired size
-            if result.size != result_rows * result_cols:
+            if result is None or filled != result_rows * result_cols:
                 raise RuntimeError("Problems reading server full matrix message...")
             else:
                 # If everything is fine, append to resulting_matrices list
-                resulting_matrices.append(
-                    np.reshape(
-                        result,
-                        (
-                            result_rows,
-                            result_cols,
-                        ),
-                    )
-                )
+                resulting_matrices.append(result)
 
         # Return the resulting_matrices list
         return resulting_matrices
 
+    def _result_dtype(self, data_type: int):
+        # Results received with a reduced precision are returned as float64
+        if data_type not in constants.DATATYPE_TO_NP_DTYPE:
+            raise RuntimeError("Unsupported data type received: %d." % data_type)
+        wire_dtype = constants.DATATYPE_TO_NP_DTYPE[data_type]
+        if wire_dtype in (np.float32, np.float16):
+            return wire_dtype, np.float64
+
+        return wire_dtype, wire_dtype
+
     def _sanity_check_vector(self, arg):
         # Perform some argument input sanity checks.
         if type(arg) is not np.ndarray:
             raise RuntimeError("Invalid argument. Only numpy.ndarrays are allowed.")
         elif arg.dtype.type not in constants.NP_DTYPE_TO_DATATYPE.keys():
             raise RuntimeError(
-                "Invalid argument. Only numpy.ndarrays of type int32 and float64 are allowed."
+                "Invalid argument. Only numpy.ndarrays of type int32, float16, float32 and float64 are allowed."
             )
         elif arg.ndim != 1:
             raise RuntimeError("Invalid argument. Only 1D numpy.ndarrays are allowed.")
@@ -426,11 +1107,29 @@ class DemoGRPCClient:
             raise RuntimeError("Invalid argument. Only numpy.ndarrays are allowed.")
         elif arg.dtype.type not in constants.NP_DTYPE_TO_DATATYPE.keys():
             raise RuntimeError(
-                "Invalid argument. Only numpy.ndarrays of type int32 and float64 are allowed."
+                "Invalid argument. Only numpy.ndarrays of type int32, float16, float32 and float64 are allowed."
             )
         elif arg.ndim != 2:
             raise RuntimeError("Invalid argument. Only 2D numpy.ndarrays are allowed.")
 
+    def _read_operands(self, response_md: "list[tuple]", ndim: int):
+        # Keep track of the maximum length of the messages allowed by the server (if
+        # provided), which bounds the chunk size
+        for md in response_md:
+            if md[0] == "max-message-length":
+                self._server_max_message_length = int(md[1])
+
+        # With protocol version 2, the full messages are described by the header message
+        # (the first one of the stream)
+        if ("protocol-version", "2") in [tuple(md) for md in response_md]:
+            header = yield
+            return constants.read_stream_header(header, ndim, "server")
+
+        # Otherwise, the metadata provides the chunks per message (data type and shape
+        # come with the chunks)
+        full_msg, chunks_per_msg = self._parse_server_metadata(response_md)
+        return [(None, None, chunks) for chunks in chunks_per_msg]
+
     def _parse_server_metadata(self, response_md: "list[tuple]"):
         # Init the return variables: amount of full messages received
         # and partial messages per full message
@@ -450,3 +1149,1076 @@ class DemoGRPCClient:
                         chunks_per_msg.append(int(md[1]))
 
         return full_msg, chunks_per_msg
+
+
+class AsyncDemoGRPCClient(DemoGRPCClient):
+    """Provides the asyncio-based (``grpc.aio``) API Eigen Example client class.
+
+    All operations are awaitables sharing a single channel, so that many of them
+    can be in flight at the same time (for example, through ``asyncio.gather``).
+    The client must be created within a running event loop, and connected
+    through :func:`connect` (or by using it as an ``async with`` context manager).
+    """
+
+    def __init__(
+        self,
+        ip="127.0.0.1",
+        port=50051,
+        timeout=1,
+        max_in_flight=10,
+        protocol_version=constants.PROTOCOL_VERSION,
+        compression=None,
+        chunk_size=constants.MAX_CHUNKSIZE,
+        max_message_length=constants.MAX_MESSAGE_LENGTH,
+        transport_dtype=None,
+        compute_dtype="float64",
+        test=None,
+    ):
+        """Initialize the (not yet connected) asynchronous client.
+
+        Parameters
+        ----------
+        ip : str, optional
+            IP or DNS to which to connect. The default is "127.0.0.1".
+        port : int, optional
+            Port to connect to. The default is 50051.
+        timeout : int, optional
+            Number of seconds to wait before returning a timeout in the connection. The default is 1.
+        max_in_flight : int, optional
+            Maximum number of operations in flight at the same time over the shared channel.
+            Any further operation waits until one of them finishes. The default is 10.
+        protocol_version : int, optional
+            Version of the streaming protocol. Version 2 sends a header message describing
+            all vectors or matrices first, followed by chunk messages with their payload only.
+            Version 1 describes them within the metadata and every chunk message instead,
+            as servers prior to version 2 expect. The default is ``constants.PROTOCOL_VERSION``.
+        compression : str, optional
+            Compression algorithm of the streamed messages, both sent and received. Options
+            are the keys of ``constants.COMPRESSIONS``. Small or incompressible messages are
+            never compressed. The default is ``None``, meaning that the messages sent are not
+            compressed, and the ones received are compressed as the server decides.
+        chunk_size : int or str, optional
+            Maximum amount of bytes per chunk of the streamed messages, both sent and
+            received (the server is requested to use it). ``"auto"`` tunes it from the
+            throughput measured in recent calls. The default is ``constants.MAX_CHUNKSIZE``.
+        max_message_length : int, optional
+            Maximum length of the messages sent and received by the channel. Raising it
+            (on both ends) allows for larger chunks, and for sending larger operands within
+            a single message. The default is ``constants.MAX_MESSAGE_LENGTH``.
+        transport_dtype : str, optional
+            Reduced precision with which to transmit floating-point operands and results.
+            Options are the keys of ``constants.TRANSPORT_DTYPES``. Results are returned
+            as float64 anyway. The default is ``None``, meaning no reduction.
+        compute_dtype : str, optional
+            Precision with which the server computes over operands transmitted with a
+            reduced precision. Options are the keys of ``constants.COMPUTE_DTYPES``.
+            The default is ``"float64"``.
+        test : object, optional
+            Test asynchronous GRPCDemoStub to connect to. The default is ``None``. This argument is only intended for test purposes.
+        """
+        # Limit the amount of concurrent calls over the shared channel
+        if max_in_flight < 1:
+            raise RuntimeError(
+                "Invalid max_in_flight value. At least one call must be allowed."
+            )
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+
+        # Operations with small operands are performed by unary calls (while available)
+        self._unary_calls = True
+        self._protocol_version = self._check_protocol_version(protocol_version)
+        self.compression = compression
+        self._configure_chunks(chunk_size, max_message_length)
+        self._configure_transport(transport_dtype, compute_dtype)
+
+        # For test purposes, provide a stub directly (there is no channel then)
+        if test is not None:
+            self.channel = None
+            self._stub = test
+            return
+
+        self._timeout = timeout
+        self._channel_str = "%s:%d" % (ip, port)
+
+        # A single channel (and stub) is shared by all the operations
+        self.channel = grpc.aio.insecure_channel(
+            self._channel_str, options=self._channel_options()
+        )
+        self._stub = grpcdemo_pb2_grpc.GRPCDemoStub(self.channel)
+
+    async def __aenter__(self):
+        # Release the channel if the connection cannot be established
+        try:
+            await self.connect()
+        except IOError:
+            await self.close()
+            raise
+
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    # =================================================================================================
+    # PUBLIC METHODS for Client operations
+    # =================================================================================================
+
+    async def connect(self):
+        """Wait until the connection to the API Eigen server is ready.
+
+        Raises
+        ------
+        IOError
+            Error if the client was unable to connect to the server.
+        """
+        # Test stubs are provided directly... there is no channel to wait for
+        if self.channel is None:
+            return
+
+        # Verify connection
+        try:
+            await asyncio.wait_for(self.channel.channel_ready(), timeout=self._timeout)
+        except asyncio.TimeoutError:
+            raise IOError("Unable to connect to server at %s" % self._channel_str)
+
+        print("Connected to server at %s" % self._channel_str)
+
+    async def close(self):
+        """Close the channel shared by all the operations."""
+        if self.channel is not None:
+            await self.channel.close()
+
+    async def request_greeting(self, name):
+        """Method that requests a greeting from the server.
+
+        Parameters
+        ----------
+        name : str
+            Name of the "client". For example, "Michael".
+        """
+        # Build the greeting request and send it
+        request = grpcdemo_pb2.HelloRequest(name=name)
+        async with self._in_flight:
+            response = await self._stub.SayHello(request)
+
+        # Show the server's response
+        print("The server answered: " + response.message)
+
+    async def flip_vector(self, vector):
+        """Flip the position of a numpy.ndarray vector such that [A, B, C, D] --> [D, C, B, A].
+
+        Parameters
+        ----------
+        vector : numpy.ndarray
+            Vector to flip.
+
+        Returns
+        -------
+        numpy.ndarray
+            Flipped vector.
+        """
+        return await self._call_vectors(
+            self._stub.FlipVector, self._stub.FlipVectorUnary, vector
+        )
+
+    async def add_vectors(self, *args):
+        """Add numpy.ndarray vectors using the Eigen library on the server side.
+
+        Returns
+        -------
+        numpy.ndarray
+            Result of the given numpy.ndarrays.
+        """
+        return await self._call_vectors(
+            self._stub.AddVectors, self._stub.AddVectorsUnary, *args
+        )
+
+    async def multiply_vectors(self, *args):
+        """Multiply numpy.ndarray vectors using the Eigen library on the server side.
+
+        Returns
+        -------
+        numpy.ndarray
+            Result of the multiplication of numpy.ndarray vectors. Despite returning a numpy.ndarray, the result only contains one value because it is a dot product.
+        """
+        return await self._call_vectors(
+            self._stub.MultiplyVectors,
+            self._stub.MultiplyVectorsUnary,
+            *args,
+            result_shape=(1,),
+        )
+
+    async def add_matrices(self, *args):
+        """Add numpy.ndarray matrices using the Eigen library on the server side.
+
+        Returns
+        -------
+        numpy.ndarray
+            Resulting numpy.ndarray of the matrices addition.
+        """
+        return await self._call_matrices(
+            self._stub.AddMatrices, self._stub.AddMatricesUnary, *args
+        )
+
+    async def multiply_matrices(self, *args):
+        """Multiply numpy.ndarray matrices using the Eigen library on the server side.
+
+        Returns
+        -------
+        numpy.ndarray
+            Resulting numpy.ndarray of the matrices' multiplication.
+        """
+        return await self._call_matrices(
+            self._stub.MultiplyMatrices, self._stub.MultiplyMatricesUnary, *args
+        )
+
+    async def batched_operation(self, operation, *args, threads=1):
+        """Perform an operation over two stacks of vectors or matrices using the Eigen library on the server side.
+
+        Parameters
+        ----------
+        operation : str
+            Operation to perform over each pair of stacked items. Options are
+            ``add_vectors``, ``multiply_vectors``, ``add_matrices`` and ``multiply_matrices``.
+        *args : numpy.ndarray
+            Stacks of vectors, of shape (N, n), or of matrices, of shape (N, n, m).
+        threads : int, optional
+            Number of threads that the server may use for performing the operation.
+            The default is 1.
+
+        Returns
+        -------
+        numpy.ndarray
+            Stack of results: of shape (N,) for the dot products, and of the shape of the
+            given stacks otherwise.
+        """
+        # Generate the metadata, the stacks (as matrices) and the amount of chunks per stack
+        md, chunks, stacks = self._generate_batch_md(operation, threads, *args)
+
+        # Call the server method with the stream (i.e. generator) and retrieve the result
+        nparray = await self._acall_stream(
+            self._stub.BatchedOperation, "matrices", md, chunks, *stacks
+        )
+
+        # Return only the first element (expecting a single stack)
+        return self._unstack_batch(operation, args[0], nparray[0])
+
+    async def upload(self, array):
+        """Store a numpy.ndarray vector or matrix on the server side.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            Vector or matrix to store.
+
+        Returns
+        -------
+        str
+            Handle to the stored array.
+        """
+        errors = []
+        method, md, stream = self._generate_upload(array, errors)
+        async with self._in_flight:
+            handle = await method(
+                stream, metadata=md, compression=self._request_compression(array)
+            )
+        self._set_transport_error(errors, [])
+
+        return handle.id
+
+    async def release(self, handle):
+        """Release a numpy.ndarray vector or matrix stored on the server side.
+
+        Parameters
+        ----------
+        handle : str
+            Handle to the stored array.
+
+        Returns
+        -------
+        bool
+            ``True`` if the array was stored, ``False`` otherwise.
+        """
+        async with self._in_flight:
+            reply = await self._stub.ReleaseHandle(grpcdemo_pb2.Handle(id=handle))
+
+        return reply.released
+
+    async def operate_vectors(self, operation, *args):
+        """Perform an operation over numpy.ndarray vectors, or handles to stored vectors, using the Eigen library on the server side.
+
+        Parameters
+        ----------
+        operation : str
+            Operation to perform. Options are ``flip``, ``add`` and ``multiply``.
+        *args : numpy.ndarray or str
+            Vectors, which are sent, or handles to vectors stored with ``upload``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Result of the operation.
+        """
+        md, chunks, inline = self._generate_operate_md(
+            "vectors", "vec", operation, *args
+        )
+        nparray = await self._acall_stream(
+            self._stub.OperateVectors, "vectors", md, chunks, *inline
+        )
+
+        return nparray[0]
+
+    async def operate_matrices(self, operation, *args):
+        """Perform an operation over numpy.ndarray matrices, or handles to stored matrices, using the Eigen library on the server side.
+
+        Parameters
+        ----------
+        operation : str
+            Operation to perform. Options are ``add`` and ``multiply``.
+        *args : numpy.ndarray or str
+            Matrices, which are sent, or handles to matrices stored with ``upload``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Result of the operation.
+        """
+        md, chunks, inline = self._generate_operate_md(
+            "matrices", "mat", operation, *args
+        )
+        nparray = await self._acall_stream(
+            self._stub.OperateMatrices, "matrices", md, chunks, *inline
+        )
+
+        return nparray[0]
+
+    async def evaluate_pipeline(self, pipeline, *outputs):
+        """Evaluate a pipeline using the Eigen library on the server side.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Pipeline to evaluate.
+        *outputs : int
+            Values of the pipeline to send back.
+
+        Returns
+        -------
+        list of numpy.ndarray
+            Requested outputs, in order.
+        """
+        md, chunks, operands = self._generate_pipeline_md(pipeline, *outputs)
+        nparray = await self._acall_stream(
+            self._stub.Pipeline, "matrices", md, chunks, *operands
+        )
+
+        return pipeline._unpack(outputs, nparray)
+
+    def session(self):
+        """Open a session, which performs several operations over a long-lived stream.
+
+        Returns
+        -------
+        AsyncDemoGRPCSession
+            Session, to be used as an asynchronous context manager.
+        """
+        return AsyncDemoGRPCSession(self)
+
+    # =================================================================================================
+    # PRIVATE METHODS for Client operations
+    # =================================================================================================
+
+    async def _call_vectors(self, method, unary_method, *args, result_shape=None):
+        # Small operands are sent within a single message, in a unary call (unless the
+        # server does not provide it)
+        self._check_operands("vectors", "vec", *args)
+        if self._use_unary_call(*args, result_shape=result_shape):
+            result = await self._acall_unary(unary_method, "vectors", *args)
+            if result is not None:
+                return result
+
+        # Otherwise, generate the metadata and the amount of chunks per vector
+        md, chunks = self._generate_md("vectors", "vec", *args)
+
+        # Call the server method with the stream (i.e. generator) and retrieve the result
+        nparray = await self._acall_stream(method, "vectors", md, chunks, *args)
+
+        # Return only the first element (expecting a single vector)
+        return nparray[0]
+
+    async def _call_matrices(self, method, unary_method, *args):
+        # Small operands are sent within a single message, in a unary call (unless the
+        # server does not provide it)
+        self._check_operands("matrices", "mat", *args)
+        if self._use_unary_call(*args):
+            result = await self._acall_unary(unary_method, "matrices", *args)
+            if result is not None:
+                return result
+
+        # Otherwise, generate the metadata and the amount of chunks per matrix
+        md, chunks = self._generate_md("matrices", "mat", *args)
+
+        # Call the server method with the stream (i.e. generator) and retrieve the result
+        nparray = await self._acall_stream(method, "matrices", md, chunks, *args)
+
+        # Return only the first element (expecting a single matrix)
+        return nparray[0]
+
+    async def _acall_stream(
+        self,
+        method,
+        message_type: str,
+        md: "list[tuple]",
+        chunks: "list[list[int]]",
+        *args,
+    ):
+        # Wait for a free slot... and call the server method with the stream (i.e. generator)
+        async with self._in_flight:
+            start = time.perf_counter()
+            errors = []
+            if message_type == "vectors":
+                stream = self._generate_vector_stream(chunks, *args, errors=errors)
+            else:
+                stream = self._generate_matrix_stream(chunks, *args, errors=errors)
+            call = method(
+                stream, metadata=md, compression=self._request_compression(*args)
+            )
+
+            # ... and convert the result to numpy.ndarrays (as in _call_stream)
+            if message_type == "vectors":
+                parser = self._parse_vectors(await call.initial_metadata())
+            else:
+                parser = self._parse_matrices(await call.initial_metadata())
+            nparray = await self._aconsume_stream(parser, call)
+
+            self._record_call(md, time.perf_counter() - start, *args, *nparray)
+            self._set_transport_error(errors, await call.trailing_metadata())
+
+        return nparray
+
+    async def _acall_unary(self, method, message_type: str, *args):
+        # Wait for a free slot... and call the server method (as in _call_unary)
+        errors = []
+        request = self._generate_unary_request(message_type, *args, errors=errors)
+        try:
+            async with self._in_flight:
+                call = method(request, metadata=self._precision_md())
+                response = await call
+        except grpc.RpcError as error:
+            if error.code() != grpc.StatusCode.UNIMPLEMENTED:
+                raise
+            self._unary_calls = False
+            return None
+
+        self._set_transport_error(errors, await call.trailing_metadata())
+
+        return self._read_single_message(message_type, response)
+
+    async def _aconsume_stream(self, parser, call):
+        # Prime the parser and send it the server's messages until it is done
+        try:
+            next(parser)
+            async for response in call:
+                parser.send(response)
+        except StopIteration as parser_done:
+            # Reach the end of the stream, which raises the server's error (if any)
+            async for _ in call:
+                pass
+            return parser_done.value
+
+        raise RuntimeError("Unexpected end of the stream of server messages...")
+
+
+class Pipeline:
+    """Provides a builder of expressions over numpy.ndarray vectors and matrices.
+
+    Each method adds a value to the pipeline (an operand, or the result of an operation
+    over previous values) and returns its index, by which it is referenced afterwards.
+    The whole expression is then evaluated on the server side in a single call, using
+    ``evaluate``. Pipelines are built by means of ``DemoGRPCClient.pipeline``.
+    """
+
+    def __init__(self, client):
+        """Initialize an empty pipeline.
+
+        Parameters
+        ----------
+        client : DemoGRPCClient
+            Client evaluating the pipeline.
+        """
+        self._client = client
+        self._ndims = []
+        self._operands = []
+        self._nodes = []
+
+    def operand(self, array):
+        """Add an operand, which is sent when evaluating the pipeline.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            Vector or matrix.
+
+        Returns
+        -------
+        int
+            Index of the operand.
+        """
+        if type(array) is not np.ndarray or array.ndim not in (1, 2):
+            raise RuntimeError(
+                "Invalid argument. Only 1D or 2D numpy.ndarrays are allowed."
+            )
+
+        self._operands.append((len(self._ndims), array))
+        self._ndims.append(array.ndim)
+        return len(self._ndims) - 1
+
+    def flip_vector(self, vector):
+        """Add the flip of a vector, such that [A, B, C, D] --> [D, C, B, A].
+
+        Returns
+        -------
+        int
+            Index of the result.
+        """
+        return self._add_node("flip_vector", vector)
+
+    def add_vectors(self, *args):
+        """Add the addition of vectors.
+
+        Returns
+        -------
+        int
+            Index of the result.
+        """
+        return self._add_node("add_vectors", *args)
+
+    def multiply_vectors(self, *args):
+        """Add the dot product of two vectors.
+
+        Returns
+        -------
+        int
+            Index of the result (a vector with a single value).
+        """
+        return self._add_node("multiply_vectors", *args)
+
+    def add_matrices(self, *args):
+        """Add the addition of matrices.
+
+        Returns
+        -------
+        int
+            Index of the result.
+        """
+        return self._add_node("add_matrices", *args)
+
+    def multiply_matrices(self, *args):
+        """Add the product of two matrices.
+
+        Returns
+        -------
+        int
+            Index of the result.
+        """
+        return self._add_node("multiply_matrices", *args)
+
+    def evaluate(self, *outputs):
+        """Evaluate the pipeline on the server side.
+
+        Parameters
+        ----------
+        *outputs : int
+            Values of the pipeline to send back.
+
+        Returns
+        -------
+        list of numpy.ndarray
+            Requested outputs, in order (awaitable, for an ``AsyncDemoGRPCClient``).
+        """
+        return self._client.evaluate_pipeline(self, *outputs)
+
+    # =================================================================================================
+    # PRIVATE METHODS for Pipeline operations
+    # =================================================================================================
+
+    def _add_node(self, operation: str, *args: int):
+        # Check that the inputs are known values of the dimensions handled by the operation
+        ndim = constants.PIPELINE_OPERATIONS[operation]
+        for arg in args:
+            if self._ndims[self._check_value(arg)] != ndim:
+                raise RuntimeError(
+                    "Invalid argument. Operation %s takes %s."
+                    % (operation, "vectors" if ndim == 1 else "matrices")
+                )
+
+        self._nodes.append((len(self._ndims), operation, args))
+        self._ndims.append(ndim)
+        return len(self._ndims) - 1
+
+    def _check_value(self, value: int):
+        if type(value) is not int or not 0 <= value < len(self._ndims):
+            raise RuntimeError(
+                "Invalid argument. Unknown pipeline value: " + str(value)
+            )
+
+        return value
+
+    def _build(self, outputs: "tuple[int]"):
+        if not outputs:
+            raise RuntimeError("Invalid arguments. No outputs requested.")
+
+        # The server takes the operands first (in the order they are streamed), followed
+        # by the results of the operations (in order)
+        order = [value for value, _ in self._operands]
+        order += [value for value, _, _ in self._nodes]
+        position = {value: pos for pos, value in enumerate(order)}
+
+        graph = grpcdemo_pb2.PipelineGraph(
+            nodes=[
+                grpcdemo_pb2.PipelineNode(
+                    operation=operation, inputs=[position[arg] for arg in args]
+                )
+                for _, operation, args in self._nodes
+            ],
+            outputs=[position[self._check_value(value)] for value in outputs],
+        )
+
+        return graph, [array for _, array in self._operands]
+
+    def _unpack(self, outputs: "tuple[int]", results: "list[np.ndarray]"):
+        # Vectors are received as single-row matrices
+        return [
+            result.reshape(-1) if self._ndims[value] == 1 else result
+            for value, result in zip(outputs, results)
+        ]
+
+
+class DemoGRPCSession:
+    """Provides a session of the API Eigen Example client, which performs several operations over a long-lived stream.
+
+    Each operation is sent as a single message, with its own header (the operation and the
+    request id) and its full operands, so no call is set up per operation. Operations may be
+    pipelined: ``submit`` does not wait for the result, which is correlated by its request id.
+    Sessions are opened by means of ``DemoGRPCClient.session``.
+    """
+
+    def __init__(self, client):
+        """Open a session.
+
+        Parameters
+        ----------
+        client : DemoGRPCClient
+            Client performing the operations.
+        """
+        self._client = client
+        self._request_ids = itertools.count(1)
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._error = None
+        self._closed = False
+
+        # Requests are queued until sent... and responses are read by a separate thread
+        self._requests = queue.SimpleQueue()
+        self._responses = client._stub.Session(iter(self._requests.get, None))
+        self._reader = threading.Thread(target=self._read_responses, daemon=True)
+        self._reader.start()
+
+    def __enter__(self):
+        """Enter the session."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the session."""
+        self.close()
+
+    def close(self):
+        """Close the session, once the pending operations are done."""
+        # Later requests are refused... since they would be queued after the end of the stream
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._requests.put(None)
+
+        self._reader.join()
+
+    def submit(self, operation, *args):
+        """Request an operation, without waiting for its result.
+
+        Parameters
+        ----------
+        operation : str
+            Operation to perform. Options are ``flip_vector``, ``add_vectors``,
+            ``multiply_vectors``, ``add_matrices`` and ``multiply_matrices``.
+        *args : numpy.ndarray
+            Operands, which are limited to ``constants.MAX_CHUNKSIZE`` bytes in total.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future result of the operation.
+
+        Raises
+        ------
+        RuntimeError
+            In case the session is closed.
+        """
+        # The operation is running once requested (i.e. it can no longer be cancelled)
+        future = futures.Future()
+        future.set_running_or_notify_cancel()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Session closed.")
+            elif self._error is not None:
+                raise self._error
+
+            request_id = next(self._request_ids)
+            errors = []
+            request = self._client._generate_session_request(
+                request_id, operation, *args, errors=errors
+            )
+            self._pending[request_id] = future
+            self._requests.put(request)
+
+        # The result is received with full precision
+        self._client._set_transport_error(errors, [])
+
+        return future
+
+    def flip_vector(self, vector):
+        """Flip the position of a numpy.ndarray vector such that [A, B, C, D] --> [D, C, B, A].
+
+        Returns
+        -------
+        numpy.ndarray
+            Flipped vector.
+        """
+        return self.submit("flip_vector", vector).result()
+
+    def add_vectors(self, *args):
+        """Add numpy.ndarray vectors using the Eigen library on the server side.
+
+        Returns
+        -------
+        numpy.ndarray
+            Result of the given numpy.ndarrays.
+        """
+        return self.submit("add_vectors", *args).result()
+
+    def multiply_vectors(self, *args):
+        """Multiply numpy.ndarray vectors using the Eigen library on the server side.
+
+        Returns
+        -------
+        numpy.ndarray
+            Result of the multiplication of numpy.ndarray vectors (a single value).
+        """
+        return self.submit("multiply_vectors", *args).result()
+
+    def add_matrices(self, *args):
+        """Add numpy.ndarray matrices using the Eigen library on the server side.
+
+        Returns
+        -------
+        numpy.ndarray
+            Resulting numpy.ndarray of the matrices addition.
+        """
+        return self.submit("add_matrices", *args).result()
+
+    def multiply_matrices(self, *args):
+        """Multiply numpy.ndarray matrices using the Eigen library on the server side.
+
+        Returns
+        -------
+        numpy.ndarray
+            Resulting numpy.ndarray of the matrices' multiplication.
+        """
+        return self.submit("multiply_matrices", *args).result()
+
+    # =================================================================================================
+    # PRIVATE METHODS for Session operations
+    # =================================================================================================
+
+    def _read_responses(self):
+        # Resolve the pending operations as their responses arrive
+        try:
+            for response in self._responses:
+                with self._lock:
+                    future = self._pending.pop(response.request_id)
+
+                try:
+                    future.set_result(self._client._read_session_response(response))
+                except RuntimeError as error:
+                    future.set_exception(error)
+
+            error = RuntimeError("Session closed.")
+        except grpc.RpcError as rpc_error:
+            error = rpc_error
+
+        # Fail the operations still pending (if any)... and any later request
+        with self._lock:
+            self._error = error
+            pending, self._pending = self._pending, {}
+
+        for future in pending.values():
+            future.set_exception(error)
+
+
+class AsyncDemoGRPCSession:
+    """Provides a session of the asyncio-based API Eigen Example client, which performs several operations over a long-lived stream.
+
+    It behaves as ``DemoGRPCSession``, but its operations are awaitables. Sessions are
+    opened by means of ``AsyncDemoGRPCClient.session``, as asynchronous context managers.
+    """
+
+    def __init__(self, client):
+        """Initialize the session, which is opened when entering it.
+
+        Parameters
+        ----------
+        client : AsyncDemoGRPCClient
+            Client performing the operations.
+        """
+        self._client = client
+        self._request_ids = itertools.count(1)
+        self._pending = {}
+        self._error = None
+        self._closed = False
+        self._call = None
+        self._reader = None
+        self._write_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        """Open the session."""
+        self._call = self._client._stub.Session()
+        self._reader = asyncio.create_task(self._read_responses())
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Close the session, once the pending operations are done."""
+        # Later requests are refused... since they would be written after the end of the stream
+        async with self._write_lock:
+            self._closed = True
+            await self._call.done_writing()
+        await self._reader
+
+    async def submit(self, operation, *args):
+        """Request an operation, without waiting for its result.
+
+        Parameters
+        ----------
+        operation : str
+            Operation to perform, as in ``DemoGRPCSession.submit``.
+        *args : numpy.ndarray
+            Operands, which are limited to ``constants.MAX_CHUNKSIZE`` bytes in total.
+
+        Returns
+        -------
+        asyncio.Future
+            Future result of the operation.
+
+        Raises
+        ------
+        RuntimeError
+            In case the session is closed.
+        """
+        if self._error is not None:
+            raise self._error
+
+        request_id = next(self._request_ids)
+        errors = []
+        request = self._client._generate_session_request(
+            request_id, operation, *args, errors=errors
+        )
+        future = asyncio.get_running_loop().create_future()
+        async with self._write_lock:
+            if self._closed:
+                raise RuntimeError("Session closed.")
+
+            self._pending[request_id] = future
+            await self._call.write(request)
+
+        # The result is received with full precision
+        self._client._set_transport_error(errors, [])
+
+        return future
+
+    async def flip_vector(self, vector):
+        """Flip the position of a numpy.ndarray vector such that [A, B, C, D] --> [D, C, B, A].
+
+        Returns
+        -------
+        numpy.ndarray
+            Flipped vector.
+        """
+        return await (await self.submit("flip_vector", vector))
+
+    async def add_vectors(self, *args):
+        """Add numpy.ndarray vectors using the Eigen library on the server side.
+
+        Returns
+        -------
+        numpy.ndarray
+            Result of the given numpy.ndarrays.
+        """
+        return await (await self.submit("add_vectors", *args))
+
+    async def multiply_vectors(self, *args):
+        """Multiply numpy.ndarray vectors using the Eigen library on the server side.
+
+        Returns
+        -------
+        numpy.ndarray
+            Result of the multiplication of numpy.ndarray vectors (a single value).
+        """
+        return await (await self.submit("multiply_vectors", *args))
+
+    async def add_matrices(self, *args):
+        """Add numpy.ndarray matrices using the Eigen library on the server side.
+
+        Returns
+        -------
+        numpy.ndarray
+            Resulting numpy.ndarray of the matrices addition.
+        """
+        return await (await self.submit("add_matrices", *args))
+
+    async def multiply_matrices(self, *args):
+        """Multiply numpy.ndarray matrices using the Eigen library on the server side.
+
+        Returns
+        -------
+        numpy.ndarray
+            Resulting numpy.ndarray of the matrices' multiplication.
+        """
+        return await (await self.submit("multiply_matrices", *args))
+
+    # =================================================================================================
+    # PRIVATE METHODS for Session operations
+    # =================================================================================================
+
+    async def _read_responses(self):
+        # Resolve the pending operations as their responses arrive
+        try:
+            async for response in self._call:
+                # Skip the results no longer awaited (i.e. cancelled)
+                future = self._pending.pop(response.request_id)
+                if future.done():
+                    continue
+
+                try:
+                    future.set_result(self._client._read_session_response(response))
+                except RuntimeError as error:
+                    future.set_exception(error)
+
+            error = RuntimeError("Session closed.")
+        except grpc.RpcError as rpc_error:
+            error = rpc_error
+
+        # Fail the operations still pending (if any)... and any later request
+        self._error = error
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+
+class ChunkSizeTuner:
+    """Provides the selection of the chunk size from the throughput of recent calls.
+
+    Candidates are the powers of two from ``constants.MIN_CHUNKSIZE`` up to the largest
+    chunk size allowed (and that one). Chunk sizes which do not split the largest operand
+    of a call are equivalent, so only the smallest of them is a candidate for that call.
+    Each of the candidates is tried first. Afterwards, the one with the best mean
+    throughput over its recent calls is selected, while one of its neighbours is tried
+    every few calls, so that changing conditions are followed. The tuner is shared by
+    concurrent calls, which are serialized on its lock.
+    """
+
+    def __init__(self, window=8, explore=10):
+        """Initialize the tuner, without measurements.
+
+        Parameters
+        ----------
+        window : int, optional
+            Number of recent calls whose throughput is averaged per chunk size.
+            The default is 8.
+        explore : int, optional
+            Period (in calls) with which a neighbour of the best chunk size is tried.
+            The default is 10.
+        """
+        self._lock = threading.Lock()
+        self._window = window
+        self._explore = explore
+        self._throughputs = {}
+        self._calls = 0
+
+    def select(self, limit: int, nbytes: int = None):
+        """Select the chunk size of a call.
+
+        Parameters
+        ----------
+        limit : int
+            Largest chunk size allowed.
+        nbytes : int, optional
+            Size (in bytes, as transmitted) of the largest operand of the call. The default
+            is ``None``, in which case all chunk sizes up to the limit are candidates.
+
+        Returns
+        -------
+        int
+            Chunk size to use.
+        """
+        with self._lock:
+            candidates = self._candidates(limit, nbytes)
+
+            # Try the candidates not measured yet
+            for candidate in candidates:
+                if candidate not in self._throughputs:
+                    return candidate
+
+            # Use the best one... or try one of its neighbours, every few calls
+            self._calls += 1
+            best = max(candidates, key=self._mean_throughput)
+            if self._calls % self._explore != 0:
+                return best
+
+            idx = candidates.index(best)
+            neighbours = [
+                candidates[i] for i in (idx - 1, idx + 1) if 0 <= i < len(candidates)
+            ]
+            return neighbours[(self._calls // self._explore) % len(neighbours)]
+
+    def record(self, chunk_size: int, nbytes: int, seconds: float):
+        """Record the throughput of a call.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Chunk size used in the call.
+        nbytes : int
+            Amount of bytes transmitted in the call (sent and received).
+        seconds : float
+            Duration of the call.
+        """
+        with self._lock:
+            if chunk_size not in self._throughputs:
+                self._throughputs[chunk_size] = collections.deque(maxlen=self._window)
+            self._throughputs[chunk_size].append(nbytes / max(seconds, 1e-9))
+
+    def _candidates(self, limit: int, nbytes: int = None):
+        # Powers of two within the limit... and the limit itself. Once a chunk size holds
+        # the largest operand, the larger ones are equivalent (and not explored)
+        candidates = []
+        chunk_size = constants.MIN_CHUNKSIZE
+        while chunk_size < limit:
+            candidates.append(chunk_size)
+            if nbytes is not None and chunk_size >= nbytes:
+                return candidates
+            chunk_size *= 2
+        candidates.append(limit)
+
+        return candidates
+
+    def _mean_throughput(self, chunk_size: int):
+        throughputs = self._throughputs[chunk_size]
+        return sum(throughputs) / len(throughputs)
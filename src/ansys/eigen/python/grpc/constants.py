@@ -2,15 +2,87 @@
 
 from math import floor
 from sys import getsizeof
+import zlib
 
+import grpc
 import numpy as np
 
+import ansys.eigen.python.grpc.generated.grpcdemo_pb2 as grpcdemo_pb2
+
 MAX_CHUNKSIZE = 1024 * 1024 * 3
-"""Maximum chunk size for transmitting in gRPC."""
+"""Maximum chunk size for transmitting in gRPC (and default one)."""
+
+MIN_CHUNKSIZE = 1024 * 64
+"""Minimum chunk size for transmitting in gRPC."""
+
+MAX_MESSAGE_LENGTH = 1024 * 1024 * 4
+"""Default maximum length of the messages received by gRPC channels and servers."""
+
+MESSAGE_OVERHEAD = 1024
+"""Amount of bytes reserved within each message for the fields other than its payload."""
 
-NP_DTYPE_TO_DATATYPE = {np.int32: "INTEGER", np.float64: "DOUBLE"}
+NP_DTYPE_TO_DATATYPE = {
+    np.int32: "INTEGER",
+    np.float64: "DOUBLE",
+    np.float32: "FLOAT",
+    np.float16: "HALF",
+}
 """Dictionary of constants showing the translation between the handled numpy dtypes and the gRPC DataType enum values."""
 
+DATATYPE_TO_NP_DTYPE = {
+    grpcdemo_pb2.DataType.Value(data_type): np_dtype
+    for np_dtype, data_type in NP_DTYPE_TO_DATATYPE.items()
+}
+"""Dictionary of constants showing the translation between the gRPC DataType enum values and the handled numpy dtypes."""
+
+TRANSPORT_DTYPES = {"float32": np.float32, "float16": np.float16}
+"""Dictionary of constants showing the reduced precisions handled for transmitting floating-point arrays, and their numpy dtypes."""
+
+COMPUTE_DTYPES = {"float64": np.float64, "float32": np.float32}
+"""Dictionary of constants showing the precisions handled for computing over arrays transmitted with a reduced precision, and their numpy dtypes."""
+
+BATCHED_OPERATIONS = {
+    "add-vectors": 2,
+    "multiply-vectors": 2,
+    "add-matrices": 3,
+    "multiply-matrices": 3,
+}
+"""Dictionary of constants showing the operations handled by the BatchedOperation service, and the number of dimensions of their stacks."""
+
+PIPELINE_OPERATIONS = {
+    "flip_vector": 1,
+    "add_vectors": 1,
+    "multiply_vectors": 1,
+    "add_matrices": 2,
+    "multiply_matrices": 2,
+}
+"""Dictionary of constants showing the operations handled by the Pipeline and Session services, and the number of dimensions of their inputs and results."""
+
+STORE_BUDGET = 1024 * 1024 * 512
+"""Default maximum amount of bytes held by the arrays stored on the server."""
+
+PROTOCOL_VERSION = 2
+"""Version of the streaming protocol used by default: 1 describes the streamed vectors and matrices within the metadata and every chunk message, 2 within a header message sent first."""
+
+PROTOCOL_VERSIONS = (1, 2)
+"""Versions of the streaming protocol handled."""
+
+COMPRESSIONS = {
+    "none": grpc.Compression.NoCompression,
+    "gzip": grpc.Compression.Gzip,
+    "deflate": grpc.Compression.Deflate,
+}
+"""Dictionary of constants showing the compression algorithms handled for the streamed messages, and their gRPC counterparts."""
+
+MIN_COMPRESSION_SIZE = 1024 * 64
+"""Minimum amount of bytes of the streamed vectors or matrices for compressing them."""
+
+COMPRESSION_SAMPLE = 1024 * 16
+"""Amount of bytes sampled (from several positions of the largest array) for estimating whether the streamed vectors or matrices are compressible."""
+
+MAX_COMPRESSION_RATIO = 0.9
+"""Maximum ratio between the compressed and the original size of the sample for compressing the streamed vectors or matrices."""
+
 HUMAN_SIZES = ["B", "KB", "MB", "GB", "TB"]
 """List of human-readable sizes handled."""
 
@@ -42,3 +114,363 @@ def human_size(content: object):
         raise RuntimeError("Message size above TB level... Not handled!")
 
     return str(content_length) + HUMAN_SIZES[idx]
+
+
+def fill_chunk(array, filled, chunk, message_name, dtype=None):
+    """Copy a received chunk into its slot of a preallocated 1D array.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        Preallocated 1D array (or 1D view) to fill in.
+    filled : int
+        Number of elements already written into the array.
+    chunk : bytes
+        Raw content of the received chunk.
+    message_name : str
+        Name of the message being processed. It is used in the error message.
+    dtype : numpy.dtype, optional
+        Type of the elements of the chunk, which are converted to the type of the array.
+        The default is ``None``, meaning the type of the array.
+
+    Returns
+    -------
+    int
+        Number of elements written into the array after copying the chunk.
+
+    Raises
+    ------
+    RuntimeError
+        In case the chunk does not fit into the remaining space of the array.
+    """
+    # Interpret the chunk without copying it... and check that it fits
+    tmp = np.frombuffer(chunk, dtype=dtype or array.dtype)
+    last = filled + tmp.size
+    if last > array.size:
+        raise RuntimeError("Problems reading " + message_name + " message...")
+
+    # Copy (and convert, if needed) the chunk straight into its slot
+    array[filled:last] = tmp
+
+    return last
+
+
+def chunk_boundaries(arg: np.ndarray, chunk_size: int = MAX_CHUNKSIZE, dtype=None):
+    """Determine the last element index of each chunk in which to decompose an array.
+
+    Matrices are decomposed in full rows whenever a row fits in a chunk. This allows
+    for serializing each chunk with a single copy, even if the matrix is not
+    C-contiguous (for example, column-major results provided by Eigen).
+
+    Parameters
+    ----------
+    arg : numpy.ndarray
+        Vector or matrix to transmit.
+    chunk_size : int, optional
+        Maximum amount of bytes per chunk. The default is ``MAX_CHUNKSIZE``.
+    dtype : numpy.dtype, optional
+        Type of the elements transmitted. The default is ``None``, meaning the type of
+        the array.
+
+    Returns
+    -------
+    list[int]
+        Last index (in C order) up to which to process in each chunk message.
+    """
+    # Max amount of elements per chunk
+    max_elems = max(chunk_size // np.dtype(dtype or arg.dtype).itemsize, 1)
+
+    # In case of matrices, round it to full rows (if possible)
+    if arg.ndim == 2 and 0 < arg.shape[1] <= max_elems:
+        max_elems = (max_elems // arg.shape[1]) * arg.shape[1]
+
+    # If size is not surpassed, deal with a single message
+    if arg.size <= max_elems:
+        return [arg.size]
+
+    # Otherwise, provide the last index of each chunk... and take into account
+    # that if there is a remainder, one last partial message is needed
+    last_idx_chunk = list(range(max_elems, arg.size + 1, max_elems))
+    if arg.size % max_elems != 0:
+        last_idx_chunk.append(arg.size)
+
+    return last_idx_chunk
+
+
+def check_chunk_size(chunk_size: int, max_message_length: int = MAX_MESSAGE_LENGTH):
+    """Check that a chunk size fits within the messages allowed.
+
+    Parameters
+    ----------
+    chunk_size : int
+        Maximum amount of bytes per chunk.
+    max_message_length : int, optional
+        Maximum length of the messages. The default is ``MAX_MESSAGE_LENGTH``.
+
+    Returns
+    -------
+    int
+        Checked chunk size.
+
+    Raises
+    ------
+    RuntimeError
+        In case the chunk size is below ``MIN_CHUNKSIZE``, or the chunks (and the rest
+        of their message) do not fit within the maximum length of the messages.
+    """
+    if not MIN_CHUNKSIZE <= chunk_size <= max_message_length - MESSAGE_OVERHEAD:
+        raise RuntimeError(
+            "Invalid chunk size: %d. It must be between %d and %d bytes."
+            % (chunk_size, MIN_CHUNKSIZE, max_message_length - MESSAGE_OVERHEAD)
+        )
+
+    return chunk_size
+
+
+def chunk_payloads(
+    arg: np.ndarray, last_idx_chunk: "list[int]", dtype=None, errors: list = None
+):
+    """Serialize the chunks of an array, performing a single copy per chunk.
+
+    C-contiguous arrays are sliced through a memoryview over their buffer, so that
+    the only copy is the one creating the ``bytes`` object required by protobuf.
+    Non-contiguous arrays (such as ``np.flip`` views or column-major matrices) are
+    sliced with numpy, which writes each chunk in C order directly into its ``bytes``.
+    Chunks transmitted with another type are converted (and then serialized) instead.
+
+    Parameters
+    ----------
+    arg : numpy.ndarray
+        Vector or matrix to transmit.
+    last_idx_chunk : list[int]
+        Last index (in C order) up to which to process in each chunk message.
+    dtype : numpy.dtype, optional
+        Type of the elements transmitted. The default is ``None``, meaning the type of
+        the array.
+    errors : list, optional
+        List to which the maximum relative error introduced by converting each chunk
+        is appended (see ``max_relative_error``). The default is ``None``.
+
+    Yields
+    ------
+    bytes
+        Content of each chunk message.
+    """
+    # Non-contiguous matrices can only be sliced by full rows without copying them.
+    # If the chunks are not made of full rows... make it contiguous once.
+    if not arg.flags.c_contiguous and arg.ndim == 2:
+        cols = arg.shape[1]
+        if any(idx % cols != 0 for idx in last_idx_chunk):
+            arg = np.ascontiguousarray(arg)
+
+    if dtype is not None and np.dtype(dtype) != arg.dtype:
+        # Slice each chunk (a view, either raveled or by full rows)... and convert it
+        flat = arg.reshape(-1) if arg.flags.c_contiguous else None
+        processed_idx = 0
+        for idx in last_idx_chunk:
+            if flat is not None:
+                chunk = flat[processed_idx:idx]
+            else:
+                chunk = arg[processed_idx // arg.shape[1] : idx // arg.shape[1]]
+            with np.errstate(over="ignore"):
+                converted = chunk.astype(dtype)
+            if errors is not None:
+                errors.append(max_relative_error(chunk, converted))
+            yield converted.tobytes()
+            processed_idx = idx
+    elif arg.flags.c_contiguous:
+        # Access the raw buffer of the array (no copy involved)
+        buffer = memoryview(arg).cast("B")
+        processed_idx = 0
+        for idx in last_idx_chunk:
+            yield buffer[processed_idx * arg.itemsize : idx * arg.itemsize].tobytes()
+            processed_idx = idx
+    elif arg.ndim == 1:
+        processed_idx = 0
+        for idx in last_idx_chunk:
+            yield arg[processed_idx:idx].tobytes()
+            processed_idx = idx
+    else:
+        processed_row = 0
+        for idx in last_idx_chunk:
+            yield arg[processed_row : idx // arg.shape[1]].tobytes()
+            processed_row = idx // arg.shape[1]
+
+
+def stream_header(chunks: "list[list[int]]", *args: np.ndarray, transport=None):
+    """Build the header of a stream (protocol version 2), describing the arrays sent.
+
+    Parameters
+    ----------
+    chunks : list[list[int]]
+        Chunk indices for the list of arrays to send.
+    args : np.ndarray
+        Vectors or matrices to send.
+    transport : str, optional
+        Reduced precision with which to transmit floating-point arrays (see
+        ``transport_dtype``). The default is ``None``.
+
+    Returns
+    -------
+    grpcdemo_pb2.StreamHeader
+        Header with the data type, the shape and the amount of chunks of each array.
+    """
+    return grpcdemo_pb2.StreamHeader(
+        operands=[
+            grpcdemo_pb2.OperandHeader(
+                data_type=NP_DTYPE_TO_DATATYPE[transport_dtype(arg, transport).type],
+                shape=arg.shape,
+                chunks=len(arg_chunks),
+            )
+            for arg, arg_chunks in zip(args, chunks)
+        ]
+    )
+
+
+def read_stream_header(msg, ndim: int, message_name: str):
+    """Read the header of a stream (protocol version 2) from its first message.
+
+    Parameters
+    ----------
+    msg : grpcdemo_pb2.Vector or grpcdemo_pb2.Matrix
+        First message of the stream.
+    ndim : int
+        Number of dimensions of the arrays sent: 1 for vectors and 2 for matrices.
+    message_name : str
+        Name of the stream being processed. It is used in the error message.
+
+    Returns
+    -------
+    list[tuple]
+        Data type (``DataType`` value), shape and amount of chunks of each array sent.
+
+    Raises
+    ------
+    RuntimeError
+        In case the message is not a valid header.
+    """
+    if not msg.HasField("header"):
+        raise RuntimeError("Missing header of the " + message_name + " stream...")
+
+    operands = []
+    for operand in msg.header.operands:
+        if len(operand.shape) != ndim:
+            raise RuntimeError("Problems reading " + message_name + " stream header...")
+        operands.append((operand.data_type, tuple(operand.shape), operand.chunks))
+
+    return operands
+
+
+def select_compression(compression: str, *args: np.ndarray):
+    """Select the compression algorithm of the messages transmitting some arrays.
+
+    Compression is skipped for small arrays (below ``MIN_COMPRESSION_SIZE`` bytes in
+    total) and for incompressible ones, as estimated by compressing a sample of the
+    largest array (at the fastest level) and comparing against ``MAX_COMPRESSION_RATIO``.
+
+    Parameters
+    ----------
+    compression : str
+        Requested compression algorithm. Options are the keys of ``COMPRESSIONS``.
+    args : np.ndarray
+        Vectors or matrices to transmit.
+
+    Returns
+    -------
+    str
+        Selected compression algorithm: either the requested one or ``"none"``.
+
+    Raises
+    ------
+    RuntimeError
+        In case the compression algorithm is not handled.
+    """
+    if compression not in COMPRESSIONS:
+        raise RuntimeError(
+            "Invalid compression. Options are: " + ", ".join(COMPRESSIONS)
+        )
+
+    # Small arrays are not worth compressing
+    if compression == "none" or sum(arg.nbytes for arg in args) < MIN_COMPRESSION_SIZE:
+        return "none"
+
+    # Sample the largest array at several evenly spaced positions (flat indexing copies
+    # the sampled elements only, in C order, whatever the layout of the array)
+    arg = max(args, key=lambda arg: arg.nbytes)
+    positions = 4
+    elems = max(COMPRESSION_SAMPLE // (positions * arg.itemsize), 1)
+    step = max(arg.size // positions, elems)
+    sample = b"".join(
+        arg.flat[start : start + elems].tobytes() for start in range(0, arg.size, step)
+    )
+
+    # Skip the compression if the sample does not shrink enough
+    if len(zlib.compress(sample, 1)) > MAX_COMPRESSION_RATIO * len(sample):
+        return "none"
+
+    return compression
+
+
+def transport_dtype(arg: np.ndarray, transport: str = None):
+    """Determine the type with which to transmit an array.
+
+    Floating-point arrays are transmitted with the reduced precision requested (unless
+    theirs is already lower). The rest of arrays are transmitted with their own type.
+
+    Parameters
+    ----------
+    arg : numpy.ndarray
+        Vector or matrix to transmit.
+    transport : str, optional
+        Reduced precision requested. Options are the keys of ``TRANSPORT_DTYPES``.
+        The default is ``None``, meaning no reduction.
+
+    Returns
+    -------
+    numpy.dtype
+        Type of the elements transmitted.
+
+    Raises
+    ------
+    RuntimeError
+        In case the reduced precision is not handled.
+    """
+    if transport is None:
+        return arg.dtype
+    elif transport not in TRANSPORT_DTYPES:
+        raise RuntimeError(
+            "Invalid transport precision. Options are: " + ", ".join(TRANSPORT_DTYPES)
+        )
+
+    dtype = np.dtype(TRANSPORT_DTYPES[transport])
+    if arg.dtype.kind != "f" or arg.dtype.itemsize <= dtype.itemsize:
+        return arg.dtype
+
+    return dtype
+
+
+def max_relative_error(exact: np.ndarray, converted: np.ndarray):
+    """Compute the maximum relative error introduced by converting an array.
+
+    Zero and non-finite elements are skipped. Elements overflowing the converted type
+    introduce an infinite error.
+
+    Parameters
+    ----------
+    exact : numpy.ndarray
+        Original array.
+    converted : numpy.ndarray
+        Array converted to another type.
+
+    Returns
+    -------
+    float
+        Maximum relative error of the elements of the converted array.
+    """
+    magnitude = np.abs(exact)
+    mask = np.isfinite(exact) & (exact != 0)
+    with np.errstate(invalid="ignore"):
+        error = np.abs(converted - exact)
+    np.divide(error, magnitude, out=error, where=mask)
+
+    return float(np.max(error, initial=0.0, where=mask))
@@ -15,18 +15,44 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0egrpcdemo.proto\x12\x08grpcdemo\"]\n\x06Vector\x12%\n\tdata_type\x18\x01 \x01(\x0e\x32\x12.grpcdemo.DataType\x12\x13\n\x0bvector_size\x18\x02 \x01(\x05\x12\x17\n\x0fvector_as_chunk\x18\x03 \x01(\x0c\"r\n\x06Matrix\x12%\n\tdata_type\x18\x01 \x01(\x0e\x32\x12.grpcdemo.DataType\x12\x13\n\x0bmatrix_rows\x18\x02 \x01(\x05\x12\x13\n\x0bmatrix_cols\x18\x03 \x01(\x05\x12\x17\n\x0fmatrix_as_chunk\x18\x04 \x01(\x0c\"\x1c\n\x0cHelloRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"\x1d\n\nHelloReply\x12\x0f\n\x07message\x18\x01 \x01(\t*#\n\x08\x44\x61taType\x12\x0b\n\x07INTEGER\x10\x00\x12\n\n\x06\x44OUBLE\x10\x01\x32\xea\x02\n\x08GRPCDemo\x12:\n\x08SayHello\x12\x16.grpcdemo.HelloRequest\x1a\x14.grpcdemo.HelloReply\"\x00\x12\x36\n\nFlipVector\x12\x10.grpcdemo.Vector\x1a\x10.grpcdemo.Vector\"\x00(\x01\x30\x01\x12\x36\n\nAddVectors\x12\x10.grpcdemo.Vector\x1a\x10.grpcdemo.Vector\"\x00(\x01\x30\x01\x12;\n\x0fMultiplyVectors\x12\x10.grpcdemo.Vector\x1a\x10.grpcdemo.Vector\"\x00(\x01\x30\x01\x12\x37\n\x0b\x41\x64\x64Matrices\x12\x10.grpcdemo.Matrix\x1a\x10.grpcdemo.Matrix\"\x00(\x01\x30\x01\x12<\n\x10MultiplyMatrices\x12\x10.grpcdemo.Matrix\x1a\x10.grpcdemo.Matrix\"\x00(\x01\x30\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0egrpcdemo.proto\x12\x08grpcdemo\"U\n\rOperandHeader\x12%\n\tdata_type\x18\x01 \x01(\x0e\x32\x12.grpcdemo.DataType\x12\r\n\x05shape\x18\x02 \x03(\x05\x12\x0e\n\x06\x63hunks\x18\x03 \x01(\x05\"9\n\x0cStreamHeader\x12)\n\x08operands\x18\x01 \x03(\x0b\x32\x17.grpcdemo.OperandHeader\"\x85\x01\n\x06Vector\x12%\n\tdata_type\x18\x01 \x01(\x0e\x32\x12.grpcdemo.DataType\x12\x13\n\x0bvector_size\x18\x02 \x01(\x05\x12\x17\n\x0fvector_as_chunk\x18\x03 \x01(\x0c\x12&\n\x06header\x18\x04 \x01(\x0b\x32\x16.grpcdemo.StreamHeader\"\x9a\x01\n\x06Matrix\x12%\n\tdata_type\x18\x01 \x01(\x0e\x32\x12.grpcdemo.DataType\x12\x13\n\x0bmatrix_rows\x18\x02 \x01(\x05\x12\x13\n\x0bmatrix_cols\x18\x03 \x01(\x05\x12\x17\n\x0fmatrix_as_chunk\x18\x04 \x01(\x0c\x12&\n\x06header\x18\x05 \x01(\x0b\x32\x16.grpcdemo.StreamHeader\",\n\x07Vectors\x12!\n\x07vectors\x18\x01 \x03(\x0b\x32\x10.grpcdemo.Vector\".\n\x08Matrices\x12\"\n\x08matrices\x18\x01 \x03(\x0b\x32\x10.grpcdemo.Matrix\"\x14\n\x06Handle\x12\n\n\x02id\x18\x01 \x01(\t\" \n\x0cReleaseReply\x12\x10\n\x08released\x18\x01 \x01(\x08\"1\n\x0cPipelineNode\x12\x11\n\toperation\x18\x01 \x01(\t\x12\x0e\n\x06inputs\x18\x02 \x03(\x05\"G\n\rPipelineGraph\x12%\n\x05nodes\x18\x01 \x03(\x0b\x32\x16.grpcdemo.PipelineNode\x12\x0f\n\x07outputs\x18\x02 \x03(\x05\"~\n\x0eSessionRequest\x12\x12\n\nrequest_id\x18\x01 \x01(\x03\x12\x11\n\toperation\x18\x02 \x01(\t\x12!\n\x07vectors\x18\x03 \x03(\x0b\x32\x10.grpcdemo.Vector\x12\"\n\x08matrices\x18\x04 \x03(\x0b\x32\x10.grpcdemo.Matrix\"x\n\x0fSessionResponse\x12\x12\n\nrequest_id\x18\x01 \x01(\x03\x12 \n\x06vector\x18\x02 \x01(\x0b\x32\x10.grpcdemo.Vector\x12 \n\x06matrix\x18\x03 \x01(\x0b\x32\x10.grpcdemo.Matrix\x12\r\n\x05\x65rror\x18\x04 \x01(\t\"\x1c\n\x0cHelloRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"\x1d\n\nHelloReply\x12\x0f\n\x07message\x18\x01 \x01(\t*8\n\x08\x44\x61taType\x12\x0b\n\x07INTEGER\x10\x00\x12\n\n\x06\x44OUBLE\x10\x01\x12\t\n\x05\x46LOAT\x10\x02\x12\x08\n\x04HALF\x10\x03\x32\xfa\x08\n\x08GRPCDemo\x12:\n\x08SayHello\x12\x16.grpcdemo.HelloRequest\x1a\x14.grpcdemo.HelloReply\"\x00\x12\x36\n\nFlipVector\x12\x10.grpcdemo.Vector\x1a\x10.grpcdemo.Vector\"\x00(\x01\x30\x01\x12\x36\n\nAddVectors\x12\x10.grpcdemo.Vector\x1a\x10.grpcdemo.Vector\"\x00(\x01\x30\x01\x12;\n\x0fMultiplyVectors\x12\x10.grpcdemo.Vector\x1a\x10.grpcdemo.Vector\"\x00(\x01\x30\x01\x12\x37\n\x0b\x41\x64\x64Matrices\x12\x10.grpcdemo.Matrix\x1a\x10.grpcdemo.Matrix\"\x00(\x01\x30\x01\x12<\n\x10MultiplyMatrices\x12\x10.grpcdemo.Matrix\x1a\x10.grpcdemo.Matrix\"\x00(\x01\x30\x01\x12<\n\x10\x42\x61tchedOperation\x12\x10.grpcdemo.Matrix\x1a\x10.grpcdemo.Matrix\"\x00(\x01\x30\x01\x12\x36\n\x0cUploadVector\x12\x10.grpcdemo.Vector\x1a\x10.grpcdemo.Handle\"\x00(\x01\x12\x36\n\x0cUploadMatrix\x12\x10.grpcdemo.Matrix\x1a\x10.grpcdemo.Handle\"\x00(\x01\x12;\n\rReleaseHandle\x12\x10.grpcdemo.Handle\x1a\x16.grpcdemo.ReleaseReply\"\x00\x12:\n\x0eOperateVectors\x12\x10.grpcdemo.Vector\x1a\x10.grpcdemo.Vector\"\x00(\x01\x30\x01\x12;\n\x0fOperateMatrices\x12\x10.grpcdemo.Matrix\x1a\x10.grpcdemo.Matrix\"\x00(\x01\x30\x01\x12\x34\n\x08Pipeline\x12\x10.grpcdemo.Matrix\x1a\x10.grpcdemo.Matrix\"\x00(\x01\x30\x01\x12\x44\n\x07Session\x12\x18.grpcdemo.SessionRequest\x1a\x19.grpcdemo.SessionResponse\"\x00(\x01\x30\x01\x12\x38\n\x0f\x46lipVectorUnary\x12\x11.grpcdemo.Vectors\x1a\x10.grpcdemo.Vector\"\x00\x12\x38\n\x0f\x41\x64\x64VectorsUnary\x12\x11.grpcdemo.Vectors\x1a\x10.grpcdemo.Vector\"\x00\x12=\n\x14MultiplyVectorsUnary\x12\x11.grpcdemo.Vectors\x1a\x10.grpcdemo.Vector\"\x00\x12:\n\x10\x41\x64\x64MatricesUnary\x12\x12.grpcdemo.Matrices\x1a\x10.grpcdemo.Matrix\"\x00\x12?\n\x15MultiplyMatricesUnary\x12\x12.grpcdemo.Matrices\x1a\x10.grpcdemo.Matrix\"\x00\x62\x06proto3')
 
 _DATATYPE = DESCRIPTOR.enum_types_by_name['DataType']
 DataType = enum_type_wrapper.EnumTypeWrapper(_DATATYPE)
 INTEGER = 0
 DOUBLE = 1
+FLOAT = 2
+HALF = 3
 
 
+_OPERANDHEADER = DESCRIPTOR.message_types_by_name['OperandHeader']
+_STREAMHEADER = DESCRIPTOR.message_types_by_name['StreamHeader']
 _VECTOR = DESCRIPTOR.message_types_by_name['Vector']
 _MATRIX = DESCRIPTOR.message_types_by_name['Matrix']
+_VECTORS = DESCRIPTOR.message_types_by_name['Vectors']
+_MATRICES = DESCRIPTOR.message_types_by_name['Matrices']
+_HANDLE = DESCRIPTOR.message_types_by_name['Handle']
+_RELEASEREPLY = DESCRIPTOR.message_types_by_name['ReleaseReply']
+_PIPELINENODE = DESCRIPTOR.message_types_by_name['PipelineNode']
+_PIPELINEGRAPH = DESCRIPTOR.message_types_by_name['PipelineGraph']
+_SESSIONREQUEST = DESCRIPTOR.message_types_by_name['SessionRequest']
+_SESSIONRESPONSE = DESCRIPTOR.message_types_by_name['SessionResponse']
 _HELLOREQUEST = DESCRIPTOR.message_types_by_name['HelloRequest']
 _HELLOREPLY = DESCRIPTOR.message_types_by_name['HelloReply']
+OperandHeader = _reflection.GeneratedProtocolMessageType('OperandHeader', (_message.Message,), {
+  'DESCRIPTOR' : _OPERANDHEADER,
+  '__module__' : 'grpcdemo_pb2'
+  # @@protoc_insertion_point(class_scope:grpcdemo.OperandHeader)
+  })
+_sym_db.RegisterMessage(OperandHeader)
+
+StreamHeader = _reflection.GeneratedProtocolMessageType('StreamHeader', (_message.Message,), {
+  'DESCRIPTOR' : _STREAMHEADER,
+  '__module__' : 'grpcdemo_pb2'
+  # @@protoc_insertion_point(class_scope:grpcdemo.StreamHeader)
+  })
+_sym_db.RegisterMessage(StreamHeader)
+
 Vector = _reflection.GeneratedProtocolMessageType('Vector', (_message.Message,), {
   'DESCRIPTOR' : _VECTOR,
   '__module__' : 'grpcdemo_pb2'
@@ -41,6 +67,62 @@ Matrix = _reflection.GeneratedProtocolMessageType('Matrix', (_message.Message,),
   })
 _sym_db.RegisterMessage(Matrix)
 
+Vectors = _reflection.GeneratedProtocolMessageType('Vectors', (_message.Message,), {
+  'DESCRIPTOR' : _VECTORS,
+  '__module__' : 'grpcdemo_pb2'
+  # @@protoc_insertion_point(class_scope:grpcdemo.Vectors)
+  })
+_sym_db.RegisterMessage(Vectors)
+
+Matrices = _reflection.GeneratedProtocolMessageType('Matrices', (_message.Message,), {
+  'DESCRIPTOR' : _MATRICES,
+  '__module__' : 'grpcdemo_pb2'
+  # @@protoc_insertion_point(class_scope:grpcdemo.Matrices)
+  })
+_sym_db.RegisterMessage(Matrices)
+
+Handle = _reflection.GeneratedProtocolMessageType('Handle', (_message.Message,), {
+  'DESCRIPTOR' : _HANDLE,
+  '__module__' : 'grpcdemo_pb2'
+  # @@protoc_insertion_point(class_scope:grpcdemo.Handle)
+  })
+_sym_db.RegisterMessage(Handle)
+
+ReleaseReply = _reflection.GeneratedProtocolMessageType('ReleaseReply', (_message.Message,), {
+  'DESCRIPTOR' : _RELEASEREPLY,
+  '__module__' : 'grpcdemo_pb2'
+  # @@protoc_insertion_point(class_scope:grpcdemo.ReleaseReply)
+  })
+_sym_db.RegisterMessage(ReleaseReply)
+
+PipelineNode = _reflection.GeneratedProtocolMessageType('PipelineNode', (_message.Message,), {
+  'DESCRIPTOR' : _PIPELINENODE,
+  '__module__' : 'grpcdemo_pb2'
+  # @@protoc_insertion_point(class_scope:grpcdemo.PipelineNode)
+  })
+_sym_db.RegisterMessage(PipelineNode)
+
+PipelineGraph = _reflection.GeneratedProtocolMessageType('PipelineGraph', (_message.Message,), {
+  'DESCRIPTOR' : _PIPELINEGRAPH,
+  '__module__' : 'grpcdemo_pb2'
+  # @@protoc_insertion_point(class_scope:grpcdemo.PipelineGraph)
+  })
+_sym_db.RegisterMessage(PipelineGraph)
+
+SessionRequest = _reflection.GeneratedProtocolMessageType('SessionRequest', (_message.Message,), {
+  'DESCRIPTOR' : _SESSIONREQUEST,
+  '__module__' : 'grpcdemo_pb2'
+  # @@protoc_insertion_point(class_scope:grpcdemo.SessionRequest)
+  })
+_sym_db.RegisterMessage(SessionRequest)
+
+SessionResponse = _reflection.GeneratedProtocolMessageType('SessionResponse', (_message.Message,), {
+  'DESCRIPTOR' : _SESSIONRESPONSE,
+  '__module__' : 'grpcdemo_pb2'
+  # @@protoc_insertion_point(class_scope:grpcdemo.SessionResponse)
+  })
+_sym_db.RegisterMessage(SessionResponse)
+
 HelloRequest = _reflection.GeneratedProtocolMessageType('HelloRequest', (_message.Message,), {
   'DESCRIPTOR' : _HELLOREQUEST,
   '__module__' : 'grpcdemo_pb2'
@@ -59,16 +141,36 @@ _GRPCDEMO = DESCRIPTOR.services_by_name['GRPCDemo']
 if _descriptor._USE_C_DESCRIPTORS == False:
 
   DESCRIPTOR._options = None
-  _DATATYPE._serialized_start=300
-  _DATATYPE._serialized_end=335
-  _VECTOR._serialized_start=28
-  _VECTOR._serialized_end=121
-  _MATRIX._serialized_start=123
-  _MATRIX._serialized_end=237
-  _HELLOREQUEST._serialized_start=239
-  _HELLOREQUEST._serialized_end=267
-  _HELLOREPLY._serialized_start=269
-  _HELLOREPLY._serialized_end=298
-  _GRPCDEMO._serialized_start=338
-  _GRPCDEMO._serialized_end=700
+  _DATATYPE._serialized_start=1052
+  _DATATYPE._serialized_end=1108
+  _OPERANDHEADER._serialized_start=28
+  _OPERANDHEADER._serialized_end=113
+  _STREAMHEADER._serialized_start=115
+  _STREAMHEADER._serialized_end=172
+  _VECTOR._serialized_start=175
+  _VECTOR._serialized_end=308
+  _MATRIX._serialized_start=311
+  _MATRIX._serialized_end=465
+  _VECTORS._serialized_start=467
+  _VECTORS._serialized_end=511
+  _MATRICES._serialized_start=513
+  _MATRICES._serialized_end=559
+  _HANDLE._serialized_start=561
+  _HANDLE._serialized_end=581
+  _RELEASEREPLY._serialized_start=583
+  _RELEASEREPLY._serialized_end=615
+  _PIPELINENODE._serialized_start=617
+  _PIPELINENODE._serialized_end=666
+  _PIPELINEGRAPH._serialized_start=668
+  _PIPELINEGRAPH._serialized_end=739
+  _SESSIONREQUEST._serialized_start=741
+  _SESSIONREQUEST._serialized_end=867
+  _SESSIONRESPONSE._serialized_start=869
+  _SESSIONRESPONSE._serialized_end=989
+  _HELLOREQUEST._serialized_start=991
+  _HELLOREQUEST._serialized_end=1019
+  _HELLOREPLY._serialized_start=1021
+  _HELLOREPLY._serialized_end=1050
+  _GRPCDEMO._serialized_start=1111
+  _GRPCDEMO._serialized_end=2257
 # @@protoc_insertion_point(module_scope)
@@ -50,6 +50,71 @@ class GRPCDemoStub(object):
                 request_serializer=grpcdemo__pb2.Matrix.SerializeToString,
                 response_deserializer=grpcdemo__pb2.Matrix.FromString,
                 )
+        self.BatchedOperation = channel.stream_stream(
+                '/grpcdemo.GRPCDemo/BatchedOperation',
+                request_serializer=grpcdemo__pb2.Matrix.SerializeToString,
+                response_deserializer=grpcdemo__pb2.Matrix.FromString,
+                )
+        self.UploadVector = channel.stream_unary(
+                '/grpcdemo.GRPCDemo/UploadVector',
+                request_serializer=grpcdemo__pb2.Vector.SerializeToString,
+                response_deserializer=grpcdemo__pb2.Handle.FromString,
+                )
+        self.UploadMatrix = channel.stream_unary(
+                '/grpcdemo.GRPCDemo/UploadMatrix',
+                request_serializer=grpcdemo__pb2.Matrix.SerializeToString,
+                response_deserializer=grpcdemo__pb2.Handle.FromString,
+                )
+        self.ReleaseHandle = channel.unary_unary(
+                '/grpcdemo.GRPCDemo/ReleaseHandle',
+                request_serializer=grpcdemo__pb2.Handle.SerializeToString,
+                response_deserializer=grpcdemo__pb2.ReleaseReply.FromString,
+                )
+        self.OperateVectors = channel.stream_stream(
+                '/grpcdemo.GRPCDemo/OperateVectors',
+                request_serializer=grpcdemo__pb2.Vector.SerializeToString,
+                response_deserializer=grpcdemo__pb2.Vector.FromString,
+                )
+        self.OperateMatrices = channel.stream_stream(
+                '/grpcdemo.GRPCDemo/OperateMatrices',
+                request_serializer=grpcdemo__pb2.Matrix.SerializeToString,
+                response_deserializer=grpcdemo__pb2.Matrix.FromString,
+                )
+        self.Pipeline = channel.stream_stream(
+                '/grpcdemo.GRPCDemo/Pipeline',
+                request_serializer=grpcdemo__pb2.Matrix.SerializeToString,
+                response_deserializer=grpcdemo__pb2.Matrix.FromString,
+                )
+        self.Session = channel.stream_stream(
+                '/grpcdemo.GRPCDemo/Session',
+                request_serializer=grpcdemo__pb2.SessionRequest.SerializeToString,
+                response_deserializer=grpcdemo__pb2.SessionResponse.FromString,
+                )
+        self.FlipVectorUnary = channel.unary_unary(
+                '/grpcdemo.GRPCDemo/FlipVectorUnary',
+                request_serializer=grpcdemo__pb2.Vectors.SerializeToString,
+                response_deserializer=grpcdemo__pb2.Vector.FromString,
+                )
+        self.AddVectorsUnary = channel.unary_unary(
+                '/grpcdemo.GRPCDemo/AddVectorsUnary',
+                request_serializer=grpcdemo__pb2.Vectors.SerializeToString,
+                response_deserializer=grpcdemo__pb2.Vector.FromString,
+                )
+        self.MultiplyVectorsUnary = channel.unary_unary(
+                '/grpcdemo.GRPCDemo/MultiplyVectorsUnary',
+                request_serializer=grpcdemo__pb2.Vectors.SerializeToString,
+                response_deserializer=grpcdemo__pb2.Vector.FromString,
+                )
+        self.AddMatricesUnary = channel.unary_unary(
+                '/grpcdemo.GRPCDemo/AddMatricesUnary',
+                request_serializer=grpcdemo__pb2.Matrices.SerializeToString,
+                response_deserializer=grpcdemo__pb2.Matrix.FromString,
+                )
+        self.MultiplyMatricesUnary = channel.unary_unary(
+                '/grpcdemo.GRPCDemo/MultiplyMatricesUnary',
+                request_serializer=grpcdemo__pb2.Matrices.SerializeToString,
+                response_deserializer=grpcdemo__pb2.Matrix.FromString,
+                )
 
 
 class GRPCDemoServicer(object):
@@ -103,6 +168,97 @@ class GRPCDemoServicer(object):
         context.set_details('Method is not implemented.')
         raise NotImplementedError('Method is not implemented.')
 
+    def BatchedOperation(self, request_iterator, context):
+        """Perform an operation over two stacks of vectors or matrices.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method is not implemented.')
+        raise NotImplementedError('Method is not implemented.')
+
+    def UploadVector(self, request_iterator, context):
+        """Store a vector on the server, which can then be referenced by its handle.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method is not implemented.')
+        raise NotImplementedError('Method is not implemented.')
+
+    def UploadMatrix(self, request_iterator, context):
+        """Store a matrix on the server, which can then be referenced by its handle.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method is not implemented.')
+        raise NotImplementedError('Method is not implemented.')
+
+    def ReleaseHandle(self, request, context):
+        """Release a stored vector or matrix.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method is not implemented.')
+        raise NotImplementedError('Method is not implemented.')
+
+    def OperateVectors(self, request_iterator, context):
+        """Operate vectors, either stored (referenced by their handles) or streamed.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method is not implemented.')
+        raise NotImplementedError('Method is not implemented.')
+
+    def OperateMatrices(self, request_iterator, context):
+        """Operate matrices, either stored (referenced by their handles) or streamed.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method is not implemented.')
+        raise NotImplementedError('Method is not implemented.')
+
+    def Pipeline(self, request_iterator, context):
+        """Evaluate a pipeline over the streamed operands, and send back its outputs.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method is not implemented.')
+        raise NotImplementedError('Method is not implemented.')
+
+    def Session(self, request_iterator, context):
+        """Perform several operations over a long-lived stream, each of them requested by its own message.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method is not implemented.')
+        raise NotImplementedError('Method is not implemented.')
+
+    def FlipVectorUnary(self, request, context):
+        """Flip a vector sent within a single message.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method is not implemented.')
+        raise NotImplementedError('Method is not implemented.')
+
+    def AddVectorsUnary(self, request, context):
+        """Add vectors sent within a single message.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method is not implemented.')
+        raise NotImplementedError('Method is not implemented.')
+
+    def MultiplyVectorsUnary(self, request, context):
+        """Multiply two vectors sent within a single message.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method is not implemented.')
+        raise NotImplementedError('Method is not implemented.')
+
+    def AddMatricesUnary(self, request, context):
+        """Add matrices sent within a single message.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method is not implemented.')
+        raise NotImplementedError('Method is not implemented.')
+
+    def MultiplyMatricesUnary(self, request, context):
+        """Multiply two matrices sent within a single message.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method is not implemented.')
+        raise NotImplementedError('Method is not implemented.')
+
 
 def add_GRPCDemoServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -136,6 +292,71 @@ def add_GRPCDemoServicer_to_server(servicer, server):
                     request_deserializer=grpcdemo__pb2.Matrix.FromString,
                     response_serializer=grpcdemo__pb2.Matrix.SerializeToString,
             ),
+            'BatchedOperation': grpc.stream_stream_rpc_method_handler(
+                    servicer.BatchedOperation,
+                    request_deserializer=grpcdemo__pb2.Matrix.FromString,
+                    response_serializer=grpcdemo__pb2.Matrix.SerializeToString,
+            ),
+            'UploadVector': grpc.stream_unary_rpc_method_handler(
+                    servicer.UploadVector,
+                    request_deserializer=grpcdemo__pb2.Vector.FromString,
+                    response_serializer=grpcdemo__pb2.Handle.SerializeToString,
+            ),
+            'UploadMatrix': grpc.stream_unary_rpc_method_handler(
+                    servicer.UploadMatrix,
+                    request_deserializer=grpcdemo__pb2.Matrix.FromString,
+                    response_serializer=grpcdemo__pb2.Handle.SerializeToString,
+            ),
+            'ReleaseHandle': grpc.unary_unary_rpc_method_handler(
+                    servicer.ReleaseHandle,
+                    request_deserializer=grpcdemo__pb2.Handle.FromString,
+                    response_serializer=grpcdemo__pb2.ReleaseReply.SerializeToString,
+            ),
+            'OperateVectors': grpc.stream_stream_rpc_method_handler(
+                    servicer.OperateVectors,
+                    request_deserializer=grpcdemo__pb2.Vector.FromString,
+                    response_serializer=grpcdemo__pb2.Vector.SerializeToString,
+            ),
+            'OperateMatrices': grpc.stream_stream_rpc_method_handler(
+                    servicer.OperateMatrices,
+                    request_deserializer=grpcdemo__pb2.Matrix.FromString,
+                    response_serializer=grpcdemo__pb2.Matrix.SerializeToString,
+            ),
+            'Pipeline': grpc.stream_stream_rpc_method_handler(
+                    servicer.Pipeline,
+                    request_deserializer=grpcdemo__pb2.Matrix.FromString,
+                    response_serializer=grpcdemo__pb2.Matrix.SerializeToString,
+            ),
+            'Session': grpc.stream_stream_rpc_method_handler(
+                    servicer.Session,
+                    request_deserializer=grpcdemo__pb2.SessionRequest.FromString,
+                    response_serializer=grpcdemo__pb2.SessionResponse.SerializeToString,
+            ),
+            'FlipVectorUnary': grpc.unary_unary_rpc_method_handler(
+                    servicer.FlipVectorUnary,
+                    request_deserializer=grpcdemo__pb2.Vectors.FromString,
+                    response_serializer=grpcdemo__pb2.Vector.SerializeToString,
+            ),
+            'AddVectorsUnary': grpc.unary_unary_rpc_method_handler(
+                    servicer.AddVectorsUnary,
+                    request_deserializer=grpcdemo__pb2.Vectors.FromString,
+                    response_serializer=grpcdemo__pb2.Vector.SerializeToString,
+            ),
+            'MultiplyVectorsUnary': grpc.unary_unary_rpc_method_handler(
+                    servicer.MultiplyVectorsUnary,
+                    request_deserializer=grpcdemo__pb2.Vectors.FromString,
+                    response_serializer=grpcdemo__pb2.Vector.SerializeToString,
+            ),
+            'AddMatricesUnary': grpc.unary_unary_rpc_method_handler(
+                    servicer.AddMatricesUnary,
+                    request_deserializer=grpcdemo__pb2.Matrices.FromString,
+                    response_serializer=grpcdemo__pb2.Matrix.SerializeToString,
+            ),
+            'MultiplyMatricesUnary': grpc.unary_unary_rpc_method_handler(
+                    servicer.MultiplyMatricesUnary,
+                    request_deserializer=grpcdemo__pb2.Matrices.FromString,
+                    response_serializer=grpcdemo__pb2.Matrix.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'grpcdemo.GRPCDemo', rpc_method_handlers)
@@ -253,3 +474,224 @@ class GRPCDemo(object):
             grpcdemo__pb2.Matrix.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def BatchedOperation(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/grpcdemo.GRPCDemo/BatchedOperation',
+            grpcdemo__pb2.Matrix.SerializeToString,
+            grpcdemo__pb2.Matrix.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def UploadVector(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(request_iterator, target, '/grpcdemo.GRPCDemo/UploadVector',
+            grpcdemo__pb2.Vector.SerializeToString,
+            grpcdemo__pb2.Handle.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def UploadMatrix(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(request_iterator, target, '/grpcdemo.GRPCDemo/UploadMatrix',
+            grpcdemo__pb2.Matrix.SerializeToString,
+            grpcdemo__pb2.Handle.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def ReleaseHandle(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/grpcdemo.GRPCDemo/ReleaseHandle',
+            grpcdemo__pb2.Handle.SerializeToString,
+            grpcdemo__pb2.ReleaseReply.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def OperateVectors(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/grpcdemo.GRPCDemo/OperateVectors',
+            grpcdemo__pb2.Vector.SerializeToString,
+            grpcdemo__pb2.Vector.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def OperateMatrices(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/grpcdemo.GRPCDemo/OperateMatrices',
+            grpcdemo__pb2.Matrix.SerializeToString,
+            grpcdemo__pb2.Matrix.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def Pipeline(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/grpcdemo.GRPCDemo/Pipeline',
+            grpcdemo__pb2.Matrix.SerializeToString,
+            grpcdemo__pb2.Matrix.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def Session(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/grpcdemo.GRPCDemo/Session',
+            grpcdemo__pb2.SessionRequest.SerializeToString,
+            grpcdemo__pb2.SessionResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def FlipVectorUnary(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/grpcdemo.GRPCDemo/FlipVectorUnary',
+            grpcdemo__pb2.Vectors.SerializeToString,
+            grpcdemo__pb2.Vector.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def AddVectorsUnary(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/grpcdemo.GRPCDemo/AddVectorsUnary',
+            grpcdemo__pb2.Vectors.SerializeToString,
+            grpcdemo__pb2.Vector.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def MultiplyVectorsUnary(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/grpcdemo.GRPCDemo/MultiplyVectorsUnary',
+            grpcdemo__pb2.Vectors.SerializeToString,
+            grpcdemo__pb2.Vector.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def AddMatricesUnary(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/grpcdemo.GRPCDemo/AddMatricesUnary',
+            grpcdemo__pb2.Matrices.SerializeToString,
+            grpcdemo__pb2.Matrix.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def MultiplyMatricesUnary(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/grpcdemo.GRPCDemo/MultiplyMatricesUnary',
+            grpcdemo__pb2.Matrices.SerializeToString,
+            grpcdemo__pb2.Matrix.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -1,7 +1,10 @@
 """Python implementation of the gRPC API Eigen example server."""
 
+import asyncio
 from concurrent import futures
+import functools
 import logging
+import os
 
 import click
 import demo_eigen_wrapper
@@ -11,6 +14,7 @@ import numpy as np
 import ansys.eigen.python.grpc.constants as constants
 import ansys.eigen.python.grpc.generated.grpcdemo_pb2 as grpcdemo_pb2
 import ansys.eigen.python.grpc.generated.grpcdemo_pb2_grpc as grpcdemo_pb2_grpc
+from ansys.eigen.python.grpc.store import ArrayStore
 
 # =================================================================================================
 # AUXILIARY METHODS for Server operations
@@ -77,13 +81,90 @@ def check_size(size, new_size):
         return size
 
 
+def add_chunk(array, added, chunk, message_name, dtype=None):
+    """Add a received chunk into its slot of a 1D array, using the Eigen library.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        1D array (or 1D view) into which to accumulate the chunk.
+    added : int
+        Number of elements of the array into which chunks have already been added.
+    chunk : bytes
+        Raw content of the received chunk.
+    message_name : str
+        Name of the message being processed. It is used in the error message.
+    dtype : numpy.dtype, optional
+        Type of the elements of the chunk, which are converted to the type of the array.
+        The default is ``None``, meaning the type of the array.
+
+    Returns
+    -------
+    int
+        Number of elements of the array into which chunks have been added, after adding
+        this one.
+
+    Raises
+    ------
+    RuntimeError
+        In case the chunk does not fit into the remaining space of the array.
+    """
+    # Interpret the chunk without copying it... and check that it fits
+    tmp = np.frombuffer(chunk, dtype=dtype or array.dtype)
+    last = added + tmp.size
+    if last > array.size:
+        raise RuntimeError("Problems reading " + message_name + " message...")
+
+    # Chunks transmitted with a reduced precision are converted first
+    tmp = tmp.astype(array.dtype, copy=False)
+
+    # Add the chunk straight into its slot (integer arrays are added in integer arithmetic)
+    demo_eigen_wrapper.add_vectors_inplace(array[added:last], tmp)
+
+    return last
+
+
 class GRPCDemoServicer(grpcdemo_pb2_grpc.GRPCDemoServicer):
     """Provides methods that implement functionality of the API Eigen Example server."""
 
-    def __init__(self) -> None:
-        """No special init is required for the server... unless data is to be stored in a DB. This is to be determined."""
-        # TODO : is it required to store the input vectors in a DB?
+    def __init__(
+        self,
+        store_budget=constants.STORE_BUDGET,
+        compression="none",
+        chunk_size=constants.MAX_CHUNKSIZE,
+        max_message_length=constants.MAX_MESSAGE_LENGTH,
+    ) -> None:
+        """Initialize the server, with an empty in-memory store of arrays.
+
+        Parameters
+        ----------
+        store_budget : int, optional
+            Maximum amount of bytes held by the arrays stored on the server. The least
+            recently used arrays are evicted beyond it. The default is ``constants.STORE_BUDGET``.
+        compression : str, optional
+            Compression algorithm of the response messages, unless the client requests
+            another one. Options are the keys of ``constants.COMPRESSIONS``. Small or
+            incompressible responses are never compressed. The default is ``"none"``.
+        chunk_size : int, optional
+            Maximum amount of bytes per chunk of the response messages, unless the client
+            requests another one. The default is ``constants.MAX_CHUNKSIZE``.
+        max_message_length : int, optional
+            Maximum length of the messages allowed by the server, which must be set as
+            well on the server itself (see ``serve``). It bounds the chunk size, and it is
+            provided to the clients. The default is ``constants.MAX_MESSAGE_LENGTH``.
+        """
         super().__init__()
+        self._store = ArrayStore(store_budget)
+
+        # Check the compression algorithm (as if selecting it for an empty response)
+        constants.select_compression(compression)
+        self._compression = compression
+
+        # Check the chunk size (against the messages allowed)
+        self._default_chunk_size = constants.check_chunk_size(
+            chunk_size, max_message_length
+        )
+        self._max_message_length = max_message_length
 
     # =================================================================================================
     # PUBLIC METHODS for Server operations
@@ -135,7 +216,7 @@ class GRPCDemoServicer(grpcdemo_pb2_grpc.GRPCDemoServicer):
         dtype, size, vector_list = self._get_vectors(request_iterator, md)
 
         # Flip it --> assuming that only one vector is passed
-        nparray_flipped = np.flip(vector_list[0])
+        nparray_flipped = self._flip_vector(dtype, size, vector_list)
 
         # Send the response
         return self._send_vectors(context, nparray_flipped)
@@ -159,18 +240,12 @@ class GRPCDemoServicer(grpcdemo_pb2_grpc.GRPCDemoServicer):
         # Process the metadata
         md = self._read_client_metadata(context)
 
-        # Process the input messages
-        dtype, size, vector_list = self._get_vectors(request_iterator, md)
-
-        # Create an empty array with the input arguments characteristics (dtype, size)
-        result = np.zeros(size, dtype=dtype)
-
-        # Add all provided vectors using the Eigen library
-        for vector in vector_list:
-            # Casting is needed due to interface with Eigen library... Not the desired approach,
-            # but works. Ideally, vectors should be passed directly, but errors appear
-            cast_vector = np.array(vector, dtype=dtype)
-            result = demo_eigen_wrapper.add_vectors(result, cast_vector)
+        # Process the input messages, adding each vector into the result (using the Eigen
+        # library) as soon as its chunks are received
+        dtype, size, vector_list = self._get_vectors(
+            request_iterator, md, accumulate=True
+        )
+        result = self._accumulated_sum(dtype, size, vector_list)
 
         # Send the response
         return self._send_vectors(context, result)
@@ -198,23 +273,8 @@ class GRPCDemoServicer(grpcdemo_pb2_grpc.GRPCDemoServicer):
         # Process the input messages
         dtype, size, vector_list = self._get_vectors(request_iterator, md)
 
-        # Check that the vctor list contains a maximum of two vectors
-        if len(vector_list) != 2:
-            raise RuntimeError(
-                "Unexpected number of vectors to be multiplied: "
-                + len(vector_list)
-                + ". Only 2 is valid."
-            )
-
         # Perform the dot product of the provided vectors using the Eigen library
-        # casting is needed due to interface with Eigen library... Not the desired approach,
-        # but works. Ideally, vectors should be passed directly, but errors appear
-        vec_1 = np.array(vector_list[0], dtype=dtype)
-        vec_2 = np.array(vector_list[1], dtype=dtype)
-        result = demo_eigen_wrapper.multiply_vectors(vec_1, vec_2)
-
-        # Return the result as a numpy.ndarray
-        result = np.array(result, dtype=dtype, ndmin=1)
+        result = self._multiply_vectors(dtype, size, vector_list)
 
         # Finally, send the response
         return self._send_vectors(context, result)
@@ -238,18 +298,12 @@ class GRPCDemoServicer(grpcdemo_pb2_grpc.GRPCDemoServicer):
         # Process the metadata
         md = self._read_client_metadata(context)
 
-        # Process the input messages
-        dtype, size, matrix_list = self._get_matrices(request_iterator, md)
-
-        # Create an empty array with the input arguments characteristics (dtype, size)
-        result = np.zeros(size, dtype=dtype)
-
-        # Add all provided matrices using the Eigen library
-        for matrix in matrix_list:
-            # Casting is needed due to interface with Eigen library... Not the desired approach,
-            # but works. Ideally, we would want to pass matrix directly, but errors appear
-            cast_matrix = np.array(matrix, dtype=dtype)
-            result = demo_eigen_wrapper.add_matrices(result, cast_matrix)
+        # Process the input messages, adding each matrix into the result (using the Eigen
+        # library) as soon as its chunks are received
+        dtype, size, matrix_list = self._get_matrices(
+            request_iterator, md, accumulate=True
+        )
+        result = self._accumulated_sum(dtype, size, matrix_list)
 
         # Send the response
         return self._send_matrices(context, result)
@@ -274,356 +328,2551 @@ class GRPCDemoServicer(grpcdemo_pb2_grpc.GRPCDemoServicer):
         # Process the metadata
         md = self._read_client_metadata(context)
 
-        # Process the input messages
+        # Process the input messages (the product needs both matrices to be complete)
         dtype, size, matrix_list = self._get_matrices(request_iterator, md)
 
-        # Check that the matrix list contains a maximum of two matrices
-        if len(matrix_list) != 2:
-            raise RuntimeError(
-                "Unexpected number of matrices to be multiplied: "
-                + len(matrix_list)
-                + ". You can only multiple two matrices."
-            )
-
-        # Due to the previous _get_matrices method, the size of all
-        # matrices is the same... check that it is a square matrix. Otherwise, no multiplication
-        # is possible
-        if size[0] != size[1]:
-            raise RuntimeError("Only square matrices are allowed for multiplication.")
-
-        # Perform the matrix multiplication of the provided matrices using the Eigen library
-        # Casting is needed due to interface with Eigen library... Not the desired approach,
-        # but works. Ideally, vector should be passed directly, but errors appear
-        mat_1 = np.array(matrix_list[0], dtype=dtype)
-        mat_2 = np.array(matrix_list[1], dtype=dtype)
-        result = demo_eigen_wrapper.multiply_matrices(mat_1, mat_2)
-
-        # Finally, send the response
-        return self._send_matrices(context, result)
+        # Perform the matrix multiplication of the provided matrices using the Eigen library,
+        # sending each row block of the product as soon as it is computed
+        return self._send_matrix_product(context, dtype, size, matrix_list)
 
-    # =================================================================================================
-    # PRIVATE METHODS for Server operations
-    # =================================================================================================
+    def BatchedOperation(self, request_iterator, context):
+        """Perform an operation over two stacks of vectors or matrices.
 
-    def _get_vectors(self, request_iterator, md: dict):
-        """Process a stream of vector messages.
+        The operation (such as ``multiply-matrices``), the amount of items per stack and,
+        optionally, the amount of threads to use are provided within the metadata. Each
+        stack is received as a single matrix, whose rows are those of the stacked items.
 
         Parameters
         ----------
         request_iterator : iterator
-            Iterator to the received request messages of type Vector.
-        md : dict
-            Metadata provided by the client.
+            Iterator to the stream of Matrix messages provided.
+        context : grpc.ServicerContext
+            gRPC-specific information.
 
         Returns
         -------
-        np.type, tuple, list of np.array
-            Type of data, size of the vectors, and list of vectors to process.
+        grpcdemo_pb2.Matrix
+            Matrix message.
         """
-        # First, determine how many full vector messages are to be processed
-        full_msgs = int(md.get("full-vectors"))
-
-        # Initialize the output vector list and some aux vars
-        vector_list = []
-        dtype = None
-        size = None
+        click.echo("Batched operation requested.")
 
-        # Loop over the expected full messages
-        for msg in range(1, full_msgs + 1):
+        # Process the metadata
+        md = self._read_client_metadata(context)
 
-            # Find out how many partial vector messages constitute this full vector message
-            chunks = int(md.get("vec%d-messages" % msg))
+        # Process the input messages
+        dtype, size, matrix_list = self._get_matrices(request_iterator, md)
 
-            # Initialize the output vector
-            vector = None
+        # Perform the operation over the stacks using the Eigen library
+        result = self._batched_operation(md, dtype, size, matrix_list)
 
-            # Loop over the expected chunks
-            for chunk_msg in range(chunks):
-                # Read the vector message
-                chunk_vec = next(request_iterator)
+        # Finally, send the response
+        return self._send_matrices(context, result)
 
-                # Inform about the size of the message content
-                click.echo(
-                    "Size of message: "
-                    + constants.human_size(chunk_vec.vector_as_chunk)
-                )
+    def UploadVector(self, request_iterator, context):
+        """Store a vector, which can then be referenced by its handle.
 
-                # If processing the first chunk of the message, fill in some data
-                if chunk_msg == 0:
-                    # Check the data type of the incoming vector
-                    if chunk_vec.data_type == grpcdemo_pb2.DataType.Value("INTEGER"):
-                        dtype = check_data_type(dtype, np.int32)
-                    elif chunk_vec.data_type == grpcdemo_pb2.DataType.Value("DOUBLE"):
-                        dtype = check_data_type(dtype, np.float64)
+        Parameters
+        ----------
+        request_iterator : iterator
+            Iterator to the stream of vector messages provided.
+        context : grpc.ServicerContext
+            gRPC-specific information.
 
-                    # Check the size of the incoming vector
-                    size = check_size(size, (chunk_vec.vector_size,))
+        Returns
+        -------
+        grpcdemo_pb2.Handle
+            Handle to the stored vector.
+        """
+        click.echo("Vector upload requested.")
 
-                # Parse the chunk
-                if vector is None:
-                    vector = np.frombuffer(chunk_vec.vector_as_chunk, dtype=dtype)
-                else:
-                    tmp = np.frombuffer(chunk_vec.vector_as_chunk, dtype=dtype)
-                    vector = np.concatenate((vector, tmp))
+        # Process the metadata
+        md = self._read_client_metadata(context)
 
-            # Check if the final vector has the desired size
-            if vector.size != size[0]:
-                raise RuntimeError("Problems reading client full vector message...")
-            else:
-                # If everything is fine, append to vector_list
-                vector_list.append(vector)
+        # Process the input messages
+        _, _, vector_list = self._get_vectors(request_iterator, md)
 
-        # Return the input vector list (as a list of numpy.ndarray)
-        return dtype, size, vector_list
+        # Store the vector and return its handle
+        return self._store_array(vector_list)
 
-    def _get_matrices(self, request_iterator, md: dict):
-        """Process a stream of matrix messages.
+    def UploadMatrix(self, request_iterator, context):
+        """Store a matrix, which can then be referenced by its handle.
 
         Parameters
         ----------
         request_iterator : iterator
-            Iterator to the received request messages of type ``Matrix``.
-        md : dict
-            Metadata provided by the client.
+            Iterator to the stream of matrix messages provided.
+        context : grpc.ServicerContext
+            gRPC-specific information.
 
         Returns
         -------
-        np.type, tuple, list of np.array
-            Type of data, shape of the matrices, and list of matrices to process.
+        grpcdemo_pb2.Handle
+            Handle to the stored matrix.
         """
-        # Determine how many full matrix messages are to be processed
-        full_msgs = int(md.get("full-matrices"))
-
-        # Initialize the output matrix list and some aux vars
-        matrix_list = []
-        dtype = None
-        size = None
-
-        # Loop over the expected full messages
-        for msg in range(1, full_msgs + 1):
+        click.echo("Matrix upload requested.")
 
-            # Find out how many partial matrix messages constitute this full matrix message
-            chunks = int(md.get("mat%d-messages" % msg))
-
-            # Initialize the output matrix
-            matrix = None
+        # Process the metadata
+        md = self._read_client_metadata(context)
 
-            # Loop over the expected chunks
-            for chunk_msg in range(chunks):
-                # Read the matrix message
-                chunk_mat = next(request_iterator)
+        # Process the input messages
+        _, _, matrix_list = self._get_matrices(request_iterator, md)
 
-                # Inform about the size of the message content
-                click.echo(
-                    "Size of message: "
-                    + constants.human_size(chunk_mat.matrix_as_chunk)
-                )
+        # Store the matrix and return its handle
+        return self._store_array(matrix_list)
 
-                # If processing the first chunk of the message, fill in some data
-                if chunk_msg == 0:
-                    # Check the data type of the incoming matrix
-                    if chunk_mat.data_type == grpcdemo_pb2.DataType.Value("INTEGER"):
-                        dtype = check_data_type(dtype, np.int32)
-                    elif chunk_mat.data_type == grpcdemo_pb2.DataType.Value("DOUBLE"):
-                        dtype = check_data_type(dtype, np.float64)
+    def ReleaseHandle(self, request, context):
+        """Release a stored vector or matrix.
 
-                    # Check the size of the incoming matrix
-                    size = check_size(
-                        size,
-                        (
-                            chunk_mat.matrix_rows,
-                            chunk_mat.matrix_cols,
-                        ),
-                    )
+        Parameters
+        ----------
+        request : Handle
+            Handle to the stored vector or matrix.
+        context : grpc.ServicerContext
+            gRPC-specific information.
 
-                # Parse the chunk
-                if matrix is None:
-                    matrix = np.frombuffer(chunk_mat.matrix_as_chunk, dtype=dtype)
-                else:
-                    tmp = np.frombuffer(chunk_mat.matrix_as_chunk, dtype=dtype)
-                    matrix = np.concatenate((matrix, tmp))
+        Returns
+        -------
+        grpcdemo_pb2.ReleaseReply
+            Whether the vector or matrix was stored (and has been released).
+        """
+        click.echo("Handle release requested.")
 
-            # Check if the final matrix has the desired size
-            if matrix.size != size[0] * size[1]:
-                raise RuntimeError("Problems reading client full Matrix message...")
-            else:
-                # If everything is fine, append to matrix_list
-                matrix = np.reshape(matrix, size)
-                matrix_list.append(matrix)
+        return grpcdemo_pb2.ReleaseReply(released=self._store.release(request.id))
 
-        # Return the input matrix list (as a list of numpy.ndarray)
-        return dtype, size, matrix_list
+    def OperateVectors(self, request_iterator, context):
+        """Operate vectors, either stored or streamed.
 
-    def _read_client_metadata(self, context):
-        """Return the metadata as a dictionary.
+        The operation (``flip``, ``add`` or ``multiply``) and its operands are provided within
+        the metadata. Operands are either handles to stored vectors or ``inline``, meaning
+        that they are streamed (in order).
 
         Parameters
         ----------
+        request_iterator : iterator
+            Iterator to the stream of vector messages provided.
         context : grpc.ServicerContext
             gRPC-specific information.
 
         Returns
         -------
-        dict
-            Python-readable metadata in dictionary form.
+        grpcdemo_pb2.Vector
+            Vector message.
         """
-        metadata = context.invocation_metadata()
-        metadata_dict = {}
-        for c in metadata:
-            metadata_dict[c.key] = c.value
+        click.echo("Operation on vectors requested.")
 
-        return metadata_dict
+        # Process the metadata
+        md = self._read_client_metadata(context)
 
-    def _generate_md(self, message_type: str, abbrev: str, *args: np.ndarray):
-        """Generate the server metadata sent to the client and determine the number of chunks in which to decompose each message.
+        # Process the input messages
+        dtype, size, vector_list = self._get_vectors(request_iterator, md)
+
+        # Perform the operation over the stored and the streamed vectors
+        result = self._operate_vectors(md, dtype, size, vector_list)
+
+        # Finally, send the response
+        return self._send_vectors(context, result)
+
+    def OperateMatrices(self, request_iterator, context):
+        """Operate matrices, either stored or streamed.
+
+        The operation (``add`` or ``multiply``) and its operands are provided within the
+        metadata. Operands are either handles to stored matrices or ``inline``, meaning
+        that they are streamed (in order).
 
         Parameters
         ----------
-        message_type : str
-            Type of message being sent. Options are``vectors`` and ``matrices``.
-        abbrev : str
-            Abbreviated form of the message being sent. Options are ``vec`` and ``mat``.
+        request_iterator : iterator
+            Iterator to the stream of matrix messages provided.
+        context : grpc.ServicerContext
+            gRPC-specific information.
 
         Returns
         -------
-        list[tuple], list[list[int]]
-            Metadata to be sent by the server and the chunk indices for the list
-            of messages to send.
-
-        Raises
-        ------
-        RuntimeError
-            In case of an invalid use of this function.
+        grpcdemo_pb2.Matrix
+            Matrix message.
         """
-        # Initialize the metadata and the chunks list for each full message
-        md = []
-        chunks = []
+        click.echo("Operation on matrices requested.")
 
-        # Find how many arguments are to be transmitted
-        md.append(("full-" + message_type, str(len(args))))
+        # Process the metadata
+        md = self._read_client_metadata(context)
 
-        # Loop over all input arguments
-        idx = 1
-        for arg in args:
-            # Check the size of the arrays
-            # If size is surpassed, determine chunks needed
-            if arg.nbytes > constants.MAX_CHUNKSIZE:
-                # Let us determine how many chunks we will need
-                #
-                # Max amount of elements per chunk
-                max_elems = constants.MAX_CHUNKSIZE // arg.itemsize
-
-                # Bulk number of chunks needed
-                bulk_chunks = arg.size // max_elems
-
-                # The remainder amount of elements (if any)
-                remainder = arg.size % max_elems
-
-                # This list provides the last index up to which to
-                # process in each partial vector or matrix message
-                last_idx_chunk = []
-                for i in range(1, bulk_chunks + 1):
-                    last_idx_chunk.append(i * max_elems)
-
-                # Take into account that if there is a remainder,
-                # include one last partial vector or matrix message.
-                if remainder != 0:
-                    last_idx_chunk.append(arg.size)
-
-                # Append the results
-                md.append((abbrev + str(idx) + "-messages", str(len(last_idx_chunk))))
-                chunks.append(last_idx_chunk)
+        # Process the input messages
+        dtype, size, matrix_list = self._get_matrices(request_iterator, md)
 
-            else:
-                # Otherwise dealing with a single message.. Append results.
-                md.append((abbrev + str(idx) + "-messages", str(1)))
-                chunks.append([arg.size])
+        # Perform the operation over the stored and the streamed matrices
+        result = self._operate_matrices(md, dtype, size, matrix_list)
 
-            # Increase idx by 1
-            idx += 1
+        # Finally, send the response
+        return self._send_matrices(context, result)
 
-        # Return the metadata and the chunks list for each vector or matrix
-        return md, chunks
+    def Pipeline(self, request_iterator, context):
+        """Evaluate a pipeline over the streamed operands, and send back its outputs.
 
-    def _send_vectors(self, context: grpc.ServicerContext, *args: np.ndarray):
-        """Send the response vector messages.
+        The pipeline (a ``PipelineGraph`` message) is provided within the ``pipeline-bin``
+        metadata. Its operands are streamed as matrices, vectors being single-row matrices.
 
         Parameters
         ----------
+        request_iterator : iterator
+            Iterator to the stream of matrix messages provided.
         context : grpc.ServicerContext
-            gRPC context.
-        args : np.ndarray
-            Variable size of np.arrays to transmit.
+            gRPC-specific information.
 
-        Yields
-        ------
-        grpcdemo_pb2.Vector
-            Vector messages streamed (full or partial, depending on the metadata)
+        Returns
+        -------
+        grpcdemo_pb2.Matrix
+            Matrix messages, one full message per output.
         """
+        click.echo("Pipeline requested.")
 
-        # Generate the metadata and info on the chunks
-        md, chunks = self._generate_md("vectors", "vec", *args)
+        # Process the metadata
+        md = self._read_client_metadata(context)
 
-        # Send the initial metadata
-        context.send_initial_metadata(md)
+        # Process the input messages (the operands of a pipeline may have different shapes)
+        dtype, _, matrix_list = self._get_matrices(
+            request_iterator, md, same_size=False
+        )
 
-        # Loop over all input arguments
-        for arg, vector_chunks in zip(args, chunks):
-            # Loop over the chunk indices
-            processed_idx = 0
-            for last_idx_chunk in vector_chunks:
-                # Use tmp_idx in yield function and update the processed_idx afterwards
-                tmp_idx = processed_idx
-                processed_idx = last_idx_chunk
+        # Evaluate the pipeline
+        results = self._run_pipeline(md, dtype, matrix_list)
 
-                # Yield!
-                yield grpcdemo_pb2.Vector(
-                    data_type=constants.NP_DTYPE_TO_DATATYPE[arg.dtype.type],
-                    vector_size=arg.shape[0],
-                    vector_as_chunk=arg[tmp_idx:last_idx_chunk].tobytes(),
-                )
+        # Finally, send the response
+        return self._send_matrices(context, *results)
 
-    def _send_matrices(self, context: grpc.ServicerContext, *args: np.ndarray):
-        """Sending the response matrix messages.
+    def Session(self, request_iterator, context):
+        """Perform several operations over a long-lived stream.
+
+        Each request message carries an operation (as in ``constants.PIPELINE_OPERATIONS``)
+        and its full operands. Requests are processed in order, and their responses carry
+        the same request id. Errors are reported within the responses, without ending the
+        session.
 
         Parameters
         ----------
+        request_iterator : iterator
+            Iterator to the stream of session request messages provided.
         context : grpc.ServicerContext
-            gRPC context.
-        args : np.ndarray
-            Variable size of np.arrays to transmit.
+            gRPC-specific information.
 
         Yields
         ------
-        grpcdemo_pb2.Matrix
-            Matrix messages streamed (full or partial, depending on the metadata)
+        grpcdemo_pb2.SessionResponse
+            Session response messages.
         """
+        click.echo("Session requested.")
 
-        # Generate the metadata and info on the chunks
-        md, chunks = self._generate_md("matrices", "mat", *args)
+        for request in request_iterator:
+            yield self._session_operation(request)
 
-        # Send the initial metadata
-        context.send_initial_metadata(md)
+    def FlipVectorUnary(self, request, context):
+        """Flip a vector sent within a single message (unary call).
 
-        # Loop over all input arguments
-        for arg, matrix_chunks in zip(args, chunks):
-            # Since we are dealing with matrices, ravel it to a 1D array (avoids copy)
-            arg_as_vec = arg.ravel()
+        Parameters
+        ----------
+        request : Vectors
+            Vectors message, with all the vectors within a single message.
+        context : grpc.ServicerContext
+            gRPC-specific information.
+
+        Returns
+        -------
+        grpcdemo_pb2.Vector
+            Vector message.
+        """
+        click.echo("Unary vector flip requested.")
+
+        return self._process_unary(
+            self._unary_vectors, self._flip_vector, request, context
+        )
+
+    def AddVectorsUnary(self, request, context):
+        """Add vectors sent within a single message (unary call).
+
+        Parameters
+        ----------
+        request : Vectors
+            Vectors message, with all the vectors within a single message.
+        context : grpc.ServicerContext
+            gRPC-specific information.
+
+        Returns
+        -------
+        grpcdemo_pb2.Vector
+            Vector message.
+        """
+        click.echo("Unary vector addition requested.")
+
+        return self._process_unary(
+            self._unary_vectors, self._add_vectors, request, context
+        )
+
+    def MultiplyVectorsUnary(self, request, context):
+        """Multiply two vectors sent within a single message (unary call).
+
+        Parameters
+        ----------
+        request : Vectors
+            Vectors message, with all the vectors within a single message.
+        context : grpc.ServicerContext
+            gRPC-specific information.
+
+        Returns
+        -------
+        grpcdemo_pb2.Vector
+            Vector message.
+        """
+        click.echo("Unary vector dot product requested.")
+
+        return self._process_unary(
+            self._unary_vectors, self._multiply_vectors, request, context
+        )
+
+    def AddMatricesUnary(self, request, context):
+        """Add matrices sent within a single message (unary call).
+
+        Parameters
+        ----------
+        request : Matrices
+            Matrices message, with all the matrices within a single message.
+        context : grpc.ServicerContext
+            gRPC-specific information.
+
+        Returns
+        -------
+        grpcdemo_pb2.Matrix
+            Matrix message.
+        """
+        click.echo("Unary matrix addition requested.")
+
+        return self._process_unary(
+            self._unary_matrices, self._add_matrices, request, context
+        )
+
+    def MultiplyMatricesUnary(self, request, context):
+        """Multiply two matrices sent within a single message (unary call).
+
+        Parameters
+        ----------
+        request : Matrices
+            Matrices message, with all the matrices within a single message.
+        context : grpc.ServicerContext
+            gRPC-specific information.
+
+        Returns
+        -------
+        grpcdemo_pb2.Matrix
+            Matrix message.
+        """
+        click.echo("Unary matrix multiplication requested.")
+
+        return self._process_unary(
+            self._unary_matrices, self._multiply_matrices, request, context
+        )
+
+    # =================================================================================================
+    # OPERATION METHODS for Server operations
+    # =================================================================================================
+
+    def _flip_vector(self, dtype, size, vector_list):
+        """Flip the first of the provided vectors.
+
+        Parameters
+        ----------
+        dtype : np.type
+            Type of data of the vectors.
+        size : tuple
+            Size of the vectors.
+        vector_list : list of np.array
+            Vectors provided by the client.
+
+        Returns
+        -------
+        np.array
+            Flipped vector.
+        """
+        return np.flip(vector_list[0])
+
+    def _add_vectors(self, dtype, size, vector_list):
+        """Add the provided vectors using the Eigen library.
+
+        Parameters
+        ----------
+        dtype : np.type
+            Type of data of the vectors.
+        size : tuple
+            Size of the vectors.
+        vector_list : list of np.array
+            Vectors provided by the client.
+
+        Returns
+        -------
+        np.array
+            Sum of the vectors.
+        """
+        # Allocate the result only once, initialized with the first vector
+        result = np.array(vector_list[0], dtype=dtype)
+
+        # Accumulate the remaining vectors into the result using the Eigen library (integer
+        # vectors are added in integer arithmetic)
+        for vector in vector_list[1:]:
+            demo_eigen_wrapper.add_vectors_inplace(result, vector)
+
+        return result
+
+    def _multiply_vectors(self, dtype, size, vector_list):
+        """Perform the dot product of the two provided vectors using the Eigen library.
+
+        Parameters
+        ----------
+        dtype : np.type
+            Type of data of the vectors.
+        size : tuple
+            Size of the vectors.
+        vector_list : list of np.array
+            Vectors provided by the client.
+
+        Returns
+        -------
+        np.array
+            Dot product of the vectors (as a single-element vector).
+
+        Raises
+        ------
+        RuntimeError
+            In case the number of vectors provided is not two.
+        """
+        # Check that the vector list contains a maximum of two vectors
+        if len(vector_list) != 2:
+            raise RuntimeError(
+                "Unexpected number of vectors to be multiplied: "
+                + str(len(vector_list))
+                + ". Only 2 is valid."
+            )
+
+        # Perform the dot product of the provided vectors using the Eigen library (the
+        # vectors are passed directly, since the library operates on their own dtype)
+        result = demo_eigen_wrapper.multiply_vectors(vector_list[0], vector_list[1])
+
+        # Return the result as a numpy.ndarray
+        return np.array(result, dtype=dtype, ndmin=1)
+
+    def _add_matrices(self, dtype, size, matrix_list):
+        """Add the provided matrices using the Eigen library.
+
+        Parameters
+        ----------
+        dtype : np.type
+            Type of data of the matrices.
+        size : tuple
+            Shape of the matrices.
+        matrix_list : list of np.array
+            Matrices provided by the client.
+
+        Returns
+        -------
+        np.array
+            Sum of the matrices.
+        """
+        # Allocate the result only once, initialized with the first matrix
+        result = np.array(matrix_list[0], dtype=dtype)
+
+        # Accumulate the remaining matrices into the result using the Eigen library (integer
+        # matrices are added in integer arithmetic)
+        for matrix in matrix_list[1:]:
+            demo_eigen_wrapper.add_matrices_inplace(result, matrix)
+
+        return result
+
+    def _accumulated_sum(self, dtype, size, array_list):
+        """Provide the sum of the vectors or matrices, accumulated while being received.
+
+        Parameters
+        ----------
+        dtype : np.type
+            Type of data of the vectors or matrices.
+        size : tuple
+            Shape of the vectors or matrices.
+        array_list : list of np.array
+            Single array into which all vectors or matrices provided by the client have
+            been accumulated (see the ``accumulate`` argument of ``_parse_vectors`` and
+            ``_parse_matrices``).
+
+        Returns
+        -------
+        np.array
+            Sum of the vectors or matrices.
+        """
+        return array_list[0]
+
+    def _multiply_matrices(self, dtype, size, matrix_list):
+        """Multiply the two provided matrices using the Eigen library.
+
+        Parameters
+        ----------
+        dtype : np.type
+            Type of data of the matrices.
+        size : tuple
+            Shape of the matrices.
+        matrix_list : list of np.array
+            Matrices provided by the client.
+
+        Returns
+        -------
+        np.array
+            Product of the matrices.
+        """
+        self._check_multiplication(size, matrix_list)
+
+        # Perform the matrix multiplication of the provided matrices using the Eigen library
+        # (the matrices are passed directly, since the library operates on their own dtype)
+        return demo_eigen_wrapper.multiply_matrices(matrix_list[0], matrix_list[1])
+
+    def _check_multiplication(self, size, matrix_list):
+        """Check that the two provided matrices can be multiplied.
+
+        Parameters
+        ----------
+        size : tuple
+            Shape of the matrices.
+        matrix_list : list of np.array
+            Matrices provided by the client.
+
+        Raises
+        ------
+        RuntimeError
+            In case the number of matrices provided is not two.
+        RuntimeError
+            In case the matrices are not square.
+        """
+        # Check that the matrix list contains a maximum of two matrices
+        if len(matrix_list) != 2:
+            raise RuntimeError(
+                "Unexpected number of matrices to be multiplied: "
+                + str(len(matrix_list))
+                + ". You can only multiple two matrices."
+            )
+
+        # Due to the previous _get_matrices method, the size of all
+        # matrices is the same... check that it is a square matrix. Otherwise, no multiplication
+        # is possible
+        if size[0] != size[1]:
+            raise RuntimeError("Only square matrices are allowed for multiplication.")
+
+    def _batched_operation(self, md, dtype, size, matrix_list):
+        """Perform an operation over the two provided stacks using the Eigen library.
+
+        Parameters
+        ----------
+        md : dict
+            Metadata provided by the client.
+        dtype : np.type
+            Type of data of the stacks.
+        size : tuple
+            Shape of the stacks, as received (items stacked by rows).
+        matrix_list : list of np.array
+            Stacks provided by the client, as received (items stacked by rows).
+
+        Returns
+        -------
+        np.array
+            Stack of results (items stacked by rows).
+
+        Raises
+        ------
+        RuntimeError
+            In case the operation is unknown.
+        RuntimeError
+            In case the number of stacks provided is not two.
+        RuntimeError
+            In case the stacks cannot be split into the given amount of items.
+        """
+        # Check the operation requested, and the stacks provided
+        operation = md.get("batch-operation")
+        if operation not in constants.BATCHED_OPERATIONS:
+            raise RuntimeError("Unknown batched operation: " + str(operation) + ".")
+
+        if len(matrix_list) != 2:
+            raise RuntimeError(
+                "Unexpected number of stacks to be operated: "
+                + str(len(matrix_list))
+                + ". Only 2 is valid."
+            )
+
+        # Recover the stacks (as views): vector stacks are received as they are
+        # (N, n), while matrix stacks are received as (N * n, m) matrices
+        items = int(md.get("batch-size"))
+        if items <= 0 or size[0] % items != 0:
+            raise RuntimeError(
+                "Stacks of "
+                + str(size[0])
+                + " rows cannot hold "
+                + str(items)
+                + " items."
+            )
+
+        if constants.BATCHED_OPERATIONS[operation] == 3:
+            stacks = [
+                mat.reshape(items, size[0] // items, size[1]) for mat in matrix_list
+            ]
+        elif items == size[0]:
+            stacks = matrix_list
+        else:
+            raise RuntimeError("Stacks of vectors must hold one vector per row.")
+
+        # Use as many threads as requested... up to the amount of cores available
+        threads = min(int(md.get("batch-threads", 1)), os.cpu_count() or 1)
+
+        # Perform the operation over the stacks in a single call to the Eigen library
+        batched_operation = getattr(
+            demo_eigen_wrapper, "batched_" + operation.replace("-", "_")
+        )
+        result = batched_operation(*stacks, threads=threads)
+
+        # Return the results stacked by rows, as they are sent
+        return result.reshape(size[0], -1)
+
+    def _run_pipeline(self, md, dtype, matrix_list):
+        """Evaluate the operations of a pipeline needed for its outputs.
+
+        Parameters
+        ----------
+        md : dict
+            Metadata provided by the client, with the pipeline.
+        dtype : np.type
+            Type of data of the operands.
+        matrix_list : list of np.array
+            Operands streamed by the client (vectors being single-row matrices).
+
+        Returns
+        -------
+        list of np.array
+            Outputs of the pipeline (vectors being single-row matrices).
+
+        Raises
+        ------
+        RuntimeError
+            In case no pipeline is provided.
+        RuntimeError
+            In case an operation or output references a value which is not available.
+        """
+        if "pipeline-bin" not in md:
+            raise RuntimeError("No pipeline provided in the metadata.")
+
+        graph = grpcdemo_pb2.PipelineGraph.FromString(md["pipeline-bin"])
+
+        # Values are the operands, followed by the results of the operations
+        values = list(matrix_list)
+        nvalues = len(values) + len(graph.nodes)
+        if any(idx < 0 or idx >= nvalues for idx in graph.outputs):
+            raise RuntimeError("Invalid pipeline: outputs reference unknown values.")
+
+        # Find out which operations are needed for the outputs... walking back from them
+        # (operations may only depend on previous values)
+        needed = set(graph.outputs)
+        for idx in reversed(range(len(values), nvalues)):
+            inputs = graph.nodes[idx - len(values)].inputs
+            if any(input < 0 or input >= idx for input in inputs):
+                raise RuntimeError(
+                    "Invalid pipeline: operation %d references values not available yet."
+                    % (idx - len(values))
+                )
+            elif idx in needed:
+                needed.update(inputs)
+
+        # Evaluate the needed operations (in order)
+        for idx, node in enumerate(graph.nodes, start=len(values)):
+            if idx in needed:
+                inputs = [values[input] for input in node.inputs]
+                values.append(self._pipeline_operation(node.operation, dtype, inputs))
+            else:
+                values.append(None)
+
+        return [values[idx] for idx in graph.outputs]
+
+    def _pipeline_operation(self, operation, dtype, inputs):
+        """Perform an operation of a pipeline.
+
+        Parameters
+        ----------
+        operation : str
+            Operation to perform, as in ``constants.PIPELINE_OPERATIONS``.
+        dtype : np.type
+            Type of data of the operands.
+        inputs : list of np.array
+            Inputs of the operation (vectors being single-row matrices).
+
+        Returns
+        -------
+        np.array
+            Result of the operation (vectors being single-row matrices).
+
+        Raises
+        ------
+        RuntimeError
+            In case the operation is unknown.
+        RuntimeError
+            In case the inputs are not valid for the operation.
+        """
+        perform = self._named_operation(operation)
+        if not inputs:
+            raise RuntimeError(
+                "Invalid pipeline: operation " + operation + " has no inputs."
+            )
+
+        # Vector operations take the single-row matrices as vectors (views, no copies)
+        vectors = constants.PIPELINE_OPERATIONS[operation] == 1
+        if vectors:
+            if any(value.shape[0] != 1 for value in inputs):
+                raise RuntimeError(
+                    "Invalid pipeline: operation " + operation + " takes vectors."
+                )
+            inputs = [value.ravel() for value in inputs]
+
+        # As for the rest of services, all inputs must have the same size
+        size = None
+        for value in inputs:
+            size = check_size(size, value.shape)
+
+        result = perform(dtype, size, inputs)
+        return result.reshape(1, -1) if vectors else result
+
+    def _session_operation(self, request):
+        """Perform the operation requested within a session.
+
+        Parameters
+        ----------
+        request : grpcdemo_pb2.SessionRequest
+            Request message, with the operation and its operands.
+
+        Returns
+        -------
+        grpcdemo_pb2.SessionResponse
+            Response message, with the result or the error raised by the operation.
+        """
+        try:
+            perform = self._named_operation(request.operation)
+
+            # Parse the operands as if they were streamed, each in a single message
+            if constants.PIPELINE_OPERATIONS[request.operation] == 1:
+                self._check_session_operands(request.operation, request.vectors)
+                md = self._single_message_md("vectors", "vec", len(request.vectors))
+                parsed = self._consume_stream(self._parse_vectors(md), request.vectors)
+            else:
+                self._check_session_operands(request.operation, request.matrices)
+                md = self._single_message_md("matrices", "mat", len(request.matrices))
+                parsed = self._consume_stream(
+                    self._parse_matrices(md), request.matrices
+                )
+
+            result = perform(*parsed)
+        except Exception as error:
+            # Report any error... without ending the session (nor failing later requests)
+            return grpcdemo_pb2.SessionResponse(
+                request_id=request.request_id, error=str(error)
+            )
+
+        # Build the response, with the result in a single message
+        if result.ndim == 1:
+            (msg,) = self._vector_messages([[result.size]], result)
+            return grpcdemo_pb2.SessionResponse(
+                request_id=request.request_id, vector=msg
+            )
+        else:
+            (msg,) = self._matrix_messages([[result.size]], result)
+            return grpcdemo_pb2.SessionResponse(
+                request_id=request.request_id, matrix=msg
+            )
+
+    def _check_session_operands(self, operation, operands):
+        """Check the number of operands of an operation requested within a session.
+
+        Parameters
+        ----------
+        operation : str
+            Operation name, as in ``constants.PIPELINE_OPERATIONS``.
+        operands : list of Vectors or list of Matrices
+            Operands provided, each in a single message.
+
+        Raises
+        ------
+        RuntimeError
+            In case the number of operands is not valid for the operation.
+        """
+        if not operands:
+            raise RuntimeError("No operands provided for operation " + operation + ".")
+        elif operation == "flip_vector" and len(operands) != 1:
+            raise RuntimeError(
+                "Unexpected number of vectors to be flipped: "
+                + str(len(operands))
+                + ". Only 1 is valid."
+            )
+
+    def _named_operation(self, operation):
+        """Retrieve an operation by its name.
+
+        Parameters
+        ----------
+        operation : str
+            Operation name, as in ``constants.PIPELINE_OPERATIONS``.
+
+        Returns
+        -------
+        callable
+            Operation, such as ``_add_matrices``.
+
+        Raises
+        ------
+        RuntimeError
+            In case the operation is unknown.
+        """
+        operations = {
+            "flip_vector": self._flip_vector,
+            "add_vectors": self._add_vectors,
+            "multiply_vectors": self._multiply_vectors,
+            "add_matrices": self._add_matrices,
+            "multiply_matrices": self._multiply_matrices,
+        }
+        if operation not in operations:
+            raise RuntimeError("Unknown operation: " + operation + ".")
+
+        return operations[operation]
+
+    def _operate_vectors(self, md, dtype, size, vector_list):
+        """Perform an operation over stored and streamed vectors.
+
+        Parameters
+        ----------
+        md : dict
+            Metadata provided by the client.
+        dtype : np.type
+            Type of data of the streamed vectors.
+        size : tuple
+            Size of the streamed vectors.
+        vector_list : list of np.array
+            Vectors streamed by the client.
+
+        Returns
+        -------
+        np.array
+            Result of the operation.
+        """
+        operations = {
+            "flip": self._flip_vector,
+            "add": self._add_vectors,
+            "multiply": self._multiply_vectors,
+        }
+        return self._operate_stored(operations, 1, md, dtype, size, vector_list)
+
+    def _operate_matrices(self, md, dtype, size, matrix_list):
+        """Perform an operation over stored and streamed matrices.
+
+        Parameters
+        ----------
+        md : dict
+            Metadata provided by the client.
+        dtype : np.type
+            Type of data of the streamed matrices.
+        size : tuple
+            Shape of the streamed matrices.
+        matrix_list : list of np.array
+            Matrices streamed by the client.
+
+        Returns
+        -------
+        np.array
+            Result of the operation.
+        """
+        operations = {"add": self._add_matrices, "multiply": self._multiply_matrices}
+        return self._operate_stored(operations, 2, md, dtype, size, matrix_list)
+
+    def _operate_stored(self, operations, ndim, md, dtype, size, inline_list):
+        """Gather the stored and streamed operands, in order, and perform an operation.
+
+        Parameters
+        ----------
+        operations : dict
+            Operations available, by name.
+        ndim : int
+            Number of dimensions of the operands.
+        md : dict
+            Metadata provided by the client.
+        dtype : np.type
+            Type of data of the streamed operands.
+        size : tuple
+            Shape of the streamed operands.
+        inline_list : list of np.array
+            Operands streamed by the client.
+
+        Returns
+        -------
+        np.array
+            Result of the operation.
+
+        Raises
+        ------
+        RuntimeError
+            In case the operation is unknown.
+        RuntimeError
+            In case the operands streamed do not match those stated in the metadata.
+        RuntimeError
+            In case a handle is unknown, or it references an array of other dimensions.
+        """
+        # Check the operation requested
+        operation = operations.get(md.get("operation"))
+        if operation is None:
+            raise RuntimeError("Unknown operation: " + str(md.get("operation")) + ".")
+
+        # Gather the operands: streamed ones are marked as "inline" (and taken in order),
+        # while stored ones are referenced by their handle
+        inline = iter(inline_list)
+        operands = []
+        for operand in md.get("operands", "").split(","):
+            if operand == "inline":
+                array = next(inline, None)
+                if array is None:
+                    raise RuntimeError(
+                        "Fewer operands streamed than stated in the metadata."
+                    )
+            else:
+                array = self._store.get(operand)
+                if array.ndim != ndim:
+                    raise RuntimeError(
+                        "Handle "
+                        + operand
+                        + " references an array of other dimensions."
+                    )
+
+                # Check that the stored operand is consistent with the rest of them
+                dtype = check_data_type(dtype, array.dtype.type)
+                size = check_size(size, array.shape)
+
+            operands.append(array)
+
+        if next(inline, None) is not None:
+            raise RuntimeError("More operands streamed than stated in the metadata.")
+
+        return operation(dtype, size, operands)
+
+    # =================================================================================================
+    # PRIVATE METHODS for Server operations
+    # =================================================================================================
+
+    def _single_message_md(
+        self, message_type: str, abbrev: str, count: int, client_md: dict = None
+    ):
+        """Generate the metadata describing operands sent each in a single message.
+
+        Parameters
+        ----------
+        message_type : str
+            Type of message: "vectors" or "matrices".
+        abbrev : str
+            Abbreviation of the message type: "vec" or "mat".
+        count : int
+            Number of operands, each in a single message.
+        client_md : dict, optional
+            Metadata provided by the client, from which the precisions requested are kept.
+            The default is ``None``.
+
+        Returns
+        -------
+        dict
+            Metadata, as provided by the client for the streaming services.
+        """
+        md = {
+            key: value
+            for key, value in (client_md or {}).items()
+            if key in ("transport-dtype", "compute-dtype")
+        }
+        md["full-" + message_type] = str(count)
+        for idx in range(1, count + 1):
+            md[abbrev + str(idx) + "-messages"] = "1"
+
+        return md
+
+    def _process_unary(self, unary, operation, request, context):
+        """Perform an operation over the operands of a unary call.
+
+        Parameters
+        ----------
+        unary : callable
+            Handler of the unary call, such as ``_unary_vectors``.
+        operation : callable
+            Operation to perform, such as ``_add_vectors``.
+        request : grpcdemo_pb2.Vectors or grpcdemo_pb2.Matrices
+            Message with all the operands.
+        context : grpc.ServicerContext
+            gRPC-specific information.
+
+        Returns
+        -------
+        grpcdemo_pb2.Vector or grpcdemo_pb2.Matrix
+            Resulting vector or matrix, within a single message.
+        """
+        # Compute and transmit with the precisions requested by the client (if any)... and
+        # report the error introduced on the result
+        errors = []
+        msg = unary(operation, request, self._read_client_metadata(context), errors)
+        self._report_transport_error(context, errors)
+
+        return msg
+
+    def _unary_vectors(self, operation, request, md: dict, errors: list = None):
+        """Perform an operation over the vectors of a unary call.
+
+        Parameters
+        ----------
+        operation : callable
+            Operation to perform, such as ``_add_vectors``.
+        request : grpcdemo_pb2.Vectors
+            Vectors message.
+        md : dict
+            Metadata provided by the client.
+        errors : list, optional
+            List to which the maximum relative error introduced by the reduced precision
+            on the result is appended. The default is ``None``.
+
+        Returns
+        -------
+        grpcdemo_pb2.Vector
+            Resulting vector, within a single message.
+        """
+        # Parse the vectors as if they were streamed, each in a single message
+        parser = self._parse_vectors(
+            self._single_message_md("vectors", "vec", len(request.vectors), md)
+        )
+        result = operation(*self._consume_stream(parser, request.vectors))
+
+        transport = self._transport(md)
+        self._check_single_message(result, transport)
+        (msg,) = self._vector_messages(
+            [[result.size]], result, transport=transport, errors=errors
+        )
+        return msg
+
+    def _unary_matrices(self, operation, request, md: dict, errors: list = None):
+        """Perform an operation over the matrices of a unary call.
+
+        Parameters
+        ----------
+        operation : callable
+            Operation to perform, such as ``_add_matrices``.
+        request : grpcdemo_pb2.Matrices
+            Matrices message.
+        md : dict
+            Metadata provided by the client.
+        errors : list, optional
+            List to which the maximum relative error introduced by the reduced precision
+            on the result is appended. The default is ``None``.
+
+        Returns
+        -------
+        grpcdemo_pb2.Matrix
+            Resulting matrix, within a single message.
+        """
+        # Parse the matrices as if they were streamed, each in a single message
+        parser = self._parse_matrices(
+            self._single_message_md("matrices", "mat", len(request.matrices), md)
+        )
+        result = operation(*self._consume_stream(parser, request.matrices))
+
+        transport = self._transport(md)
+        self._check_single_message(result, transport)
+        (msg,) = self._matrix_messages(
+            [[result.size]], result, transport=transport, errors=errors
+        )
+        return msg
+
+    def _check_single_message(self, result: np.ndarray, transport: str = None):
+        """Check that a result fits within a single message, as transmitted.
+
+        Parameters
+        ----------
+        result : np.ndarray
+            Result to transmit.
+        transport : str, optional
+            Reduced precision with which to transmit the result. The default is ``None``.
+
+        Raises
+        ------
+        RuntimeError
+            In case the result exceeds the messages allowed.
+        """
+        nbytes = result.size * constants.transport_dtype(result, transport).itemsize
+        if nbytes > self._max_message_length - constants.MESSAGE_OVERHEAD:
+            raise RuntimeError(
+                "The result (%d bytes) exceeds a single message. Stream the operation."
+                % nbytes
+            )
+
+    def _store_array(self, array_list):
+        """Store the single array provided.
+
+        Parameters
+        ----------
+        array_list : list of np.array
+            Arrays provided by the client.
+
+        Returns
+        -------
+        grpcdemo_pb2.Handle
+            Handle to the stored array.
+
+        Raises
+        ------
+        RuntimeError
+            In case the number of arrays provided is not one.
+        """
+        if len(array_list) != 1:
+            raise RuntimeError(
+                "Unexpected number of arrays to be stored: "
+                + str(len(array_list))
+                + ". Only 1 is valid."
+            )
+
+        return grpcdemo_pb2.Handle(id=self._store.put(array_list[0]))
+
+    def _get_vectors(self, request_iterator, md: dict, accumulate=False):
+        """Process a stream of vector messages.
+
+        Parameters
+        ----------
+        request_iterator : iterator
+            Iterator to the received request messages of type Vector.
+        md : dict
+            Metadata provided by the client.
+        accumulate : bool, optional
+            Whether to add all vectors into the first one as they are received. The
+            default is ``False``.
+
+        Returns
+        -------
+        np.type, tuple, list of np.array
+            Type of data, size of the vectors, and list of vectors to process.
+        """
+        return self._consume_stream(
+            self._parse_vectors(md, accumulate), request_iterator
+        )
+
+    def _get_matrices(
+        self, request_iterator, md: dict, same_size=True, accumulate=False
+    ):
+        """Process a stream of matrix messages.
+
+        Parameters
+        ----------
+        request_iterator : iterator
+            Iterator to the received request messages of type ``Matrix``.
+        md : dict
+            Metadata provided by the client.
+        same_size : bool, optional
+            Whether all matrices must have the same shape. The default is ``True``.
+        accumulate : bool, optional
+            Whether to add all matrices into the first one as they are received. The
+            default is ``False``.
+
+        Returns
+        -------
+        np.type, tuple, list of np.array
+            Type of data, shape of the matrices, and list of matrices to process.
+        """
+        return self._consume_stream(
+            self._parse_matrices(md, same_size, accumulate), request_iterator
+        )
+
+    def _consume_stream(self, parser, request_iterator):
+        """Feed a parser with the received request messages until it is done.
+
+        Parameters
+        ----------
+        parser : generator
+            Parser of the messages, as provided by ``_parse_vectors`` or ``_parse_matrices``.
+        request_iterator : iterator
+            Iterator to the received request messages.
+
+        Returns
+        -------
+        np.type, tuple, list of np.array
+            Result of the parser.
+
+        Raises
+        ------
+        RuntimeError
+            In case the stream ends before the parser is done.
+        """
+        try:
+            # Start the parser... and send it messages until it returns its result
+            next(parser)
+            for request in request_iterator:
+                parser.send(request)
+        except StopIteration as parser_done:
+            return parser_done.value
+
+        raise RuntimeError("Unexpected end of the stream of client messages...")
+
+    def _parse_vectors(self, md: dict, accumulate=False):
+        """Parse a stream of vector messages, which are sent to this generator one by one.
+
+        Parameters
+        ----------
+        md : dict
+            Metadata provided by the client.
+        accumulate : bool, optional
+            Whether to add all vectors into the first one, chunk by chunk, as they are
+            received. Only the first vector (the sum) is kept in memory then. The default
+            is ``False``.
+
+        Returns
+        -------
+        np.type, tuple, list of np.array
+            Type of data, size of the vectors, and list of vectors to process (their sum
+            only, if accumulated).
+        """
+        # First, determine the full vector messages to be processed
+        operands = yield from self._read_operands(md, "vectors", "vec", 1)
+
+        # Initialize the output vector list and some aux vars
+        vector_list = []
+        dtype = None
+        size = None
+
+        # Loop over the expected full messages
+        for data_type, shape, chunks in operands:
+
+            # Initialize the output vector and the position up to which it has been filled.
+            # If accumulated, all vectors but the first one are added into the first one.
+            accumulated = accumulate and len(vector_list) > 0
+            fill_chunk = add_chunk if accumulated else constants.fill_chunk
+            vector = None
+            filled = 0
+
+            # Loop over the expected chunks
+            for chunk_msg in range(chunks):
+                # Wait for the vector message
+                chunk_vec = yield
+
+                # Inform about the size of the message content
+                click.echo(
+                    "Size of message: "
+                    + constants.human_size(chunk_vec.vector_as_chunk)
+                )
+
+                # If processing the first chunk of the message, fill in some data
+                if chunk_msg == 0:
+                    # Without a header, the data type and size come with every chunk
+                    if data_type is None:
+                        data_type = chunk_vec.data_type
+                        shape = (chunk_vec.vector_size,)
+
+                    # Check the data type of the incoming vector (as computed)
+                    wire_dtype = self._wire_dtype(data_type)
+                    dtype = check_data_type(dtype, self._compute_dtype(md, wire_dtype))
+
+                    # Check the size of the incoming vector
+                    size = check_size(size, shape)
+
+                    # Allocate the full vector only once, using the advertised size
+                    if accumulated:
+                        vector = vector_list[0]
+                    else:
+                        vector = np.empty(size, dtype=dtype)
+
+                # Parse the chunk and copy (or add) it straight into its slot
+                filled = fill_chunk(
+                    vector,
+                    filled,
+                    chunk_vec.vector_as_chunk,
+                    "client full vector",
+                    wire_dtype,
+                )
+
+            # Check if the final vector has the desired size
+            if vector is None or filled != size[0]:
+                raise RuntimeError("Problems reading client full vector message...")
+            elif not accumulated:
+                # If everything is fine, append to vector_list
+                vector_list.append(vector)
+
+        # Return the input vector list (as a list of numpy.ndarray)
+        return dtype, size, vector_list
+
+    def _parse_matrices(self, md: dict, same_size=True, accumulate=False):
+        """Parse a stream of matrix messages, which are sent to this generator one by one.
+
+        Parameters
+        ----------
+        md : dict
+            Metadata provided by the client.
+        same_size : bool, optional
+            Whether all matrices must have the same shape. The default is ``True``.
+        accumulate : bool, optional
+            Whether to add all matrices into the first one, chunk by chunk, as they are
+            received. Only the first matrix (the sum) is kept in memory then. The default
+            is ``False``.
+
+        Returns
+        -------
+        np.type, tuple, list of np.array
+            Type of data, shape of the matrices (of the last one, if they may differ),
+            and list of matrices to process (their sum only, if accumulated).
+        """
+        # Determine the full matrix messages to be processed
+        operands = yield from self._read_operands(md, "matrices", "mat", 2)
+
+        # Initialize the output matrix list and some aux vars
+        matrix_list = []
+        dtype = None
+        size = None
+
+        # Loop over the expected full messages
+        for data_type, shape, chunks in operands:
+
+            # Initialize the output matrix and the position up to which it has been filled.
+            # If accumulated, all matrices but the first one are added into the first one.
+            accumulated = accumulate and len(matrix_list) > 0
+            fill_chunk = add_chunk if accumulated else constants.fill_chunk
+            matrix = None
+            filled = 0
+
+            # Loop over the expected chunks
+            for chunk_msg in range(chunks):
+                # Wait for the matrix message
+                chunk_mat = yield
+
+                # Inform about the size of the message content
+                click.echo(
+                    "Size of message: "
+                    + constants.human_size(chunk_mat.matrix_as_chunk)
+                )
+
+                # If processing the first chunk of the message, fill in some data
+                if chunk_msg == 0:
+                    # Without a header, the data type and shape come with every chunk
+                    if data_type is None:
+                        data_type = chunk_mat.data_type
+                        shape = (chunk_mat.matrix_rows, chunk_mat.matrix_cols)
+
+                    # Check the data type of the incoming matrix (as computed)
+                    wire_dtype = self._wire_dtype(data_type)
+                    dtype = check_data_type(dtype, self._compute_dtype(md, wire_dtype))
+
+                    # Check the size of the incoming matrix
+                    size = check_size(size if same_size else None, shape)
+
+                    # Allocate the full matrix only once, using the advertised shape
+                    if accumulated:
+                        matrix = matrix_list[0]
+                    else:
+                        matrix = np.empty(size, dtype=dtype)
+
+                # Parse the chunk and copy (or add) it straight into its slot (the matrix
+                # is C-contiguous, so its raveled form is a view over the same memory)
+                filled = fill_chunk(
+                    matrix.ravel(),
+                    filled,
+                    chunk_mat.matrix_as_chunk,
+                    "client full Matrix",
+                    wire_dtype,
+                )
+
+            # Check if the final matrix has the desired size
+            if matrix is None or filled != size[0] * size[1]:
+                raise RuntimeError("Problems reading client full Matrix message...")
+            elif not accumulated:
+                # If everything is fine, append to matrix_list
+                matrix_list.append(matrix)
+
+        # Return the input matrix list (as a list of numpy.ndarray)
+        return dtype, size, matrix_list
+
+    def _read_operands(self, md: dict, message_type: str, abbrev: str, ndim: int):
+        """Determine the full messages to be processed, which this generator may wait for.
+
+        With protocol version 2, they are described by the header message, which is the
+        first message of the stream. Otherwise, the metadata provides the amount of chunks
+        of each full message, whose data type and shape come with its chunks.
+
+        Parameters
+        ----------
+        md : dict
+            Metadata provided by the client.
+        message_type : str
+            Type of message being processed. Options are ``vectors`` and ``matrices``.
+        abbrev : str
+            Abbreviated form of the message being processed. Options are ``vec`` and ``mat``.
+        ndim : int
+            Number of dimensions of the arrays: 1 for vectors and 2 for matrices.
+
+        Returns
+        -------
+        list[tuple]
+            Data type (``None`` if unknown yet), shape (``None`` if unknown yet) and amount
+            of chunks of each full message.
+        """
+        if self._protocol_version(md) == 2:
+            header = yield
+            return constants.read_stream_header(header, ndim, "client")
+
+        full_msgs = int(md.get("full-" + message_type))
+        return [
+            (None, None, int(md.get("%s%d-messages" % (abbrev, msg))))
+            for msg in range(1, full_msgs + 1)
+        ]
+
+    def _protocol_version(self, md: dict):
+        """Determine the version of the streaming protocol used by the client.
+
+        Parameters
+        ----------
+        md : dict
+            Metadata provided by the client.
+
+        Returns
+        -------
+        int
+            Version of the streaming protocol (1, unless stated otherwise by the client).
+
+        Raises
+        ------
+        RuntimeError
+            In case the version is not handled.
+        """
+        version = int(md.get("protocol-version", "1"))
+        if version not in constants.PROTOCOL_VERSIONS:
+            raise RuntimeError("Unsupported protocol version: %d." % version)
+
+        return version
+
+    def _read_client_metadata(self, context):
+        """Return the metadata as a dictionary.
+
+        Parameters
+        ----------
+        context : grpc.ServicerContext
+            gRPC-specific information.
+
+        Returns
+        -------
+        dict
+            Python-readable metadata in dictionary form.
+        """
+        metadata = context.invocation_metadata()
+        metadata_dict = {}
+        for c in metadata:
+            metadata_dict[c.key] = c.value
+
+        return metadata_dict
+
+    def _chunk_size(self, md: dict):
+        """Determine the chunk size of the response messages.
+
+        The chunk size requested by the client (within the metadata), or the default
+        one of the server otherwise, is used within the limits allowed by the server.
+
+        Parameters
+        ----------
+        md : dict
+            Metadata provided by the client.
+
+        Returns
+        -------
+        int
+            Maximum amount of bytes per chunk.
+        """
+        chunk_size = int(md.get("chunk-size", self._default_chunk_size))
+        return min(
+            max(chunk_size, constants.MIN_CHUNKSIZE),
+            self._max_message_length - constants.MESSAGE_OVERHEAD,
+        )
+
+    def _wire_dtype(self, data_type: int):
+        """Determine the numpy dtype of the elements received with a given data type.
+
+        Parameters
+        ----------
+        data_type : int
+            ``DataType`` value of the message.
+
+        Returns
+        -------
+        numpy.type
+            Type of the elements of the chunks.
+
+        Raises
+        ------
+        RuntimeError
+            In case the data type is not handled.
+        """
+        if data_type not in constants.DATATYPE_TO_NP_DTYPE:
+            raise RuntimeError("Unsupported data type: %d." % data_type)
+
+        return constants.DATATYPE_TO_NP_DTYPE[data_type]
+
+    def _compute_dtype(self, md: dict, wire_dtype):
+        """Determine the numpy dtype with which to compute over the elements received.
+
+        Floating-point arrays received with a reduced precision are computed in float64,
+        unless the client requests computing them natively in float32 (within the metadata).
+
+        Parameters
+        ----------
+        md : dict
+            Metadata provided by the client.
+        wire_dtype : numpy.type
+            Type of the elements received.
+
+        Returns
+        -------
+        numpy.type
+            Type of the elements computed.
+
+        Raises
+        ------
+        RuntimeError
+            In case the requested precision is not handled.
+        """
+        if wire_dtype not in (np.float32, np.float16):
+            return wire_dtype
+
+        compute = md.get("compute-dtype", "float64")
+        if compute not in constants.COMPUTE_DTYPES:
+            raise RuntimeError("Unsupported compute precision: %s." % compute)
+
+        return constants.COMPUTE_DTYPES[compute]
+
+    def _transport(self, md: dict):
+        """Determine the reduced precision with which to transmit the response.
+
+        Parameters
+        ----------
+        md : dict
+            Metadata provided by the client.
+
+        Returns
+        -------
+        str
+            Reduced precision requested by the client (``None`` if not requested).
+
+        Raises
+        ------
+        RuntimeError
+            In case the requested precision is not handled.
+        """
+        transport = md.get("transport-dtype")
+        if transport is not None and transport not in constants.TRANSPORT_DTYPES:
+            raise RuntimeError("Unsupported transport precision: %s." % transport)
+
+        return transport
+
+    def _report_transport_error(self, context, errors: "list[float]"):
+        """Report the maximum relative error introduced by the reduced precision (if any).
+
+        The error is sent within the trailing metadata of the response.
+
+        Parameters
+        ----------
+        context : grpc.ServicerContext or grpc.aio.ServicerContext
+            gRPC-specific information.
+        errors : list[float]
+            Maximum relative error introduced in each chunk sent.
+        """
+        if errors:
+            context.set_trailing_metadata((("transport-error", repr(max(errors))),))
+
+    def _set_compression(self, context, md: dict, *args: np.ndarray):
+        """Set the compression of the response messages, before sending the initial metadata.
+
+        The compression algorithm requested by the client (within the metadata), or the
+        default one of the server otherwise, is used unless the vectors or matrices sent
+        are small or incompressible (see ``constants.select_compression``).
+
+        Parameters
+        ----------
+        context : grpc.ServicerContext or grpc.aio.ServicerContext
+            gRPC-specific information.
+        md : dict
+            Metadata provided by the client.
+        args : np.ndarray
+            Vectors or matrices to send (or from which to estimate the compressibility).
+        """
+        compression = constants.select_compression(
+            md.get("compression", self._compression), *args
+        )
+        context.set_compression(constants.COMPRESSIONS[compression])
+
+    def _generate_md(
+        self,
+        message_type: str,
+        abbrev: str,
+        *args: np.ndarray,
+        version: int = 1,
+        chunk_size: int = constants.MAX_CHUNKSIZE,
+        transport: str = None,
+    ):
+        """Generate the server metadata sent to the client and determine the number of chunks in which to decompose each message.
+
+        Parameters
+        ----------
+        message_type : str
+            Type of message being sent. Options are``vectors`` and ``matrices``.
+        abbrev : str
+            Abbreviated form of the message being sent. Options are ``vec`` and ``mat``.
+        version : int, optional
+            Version of the streaming protocol. With version 2, the messages are described
+            by the header message instead. The default is 1.
+        chunk_size : int, optional
+            Maximum amount of bytes per chunk. The default is ``constants.MAX_CHUNKSIZE``.
+        transport : str, optional
+            Reduced precision with which to transmit floating-point arrays. The default
+            is ``None``.
+
+        Returns
+        -------
+        list[tuple], list[list[int]]
+            Metadata to be sent by the server and the chunk indices for the list
+            of messages to send.
+
+        Raises
+        ------
+        RuntimeError
+            In case of an invalid use of this function.
+        """
+        # Determine the chunks needed (a single one if the size is not surpassed)
+        chunks = [
+            constants.chunk_boundaries(
+                arg, chunk_size, constants.transport_dtype(arg, transport)
+            )
+            for arg in args
+        ]
+
+        # Let the client know the maximum length of the messages allowed by the server
+        max_message_length = ("max-message-length", str(self._max_message_length))
+
+        # With protocol version 2, only the version is stated
+        if version == 2:
+            return [("protocol-version", "2"), max_message_length], chunks
+
+        # Find how many arguments are to be transmitted... and their chunks
+        md = [("full-" + message_type, str(len(args))), max_message_length]
+        for idx, last_idx_chunk in enumerate(chunks, start=1):
+            md.append((abbrev + str(idx) + "-messages", str(len(last_idx_chunk))))
+
+        # Return the metadata and the chunks list for each vector or matrix
+        return md, chunks
+
+    def _send_vectors(self, context: grpc.ServicerContext, *args: np.ndarray):
+        """Send the response vector messages.
+
+        Parameters
+        ----------
+        context : grpc.ServicerContext
+            gRPC context.
+        args : np.ndarray
+            Variable size of np.arrays to transmit.
+
+        Yields
+        ------
+        grpcdemo_pb2.Vector
+            Vector messages streamed (full or partial, depending on the metadata)
+        """
+
+        # Answer with the protocol version used by the client... and compress the messages
+        # as requested (if worth it)
+        client_md = self._read_client_metadata(context)
+        version = self._protocol_version(client_md)
+        transport = self._transport(client_md)
+        self._set_compression(context, client_md, *args)
+
+        # Generate the metadata and info on the chunks
+        md, chunks = self._generate_md(
+            "vectors",
+            "vec",
+            *args,
+            version=version,
+            chunk_size=self._chunk_size(client_md),
+            transport=transport,
+        )
+
+        # Send the initial metadata
+        context.send_initial_metadata(md)
+
+        # Yield all the vector messages
+        errors = []
+        yield from self._vector_messages(
+            chunks, *args, version=version, transport=transport, errors=errors
+        )
+        self._report_transport_error(context, errors)
+
+    def _vector_messages(
+        self,
+        chunks: "list[list[int]]",
+        *args: np.ndarray,
+        version: int = 1,
+        transport: str = None,
+        errors: list = None,
+    ):
+        """Build the response vector messages.
+
+        Parameters
+        ----------
+        chunks : list[list[int]]
+            Chunk indices for the list of messages to send.
+        args : np.ndarray
+            Variable size of np.arrays to transmit.
+        version : int, optional
+            Version of the streaming protocol. With version 2, a header message comes
+            first, and the chunk messages carry their payload only. The default is 1.
+        transport : str, optional
+            Reduced precision with which to transmit floating-point arrays. The default
+            is ``None``.
+        errors : list, optional
+            List to which the maximum relative error introduced by the reduced precision
+            is appended, per chunk. The default is ``None``.
+
+        Yields
+        ------
+        grpcdemo_pb2.Vector
+            Vector messages (full or partial, depending on the chunks)
+        """
+        if version == 2:
+            yield grpcdemo_pb2.Vector(
+                header=constants.stream_header(chunks, *args, transport=transport)
+            )
+
+        # Loop over all input arguments
+        for arg, vector_chunks in zip(args, chunks):
+            # Loop over the serialized chunks (a single copy is performed per chunk)
+            dtype = constants.transport_dtype(arg, transport)
+            for payload in constants.chunk_payloads(arg, vector_chunks, dtype, errors):
+                # Build the message... and release the chunk (protobuf holds a copy)
+                if version == 2:
+                    msg = grpcdemo_pb2.Vector(vector_as_chunk=payload)
+                else:
+                    msg = grpcdemo_pb2.Vector(
+                        data_type=constants.NP_DTYPE_TO_DATATYPE[dtype.type],
+                        vector_size=arg.shape[0],
+                        vector_as_chunk=payload,
+                    )
+                del payload
+
+                # Yield!
+                yield msg
+
+    def _send_matrices(self, context: grpc.ServicerContext, *args: np.ndarray):
+        """Sending the response matrix messages.
+
+        Parameters
+        ----------
+        context : grpc.ServicerContext
+            gRPC context.
+        args : np.ndarray
+            Variable size of np.arrays to transmit.
+
+        Yields
+        ------
+        grpcdemo_pb2.Matrix
+            Matrix messages streamed (full or partial, depending on the metadata)
+        """
+
+        # Answer with the protocol version used by the client... and compress the messages
+        # as requested (if worth it)
+        client_md = self._read_client_metadata(context)
+        version = self._protocol_version(client_md)
+        transport = self._transport(client_md)
+        self._set_compression(context, client_md, *args)
+
+        # Generate the metadata and info on the chunks
+        md, chunks = self._generate_md(
+            "matrices",
+            "mat",
+            *args,
+            version=version,
+            chunk_size=self._chunk_size(client_md),
+            transport=transport,
+        )
+
+        # Send the initial metadata
+        context.send_initial_metadata(md)
+
+        # Yield all the matrix messages
+        errors = []
+        yield from self._matrix_messages(
+            chunks, *args, version=version, transport=transport, errors=errors
+        )
+        self._report_transport_error(context, errors)
+
+    def _send_matrix_product(
+        self, context: grpc.ServicerContext, dtype, size, matrix_list
+    ):
+        """Send the response matrix messages with the product of two matrices.
+
+        Both matrices must have been fully received: the product is computed while its
+        messages are sent, not while the operands are received.
+
+        Parameters
+        ----------
+        context : grpc.ServicerContext
+            gRPC context.
+        dtype : np.type
+            Type of data of the matrices.
+        size : tuple
+            Shape of the matrices.
+        matrix_list : list of np.array
+            Matrices provided by the client.
+
+        Yields
+        ------
+        grpcdemo_pb2.Matrix
+            Matrix messages streamed (full or partial, depending on the metadata)
+        """
+        # Check the matrices before answering
+        self._check_multiplication(size, matrix_list)
+
+        # Answer with the protocol version used by the client... and compress the messages
+        # as requested (if worth it, as estimated from the matrices multiplied)
+        client_md = self._read_client_metadata(context)
+        version = self._protocol_version(client_md)
+        transport = self._transport(client_md)
+        self._set_compression(context, client_md, *matrix_list)
+
+        # Generate the metadata and info on the chunks (of the product, yet to be computed)
+        result = np.empty(size, dtype=dtype)
+        md, chunks = self._generate_md(
+            "matrices",
+            "mat",
+            result,
+            version=version,
+            chunk_size=self._chunk_size(client_md),
+            transport=transport,
+        )
+
+        # Send the initial metadata
+        context.send_initial_metadata(md)
+
+        # Yield all the matrix messages, computing the product while they are sent
+        errors = []
+        yield from self._matrix_product_messages(
+            chunks,
+            result,
+            *matrix_list,
+            version=version,
+            transport=transport,
+            errors=errors,
+        )
+        self._report_transport_error(context, errors)
+
+    def _matrix_product_messages(
+        self,
+        chunks: "list[list[int]]",
+        result: np.ndarray,
+        a: np.ndarray,
+        b: np.ndarray,
+        version: int = 1,
+        transport: str = None,
+        errors: list = None,
+    ):
+        """Build the response matrix messages with the product of two matrices.
+
+        The product is computed by row blocks (the rows sent within each chunk message)
+        using the Eigen library. Each row block is computed right before its message is
+        built, so that the first messages are sent (and read by the client) while the
+        rest of the product is still being computed.
+
+        Only the transmission of the product overlaps its computation, not the reception
+        of the operands: every row block needs all of ``b``, which the client streams
+        last, so no row block can be computed before both matrices are complete.
+
+        Parameters
+        ----------
+        chunks : list[list[int]]
+            Chunk indices for the product to send.
+        result : np.ndarray
+            C-contiguous matrix into which to compute the product.
+        a : np.ndarray
+            First matrix to multiply.
+        b : np.ndarray
+            Second matrix to multiply.
+        version : int, optional
+            Version of the streaming protocol. The default is 1.
+        transport : str, optional
+            Reduced precision with which to transmit the product. The default is ``None``.
+        errors : list, optional
+            List to which the maximum relative error introduced by the reduced precision
+            is appended, per chunk. The default is ``None``.
+
+        Yields
+        ------
+        grpcdemo_pb2.Matrix
+            Matrix messages (full or partial, depending on the chunks)
+        """
+        # The messages are built lazily, reading the product when serializing each chunk
+        messages = self._matrix_messages(
+            chunks, result, version=version, transport=transport, errors=errors
+        )
+        if version == 2:
+            yield next(messages)
+
+        computed_rows = 0
+        for last_idx in chunks[0]:
+            # Compute the rows of the product involved in the chunk (rounding up, in case
+            # the chunk is made of partial rows)... and send it
+            rows = -(-last_idx // result.shape[1])
+            demo_eigen_wrapper.multiply_matrices(
+                a[computed_rows:rows], b, out=result[computed_rows:rows]
+            )
+            computed_rows = rows
+            yield next(messages)
+
+    def _matrix_messages(
+        self,
+        chunks: "list[list[int]]",
+        *args: np.ndarray,
+        version: int = 1,
+        transport: str = None,
+        errors: list = None,
+    ):
+        """Build the response matrix messages.
+
+        Parameters
+        ----------
+        chunks : list[list[int]]
+            Chunk indices for the list of messages to send.
+        args : np.ndarray
+            Variable size of np.arrays to transmit.
+        version : int, optional
+            Version of the streaming protocol. With version 2, a header message comes
+            first, and the chunk messages carry their payload only. The default is 1.
+        transport : str, optional
+            Reduced precision with which to transmit floating-point arrays. The default
+            is ``None``.
+        errors : list, optional
+            List to which the maximum relative error introduced by the reduced precision
+            is appended, per chunk. The default is ``None``.
+
+        Yields
+        ------
+        grpcdemo_pb2.Matrix
+            Matrix messages (full or partial, depending on the chunks)
+        """
+        if version == 2:
+            yield grpcdemo_pb2.Matrix(
+                header=constants.stream_header(chunks, *args, transport=transport)
+            )
+
+        # Loop over all input arguments
+        for arg, matrix_chunks in zip(args, chunks):
+            # Loop over the serialized chunks (a single copy is performed per chunk,
+            # without raveling the matrix, which copies it if it is not C-contiguous)
+            dtype = constants.transport_dtype(arg, transport)
+            for payload in constants.chunk_payloads(arg, matrix_chunks, dtype, errors):
+                # Build the message... and release the chunk (protobuf holds a copy)
+                if version == 2:
+                    msg = grpcdemo_pb2.Matrix(matrix_as_chunk=payload)
+                else:
+                    msg = grpcdemo_pb2.Matrix(
+                        data_type=constants.NP_DTYPE_TO_DATATYPE[dtype.type],
+                        matrix_rows=arg.shape[0],
+                        matrix_cols=arg.shape[1],
+                        matrix_as_chunk=payload,
+                    )
+                del payload
+
+                # Yield!
+                yield msg
+
+
+class AsyncGRPCDemoServicer(GRPCDemoServicer):
+    """Provides an asyncio-based (``grpc.aio``) implementation of the API Eigen Example server.
+
+    The messages are processed and the operations are performed as in ``GRPCDemoServicer``,
+    but the incoming chunks are awaited instead of blocking a worker thread per call.
+    Thus, the amount of concurrent calls is not limited by the size of a thread pool.
+    """
+
+    # =================================================================================================
+    # PUBLIC METHODS for Server operations
+    # =================================================================================================
+
+    async def SayHello(self, request, context):
+        """Test the greeter method to see if the server is up and running correctly.
+
+        Parameters
+        ----------
+        request : HelloRequest
+            Greeting request sent by the client.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+
+        Returns
+        -------
+        grpcdemo_pb2.HelloReply
+           Reply to greeting by the server.
+        """
+        return super().SayHello(request, context)
 
-            # Loop over the chunk indices
-            processed_idx = 0
-            for last_idx_chunk in matrix_chunks:
-                # Use tmp_idx in yield function and update the processed_idx afterwards
-                tmp_idx = processed_idx
-                processed_idx = last_idx_chunk
+    async def FlipVector(self, request_iterator, context):
+        """Flip a given vector.
 
-                # Yield!
-                yield grpcdemo_pb2.Matrix(
-                    data_type=constants.NP_DTYPE_TO_DATATYPE[arg.dtype.type],
-                    matrix_rows=arg.shape[0],
-                    matrix_cols=arg.shape[1],
-                    matrix_as_chunk=arg_as_vec[tmp_idx:last_idx_chunk].tobytes(),
-                )
+        Parameters
+        ----------
+        request_iterator : async iterator
+            Asynchronous iterator to the stream of vector messages provided.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+        """
+        click.echo("Vector flip requested.")
+        await self._process_vectors(self._flip_vector, request_iterator, context)
+
+    async def AddVectors(self, request_iterator, context):
+        """Add vectors.
+
+        Parameters
+        ----------
+        request_iterator : async iterator
+            Asynchronous iterator to the stream of vector messages provided.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+        """
+        click.echo("Vector addition requested.")
+        await self._process_vectors(
+            self._accumulated_sum, request_iterator, context, accumulate=True
+        )
+
+    async def MultiplyVectors(self, request_iterator, context):
+        """Multiply two vectors.
+
+        Parameters
+        ----------
+        request_iterator : async iterator
+            Asynchronous iterator to the stream of vector messages provided.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+        """
+        click.echo("Vector dot product requested")
+        await self._process_vectors(self._multiply_vectors, request_iterator, context)
+
+    async def AddMatrices(self, request_iterator, context):
+        """Add matrices.
+
+        Parameters
+        ----------
+        request_iterator : async iterator
+            Asynchronous iterator to the stream of matrix messages provided.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+        """
+        click.echo("Matrix addition requested!")
+        await self._process_matrices(
+            self._accumulated_sum, request_iterator, context, accumulate=True
+        )
+
+    async def MultiplyMatrices(self, request_iterator, context):
+        """Multiply two matrices.
+
+        Parameters
+        ----------
+        request_iterator : async iterator
+            Asynchronous iterator to the stream of matrix messages provided.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+        """
+        click.echo("Matrix multiplication requested.")
+
+        # Process the metadata and the input messages (the product needs both matrices
+        # to be complete)
+        md = self._read_client_metadata(context)
+        dtype, size, matrix_list = await self._aconsume_stream(
+            self._parse_matrices(md), request_iterator
+        )
+        self._check_multiplication(size, matrix_list)
+
+        # Send the response (with the protocol version used by the client)
+        version = self._protocol_version(md)
+        transport = self._transport(md)
+        self._set_compression(context, md, *matrix_list)
+        result = np.empty(size, dtype=dtype)
+        md, chunks = self._generate_md(
+            "matrices",
+            "mat",
+            result,
+            version=version,
+            chunk_size=self._chunk_size(md),
+            transport=transport,
+        )
+        await context.send_initial_metadata(md)
+
+        # Compute each row block of the product (building its message) outside the event
+        # loop, and send it as soon as it is computed
+        errors = []
+        messages = self._matrix_product_messages(
+            chunks,
+            result,
+            *matrix_list,
+            version=version,
+            transport=transport,
+            errors=errors,
+        )
+        loop = asyncio.get_running_loop()
+        while True:
+            msg = await loop.run_in_executor(None, next, messages, None)
+            if msg is None:
+                break
+            await context.write(msg)
+        self._report_transport_error(context, errors)
+
+    async def BatchedOperation(self, request_iterator, context):
+        """Perform an operation over two stacks of vectors or matrices.
+
+        Parameters
+        ----------
+        request_iterator : async iterator
+            Asynchronous iterator to the stream of matrix messages provided.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+        """
+        click.echo("Batched operation requested.")
+        md = self._read_client_metadata(context)
+        await self._process_matrices(
+            functools.partial(self._batched_operation, md), request_iterator, context
+        )
+
+    async def UploadVector(self, request_iterator, context):
+        """Store a vector, which can then be referenced by its handle.
+
+        Parameters
+        ----------
+        request_iterator : async iterator
+            Asynchronous iterator to the stream of vector messages provided.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+
+        Returns
+        -------
+        grpcdemo_pb2.Handle
+            Handle to the stored vector.
+        """
+        click.echo("Vector upload requested.")
+        md = self._read_client_metadata(context)
+        _, _, vector_list = await self._aconsume_stream(
+            self._parse_vectors(md), request_iterator
+        )
+        return self._store_array(vector_list)
+
+    async def UploadMatrix(self, request_iterator, context):
+        """Store a matrix, which can then be referenced by its handle.
+
+        Parameters
+        ----------
+        request_iterator : async iterator
+            Asynchronous iterator to the stream of matrix messages provided.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+
+        Returns
+        -------
+        grpcdemo_pb2.Handle
+            Handle to the stored matrix.
+        """
+        click.echo("Matrix upload requested.")
+        md = self._read_client_metadata(context)
+        _, _, matrix_list = await self._aconsume_stream(
+            self._parse_matrices(md), request_iterator
+        )
+        return self._store_array(matrix_list)
+
+    async def ReleaseHandle(self, request, context):
+        """Release a stored vector or matrix.
+
+        Parameters
+        ----------
+        request : Handle
+            Handle to the stored vector or matrix.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+
+        Returns
+        -------
+        grpcdemo_pb2.ReleaseReply
+            Whether the vector or matrix was stored (and has been released).
+        """
+        return super().ReleaseHandle(request, context)
+
+    async def OperateVectors(self, request_iterator, context):
+        """Operate vectors, either stored or streamed.
+
+        Parameters
+        ----------
+        request_iterator : async iterator
+            Asynchronous iterator to the stream of vector messages provided.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+        """
+        click.echo("Operation on vectors requested.")
+        md = self._read_client_metadata(context)
+        await self._process_vectors(
+            functools.partial(self._operate_vectors, md), request_iterator, context
+        )
+
+    async def OperateMatrices(self, request_iterator, context):
+        """Operate matrices, either stored or streamed.
+
+        Parameters
+        ----------
+        request_iterator : async iterator
+            Asynchronous iterator to the stream of matrix messages provided.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+        """
+        click.echo("Operation on matrices requested.")
+        md = self._read_client_metadata(context)
+        await self._process_matrices(
+            functools.partial(self._operate_matrices, md), request_iterator, context
+        )
+
+    async def Pipeline(self, request_iterator, context):
+        """Evaluate a pipeline over the streamed operands, and send back its outputs.
+
+        Parameters
+        ----------
+        request_iterator : async iterator
+            Asynchronous iterator to the stream of matrix messages provided.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+        """
+        click.echo("Pipeline requested.")
+        md = self._read_client_metadata(context)
+        dtype, _, matrix_list = await self._aconsume_stream(
+            self._parse_matrices(md, same_size=False), request_iterator
+        )
+
+        # Evaluate the pipeline outside the event loop, so that other calls can progress
+        results = await asyncio.get_running_loop().run_in_executor(
+            None, self._run_pipeline, md, dtype, matrix_list
+        )
+
+        # Send the response (with the protocol version used by the client)
+        version = self._protocol_version(md)
+        transport = self._transport(md)
+        self._set_compression(context, md, *results)
+        md, chunks = self._generate_md(
+            "matrices",
+            "mat",
+            *results,
+            version=version,
+            chunk_size=self._chunk_size(md),
+            transport=transport,
+        )
+        await context.send_initial_metadata(md)
+        errors = []
+        for msg in self._matrix_messages(
+            chunks, *results, version=version, transport=transport, errors=errors
+        ):
+            await context.write(msg)
+        self._report_transport_error(context, errors)
+
+    async def Session(self, request_iterator, context):
+        """Perform several operations over a long-lived stream.
+
+        Parameters
+        ----------
+        request_iterator : async iterator
+            Asynchronous iterator to the stream of session request messages provided.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+        """
+        click.echo("Session requested.")
+
+        # Perform the operations outside the event loop, so that other calls can progress
+        loop = asyncio.get_running_loop()
+        async for request in request_iterator:
+            response = await loop.run_in_executor(
+                None, self._session_operation, request
+            )
+            await context.write(response)
+
+    async def FlipVectorUnary(self, request, context):
+        """Flip a vector sent within a single message (unary call).
+
+        Parameters
+        ----------
+        request : Vectors
+            Vectors message, with all the vectors within a single message.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+
+        Returns
+        -------
+        grpcdemo_pb2.Vector
+            Vector message.
+        """
+        click.echo("Unary vector flip requested.")
+        return await self._process_unary(
+            self._unary_vectors, self._flip_vector, request, context
+        )
+
+    async def AddVectorsUnary(self, request, context):
+        """Add vectors sent within a single message (unary call).
+
+        Parameters
+        ----------
+        request : Vectors
+            Vectors message, with all the vectors within a single message.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+
+        Returns
+        -------
+        grpcdemo_pb2.Vector
+            Vector message.
+        """
+        click.echo("Unary vector addition requested.")
+        return await self._process_unary(
+            self._unary_vectors, self._add_vectors, request, context
+        )
+
+    async def MultiplyVectorsUnary(self, request, context):
+        """Multiply two vectors sent within a single message (unary call).
+
+        Parameters
+        ----------
+        request : Vectors
+            Vectors message, with all the vectors within a single message.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+
+        Returns
+        -------
+        grpcdemo_pb2.Vector
+            Vector message.
+        """
+        click.echo("Unary vector dot product requested.")
+        return await self._process_unary(
+            self._unary_vectors, self._multiply_vectors, request, context
+        )
+
+    async def AddMatricesUnary(self, request, context):
+        """Add matrices sent within a single message (unary call).
+
+        Parameters
+        ----------
+        request : Matrices
+            Matrices message, with all the matrices within a single message.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+
+        Returns
+        -------
+        grpcdemo_pb2.Matrix
+            Matrix message.
+        """
+        click.echo("Unary matrix addition requested.")
+        return await self._process_unary(
+            self._unary_matrices, self._add_matrices, request, context
+        )
+
+    async def MultiplyMatricesUnary(self, request, context):
+        """Multiply two matrices sent within a single message (unary call).
+
+        Parameters
+        ----------
+        request : Matrices
+            Matrices message, with all the matrices within a single message.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+
+        Returns
+        -------
+        grpcdemo_pb2.Matrix
+            Matrix message.
+        """
+        click.echo("Unary matrix multiplication requested.")
+        return await self._process_unary(
+            self._unary_matrices, self._multiply_matrices, request, context
+        )
+
+    # =================================================================================================
+    # PRIVATE METHODS for Server operations
+    # =================================================================================================
+
+    async def _process_unary(self, unary, operation, request, context):
+        """Perform an operation over the operands of a unary call.
+
+        Parameters
+        ----------
+        unary : callable
+            Handler of the unary call, such as ``_unary_vectors``.
+        operation : callable
+            Operation to perform, such as ``_add_vectors``.
+        request : grpcdemo_pb2.Vectors or grpcdemo_pb2.Matrices
+            Message with all the operands.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+
+        Returns
+        -------
+        grpcdemo_pb2.Vector or grpcdemo_pb2.Matrix
+            Resulting vector or matrix, within a single message.
+        """
+        # Perform the operation outside the event loop, so that other calls can progress
+        # (with the precisions requested by the client, as in the synchronous server)
+        errors = []
+        msg = await asyncio.get_running_loop().run_in_executor(
+            None, unary, operation, request, self._read_client_metadata(context), errors
+        )
+        self._report_transport_error(context, errors)
+
+        return msg
+
+    async def _process_vectors(
+        self, operation, request_iterator, context, accumulate=False
+    ):
+        """Read the vector messages, perform an operation and send the resulting vector.
+
+        Parameters
+        ----------
+        operation : callable
+            Operation to perform, such as ``_add_vectors``.
+        request_iterator : async iterator
+            Asynchronous iterator to the stream of vector messages provided.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+        accumulate : bool, optional
+            Whether to add all vectors into the first one as they are received. The
+            default is ``False``.
+        """
+        # Process the metadata and the input messages
+        md = self._read_client_metadata(context)
+        parser = self._parse_vectors(md, accumulate=accumulate)
+        parsed = await self._aconsume_stream(parser, request_iterator)
+
+        # Perform the operation outside the event loop, so that other calls can progress
+        result = await asyncio.get_running_loop().run_in_executor(
+            None, operation, *parsed
+        )
+
+        # Send the response (with the protocol version used by the client)
+        version = self._protocol_version(md)
+        transport = self._transport(md)
+        self._set_compression(context, md, result)
+        md, chunks = self._generate_md(
+            "vectors",
+            "vec",
+            result,
+            version=version,
+            chunk_size=self._chunk_size(md),
+            transport=transport,
+        )
+        await context.send_initial_metadata(md)
+        errors = []
+        for msg in self._vector_messages(
+            chunks, result, version=version, transport=transport, errors=errors
+        ):
+            await context.write(msg)
+        self._report_transport_error(context, errors)
+
+    async def _process_matrices(
+        self, operation, request_iterator, context, accumulate=False
+    ):
+        """Read the matrix messages, perform an operation and send the resulting matrix.
+
+        Parameters
+        ----------
+        operation : callable
+            Operation to perform, such as ``_add_matrices``.
+        request_iterator : async iterator
+            Asynchronous iterator to the stream of matrix messages provided.
+        context : grpc.aio.ServicerContext
+            gRPC-specific information.
+        accumulate : bool, optional
+            Whether to add all matrices into the first one as they are received. The
+            default is ``False``.
+        """
+        # Process the metadata and the input messages
+        md = self._read_client_metadata(context)
+        parser = self._parse_matrices(md, accumulate=accumulate)
+        parsed = await self._aconsume_stream(parser, request_iterator)
+
+        # Perform the operation outside the event loop, so that other calls can progress
+        result = await asyncio.get_running_loop().run_in_executor(
+            None, operation, *parsed
+        )
+
+        # Send the response (with the protocol version used by the client)
+        version = self._protocol_version(md)
+        transport = self._transport(md)
+        self._set_compression(context, md, result)
+        md, chunks = self._generate_md(
+            "matrices",
+            "mat",
+            result,
+            version=version,
+            chunk_size=self._chunk_size(md),
+            transport=transport,
+        )
+        await context.send_initial_metadata(md)
+        errors = []
+        for msg in self._matrix_messages(
+            chunks, result, version=version, transport=transport, errors=errors
+        ):
+            await context.write(msg)
+        self._report_transport_error(context, errors)
+
+    async def _aconsume_stream(self, parser, request_iterator):
+        """Feed a parser with the received request messages (awaiting them) until it is done.
+
+        Parameters
+        ----------
+        parser : generator
+            Parser of the messages, as provided by ``_parse_vectors`` or ``_parse_matrices``.
+        request_iterator : async iterator
+            Asynchronous iterator to the received request messages.
+
+        Returns
+        -------
+        np.type, tuple, list of np.array
+            Result of the parser.
+
+        Raises
+        ------
+        RuntimeError
+            In case the stream ends before the parser is done.
+        """
+        # Start the parser... and send it messages until it returns its result. Messages are
+        # parsed (i.e. copied, converted or accumulated) outside the event loop, so that
+        # other calls can progress during large transfers
+        loop = asyncio.get_running_loop()
+        next(parser)
+        async for request in request_iterator:
+            done, value = await loop.run_in_executor(
+                None, self._send_message, parser, request
+            )
+            if done:
+                return value
+
+        raise RuntimeError("Unexpected end of the stream of client messages...")
+
+    def _send_message(self, parser, request):
+        """Send a received request message to a parser.
+
+        Parameters
+        ----------
+        parser : generator
+            Parser of the messages, as provided by ``_parse_vectors`` or ``_parse_matrices``.
+        request : grpcdemo_pb2.Vector or grpcdemo_pb2.Matrix
+            Received request message.
+
+        Returns
+        -------
+        bool, object
+            Whether the parser is done, and its result (if done). Since ``StopIteration``
+            cannot be raised through the future of an executor, it is returned instead.
+        """
+        try:
+            parser.send(request)
+        except StopIteration as parser_done:
+            return True, parser_done.value
+
+        return False, None
 
 
 # =================================================================================================
@@ -631,15 +2880,137 @@ class GRPCDemoServicer(grpcdemo_pb2_grpc.GRPCDemoServicer):
 # =================================================================================================
 
 
-def serve():
-    """Deploy the API Eigen Example server."""
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    grpcdemo_pb2_grpc.add_GRPCDemoServicer_to_server(GRPCDemoServicer(), server)
+def serve(
+    use_asyncio=False,
+    store_budget=constants.STORE_BUDGET,
+    compression="none",
+    chunk_size=constants.MAX_CHUNKSIZE,
+    max_message_length=constants.MAX_MESSAGE_LENGTH,
+):
+    """Deploy the API Eigen Example server.
+
+    Parameters
+    ----------
+    use_asyncio : bool, optional
+        Whether to deploy the asyncio-based server (``grpc.aio``) instead of the
+        thread-pool-based one. The default is ``False``.
+    store_budget : int, optional
+        Maximum amount of bytes held by the arrays stored on the server.
+        The default is ``constants.STORE_BUDGET``.
+    compression : str, optional
+        Default compression algorithm of the response messages, unless the client
+        requests another one. The default is ``"none"``.
+    chunk_size : int, optional
+        Default chunk size of the response messages, unless the client requests
+        another one. The default is ``constants.MAX_CHUNKSIZE``.
+    max_message_length : int, optional
+        Maximum length of the messages sent and received by the server.
+        The default is ``constants.MAX_MESSAGE_LENGTH``.
+    """
+    if use_asyncio:
+        asyncio.run(
+            serve_async(store_budget, compression, chunk_size, max_message_length)
+        )
+        return
+
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=10),
+        options=_server_options(max_message_length),
+    )
+    grpcdemo_pb2_grpc.add_GRPCDemoServicer_to_server(
+        GRPCDemoServicer(store_budget, compression, chunk_size, max_message_length),
+        server,
+    )
     server.add_insecure_port("[::]:50051")
     server.start()
     server.wait_for_termination()
 
 
+async def serve_async(
+    store_budget=constants.STORE_BUDGET,
+    compression="none",
+    chunk_size=constants.MAX_CHUNKSIZE,
+    max_message_length=constants.MAX_MESSAGE_LENGTH,
+):
+    """Deploy the asyncio-based (``grpc.aio``) API Eigen Example server.
+
+    Parameters
+    ----------
+    store_budget : int, optional
+        Maximum amount of bytes held by the arrays stored on the server.
+        The default is ``constants.STORE_BUDGET``.
+    compression : str, optional
+        Default compression algorithm of the response messages, unless the client
+        requests another one. The default is ``"none"``.
+    chunk_size : int, optional
+        Default chunk size of the response messages, unless the client requests
+        another one. The default is ``constants.MAX_CHUNKSIZE``.
+    max_message_length : int, optional
+        Maximum length of the messages sent and received by the server.
+        The default is ``constants.MAX_MESSAGE_LENGTH``.
+    """
+    server = grpc.aio.server(options=_server_options(max_message_length))
+    grpcdemo_pb2_grpc.add_GRPCDemoServicer_to_server(
+        AsyncGRPCDemoServicer(
+            store_budget, compression, chunk_size, max_message_length
+        ),
+        server,
+    )
+    server.add_insecure_port("[::]:50051")
+    await server.start()
+    await server.wait_for_termination()
+
+
+def _server_options(max_message_length: int):
+    # Set the maximum length of the messages sent and received by the server
+    return [
+        ("grpc.max_send_message_length", max_message_length),
+        ("grpc.max_receive_message_length", max_message_length),
+    ]
+
+
+@click.command()
+@click.option(
+    "--asyncio",
+    "use_asyncio",
+    is_flag=True,
+    help="Deploy the asyncio-based (grpc.aio) server instead of the thread-pool-based one.",
+)
+@click.option(
+    "--store-budget",
+    type=int,
+    default=constants.STORE_BUDGET,
+    show_default=True,
+    help="Maximum amount of bytes held by the arrays stored on the server.",
+)
+@click.option(
+    "--compression",
+    type=click.Choice(list(constants.COMPRESSIONS)),
+    default="none",
+    show_default=True,
+    help="Default compression algorithm of the responses (small or incompressible ones "
+    "are never compressed).",
+)
+@click.option(
+    "--chunk-size",
+    type=int,
+    default=constants.MAX_CHUNKSIZE,
+    show_default=True,
+    help="Default amount of bytes per chunk of the responses (clients may request another "
+    "one).",
+)
+@click.option(
+    "--max-message-length",
+    type=int,
+    default=constants.MAX_MESSAGE_LENGTH,
+    show_default=True,
+    help="Maximum length of the messages sent and received by the server.",
+)
+def main(use_asyncio, store_budget, compression, chunk_size, max_message_length):
+    """Deploy the API Eigen Example server."""
+    serve(use_asyncio, store_budget, compression, chunk_size, max_message_length)
+
+
 if __name__ == "__main__":
     logging.basicConfig()
-    serve()
+    main()
@@ -0,0 +1,133 @@
+"""Python implementation of the in-memory store of arrays resident on the gRPC server."""
+
+from collections import OrderedDict
+import threading
+import uuid
+
+import numpy as np
+
+
+class ArrayStore:
+    """Provides an in-memory store of numpy arrays, referenced by handles.
+
+    The store holds up to a given amount of bytes. Whenever a new array does not fit,
+    the least recently used arrays are evicted. Arrays are stored as read-only, so that
+    operations on them never modify their contents. All methods are thread-safe.
+    """
+
+    def __init__(self, budget):
+        """Initialize an empty store.
+
+        Parameters
+        ----------
+        budget : int
+            Maximum amount of bytes held by the stored arrays.
+        """
+        self._budget = budget
+        self._nbytes = 0
+        self._arrays = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def budget(self):
+        """Maximum amount of bytes held by the stored arrays."""
+        return self._budget
+
+    @property
+    def nbytes(self):
+        """Amount of bytes currently held by the stored arrays."""
+        return self._nbytes
+
+    def __len__(self):
+        """Amount of arrays currently stored."""
+        return len(self._arrays)
+
+    def put(self, array: np.ndarray):
+        """Store an array, evicting the least recently used ones if needed.
+
+        Parameters
+        ----------
+        array : np.ndarray
+            Array to store. It is no longer writable once stored.
+
+        Returns
+        -------
+        str
+            Handle to the stored array.
+
+        Raises
+        ------
+        RuntimeError
+            In case the array alone exceeds the budget of the store.
+        """
+        if array.nbytes > self._budget:
+            raise RuntimeError(
+                "Array of %d bytes exceeds the budget of the store (%d bytes)."
+                % (array.nbytes, self._budget)
+            )
+
+        array.flags.writeable = False
+        handle = uuid.uuid4().hex
+
+        with self._lock:
+            # Evict the least recently used arrays until the new one fits
+            while self._nbytes + array.nbytes > self._budget:
+                _, evicted = self._arrays.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+
+            self._arrays[handle] = array
+            self._nbytes += array.nbytes
+
+        return handle
+
+    def get(self, handle: str):
+        """Retrieve a stored array, which becomes the most recently used one.
+
+        Parameters
+        ----------
+        handle : str
+            Handle to the stored array.
+
+        Returns
+        -------
+        np.ndarray
+            Stored (read-only) array.
+
+        Raises
+        ------
+        RuntimeError
+            In case the handle is unknown (for example, if it was released or evicted).
+        """
+        with self._lock:
+            try:
+                self._arrays.move_to_end(handle)
+            except KeyError:
+                raise RuntimeError(
+                    "Unknown handle: "
+                    + handle
+                    + ". It may have been released or evicted."
+                )
+
+            return self._arrays[handle]
+
+    def release(self, handle: str):
+        """Release a stored array.
+
+        Parameters
+        ----------
+        handle : str
+            Handle to the stored array.
+
+        Returns
+        -------
+        bool
+            ``True`` if the array was stored, ``False`` otherwise (for example, if it
+            was already released or evicted).
+        """
+        with self._lock:
+            array = self._arrays.pop(handle, None)
+            if array is None:
+                return False
+
+            self._nbytes -= array.nbytes
+            return True
@@ -5,6 +5,13 @@ import json
 import numpy as np
 import requests
 
+from ansys.eigen.python.rest.payloads import (
+    JSON_MIMETYPE,
+    PAYLOAD_FORMATS,
+    decode_array,
+    encode_array,
+)
+
 _EXP_DTYPE = np.dtype("float64")
 """Expected dtype for numpy arrays."""
 
@@ -19,7 +26,16 @@ class DemoRESTClient:
     # PUBLIC METHODS for Client operations
     # =================================================================================================
 
-    def __init__(self, host, port, user=None, pwd=None, client=None):
+    def __init__(
+        self,
+        host,
+        port,
+        user=None,
+        pwd=None,
+        client=None,
+        payload_format="binary",
+        store_operands=False,
+    ):
         """Initialize the client.
 
         Parameters
@@ -34,12 +50,40 @@ class DemoRESTClient:
             Password to use in basic authentication. The default is ``None``.
         client : FlaskClient
             Flask client, which is to be used only for testing purposes. The default is ``None``.
+        payload_format : str, optional
+            Format in which the arrays are sent to the server and their results requested:
+            ``"binary"`` (raw little-endian buffers), ``"npy"`` (NumPy ``.npy`` files) or
+            ``"json"`` (lists of numbers). Servers that do not handle binary payloads are
+            detected, and JSON is used from then on. The default is ``"binary"``.
+        store_operands : bool, optional
+            Whether to store the operands in the destination server before operating on them
+            (three requests per operation). Otherwise, they are sent along with the operation
+            requested, which is computed in a single request (unless the server does not handle
+            it). The default is ``False``.
+
+        Raises
+        ------
+        RuntimeError
+            In case the payload format is not one of the handled ones.
         """
         self._host = host
         self._port = port
         self._user = user
         self._pwd = pwd
 
+        # Check that the payload format is one of the handled ones
+        if payload_format not in PAYLOAD_FORMATS:
+            raise RuntimeError(
+                "Invalid payload format. Options are: "
+                + ", ".join(PAYLOAD_FORMATS)
+                + "."
+            )
+        self._payload_format = payload_format
+
+        # Operate on the operands in a single request, unless requested otherwise
+        self._store_operands = store_operands
+        self._use_compute = True
+
         # Depending if we are testing or not... it may be needed to pass the
         # FlaskClient directly...
         if client is not None:
@@ -213,15 +257,22 @@ class DemoRESTClient:
             Tesult of the operation requested between arg1 and arg2.
         """
         # At this point we must check if we are dealing with a vector or a matrix...
-        # and proceed to perform the requested operation
-        if arg_dim == 1:
-            id1 = self.__post_resource(arg1, "Vectors")
-            id2 = self.__post_resource(arg2, "Vectors")
-            return self.__get_ops_resource(id1, id2, ops, "Vectors")
-        else:
-            id1 = self.__post_resource(arg1, "Matrices")
-            id2 = self.__post_resource(arg2, "Matrices")
-            return self.__get_ops_resource(id1, id2, ops, "Matrices")
+        resource = "Vectors" if arg_dim == 1 else "Matrices"
+
+        # ... and proceed to perform the requested operation. Unless the operands are to be
+        # stored, in a single request (if the server handles it)
+        if not self._store_operands and self._use_compute:
+            response = self.__compute_resource(arg1, arg2, ops, resource)
+
+            # Servers which do not handle stateless operations... fall back to storing them
+            if response.status_code in (404, 405):
+                self._use_compute = False
+            else:
+                return self.__parse_result(response)
+
+        id1 = self.__post_resource(arg1, resource)
+        id2 = self.__post_resource(arg2, resource)
+        return self.__get_ops_resource(id1, id2, ops, resource)
 
     def __post_resource(self, arg, resource):
         """Generalistic private method to handle the posting of objects to the destination server.
@@ -245,24 +296,14 @@ class DemoRESTClient:
         RuntimeError
             If the Client failed to post the argument to the destination server.
         """
-        # Perform the post request
-        try:
-            if not self._use_test_client:
-                response = requests.post(
-                    self._host + ":" + str(self._port) + "/" + resource,
-                    json={"value": arg.tolist()},
-                    auth=(self._user, self._pwd),
-                )
-            else:
-                response = self._client.post(
-                    "/" + resource,
-                    json={"value": arg.tolist()},
-                    auth=(self._user, self._pwd),
-                )
-        except (requests.exceptions.ConnectionError):
-            raise RuntimeError(
-                "Could not connect to server... Check server status or connection details."
-            )
+        # Perform the post request, in the requested format
+        response = self.__post_request(arg, "/" + resource, self._payload_format)
+
+        # Servers which do not handle binary payloads reject them... fall back to JSON
+        if response.status_code in (400, 415) and self._payload_format != "json":
+            response = self.__post_request(arg, "/" + resource, "json")
+            if response.status_code == 201:
+                self._payload_format = "json"
 
         # Check that the status of the response is correct
         if response.status_code != 201:
@@ -271,8 +312,77 @@ class DemoRESTClient:
         # If everything went well... extract the id of the posted object
         return self.__get_val(json.loads(response.text), "id")
 
+    def __compute_resource(self, arg1, arg2, ops, resource):
+        """Private method to request an operation on objects which are sent along, without
+        storing them in the destination server.
+
+        Parameters
+        ----------
+        arg1 : numpy.ndarray
+            First numpy.ndarray to consider in the operation.
+        arg2 : numpy.ndarray
+            Second numpy.ndarray to consider in the operation.
+        ops : str
+            Type of operation to perform.
+        resource : str
+            Type of resource involved in the operation.
+
+        Returns
+        -------
+        Response
+            Response of the destination server.
+
+        Raises
+        ------
+        RuntimeError
+            If the Client failed to connect to the destination server.
+        """
+        # Both operands are sent within the same body (stacked along a new first dimension)
+        return self.__post_request(
+            np.stack((arg1, arg2)),
+            "/compute/" + ops + "/" + resource,
+            self._payload_format,
+            headers=self.__accept_headers(),
+        )
+
+    def __post_request(self, arg, path, payload_format, headers=None):
+        """Private method to send a POST request with an array to the destination server.
+
+        Parameters
+        ----------
+        arg : numpy.ndarray
+            The numpy.ndarray to post to the destination server.
+        path : str
+            Path of the resource where the posting is to be performed.
+        payload_format : str
+            Format of the body of the request (one of ``PAYLOAD_FORMATS``).
+        headers : dict, optional
+            Additional headers of the request. The default is ``None``.
+
+        Returns
+        -------
+        Response
+            Response of the destination server.
+
+        Raises
+        ------
+        RuntimeError
+            If the Client failed to connect to the destination server.
+        """
+        headers = dict(headers or {})
+
+        # Encode the argument in the requested format
+        if payload_format == "json":
+            return self.__send_request(
+                "POST", path, json={"value": arg.tolist()}, headers=headers
+            )
+
+        body, body_headers = encode_array(arg, PAYLOAD_FORMATS[payload_format])
+        headers.update(body_headers)
+        return self.__send_request("POST", path, data=body, headers=headers)
+
     def __get_ops_resource(self, id1, id2, ops, resource):
-        """_summary_
+        """Private method to request an operation on objects stored in the destination server.
 
         Parameters
         ----------
@@ -298,30 +408,109 @@ class DemoRESTClient:
             If the Client failed to perform the operation in the destination server.
         """
         # Perform the get request
+        response = self.__send_request(
+            "GET",
+            "/" + ops + "/" + resource,
+            json={"id1": id1, "id2": id2},
+            headers=self.__accept_headers(),
+        )
+
+        return self.__parse_result(response)
+
+    def __send_request(self, method, path, **kwargs):
+        """Private method to send a request to the destination server.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method of the request. For example, "GET" or "POST".
+        path : str
+            Path of the resource requested.
+        **kwargs
+            Additional arguments of the request (body, headers...).
+
+        Returns
+        -------
+        Response
+            Response of the destination server.
+
+        Raises
+        ------
+        RuntimeError
+            If the Client failed to connect to the destination server.
+        """
         try:
             if not self._use_test_client:
-                response = requests.get(
-                    self._host + ":" + str(self._port) + "/" + ops + "/" + resource,
-                    json={"id1": id1, "id2": id2},
+                return requests.request(
+                    method,
+                    self._host + ":" + str(self._port) + path,
                     auth=(self._user, self._pwd),
+                    **kwargs,
                 )
             else:
-                response = self._client.get(
-                    "/" + ops + "/" + resource,
-                    json={"id1": id1, "id2": id2},
-                    auth=(self._user, self._pwd),
+                return self._client.open(
+                    path, method=method, auth=(self._user, self._pwd), **kwargs
                 )
-        except (requests.exceptions.ConnectionError):
+        except requests.exceptions.ConnectionError:
             raise RuntimeError(
                 "Could not connect to server... Check server status or connection details."
             )
 
+    def __accept_headers(self):
+        """Private method to generate the headers asking for results in the requested format
+        (or in JSON, as a fallback).
+
+        Returns
+        -------
+        dict
+            Headers of the request.
+        """
+        if self._payload_format == "json":
+            return {}
+
+        return {
+            "Accept": PAYLOAD_FORMATS[self._payload_format]
+            + ", "
+            + JSON_MIMETYPE
+            + ";q=0.5"
+        }
+
+    def __parse_result(self, response):
+        """Private method to extract the result of an operation from the response of the
+        destination server.
+
+        Parameters
+        ----------
+        response : Response
+            Response of the destination server.
+
+        Returns
+        -------
+        numpy.ndarray
+            Result of the operation requested.
+
+        Raises
+        ------
+        RuntimeError
+            If the Client failed to perform the operation in the destination server.
+        """
         # Check that the status of the response is correct
         if response.status_code != 200:
             raise RuntimeError(
                 "Client failed to perform operation in destination Server..."
             )
 
+        # Binary results are decoded straight into a numpy.ndarray
+        mimetype = response.headers.get("Content-Type", "").split(";")[0].strip()
+        if mimetype in PAYLOAD_FORMATS.values() and mimetype != JSON_MIMETYPE:
+            data = response.data if self._use_test_client else response.content
+            try:
+                return decode_array(data, mimetype, response.headers)
+            except ValueError:
+                raise RuntimeError(
+                    "Client failed to decode the result of the operation..."
+                )
+
         # If everything went well... extract the result of the operation
         result_aslist = self.__get_val(json.loads(response.text), "result")
 
@@ -0,0 +1,141 @@
+"""Encoding of the arrays exchanged by the REST API Eigen example server and client."""
+
+import io
+
+import numpy as np
+
+JSON_MIMETYPE = "application/json"
+"""Media type of the JSON-formatted payloads (lists of numbers)."""
+
+BINARY_MIMETYPE = "application/octet-stream"
+"""Media type of the raw payloads (little-endian buffer, shape and dtype in the headers)."""
+
+NPY_MIMETYPE = "application/x-npy"
+"""Media type of the payloads in the NumPy ``.npy`` format."""
+
+PAYLOAD_FORMATS = {
+    "binary": BINARY_MIMETYPE,
+    "npy": NPY_MIMETYPE,
+    "json": JSON_MIMETYPE,
+}
+"""Formats of the payloads handled, and their associated media types."""
+
+SHAPE_HEADER = "X-Eigen-Shape"
+"""Header carrying the comma-separated dimensions of a raw payload (empty for scalars)."""
+
+DTYPE_HEADER = "X-Eigen-Dtype"
+"""Header carrying the (little-endian) dtype of a raw payload, e.g. ``<f8``."""
+
+_ALLOWED_KINDS = ("i", "u", "f")
+"""Kinds of dtypes that can be decoded from a raw payload."""
+
+
+def encode_array(array, mimetype):
+    """Encode an array (or a scalar) into the body of a binary request or response.
+
+    Parameters
+    ----------
+    array : numpy.ndarray or float
+        Array to encode.
+    mimetype : str
+        Media type of the payload. Either ``BINARY_MIMETYPE`` or ``NPY_MIMETYPE``.
+
+    Returns
+    -------
+    bytes, dict
+        Body of the message and headers describing it.
+    """
+    # Raw buffers are always sent in little-endian byte order (and C order, see tobytes())
+    array = np.asarray(array)
+    array = array.astype(array.dtype.newbyteorder("<"), copy=False)
+
+    if mimetype == NPY_MIMETYPE:
+        buffer = io.BytesIO()
+        np.save(buffer, array, allow_pickle=False)
+        return buffer.getvalue(), {"Content-Type": NPY_MIMETYPE}
+
+    headers = {
+        "Content-Type": BINARY_MIMETYPE,
+        SHAPE_HEADER: ",".join(str(dim) for dim in array.shape),
+        DTYPE_HEADER: array.dtype.str,
+    }
+    return array.tobytes(), headers
+
+
+def decode_array(data, mimetype, headers):
+    """Decode the body of a request or response into a numpy.ndarray of dtype numpy.float64.
+
+    Parameters
+    ----------
+    data : bytes
+        Body of the message.
+    mimetype : str
+        Media type of the payload. Either ``BINARY_MIMETYPE`` or ``NPY_MIMETYPE``.
+    headers : Mapping
+        Headers of the message, describing the shape and dtype of a raw payload.
+
+    Returns
+    -------
+    numpy.ndarray
+        Decoded array.
+
+    Raises
+    ------
+    ValueError
+        In case the payload cannot be decoded.
+    """
+    if mimetype == NPY_MIMETYPE:
+        try:
+            array = np.load(io.BytesIO(data), allow_pickle=False)
+        except (OSError, EOFError) as error:
+            raise ValueError("Invalid .npy payload: " + str(error))
+    elif mimetype == BINARY_MIMETYPE:
+        array = _decode_raw(data, headers)
+    else:
+        raise ValueError("Unsupported media type: " + str(mimetype) + ".")
+
+    if array.dtype.kind not in _ALLOWED_KINDS:
+        raise ValueError("Only numeric payloads are allowed.")
+
+    return array.astype(np.float64, copy=False)
+
+
+def _decode_raw(data, headers):
+    """Decode a raw (little-endian) buffer, given its shape and dtype headers.
+
+    Parameters
+    ----------
+    data : bytes
+        Body of the message.
+    headers : Mapping
+        Headers of the message.
+
+    Returns
+    -------
+    numpy.ndarray
+        Decoded array (a read-only view on the body).
+
+    Raises
+    ------
+    ValueError
+        In case the headers are missing or do not match the size of the body.
+    """
+    shape = headers.get(SHAPE_HEADER, None)
+    if shape is None:
+        raise ValueError("No shape provided. Expected header: '" + SHAPE_HEADER + "'.")
+
+    try:
+        shape = tuple(int(dim) for dim in shape.split(",") if dim.strip())
+        dtype = np.dtype(headers.get(DTYPE_HEADER, "<f8"))
+    except (TypeError, ValueError):
+        raise ValueError("Invalid shape or dtype headers for the binary payload.")
+
+    if dtype.kind not in _ALLOWED_KINDS or dtype.byteorder == ">":
+        raise ValueError("Only little-endian numeric dtypes are allowed.")
+
+    if len(data) != dtype.itemsize * int(np.prod(shape)):
+        raise ValueError(
+            "Size of the binary payload does not match its shape and dtype."
+        )
+
+    return np.frombuffer(data, dtype=dtype).reshape(shape)
@@ -0,0 +1,136 @@
+"""Python implementation of the in-process cache of arrays decoded from the REST API database."""
+
+from collections import OrderedDict
+import os
+import threading
+import weakref
+
+
+class ArrayCache:
+    """Provides an in-process cache of the (decoded) arrays stored in the database, by their keys
+    (for example, their IDs).
+
+    The cache holds up to a given amount of bytes. Whenever a new array does not fit, the
+    least recently used arrays are evicted. Since stored arrays never change, cached arrays
+    never become stale... as long as their keys are unique: IDs are reused once the database
+    is reset, so they must be qualified by its generation. All methods are thread-safe.
+
+    Each process keeps its own cache: a process forked from another one (for example, a worker
+    of a WSGI server) starts with a copy of its entries, but a fresh lock and fresh counters.
+    """
+
+    def __init__(self, budget):
+        """Initialize an empty cache.
+
+        Parameters
+        ----------
+        budget : int
+            Maximum amount of bytes held by the cached arrays. A budget of 0 disables the cache.
+        """
+        self._budget = budget
+        self._nbytes = 0
+        self._arrays = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        # The lock may be held by another thread while forking... replace it in the child
+        if hasattr(os, "register_at_fork"):
+            ref = weakref.ref(self)
+            os.register_at_fork(after_in_child=lambda: ref() and ref()._after_fork())
+
+    @property
+    def budget(self):
+        """Maximum amount of bytes held by the cached arrays."""
+        return self._budget
+
+    @property
+    def nbytes(self):
+        """Amount of bytes currently held by the cached arrays."""
+        return self._nbytes
+
+    @property
+    def hits(self):
+        """Amount of lookups which found the array requested."""
+        return self._hits
+
+    @property
+    def misses(self):
+        """Amount of lookups which did not find the array requested."""
+        return self._misses
+
+    def __len__(self):
+        """Amount of arrays currently cached."""
+        return len(self._arrays)
+
+    def get(self, key):
+        """Retrieve a cached array, which becomes the most recently used one.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key of the array. For example, its ID in the database.
+
+        Returns
+        -------
+        numpy.ndarray
+            Cached (read-only) array, or ``None`` in case it is not cached.
+        """
+        with self._lock:
+            array = self._arrays.get(key, None)
+            if array is None:
+                self._misses += 1
+                return None
+
+            self._arrays.move_to_end(key)
+            self._hits += 1
+            return array
+
+    def put(self, key, array):
+        """Cache an array, evicting the least recently used ones if needed.
+
+        Arrays which alone exceed the budget of the cache are not cached.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key of the array. For example, its ID in the database.
+        array : numpy.ndarray
+            Array to cache. It is no longer writable once cached.
+
+        Returns
+        -------
+        bool
+            ``True`` if the array was cached, ``False`` otherwise.
+        """
+        if array.nbytes > self._budget:
+            return False
+
+        array.flags.writeable = False
+
+        with self._lock:
+            previous = self._arrays.pop(key, None)
+            if previous is not None:
+                self._nbytes -= previous.nbytes
+
+            # Evict the least recently used arrays until the new one fits
+            while self._nbytes + array.nbytes > self._budget:
+                _, evicted = self._arrays.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+
+            self._arrays[key] = array
+            self._nbytes += array.nbytes
+
+        return True
+
+    def clear(self):
+        """Evict all the cached arrays (keeping the counters)."""
+        with self._lock:
+            self._arrays.clear()
+            self._nbytes = 0
+
+    def _after_fork(self):
+        """Reset the lock and the counters of the cache in a forked process."""
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
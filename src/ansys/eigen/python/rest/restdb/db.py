@@ -1,23 +1,67 @@
 """Python implementation of the REST API Eigen example database."""
 
+import json
 import os
 import sqlite3
 
 import click
 from flask import current_app, g
+import numpy as np
+
+SCHEMA_VERSION = 2
+"""Version of the DB schema (stored as its ``user_version``). Version 0 stored JSON text, and
+version 1 had no memoized results."""
+
+# Tables added by version 2 of the DB schema (see schema.sql)
+_MIGRATION_V2 = """
+CREATE TABLE eigen_results (
+  eigen_type TEXT NOT NULL,
+  eigen_ops TEXT NOT NULL,
+  id1 INTEGER NOT NULL,
+  id2 INTEGER NOT NULL,
+  dtype TEXT NOT NULL,
+  rows INTEGER,
+  cols INTEGER,
+  nbytes INTEGER NOT NULL,
+  last_used INTEGER NOT NULL,
+  eigen_value BLOB NOT NULL,
+  PRIMARY KEY (eigen_type, eigen_ops, id1, id2)
+);
+
+CREATE TABLE eigen_meta (
+  name TEXT NOT NULL,
+  value TEXT NOT NULL,
+  PRIMARY KEY (name)
+);
+
+INSERT INTO eigen_meta (name, value) VALUES ('generation', lower(hex(randomblob(16))));
+"""
 
 # =================================================================================================
 # PUBLIC METHODS for DB interaction
 # =================================================================================================
 
 
-def init_app_db(app):
-    """Initialize a simple database for storing API REST data."""
+def init_app_db(app, reset=True):
+    """Initialize a simple database for storing API REST data.
+
+    Parameters
+    ----------
+    app : Flask
+        Instance of the application.
+    reset : bool, optional
+        Whether to delete any pre-existing data. Otherwise, the pre-existing data is kept
+        (and migrated to the current schema if needed). The default is ``True``.
+    """
     current_app = app
     current_app.app_context().push()
 
-    # Initialize the new app's DB, deleting any pre-existing data and build it from scracth
-    __init_db()
+    if reset:
+        # Initialize the new app's DB, deleting any pre-existing data and build it from scracth
+        __init_db()
+    else:
+        # Keep the pre-existing data, in the current schema
+        migrate_db(get_db())
 
     # Register this function so that it is called whenever a response is returned by the application
     current_app.teardown_appcontext(__close_db)
@@ -46,6 +90,248 @@ def get_db():
     return g.db
 
 
+def insert_array(db, eigen_type, array):
+    """Insert an array into the database, as the raw bytes of its little-endian buffer.
+
+    Parameters
+    ----------
+    db : Connection
+        Connection to the database.
+    eigen_type : str
+        Type of the array (i.e. VECTOR or MATRIX).
+    array : numpy.ndarray
+        Array to insert, of 1 (vector) or 2 (matrix) dimensions.
+
+    Returns
+    -------
+    int
+        ID of the inserted array.
+    """
+    cur = db.execute(
+        "INSERT INTO eigen_db(eigen_type, dtype, rows, cols, nbytes, eigen_value) "
+        + "VALUES (?, ?, ?, ?, ?, ?)",
+        (eigen_type,) + __array_columns(array),
+    )
+    db.commit()
+
+    return cur.lastrowid
+
+
+def load_array(db, id, eigen_type):
+    """Load an array from the database.
+
+    Parameters
+    ----------
+    db : Connection
+        Connection to the database.
+    id : int
+        ID of the array.
+    eigen_type : str
+        Type of the array (i.e. VECTOR or MATRIX).
+
+    Returns
+    -------
+    numpy.ndarray
+        Array stored (as a read-only view on the bytes retrieved), or ``None`` in case there
+        is no array of the given type for that ID.
+    """
+    row = db.execute(
+        "SELECT dtype, rows, cols, eigen_value FROM eigen_db WHERE id = ? AND eigen_type = ?",
+        (id, eigen_type),
+    ).fetchone()
+
+    if row is None:
+        return None
+
+    return __array_from_row(row)
+
+
+def array_metadata(db, id):
+    """Retrieve the metadata of an array, without loading its contents.
+
+    Parameters
+    ----------
+    db : Connection
+        Connection to the database.
+    id : int
+        ID of the array.
+
+    Returns
+    -------
+    Row
+        Type, dtype, rows, cols (``None`` for vectors) and nbytes of the array, or ``None``
+        in case there is no array for that ID.
+    """
+    return db.execute(
+        "SELECT eigen_type, dtype, rows, cols, nbytes FROM eigen_db WHERE id = ?", (id,)
+    ).fetchone()
+
+
+def get_generation(db):
+    """Get the generation of the database, which changes whenever it is reset.
+
+    IDs are only unique within a generation: after a reset, they are reused by other arrays.
+
+    Parameters
+    ----------
+    db : Connection
+        Connection to the database.
+
+    Returns
+    -------
+    str
+        Generation of the database.
+    """
+    return db.execute(
+        "SELECT value FROM eigen_meta WHERE name = 'generation'"
+    ).fetchone()[0]
+
+
+def insert_result(db, key, array, budget):
+    """Insert (or replace) the memoized result of an operation into the database, evicting
+    the least recently used results so that they fit within a budget.
+
+    Results of operands of another generation (i.e. the database has been reset meanwhile)
+    are not inserted.
+
+    Parameters
+    ----------
+    db : Connection
+        Connection to the database.
+    key : tuple
+        Generation of the database, type of the operands (i.e. VECTOR or MATRIX), operation
+        and IDs of both operands.
+    array : numpy.ndarray
+        Result of the operation. Scalar results are stored as 0-d arrays.
+    budget : int
+        Maximum amount of bytes held by the memoized results.
+    """
+    db.execute(
+        "INSERT OR REPLACE INTO eigen_results(eigen_type, eigen_ops, id1, id2, dtype, rows, "
+        + "cols, nbytes, eigen_value, last_used) SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, "
+        + "(SELECT IFNULL(MAX(last_used), 0) + 1 FROM eigen_results) "
+        + "WHERE EXISTS (SELECT 1 FROM eigen_meta WHERE name = 'generation' AND value = ?)",
+        tuple(key[1:]) + __array_columns(array) + (key[0],),
+    )
+
+    # Evict the least recently used results beyond the budget
+    db.execute(
+        "DELETE FROM eigen_results WHERE rowid IN (SELECT rowid FROM (SELECT rowid, "
+        + "SUM(nbytes) OVER (ORDER BY last_used DESC) AS used FROM eigen_results) "
+        + "WHERE used > ?)",
+        (budget,),
+    )
+    db.commit()
+
+
+def load_result(db, key):
+    """Load the memoized result of an operation from the database, which becomes the most
+    recently used one.
+
+    Parameters
+    ----------
+    db : Connection
+        Connection to the database.
+    key : tuple
+        Generation of the database, type of the operands (i.e. VECTOR or MATRIX), operation
+        and IDs of both operands.
+
+    Returns
+    -------
+    numpy.ndarray
+        Result of the operation (as a read-only view on the bytes retrieved), or ``None`` in
+        case it is not memoized (or the database is of another generation).
+    """
+    where = (
+        "WHERE eigen_type = ? AND eigen_ops = ? AND id1 = ? AND id2 = ? AND EXISTS "
+        + "(SELECT 1 FROM eigen_meta WHERE name = 'generation' AND value = ?)"
+    )
+    row = db.execute(
+        "SELECT dtype, rows, cols, eigen_value FROM eigen_results " + where,
+        tuple(key[1:]) + (key[0],),
+    ).fetchone()
+
+    if row is None:
+        return None
+
+    db.execute(
+        "UPDATE eigen_results SET last_used = "
+        + "(SELECT MAX(last_used) + 1 FROM eigen_results) "
+        + where,
+        tuple(key[1:]) + (key[0],),
+    )
+    db.commit()
+
+    return __array_from_row(row)
+
+
+def migrate_db(db):
+    """Migrate a database to the current schema, keeping its data.
+
+    Databases of version 0 store the arrays as JSON text. Their arrays are converted
+    into float64 buffers (scalars into single-element vectors or matrices), while values
+    which are not numeric vectors or matrices are skipped. Databases of version 1 get the
+    (empty) table of memoized results. Empty databases are initialized.
+
+    The migration is performed within a single transaction: either all of it is done
+    (and the version of the schema updated), or nothing is.
+
+    Parameters
+    ----------
+    db : Connection
+        Connection to the database.
+    """
+    version = db.execute("PRAGMA user_version").fetchone()[0]
+    tables = db.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'eigen_db'"
+    ).fetchall()
+
+    # Nothing to migrate... just build the DB from scratch
+    if not tables:
+        __build_db(db)
+        return
+
+    if version >= SCHEMA_VERSION:
+        return
+
+    try:
+        if version < 1:
+            # Rebuild the table of arrays in the current schema (keeping their IDs),
+            # converting the JSON text into buffers
+            db.executescript(
+                "BEGIN;\nALTER TABLE eigen_db RENAME TO eigen_db_v0;\n"
+                + __read_schema()
+            )
+
+            rows = db.execute(
+                "SELECT id, eigen_type, eigen_value FROM eigen_db_v0"
+            ).fetchall()
+            for row in rows:
+                array = __legacy_array(row)
+                if array is None:
+                    continue
+
+                db.execute(
+                    "INSERT INTO eigen_db(id, eigen_type, dtype, rows, cols, nbytes, eigen_value) "
+                    + "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (row["id"], row["eigen_type"]) + __array_columns(array),
+                )
+
+            db.execute("DROP TABLE eigen_db_v0")
+        else:
+            # Add the tables of the memoized results (and the generation of the DB)
+            db.executescript("BEGIN;\n" + _MIGRATION_V2)
+
+        # The version is only updated once all the data has been migrated
+        db.execute("PRAGMA user_version = " + str(SCHEMA_VERSION))
+        db.commit()
+    except BaseException:
+        db.rollback()
+        raise
+
+    click.echo("Our App's DB has been migrated to version " + str(SCHEMA_VERSION) + ".")
+
+
 # =================================================================================================
 # PRIVATE METHODS for DB interaction
 # =================================================================================================
@@ -61,7 +347,106 @@ def __close_db(*args):
 
 def __init_db():
     """Initialize the database."""
-    db = get_db()
+    __build_db(get_db())
+
+
+def __build_db(db):
+    """Build the database from scratch, in the current schema.
 
+    Parameters
+    ----------
+    db : Connection
+        Connection to the database.
+    """
+    db.executescript(
+        "BEGIN;\n"
+        + __read_schema()
+        + "\nPRAGMA user_version = "
+        + str(SCHEMA_VERSION)
+        + ";\nCOMMIT;"
+    )
+
+
+def __read_schema():
+    """Read the script building the database in the current schema."""
     with current_app.open_resource("restdb/schema.sql") as f:
-        db.executescript(f.read().decode("utf8"))
+        return f.read().decode("utf8")
+
+
+def __legacy_array(row):
+    """Convert the JSON text of an array stored by version 0 of the DB schema.
+
+    The values accepted by version 0 are those numpy could parse. Scalars are converted
+    into single-element vectors or matrices (as their type states). Anything else which
+    is not a numeric vector or matrix (for example, ragged lists) is skipped. Either way,
+    the user is informed.
+
+    Parameters
+    ----------
+    row : Row
+        Row with the id, eigen_type and eigen_value columns.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of 1 (vector) or 2 (matrix) dimensions, or ``None`` if it is skipped.
+    """
+    try:
+        array = np.array(json.loads(row["eigen_value"]), dtype=np.float64)
+    except (TypeError, ValueError):
+        array = None
+
+    if array is None or array.ndim > 2:
+        click.echo(
+            "Skipped the value with ID %d while migrating the DB: it is not a numeric "
+            "vector or matrix." % row["id"]
+        )
+        return None
+
+    if array.ndim == 0:
+        array = array.reshape((1,) if row["eigen_type"] == "VECTOR" else (1, 1))
+        click.echo(
+            "Converted the scalar with ID %d into a %s while migrating the DB."
+            % (row["id"], row["eigen_type"].lower())
+        )
+
+    return array
+
+
+def __array_columns(array):
+    """Get the values of the columns describing an array in the database.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        Array of 0 (scalar), 1 (vector) or 2 (matrix) dimensions.
+
+    Returns
+    -------
+    tuple
+        Values of the dtype, rows (``None`` for scalars), cols (``None`` for vectors and
+        scalars), nbytes and eigen_value columns.
+    """
+    # Arrays are stored as the raw bytes of their little-endian (C-ordered) buffer
+    array = np.asarray(array)
+    array = array.astype(array.dtype.newbyteorder("<"), copy=False)
+    rows, cols = (array.shape + (None, None))[:2]
+
+    return (array.dtype.str, rows, cols, array.nbytes, array.tobytes())
+
+
+def __array_from_row(row):
+    """Get an array from the row of the database describing it.
+
+    Parameters
+    ----------
+    row : Row
+        Row with the dtype, rows, cols and eigen_value columns.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array described (as a read-only view on the bytes retrieved).
+    """
+    shape = tuple(dim for dim in (row["rows"], row["cols"]) if dim is not None)
+    return np.frombuffer(row["eigen_value"], dtype=row["dtype"]).reshape(shape)
@@ -0,0 +1,148 @@
+"""Python implementation of the memo of operation results of the REST API Eigen example server."""
+
+import os
+import threading
+import weakref
+
+import numpy as np
+
+from ansys.eigen.python.rest.restdb.cache import ArrayCache
+from ansys.eigen.python.rest.restdb.db import get_db, insert_result, load_result
+
+
+class ResultMemo:
+    """Provides a memo of the results of the operations on the arrays stored in the database,
+    keyed by the generation of the database, the type of the operands, the operation and the
+    IDs of both operands (which are only unique within a generation).
+
+    Since stored arrays never change, neither do the results of the operations on them. The
+    results are kept in memory (see ``ArrayCache``) and, optionally, persisted into the
+    database as well, each within its own budget. The least recently used results are evicted
+    first. All methods are thread-safe.
+
+    As for ``ArrayCache``, each process keeps its own memo in memory (and its own counters).
+    """
+
+    def __init__(self, budget, db_budget=0):
+        """Initialize an empty memo.
+
+        Parameters
+        ----------
+        budget : int
+            Maximum amount of bytes held by the results kept in memory. A budget of 0 disables
+            the memo in memory.
+        db_budget : int, optional
+            Maximum amount of bytes held by the results persisted into the database. The
+            default is ``0``, in which case results are not persisted.
+        """
+        self._memory = ArrayCache(budget)
+        self._db_budget = db_budget
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        # The lock may be held by another thread while forking... replace it in the child
+        if hasattr(os, "register_at_fork"):
+            ref = weakref.ref(self)
+            os.register_at_fork(after_in_child=lambda: ref() and ref()._after_fork())
+
+    @property
+    def memory(self):
+        """Results kept in memory."""
+        return self._memory
+
+    @property
+    def db_budget(self):
+        """Maximum amount of bytes held by the results persisted into the database."""
+        return self._db_budget
+
+    @property
+    def hits(self):
+        """Amount of lookups which found the result requested (in memory or in the database)."""
+        return self._hits
+
+    @property
+    def misses(self):
+        """Amount of lookups which did not find the result requested."""
+        return self._misses
+
+    @staticmethod
+    def key(generation, eigen_type, eigen_ops, id1, id2, commutative=False):
+        """Generate the key of the result of an operation.
+
+        Parameters
+        ----------
+        generation : str
+            Generation of the database holding the operands (see ``get_generation``).
+        eigen_type : str
+            Type of the operands (i.e. VECTOR or MATRIX).
+        eigen_ops : str
+            Operation performed. For example, "addition" or "multiplication".
+        id1 : int
+            ID (in the database) of the first operand.
+        id2 : int
+            ID (in the database) of the second operand.
+        commutative : bool, optional
+            Whether the operation is commutative, in which case the order of the operands
+            does not matter. The default is ``False``.
+
+        Returns
+        -------
+        tuple
+            Key of the result.
+        """
+        if commutative and id2 < id1:
+            id1, id2 = id2, id1
+
+        return (generation, eigen_type, eigen_ops, id1, id2)
+
+    def get(self, key):
+        """Retrieve a memoized result, from memory or (if persisted) from the app's database.
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the result (see ``ResultMemo.key``).
+
+        Returns
+        -------
+        numpy.ndarray
+            Memoized (read-only) result, or ``None`` in case it is not memoized.
+        """
+        result = self._memory.get(key)
+
+        # Results persisted into the database are kept in memory again
+        if result is None and self._db_budget > 0:
+            result = load_result(get_db(), key)
+            if result is not None:
+                self._memory.put(key, result)
+
+        with self._lock:
+            if result is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+
+        return result
+
+    def put(self, key, result):
+        """Memoize a result, in memory and (if enabled) in the app's database.
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the result (see ``ResultMemo.key``).
+        result : numpy.ndarray or numpy.float64
+            Result of the operation. It is no longer writable once memoized.
+        """
+        result = np.asarray(result)
+        self._memory.put(key, result)
+
+        if 0 < result.nbytes <= self._db_budget:
+            insert_result(get_db(), key, result, self._db_budget)
+
+    def _after_fork(self):
+        """Reset the lock and the counters of the memo in a forked process."""
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
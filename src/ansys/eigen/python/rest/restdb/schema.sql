@@ -1,3 +1,5 @@
+DROP TABLE IF EXISTS eigen_results;
+DROP TABLE IF EXISTS eigen_meta;
 DROP TABLE IF EXISTS eigen_db;
 DROP TABLE IF EXISTS types;
 
@@ -6,12 +8,45 @@ CREATE TABLE types (
   PRIMARY KEY (eigen_type)
 );
 
+-- The raw bytes of the arrays are stored last, so that the metadata columns can be
+-- read without loading the (possibly overflowing) payload pages. Vectors have no cols.
 CREATE TABLE eigen_db (
   id INTEGER PRIMARY KEY AUTOINCREMENT,
   eigen_type TEXT NOT NULL,
-  eigen_value TEXT NOT NULL,
+  dtype TEXT NOT NULL,
+  rows INTEGER NOT NULL,
+  cols INTEGER,
+  nbytes INTEGER NOT NULL,
+  eigen_value BLOB NOT NULL,
   FOREIGN KEY (eigen_type) REFERENCES types (eigen_type)
 );
 
+-- Memoized results of the operations on the stored arrays (scalars have no rows nor cols).
+-- The least recently used ones are evicted first.
+CREATE TABLE eigen_results (
+  eigen_type TEXT NOT NULL,
+  eigen_ops TEXT NOT NULL,
+  id1 INTEGER NOT NULL,
+  id2 INTEGER NOT NULL,
+  dtype TEXT NOT NULL,
+  rows INTEGER,
+  cols INTEGER,
+  nbytes INTEGER NOT NULL,
+  last_used INTEGER NOT NULL,
+  eigen_value BLOB NOT NULL,
+  PRIMARY KEY (eigen_type, eigen_ops, id1, id2)
+);
+
+-- The generation identifies the contents of the DB: IDs are only unique within a generation
+CREATE TABLE eigen_meta (
+  name TEXT NOT NULL,
+  value TEXT NOT NULL,
+  PRIMARY KEY (name)
+);
+
 INSERT INTO types (eigen_type) VALUES ('VECTOR');
 INSERT INTO types (eigen_type) VALUES ('MATRIX');
+
+INSERT INTO eigen_meta (name, value) VALUES ('generation', lower(hex(randomblob(16))));
+
+-- The version of the schema (PRAGMA user_version) is set once the DB is built (or migrated)
@@ -1,15 +1,32 @@
 """Python implementation of the REST API Eigen example server."""
 
+import hashlib
 import json
 from math import floor
 import os
 
 import click
 import demo_eigen_wrapper
-from flask import Flask, jsonify, request
+from flask import Flask, g, jsonify, request
 import numpy as np
 
-from ansys.eigen.python.rest.restdb.db import get_db, init_app_db
+from ansys.eigen.python.rest.payloads import (
+    BINARY_MIMETYPE,
+    JSON_MIMETYPE,
+    NPY_MIMETYPE,
+    decode_array,
+    encode_array,
+)
+from ansys.eigen.python.rest.restdb.cache import ArrayCache
+from ansys.eigen.python.rest.restdb.db import (
+    array_metadata,
+    get_db,
+    get_generation,
+    init_app_db,
+    insert_array,
+    load_array,
+)
+from ansys.eigen.python.rest.restdb.memo import ResultMemo
 
 #
 #
@@ -26,6 +43,12 @@ ALLOWED_TYPES = (
     "matrix",
 )
 
+# Number of dimensions of each of the allowed types
+TYPE_DIMENSIONS = {
+    "vector": 1,
+    "matrix": 2,
+}
+
 ALLOWED_OPS = (
     "addition",
     "multiplication",
@@ -33,10 +56,46 @@ ALLOWED_OPS = (
 
 HUMAN_SIZES = ["B", "KB", "MB", "GB", "TB"]
 
+# Default maximum amount of bytes held by the cache of decoded arrays (per process)
+DEFAULT_CACHE_BUDGET = 256 * 1024 * 1024
+
+# Default maximum amount of bytes held by the memoized results of the operations (per process)
+DEFAULT_MEMO_BUDGET = 256 * 1024 * 1024
+
+# Media types in which the results of the operations can be returned (JSON is preferred,
+# so that clients that do not ask for a specific one keep receiving it)
+RESULT_MIMETYPES = (
+    JSON_MIMETYPE,
+    BINARY_MIMETYPE,
+    NPY_MIMETYPE,
+)
+
 
-def create_app():
+def create_app(
+    reset_db=True,
+    cache_budget=DEFAULT_CACHE_BUDGET,
+    memo_budget=DEFAULT_MEMO_BUDGET,
+    memo_db_budget=0,
+):
     """Initialize the REST API server.
 
+    Parameters
+    ----------
+    reset_db : bool, optional
+        Whether to delete the pre-existing data of the server's database. Otherwise, it is
+        kept (and migrated to the current schema if needed). The default is ``True``.
+    cache_budget : int, optional
+        Maximum amount of bytes held by the in-process cache of arrays decoded from the
+        database (see ``ArrayCache``). A budget of 0 disables the cache. The default is
+        ``DEFAULT_CACHE_BUDGET``.
+    memo_budget : int, optional
+        Maximum amount of bytes held by the memoized results of the operations kept in memory
+        (see ``ResultMemo``). A budget of 0 disables the memo in memory. The default is
+        ``DEFAULT_MEMO_BUDGET``.
+    memo_db_budget : int, optional
+        Maximum amount of bytes held by the memoized results of the operations persisted into
+        the server's database. The default is ``0``, in which case results are not persisted.
+
     Returns
     -------
     Flask
@@ -60,13 +119,41 @@ def create_app():
         DATABASE=os.path.join(app.instance_path, "app.sqlite"),
     )
 
-    # Tear down previous database and initialize it
-    init_app_db(app)
+    # Tear down previous database (unless requested otherwise) and initialize it
+    init_app_db(app, reset=reset_db)
+
+    # Stored objects never change... so keep the most recently used ones decoded in memory,
+    # keyed by the generation of the DB and their ID (IDs are reused once the DB is reset).
+    # Its hit/miss counters are available through the app's extensions.
+    cache = ArrayCache(cache_budget)
+    app.extensions["array_cache"] = cache
+
+    # ... and neither do the results of the operations on them. The generation of the DB
+    # identifies its contents within the keys of the memo and the ETags of the results
+    memo = ResultMemo(memo_budget, memo_db_budget)
+    app.extensions["result_memo"] = memo
+    cache_generation = get_generation(get_db())
 
     # =================================================================================================
     # PUBLIC METHODS for Server interaction
     # =================================================================================================
 
+    @app.before_request
+    def check_generation():
+        """Retrieves the generation of the app's database for the current request.
+
+        The database may be reset by another process (for example, another worker of a WSGI
+        server) at any time. In that case, the cached arrays (and the results kept in memory)
+        are no longer of any use... and they are evicted.
+        """
+        nonlocal cache_generation
+        g.generation = get_generation(get_db())
+
+        if g.generation != cache_generation:
+            cache_generation = g.generation
+            cache.clear()
+            memo.memory.clear()
+
     @app.route("/Vectors", methods=["POST"])
     def post_vector():
         """Handles the app's (service's) behavior when accessing the ``Vectors`` resource.
@@ -95,8 +182,8 @@ def create_app():
         # Perform the GET operation using the general method (to avoid code duplications)
         response_body = __ops_eigen_objects("vector", "addition")
 
-        # Return a successful response with the ID of the created object
-        return response_body, 200
+        # Return the response (either successful or "not modified")
+        return response_body
 
     @app.route("/multiply/Vectors", methods=["GET"])
     def multiply_vectors():
@@ -111,8 +198,8 @@ def create_app():
         # Perform the GET operation using the general method (to avoid code duplications)
         response_body = __ops_eigen_objects("vector", "multiplication")
 
-        # Return a successful response with the ID of the created object
-        return response_body, 200
+        # Return the response (either successful or "not modified")
+        return response_body
 
     @app.route("/Matrices", methods=["POST"])
     def post_matrix():
@@ -142,8 +229,8 @@ def create_app():
         # Perform the GET operation using the general method (to avoid code duplications)
         response_body = __ops_eigen_objects("matrix", "addition")
 
-        # Return a successful response with the ID of the created object
-        return response_body, 200
+        # Return the response (either successful or "not modified")
+        return response_body
 
     @app.route("/multiply/Matrices", methods=["GET"])
     def multiply_matrices():
@@ -158,7 +245,71 @@ def create_app():
         # Perform the GET operation using the general method (to avoid code duplications)
         response_body = __ops_eigen_objects("matrix", "multiplication")
 
-        # Return a successful response with the ID of the created object
+        # Return the response (either successful or "not modified")
+        return response_body
+
+    @app.route("/compute/add/Vectors", methods=["POST"])
+    def compute_add_vectors():
+        """Handles the app's (service's) behavior when accessing the stateless addition
+        operation for the ``Vectors`` resource.
+
+        Returns
+        -------
+        Response
+            Response object containing the vector operation requested.
+        """
+        # Perform the operation using the general method (to avoid code duplications)
+        response_body = __compute_eigen_objects("vector", "addition")
+
+        # Return a successful response with the result of the operation
+        return response_body, 200
+
+    @app.route("/compute/multiply/Vectors", methods=["POST"])
+    def compute_multiply_vectors():
+        """Handles the app's (service's) behavior when accessing the stateless multiplication
+        operation for the ``Vectors`` resource.
+
+        Returns
+        -------
+        Response
+            Response object containing the vector operation requested.
+        """
+        # Perform the operation using the general method (to avoid code duplications)
+        response_body = __compute_eigen_objects("vector", "multiplication")
+
+        # Return a successful response with the result of the operation
+        return response_body, 200
+
+    @app.route("/compute/add/Matrices", methods=["POST"])
+    def compute_add_matrices():
+        """Handles the app's (service's) behavior when accessing the stateless addition
+        operation for the ``Matrices`` resource.
+
+        Returns
+        -------
+        Response
+            Response object containing the matrix operation requested.
+        """
+        # Perform the operation using the general method (to avoid code duplications)
+        response_body = __compute_eigen_objects("matrix", "addition")
+
+        # Return a successful response with the result of the operation
+        return response_body, 200
+
+    @app.route("/compute/multiply/Matrices", methods=["POST"])
+    def compute_multiply_matrices():
+        """Handles the app's (service's) behavior when accessing the stateless multiplication
+        operation for the ``Matrices`` resource.
+
+        Returns
+        -------
+        Response
+            Response object containing the matrix operation requested.
+        """
+        # Perform the operation using the general method (to avoid code duplications)
+        response_body = __compute_eigen_objects("matrix", "multiplication")
+
+        # Return a successful response with the result of the operation
         return response_body, 200
 
     class InvalidUsage(Exception):
@@ -215,6 +366,11 @@ def create_app():
     def __post_eigen_object(type):
         """Inserts a possible binded object of Eigen (vector or matrix) into the server's database.
 
+        The object is provided either as a JSON-formatted body (``{"value": [...]}``), as a raw
+        little-endian buffer (``application/octet-stream``, with its shape and dtype given in the
+        ``X-Eigen-Shape`` and ``X-Eigen-Dtype`` headers) or as a ``.npy`` file
+        (``application/x-npy``).
+
         Parameters
         ----------
         type : parameter
@@ -234,10 +390,99 @@ def create_app():
             In case no 'value' is provided within the request body.
         InvalidUsage
             In case an error was encountered when transforming 'value' into numpy.ndarray.
+        InvalidUsage
+            In case an error was encountered when decoding a binary body into numpy.ndarray.
+        InvalidUsage
+            In case the dimensions of the object do not match its type.
         """
         # Check the argument of this method
         str_type = __check_value(type, ALLOWED_TYPES)
 
+        # Parse the object provided in the body of the request
+        value = __parse_value(str_type)
+
+        # Check that the dimensions of the value match its type
+        if value.ndim != TYPE_DIMENSIONS[str_type]:
+            raise InvalidUsage(
+                str_type.capitalize()
+                + " values must have "
+                + str(TYPE_DIMENSIONS[str_type])
+                + " dimension(s)."
+            )
+
+        # Insert into DB (as raw bytes) and retrieve the ID of the inserted element
+        id_in_db = insert_array(get_db(), str_type.upper(), value)
+        cache.put((g.generation, id_in_db), value)
+
+        # Announce that the object has been added to the DB and..-
+        click.echo(
+            str_type.capitalize()
+            + " with id "
+            + str(id_in_db)
+            + " has been inserted into the server's DB."
+        )
+
+        # Inform about the size of the message content
+        click.echo("Size of message: " + __human_size(request.content_length))
+
+        # ... return the body of the response
+        return json.dumps({str_type: {"id": id_in_db}})
+
+    def __parse_value(str_type):
+        """Parses the body of a POST request, provided either in JSON or binary format.
+
+        Parameters
+        ----------
+        str_type : str
+            Type of object provided (vector or matrix).
+
+        Returns
+        -------
+        numpy.ndarray
+            Object provided.
+
+        Raises
+        ------
+        InvalidUsage
+            In case an error was encountered when decoding a binary body into numpy.ndarray.
+        """
+        # Binary payloads (raw buffers or .npy files) are decoded straight into a numpy.ndarray
+        if request.mimetype in (BINARY_MIMETYPE, NPY_MIMETYPE):
+            try:
+                return decode_array(
+                    request.get_data(), request.mimetype, request.headers
+                )
+            except ValueError as error:
+                click.echo(error)
+                raise InvalidUsage(
+                    "Error encountered when decoding the binary body into numpy.ndarray: "
+                    + str(error)
+                )
+
+        return __parse_json_value(str_type)
+
+    def __parse_json_value(str_type):
+        """Parses the JSON-formatted body of a POST request.
+
+        Parameters
+        ----------
+        str_type : str
+            Type of object to insert into the database (vector or matrix).
+
+        Returns
+        -------
+        numpy.ndarray
+            Object to insert into the database.
+
+        Raises
+        ------
+        InvalidUsage
+            In case no JSON-format request body was provided.
+        InvalidUsage
+            In case no 'value' is provided within the request body.
+        InvalidUsage
+            In case an error was encountered when transforming 'value' into numpy.ndarray.
+        """
         # Retrieve the body of the request silently
         body = request.get_json(silent=True)
 
@@ -260,39 +505,14 @@ def create_app():
         # Check that the recently parsed "value" can be transformed into a numpy.ndarray...
         # Otherwise, throw exception
         try:
-            np.array(value, dtype=np.float64)
+            value = np.array(value, dtype=np.float64)
         except ValueError as error:
             click.echo(error)
             raise InvalidUsage(
                 "Error encountered when transforming input string into numpy.ndarray."
             )
 
-        # Store the value as a string inside the database
-        str_value = json.dumps(value)
-
-        # Insert into DB (as a string) and retrieve the ID of the inserted element
-        db_conn = get_db()
-        cur = db_conn.cursor()
-        cur.execute(
-            "INSERT INTO eigen_db(eigen_type, eigen_value) VALUES (?, ?)",
-            (str_type.upper(), str_value),
-        )
-        db_conn.commit()
-        id_in_db = cur.lastrowid
-
-        # Announce that the object has been added to the DB and..-
-        click.echo(
-            str_type.capitalize()
-            + " with id "
-            + str(id_in_db)
-            + " has been inserted into the server's DB."
-        )
-
-        # Inform about the size of the message content
-        click.echo("Size of message: " + __human_size(request.content_length))
-
-        # ... return the body of the response
-        return json.dumps({str_type: {"id": id_in_db}})
+        return value
 
     def __ops_eigen_objects(type, ops):
         """Handles performing a certain operation on the type of objects provided.
@@ -308,8 +528,12 @@ def create_app():
 
         Returns
         -------
-        str
-            JSON-formatted string that contains the result of the operation.
+        Response
+            Response with the result of the operation, as a JSON-formatted string or, if the
+            client accepts it (``Accept`` header), as a raw little-endian buffer
+            (``application/octet-stream``) or as a ``.npy`` file (``application/x-npy``). Its
+            ETag identifies the result: requests whose ``If-None-Match`` header matches it get
+            an empty "not modified" (304) response instead.
 
         Raises
         ------
@@ -346,11 +570,140 @@ def create_app():
                 + " are not provided. Expected keys: 'id1', 'id2'."
             )
 
-        # Once the inputs have been verified... perform the operation
-        value = __perform_operation(str_type, str_ops, id1, id2)
+        # Check that both objects exist and that their shapes are compatible with the operation
+        id1, id2, value1, value2 = __check_operands(str_type, str_ops, id1, id2)
+
+        # The result never changes for the same objects... so clients already holding it
+        # (i.e. with the same ETag) get a "not modified" response, without any computation
+        commutative = str_ops == "addition" or str_type == "vector"
+        key = ResultMemo.key(
+            g.generation, str_type.upper(), str_ops, id1, id2, commutative
+        )
+        mimetype = request.accept_mimetypes.best_match(RESULT_MIMETYPES, JSON_MIMETYPE)
+        etag = __result_etag(key, mimetype)
+
+        if request.if_none_match.contains(etag):
+            response = app.response_class(status=304)
+            response.set_etag(etag)
+            return response
+
+        # Otherwise, retrieve the memoized result... or perform the operation
+        value = memo.get(key)
+        if value is None:
+            value = __perform_operation(str_type, str_ops, id1, id2, value1, value2)
+            memo.put(key, value)
+
+        # ... and return the response
+        response = __encode_result(str_type, str_ops, value, mimetype)
+        response.set_etag(etag)
+        return response
+
+    def __compute_eigen_objects(type, ops):
+        """Handles performing a certain operation on the objects provided within the request,
+        without storing them in the server's database.
+
+        Both objects (which must have the same shape) are provided stacked along a new first
+        dimension, in any of the formats handled by ``__post_eigen_object``. For example, as a
+        JSON-formatted body ``{"value": [[...], [...]]}`` for two vectors.
+
+        Parameters
+        ----------
+        type : parameter
+            Type of object to consider in the operation. It has to be available
+            within the ``ALLOWED_TYPES`` tuple and to be a string.
+        ops : parameter
+            Operation to carry out. It has to be available within the ``ALLOWED_OPS``
+            tuple and to be a string.
+
+        Returns
+        -------
+        Response
+            Response with the result of the operation, in the format accepted by the client
+            (see ``__ops_eigen_objects``).
+
+        Raises
+        ------
+        InvalidUsage
+            In case the objects could not be parsed from the request body.
+        InvalidUsage
+            In case two objects of the given type are not provided.
+        InvalidUsage
+            In case the shapes of the objects are not compatible with the operation.
+        """
+        # Check the arguments of this method
+        str_type = __check_value(type, ALLOWED_TYPES)
+        str_ops = __check_value(ops, ALLOWED_OPS)
+
+        # Parse the objects provided in the body of the request
+        value = __parse_value(str_type)
+
+        # Check that two objects of the given type are provided
+        if value.ndim != TYPE_DIMENSIONS[str_type] + 1 or value.shape[0] != 2:
+            raise InvalidUsage(
+                "Two "
+                + str_type
+                + " values (stacked along the first dimension) must be provided."
+            )
+
+        if not __compatible_shapes(str_type, str_ops, value.shape[1:], value.shape[1:]):
+            raise InvalidUsage(
+                "The shapes of the objects provided are not compatible with the "
+                + str_ops
+                + " operation."
+            )
+
+        # Perform the operation and return the body of the response
+        value = __compute(str_type, str_ops, *value)
+        mimetype = request.accept_mimetypes.best_match(RESULT_MIMETYPES, JSON_MIMETYPE)
+        return __encode_result(str_type, str_ops, value, mimetype)
 
-        # ... and return the body of the response
-        return json.dumps({str_type + "-" + str_ops: {"result": value}})
+    def __encode_result(str_type, str_ops, value, mimetype):
+        """Encodes the result of an operation in the format accepted by the client.
+
+        Parameters
+        ----------
+        str_type : str
+            Type of the objects involved in the operation (vector or matrix).
+        str_ops : str
+            Type of operation performed. For example, addition or multiplication.
+        value : numpy.float64/numpy.ndarray
+            Result of the operation.
+        mimetype : str
+            Media type accepted by the client (one of ``RESULT_MIMETYPES``).
+
+        Returns
+        -------
+        Response
+            Response with the result of the operation, either as a JSON-formatted string or
+            in the binary format accepted by the client.
+        """
+        if mimetype != JSON_MIMETYPE:
+            body, headers = encode_array(value, mimetype)
+            return app.response_class(body, headers=headers)
+
+        return app.response_class(
+            json.dumps({str_type + "-" + str_ops: {"result": value.tolist()}})
+        )
+
+    def __result_etag(key, mimetype):
+        """Generate the ETag of the result of an operation (in a certain format).
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the result (see ``ResultMemo.key``).
+        mimetype : str
+            Media type of the result.
+
+        Returns
+        -------
+        str
+            ETag of the result (unquoted).
+        """
+        # IDs are only unique within a generation of the DB... which is part of the key
+        return hashlib.blake2b(
+            repr(key + (mimetype,)).encode(), digest_size=16
+        ).hexdigest()
 
     def __check_value(value, allowed_values):
         """Check to ensure that the provided value is in the ``ALLOWED_*`` tuple
@@ -398,7 +751,68 @@ def create_app():
         # Return as a str object
         return str_value
 
-    def __perform_operation(str_type, str_ops, id1, id2):
+    def __check_operands(str_type, str_ops, id1, id2):
+        """Check that the objects involved in an operation exist in the database DB and
+        that their shapes are compatible with the operation.
+
+        Parameters
+        ----------
+        str_type : str
+            Type of the objects involved in the operation (vector or matrix).
+        str_ops : str
+            Type of operation to perform. For example, addition or multiplication.
+        id1 : int/str
+            Dataase identifier for the first object, as provided in the request.
+        id2 : int/str
+            Database identifier for the second object, as provided in the request.
+
+        Returns
+        -------
+        int, int, numpy.ndarray, numpy.ndarray
+            Identifiers of the objects involved, and the objects themselves if they were
+            cached (``None`` otherwise).
+
+        Raises
+        ------
+        InvalidUsage
+            In case the identifiers of the objects are not integers.
+        InvalidUsage
+            In case the shapes of the objects are not compatible with the operation.
+        """
+        # Ensure that the identifiers of the objects are integers
+        try:
+            id1, id2 = int(id1), int(id2)
+        except (TypeError, ValueError):
+            raise InvalidUsage(
+                "The IDs of the objects must be integers (got "
+                + repr(id1)
+                + " and "
+                + repr(id2)
+                + ")."
+            )
+
+        # Look for the objects in the cache first... and otherwise check their metadata
+        # in the DB, without loading their values
+        value1 = __get_cached(str_type, id1)
+        value2 = __get_cached(str_type, id2)
+        shape1 = __get_shape(str_type, id1) if value1 is None else value1.shape
+        shape2 = __get_shape(str_type, id2) if value2 is None else value2.shape
+
+        # Ensure that the shapes of both objects are compatible with the operation
+        if not __compatible_shapes(str_type, str_ops, shape1, shape2):
+            raise InvalidUsage(
+                "The shapes of the objects with IDs "
+                + str(id1)
+                + " and "
+                + str(id2)
+                + " are not compatible with the "
+                + str_ops
+                + " operation."
+            )
+
+        return id1, id2, value1, value2
+
+    def __perform_operation(str_type, str_ops, id1, id2, value1=None, value2=None):
         """Retrieve the data from the database DB for performing a certain
         operation with the eigen-wrapper.
 
@@ -412,68 +826,162 @@ def create_app():
             Dataase identifier for the first object.
         id2 : int
             Database identifier for the second object.
+        value1 : numpy.ndarray, optional
+            First object, if already retrieved. The default is ``None``.
+        value2 : numpy.ndarray, optional
+            Second object, if already retrieved. The default is ``None``.
 
         Returns
         -------
-        double/List(double)
+        numpy.float64/numpy.ndarray
             Result of the operation.
         """
-        # Get the values from the DB given the ids (as strings)
-        db_conn = get_db()
-        cur = db_conn.cursor()
-        cur.execute(
-            "SELECT eigen_value FROM eigen_db WHERE id in (?) AND eigen_type in (?)",
-            (id1, str_type.upper()),
-        )
+        # Load the values missing from the DB as np.arrays (of dtype np.float64)
+        if value1 is None:
+            value1 = __load_value(str_type, id1)
+        if value2 is None:
+            value2 = __load_value(str_type, id2)
 
-        # Ensure that a value is retrieved for ID1
-        try:
-            str_value1 = cur.fetchone()[0]
-        except TypeError as error:
-            click.echo(error)
-            raise InvalidUsage(
-                "Unexpected error... No values in the database for ID "
-                + str(id1)
-                + " and type "
-                + str_type.capitalize()
-                + "."
-            )
+        # And finally... perform operation
+        return __compute(str_type, str_ops, value1, value2)
 
-        cur.execute(
-            "SELECT eigen_value FROM eigen_db WHERE id in (?) AND eigen_type in (?)",
-            (id2, str_type.upper()),
-        )
+    def __compatible_shapes(str_type, str_ops, shape1, shape2):
+        """Check whether the shapes of two objects are compatible with an operation.
 
-        # Ensure that a value is retrieved for ID2
-        try:
-            str_value2 = cur.fetchone()[0]
-        except TypeError as error:
-            click.echo(error)
-            raise InvalidUsage(
-                "Unexpected error... No values in the database for ID "
-                + str(id2)
-                + " and type "
-                + str_type.capitalize()
-                + "."
-            )
+        Parameters
+        ----------
+        str_type : str
+            Type of the objects involved in the operation (vector or matrix).
+        str_ops : str
+            Type of operation to perform. For example, addition or multiplication.
+        shape1 : tuple
+            Shape of the first object.
+        shape2 : tuple
+            Shape of the second object.
 
-        # Now, convert to np.arrays
-        value1 = np.array(json.loads(str_value1), dtype=np.float64)
-        value2 = np.array(json.loads(str_value2), dtype=np.float64)
+        Returns
+        -------
+        bool
+            Whether the shapes are compatible.
+        """
+        # Matrix products only require the inner dimensions to match
+        if str_type == "matrix" and str_ops == "multiplication":
+            return shape1[1] == shape2[0]
+        else:
+            return tuple(shape1) == tuple(shape2)
 
-        # And finally... perform operation
+    def __compute(str_type, str_ops, value1, value2):
+        """Perform a certain operation with the eigen-wrapper.
+
+        Parameters
+        ----------
+        str_type : str
+            Type of the objects involved in the operation (vector or matrix).
+        str_ops : str
+            Type of operation to perform. For example, addition or multiplication.
+        value1 : numpy.ndarray
+            First object.
+        value2 : numpy.ndarray
+            Second object.
+
+        Returns
+        -------
+        numpy.float64/numpy.ndarray
+            Result of the operation.
+        """
         if str_type == "vector" and str_ops == "addition":
-            return demo_eigen_wrapper.add_vectors(value1, value2).tolist()
+            return demo_eigen_wrapper.add_vectors(value1, value2)
         elif str_type == "vector" and str_ops == "multiplication":
-            return demo_eigen_wrapper.multiply_vectors(value1, value2)
+            return np.float64(demo_eigen_wrapper.multiply_vectors(value1, value2))
         elif str_type == "matrix" and str_ops == "addition":
-            return demo_eigen_wrapper.add_matrices(value1, value2).tolist()
+            return demo_eigen_wrapper.add_matrices(value1, value2)
         elif str_type == "matrix" and str_ops == "multiplication":
-            return demo_eigen_wrapper.multiply_matrices(value1, value2).tolist()
+            return demo_eigen_wrapper.multiply_matrices(value1, value2)
         else:
             # This should not occur
             return None
 
+    def __get_cached(str_type, id):
+        """Retrieve an object from the cache of decoded arrays.
+
+        Parameters
+        ----------
+        str_type : str
+            Type of the object (vector or matrix).
+        id : int
+            Database identifier for the object.
+
+        Returns
+        -------
+        numpy.ndarray
+            Cached object, or ``None`` in case there is no cached object of the given
+            type for that ID.
+        """
+        value = cache.get((g.generation, id))
+
+        # The type of the cached objects is given by their dimensions
+        if value is None or value.ndim != TYPE_DIMENSIONS[str_type]:
+            return None
+
+        return value
+
+    def __get_shape(str_type, id):
+        """Retrieve the shape of an object from the metadata in the database DB, ensuring
+        that it exists.
+
+        Parameters
+        ----------
+        str_type : str
+            Type of the object (vector or matrix).
+        id : int
+            Database identifier for the object.
+
+        Returns
+        -------
+        tuple
+            Shape of the object (rows and cols, which is ``None`` for vectors).
+
+        Raises
+        ------
+        InvalidUsage
+            In case there is no object of the given type for that ID.
+        """
+        metadata = array_metadata(get_db(), id)
+
+        if metadata is None or metadata["eigen_type"] != str_type.upper():
+            raise InvalidUsage(
+                "Unexpected error... No values in the database for ID "
+                + str(id)
+                + " and type "
+                + str_type.capitalize()
+                + "."
+            )
+
+        return (metadata["rows"], metadata["cols"])[: TYPE_DIMENSIONS[str_type]]
+
+    def __load_value(str_type, id):
+        """Load an object from the database DB (as a np.array of dtype np.float64), and
+        keep it in the cache of decoded arrays.
+
+        Parameters
+        ----------
+        str_type : str
+            Type of the object (vector or matrix).
+        id : int
+            Database identifier for the object.
+
+        Returns
+        -------
+        numpy.ndarray
+            Object stored.
+        """
+        value = load_array(get_db(), id, str_type.upper()).astype(
+            np.float64, copy=False
+        )
+        cache.put((g.generation, id), value)
+
+        return value
+
     def __human_size(content_length: int):
         """Show the size of the message in human-readable format.
 
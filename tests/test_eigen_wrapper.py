@@ -1,5 +1,6 @@
 import demo_eigen_wrapper
 import numpy as np
+import pytest
 
 
 def test_function():
@@ -41,3 +42,186 @@ def test_function():
     assert mat_3[0, 1] == 4
     assert mat_3[1, 0] == 23
     assert mat_3[1, 1] == 12
+
+
+def test_out_and_inplace():
+
+    # Testing adding vectors into a given vector, and in place, using the wrapper
+
+    array_1 = np.array([1, 2, 3, 4], dtype=np.float64)
+    array_2 = np.array([5, 4, 2, 0], dtype=np.float64)
+    array_3 = np.empty(4, dtype=np.float64)
+
+    demo_eigen_wrapper.add_vectors(array_1, array_2, out=array_3)
+    np.testing.assert_array_equal(array_3, [6, 6, 5, 4])
+
+    demo_eigen_wrapper.add_vectors_inplace(array_3, array_2)
+    np.testing.assert_array_equal(array_3, [11, 10, 7, 4])
+
+    # Testing adding and multiplying matrices into a given (C-contiguous) matrix,
+    # and adding them in place, using the wrapper
+
+    mat_1 = np.array([[1, 2], [3, 4]], dtype=np.float64)
+    mat_2 = np.array([[5, 4], [2, 0]], dtype=np.float64)
+    mat_3 = np.empty((2, 2), dtype=np.float64)
+
+    demo_eigen_wrapper.add_matrices(mat_1, mat_2, out=mat_3)
+    np.testing.assert_array_equal(mat_3, [[6, 6], [5, 4]])
+
+    demo_eigen_wrapper.multiply_matrices(mat_1, mat_2, out=mat_3)
+    np.testing.assert_array_equal(mat_3, [[9, 4], [23, 12]])
+
+    demo_eigen_wrapper.add_matrices_inplace(mat_3, mat_1)
+    np.testing.assert_array_equal(mat_3, [[10, 6], [26, 16]])
+
+    # Testing that the output may alias one of the operands
+
+    demo_eigen_wrapper.multiply_matrices(mat_3, mat_2, out=mat_3)
+    np.testing.assert_array_equal(mat_3, [[62, 40], [162, 104]])
+
+    # Testing that the output may also partially overlap the operands (i.e. shifted
+    # or transposed views of the same buffer)
+
+    buffer = np.arange(10, dtype=np.float64)
+    expected = buffer.copy()
+    expected[2:] = buffer[:8] + buffer[1:9]
+    demo_eigen_wrapper.add_vectors(buffer[:8], buffer[1:9], out=buffer[2:])
+    np.testing.assert_array_equal(buffer, expected)
+
+    buffer = np.arange(10, dtype=np.float64)
+    expected = buffer.copy()
+    expected[1:9] += buffer[:8]
+    demo_eigen_wrapper.add_vectors_inplace(buffer[1:9], buffer[:8])
+    np.testing.assert_array_equal(buffer, expected)
+
+    mat_4 = np.arange(16, dtype=np.float64).reshape(4, 4)
+    expected = mat_4 + mat_4.T
+    demo_eigen_wrapper.add_matrices_inplace(mat_4, mat_4.T)
+    np.testing.assert_array_equal(mat_4, expected)
+
+    mat_4 = np.arange(25, dtype=np.float64).reshape(5, 5)
+    expected = mat_4.copy()
+    expected[:4, 1:] = mat_4[:4, :4] @ mat_4[1:, 1:]
+    demo_eigen_wrapper.multiply_matrices(
+        mat_4[:4, :4], mat_4[1:, 1:], out=mat_4[:4, 1:]
+    )
+    np.testing.assert_array_equal(mat_4, expected)
+
+    # Testing that the dimensions of the output are checked
+
+    with pytest.raises(RuntimeError, match="Dimensions mismatch"):
+        demo_eigen_wrapper.add_vectors(array_1, array_2, out=np.empty(3))
+
+    with pytest.raises(RuntimeError, match="Dimensions mismatch"):
+        demo_eigen_wrapper.multiply_matrices(mat_1, mat_2, out=np.empty((2, 3)))
+
+
+@pytest.mark.parametrize(
+    "dtype", [np.float64, np.int32, np.int64, np.float32, np.complex128]
+)
+def test_dtypes(dtype):
+
+    # Testing that all operations are performed on the dtype of the inputs
+
+    array_1 = np.array([1, 2, 3, 4], dtype=dtype)
+    array_2 = np.array([5, 4, 2, 0], dtype=dtype)
+    mat_1 = array_1.reshape(2, 2)
+    mat_2 = array_2.reshape(2, 2)
+
+    array_3 = demo_eigen_wrapper.add_vectors(array_1, array_2)
+    mat_3 = demo_eigen_wrapper.add_matrices(mat_1, mat_2)
+    mat_4 = demo_eigen_wrapper.multiply_matrices(mat_1, mat_2)
+
+    for result in (array_3, mat_3, mat_4):
+        assert result.dtype == dtype
+
+    np.testing.assert_array_equal(array_3, [6, 6, 5, 4])
+    np.testing.assert_array_equal(mat_3, [[6, 6], [5, 4]])
+    np.testing.assert_array_equal(mat_4, [[9, 4], [23, 12]])
+    assert demo_eigen_wrapper.multiply_vectors(array_1, array_2) == 19
+
+    # Testing that the in-place addition is performed on the inputs themselves
+
+    demo_eigen_wrapper.add_vectors_inplace(array_1, array_2)
+    np.testing.assert_array_equal(array_1, [6, 6, 5, 4])
+
+    # Testing that sliced (i.e. non-contiguous) vectors keep their dtype too
+
+    array_4 = np.arange(8, dtype=dtype)
+    array_5 = demo_eigen_wrapper.add_vectors(array_4[::2], array_4[1::2])
+    assert array_5.dtype == dtype
+    np.testing.assert_array_equal(array_5, [1, 5, 9, 13])
+
+    assert demo_eigen_wrapper.multiply_vectors(array_4[::2], array_4[1::2]) == 68
+
+    demo_eigen_wrapper.add_vectors_inplace(array_4[::2], array_4[1::2])
+    np.testing.assert_array_equal(array_4, [1, 1, 5, 3, 9, 5, 13, 7])
+
+    # Testing that the dot product of complex vectors does not conjugate (as in numpy)
+
+    if dtype is np.complex128:
+        array_4 = np.array([1j, 2], dtype=dtype)
+        assert demo_eigen_wrapper.multiply_vectors(array_4, array_4) == 3
+
+
+def test_layouts():
+
+    # Testing that C-contiguous matrices result in C-ordered matrices, while any
+    # other layout is still supported
+
+    mat_1 = np.arange(12, dtype=np.float64).reshape(3, 4)
+    mat_2 = np.arange(12, dtype=np.float64).reshape(4, 3)
+
+    mat_3 = demo_eigen_wrapper.multiply_matrices(mat_1, mat_2)
+    assert mat_3.flags.c_contiguous
+    np.testing.assert_array_equal(mat_3, np.matmul(mat_1, mat_2))
+
+    mat_3 = demo_eigen_wrapper.add_matrices(mat_1, mat_1)
+    assert mat_3.flags.c_contiguous
+    np.testing.assert_array_equal(mat_3, mat_1 + mat_1)
+
+    for mat_f, mat_s in [
+        (np.asfortranarray(mat_1), np.asfortranarray(mat_1)),
+        (mat_1[:, ::2], mat_1[:, 1::2]),
+    ]:
+        np.testing.assert_array_equal(
+            demo_eigen_wrapper.add_matrices(mat_f, mat_s), mat_f + mat_s
+        )
+
+
+@pytest.mark.parametrize("threads", [1, 4])
+def test_batched(threads):
+
+    # Testing the batched operations over stacks of vectors and matrices
+
+    stack_1 = np.random.default_rng(1).random((20, 3, 3))
+    stack_2 = np.random.default_rng(2).random((20, 3, 3))
+
+    np.testing.assert_allclose(
+        demo_eigen_wrapper.batched_multiply_matrices(stack_1, stack_2, threads),
+        np.matmul(stack_1, stack_2),
+    )
+    np.testing.assert_allclose(
+        demo_eigen_wrapper.batched_add_matrices(stack_1, stack_2, threads),
+        stack_1 + stack_2,
+    )
+
+    vectors_1 = stack_1.reshape(20, 9)
+    vectors_2 = stack_2.reshape(20, 9)
+
+    np.testing.assert_allclose(
+        demo_eigen_wrapper.batched_multiply_vectors(vectors_1, vectors_2, threads),
+        np.einsum("ij,ij->i", vectors_1, vectors_2),
+    )
+    np.testing.assert_allclose(
+        demo_eigen_wrapper.batched_add_vectors(vectors_1, vectors_2, threads),
+        vectors_1 + vectors_2,
+    )
+
+    # Testing that the shapes of the stacks are checked
+
+    with pytest.raises(RuntimeError, match="Dimensions mismatch"):
+        demo_eigen_wrapper.batched_add_vectors(vectors_1, vectors_2[1:])
+
+    with pytest.raises(RuntimeError, match="square matrices"):
+        demo_eigen_wrapper.batched_multiply_matrices(stack_1[:, 1:], stack_2[:, 1:])
@@ -1,7 +1,13 @@
+import threading
+
+import grpc
 import numpy as np
 import pytest
 
 from ansys.eigen.python.grpc.client import DemoGRPCClient
+import ansys.eigen.python.grpc.constants as constants
+import ansys.eigen.python.grpc.generated.grpcdemo_pb2 as grpcdemo_pb2
+from ansys.eigen.python.grpc.store import ArrayStore
 from ansys.eigen.python.testing.test_tools import (
     SIZES,
     SIZES_IDS,
@@ -146,3 +152,897 @@ def test_multiply_matrices_grpc(grpc_stub, sz):
     mat_mult = client.multiply_matrices(mat_1, mat_2)
 
     np.testing.assert_allclose(mat_mult, np.matmul(mat_1, mat_2))
+
+
+def test_get_vectors_multiple_chunks_grpc(grpc_servicer):
+    """Unit test to verify that the server reassembles a vector sent in
+    several chunks, and that it rejects chunks exceeding the advertised size."""
+
+    vec_1 = vec_generator(100)
+    chunks = np.array_split(vec_1, 7)
+
+    # Build the chunk messages and the metadata sent by the client
+    md = {"full-vectors": "1", "vec1-messages": str(len(chunks))}
+    msgs = [
+        grpcdemo_pb2.Vector(
+            data_type=grpcdemo_pb2.DataType.Value("DOUBLE"),
+            vector_size=vec_1.size,
+            vector_as_chunk=chunk.tobytes(),
+        )
+        for chunk in chunks
+    ]
+
+    dtype, size, vector_list = grpc_servicer._get_vectors(iter(msgs), md)
+
+    assert dtype == np.float64
+    assert size == (100,)
+    np.testing.assert_array_equal(vector_list[0], vec_1)
+
+    # Advertise a smaller vector than the one actually sent
+    for msg in msgs:
+        msg.vector_size = 50
+
+    with pytest.raises(RuntimeError):
+        grpc_servicer._get_vectors(iter(msgs), md)
+
+
+def test_read_results_in_place_grpc(grpc_stub):
+    """Unit test to verify that the client returns writable, C-contiguous
+    numpy arrays when reading chunked responses from the server."""
+
+    client = DemoGRPCClient(test=grpc_stub)
+
+    # Use sizes which require several chunks (above constants.MAX_CHUNKSIZE)
+    vec_1 = np.random.default_rng(1).random(1024 * 1024)
+    mat_1 = np.random.default_rng(1).random((1024, 1024))
+
+    vec_flip = client.flip_vector(vec_1)
+    mat_add = client.add_matrices(mat_1, mat_1)
+
+    for result in (vec_flip, mat_add):
+        assert result.flags.writeable
+        assert result.flags.c_contiguous
+
+    np.testing.assert_array_equal(vec_flip, np.flip(vec_1))
+    np.testing.assert_allclose(mat_add, mat_1 + mat_1)
+
+
+def test_send_non_contiguous_grpc(grpc_stub):
+    """Unit test to verify that non-contiguous numpy arrays (such as flipped
+    vectors or column-major matrices) are transmitted properly in several chunks."""
+
+    client = DemoGRPCClient(test=grpc_stub)
+
+    # Use sizes which require several chunks (above constants.MAX_CHUNKSIZE)
+    vec_1 = np.flip(np.random.default_rng(1).random(1024 * 1024))
+    mat_1 = np.asfortranarray(np.random.default_rng(1).random((1000, 1001)))
+
+    assert not vec_1.flags.c_contiguous
+    assert not mat_1.flags.c_contiguous
+
+    vec_flip = client.flip_vector(vec_1)
+    mat_add = client.add_matrices(mat_1, mat_1)
+
+    np.testing.assert_array_equal(vec_flip, np.flip(vec_1))
+    np.testing.assert_allclose(mat_add, mat_1 + mat_1)
+
+
+def test_integer_ops_grpc(grpc_stub):
+    """Unit test to verify that integer numpy arrays are operated in integer
+    arithmetic, and returned as such."""
+
+    client = DemoGRPCClient(test=grpc_stub)
+
+    # Use values whose sum is not exactly representable as a float32
+    vec_1 = np.arange(2**24, 2**24 + 100, dtype=np.int32)
+    vec_2 = np.ones(100, dtype=np.int32)
+    mat_1 = np.arange(100, dtype=np.int32).reshape(10, 10)
+
+    vec_add = client.add_vectors(vec_1, vec_2, vec_2)
+    vec_mult = client.multiply_vectors(vec_2, vec_2)
+    mat_add = client.add_matrices(mat_1, mat_1)
+    mat_mult = client.multiply_matrices(mat_1, mat_1)
+
+    for result in (vec_add, vec_mult, mat_add, mat_mult):
+        assert result.dtype == np.int32
+
+    np.testing.assert_array_equal(vec_add, vec_1 + 2)
+    np.testing.assert_array_equal(vec_mult, [100])
+    np.testing.assert_array_equal(mat_add, mat_1 + mat_1)
+    np.testing.assert_array_equal(mat_mult, np.matmul(mat_1, mat_1))
+
+
+@pytest.mark.parametrize(
+    "operation,shape,expected",
+    [
+        ("add_vectors", (50, 7), lambda a, b: a + b),
+        ("multiply_vectors", (50, 7), lambda a, b: np.einsum("ij,ij->i", a, b)),
+        ("add_matrices", (50, 4, 3), lambda a, b: a + b),
+        ("multiply_matrices", (50, 4, 4), np.matmul),
+    ],
+)
+def test_batched_operation_grpc(grpc_stub, operation, shape, expected):
+    """Unit test to verify that the client gets the expected response
+    when performing an operation over two stacks of vectors or matrices."""
+
+    client = DemoGRPCClient(test=grpc_stub)
+
+    stack_1 = np.random.default_rng(1).random(shape)
+    stack_2 = np.random.default_rng(2).random(shape)
+
+    result = client.batched_operation(operation, stack_1, stack_2, threads=2)
+
+    np.testing.assert_allclose(result, expected(stack_1, stack_2))
+
+
+def test_batched_operation_errors_grpc(grpc_stub):
+    """Unit test to verify the error conditions of batched operations."""
+
+    client = DemoGRPCClient(test=grpc_stub)
+    stack = np.ones((2, 3, 3))
+
+    # Test 1: Check that only the known operations are allowed
+    with pytest.raises(RuntimeError, match="Unknown batched operation: flip_vector"):
+        client.batched_operation("flip_vector", stack, stack)
+
+    # Test 2: Check that stacks of the expected dimensions are required
+    with pytest.raises(RuntimeError, match="Only 2D numpy.ndarrays are allowed"):
+        client.batched_operation("add_vectors", stack, stack)
+
+    # Test 3: Check that the stacks must have the same shape
+    with pytest.raises(RuntimeError, match="Stacks of different shapes"):
+        client.batched_operation("add_matrices", stack, np.ones((3, 3, 3)))
+
+
+def test_resident_arrays_grpc(grpc_stub):
+    """Unit test to verify that the client gets the expected response
+    when operating vectors and matrices stored on the server side."""
+
+    client = DemoGRPCClient(test=grpc_stub)
+
+    vec_1 = np.random.default_rng(1).random(10)
+    vec_2 = np.random.default_rng(2).random(10)
+    mat_1 = np.random.default_rng(3).random((5, 5))
+    mat_2 = np.random.default_rng(4).random((5, 5))
+
+    # Store some of the operands on the server side
+    vec_handle = client.upload(vec_1)
+    mat_handle = client.upload(mat_1)
+
+    # Operate them, either on their own or along with operands sent in the call
+    np.testing.assert_allclose(client.operate_vectors("flip", vec_handle), vec_1[::-1])
+    np.testing.assert_allclose(
+        client.operate_vectors("add", vec_handle, vec_2, vec_handle), 2 * vec_1 + vec_2
+    )
+    np.testing.assert_allclose(
+        client.operate_vectors("multiply", vec_2, vec_handle), [np.dot(vec_1, vec_2)]
+    )
+    np.testing.assert_allclose(
+        client.operate_matrices("multiply", mat_2, mat_handle), np.matmul(mat_2, mat_1)
+    )
+    np.testing.assert_allclose(
+        client.operate_matrices("add", mat_handle, mat_handle), 2 * mat_1
+    )
+
+    # Release them... only once
+    assert client.release(vec_handle)
+    assert not client.release(vec_handle)
+    assert client.release(mat_handle)
+
+
+def test_resident_arrays_errors_grpc(grpc_stub):
+    """Unit test to verify the error conditions of operations on stored arrays."""
+
+    client = DemoGRPCClient(test=grpc_stub)
+    vec_handle = client.upload(np.ones(3))
+
+    # Test 1: Check that released handles are unknown
+    released = client.upload(np.ones(3))
+    client.release(released)
+    with pytest.raises(grpc.RpcError, match="Unknown handle: " + released):
+        client.operate_vectors("add", vec_handle, released)
+
+    # Test 2: Check that only the known operations are allowed
+    with pytest.raises(grpc.RpcError, match="Unknown operation: flip"):
+        client.operate_matrices("flip", np.ones((3, 3)))
+
+    # Test 3: Check that vectors cannot be operated as matrices
+    with pytest.raises(grpc.RpcError, match="references an array of other dimensions"):
+        client.operate_matrices("add", vec_handle, np.ones((3, 3)))
+
+    # Test 4: Check that stored and sent operands must have the same size
+    with pytest.raises(grpc.RpcError, match="Input arguments are of different sizes"):
+        client.operate_vectors("add", vec_handle, np.ones(4))
+
+    client.release(vec_handle)
+
+
+def test_array_store_eviction():
+    """Unit test to verify that the least recently used arrays are evicted
+    when the store runs out of room."""
+
+    store = ArrayStore(budget=3 * 80)
+    handles = [store.put(np.full(10, idx, dtype=np.float64)) for idx in range(3)]
+    assert store.nbytes == 3 * 80
+
+    # Use the first array... so that the second one is the least recently used
+    store.get(handles[0])
+    new_handle = store.put(np.zeros(10))
+
+    assert len(store) == 3
+    with pytest.raises(RuntimeError, match="released or evicted"):
+        store.get(handles[1])
+    np.testing.assert_array_equal(store.get(handles[0]), np.zeros(10))
+    np.testing.assert_array_equal(store.get(new_handle), np.zeros(10))
+
+    # Stored arrays are read-only... and those exceeding the budget are refused
+    assert not store.get(handles[2]).flags.writeable
+    with pytest.raises(RuntimeError, match="exceeds the budget of the store"):
+        store.put(np.zeros(100))
+
+
+def test_pipeline_grpc(grpc_stub):
+    """Unit test to verify that the client gets the expected response
+    when evaluating a pipeline of operations on the server side."""
+
+    client = DemoGRPCClient(test=grpc_stub)
+
+    mat_a = np.random.default_rng(1).random((4, 4))
+    mat_b = np.random.default_rng(2).random((4, 4))
+    mat_c = np.random.default_rng(3).random((4, 4))
+    vec_1 = np.random.default_rng(4).random(6)
+    vec_2 = np.random.default_rng(5).random(6)
+
+    # Build the pipeline: (A*B)+C, flip(v1+v2) and flip(v1+v2)·v1
+    pipe = client.pipeline()
+    a, b, c = pipe.operand(mat_a), pipe.operand(mat_b), pipe.operand(mat_c)
+    v1, v2 = pipe.operand(vec_1), pipe.operand(vec_2)
+    mat_res = pipe.add_matrices(pipe.multiply_matrices(a, b), c)
+    flipped = pipe.flip_vector(pipe.add_vectors(v1, v2))
+    dot = pipe.multiply_vectors(flipped, v1)
+
+    # Operations not needed by the outputs are valid (though not performed)
+    pipe.multiply_matrices(c, c)
+
+    mat_out, flip_out, dot_out, a_out = pipe.evaluate(mat_res, flipped, dot, a)
+
+    np.testing.assert_allclose(mat_out, np.matmul(mat_a, mat_b) + mat_c)
+    np.testing.assert_allclose(flip_out, (vec_1 + vec_2)[::-1])
+    np.testing.assert_allclose(dot_out, [np.dot((vec_1 + vec_2)[::-1], vec_1)])
+    np.testing.assert_array_equal(a_out, mat_a)
+
+
+def test_pipeline_errors_grpc(grpc_stub):
+    """Unit test to verify the error conditions of pipelines."""
+
+    client = DemoGRPCClient(test=grpc_stub)
+    pipe = client.pipeline()
+    vec = pipe.operand(np.ones(3))
+    mat = pipe.operand(np.ones((3, 3)))
+
+    # Test 1: Check that operations only take values of the expected dimensions
+    with pytest.raises(RuntimeError, match="Operation add_matrices takes matrices"):
+        pipe.add_matrices(mat, vec)
+
+    # Test 2: Check that only known values are allowed
+    with pytest.raises(RuntimeError, match="Unknown pipeline value: 7"):
+        pipe.flip_vector(7)
+
+    # Test 3: Check that some output is required
+    with pytest.raises(RuntimeError, match="No outputs requested"):
+        pipe.evaluate()
+
+    # Test 4: Check that the server validates the operands as usual
+    other = pipe.operand(np.ones(4))
+    with pytest.raises(grpc.RpcError, match="Input arguments are of different sizes"):
+        pipe.evaluate(pipe.add_vectors(vec, other))
+
+
+def test_run_pipeline_grpc(grpc_servicer):
+    """Unit test to verify that the server only performs the operations of a
+    pipeline needed for its outputs, and that it validates the pipeline."""
+
+    operands = [np.ones((2, 2)), np.ones((2, 3))]
+
+    # The second operation (a product of non-square matrices) is not needed
+    graph = grpcdemo_pb2.PipelineGraph(
+        nodes=[
+            grpcdemo_pb2.PipelineNode(operation="add_matrices", inputs=[0, 0]),
+            grpcdemo_pb2.PipelineNode(operation="multiply_matrices", inputs=[1, 1]),
+        ],
+        outputs=[2],
+    )
+    md = {"pipeline-bin": graph.SerializeToString()}
+    (result,) = grpc_servicer._run_pipeline(md, np.float64, operands)
+    np.testing.assert_array_equal(result, 2 * np.ones((2, 2)))
+
+    # Operations may not reference later values
+    graph.nodes[0].inputs[1] = 3
+    md = {"pipeline-bin": graph.SerializeToString()}
+    with pytest.raises(
+        RuntimeError, match="operation 0 references values not available"
+    ):
+        grpc_servicer._run_pipeline(md, np.float64, operands)
+
+
+def test_session_grpc(grpc_stub):
+    """Unit test to verify that the client gets the expected responses
+    when performing several (pipelined) operations within a session."""
+
+    client = DemoGRPCClient(test=grpc_stub)
+
+    vec_1 = np.random.default_rng(1).random(16)
+    vec_2 = np.random.default_rng(2).random(16)
+    mat_1 = np.random.default_rng(3).random((8, 8))
+    mat_2 = np.random.default_rng(4).random((8, 8))
+
+    with client.session() as session:
+        # Request several operations before waiting for any result
+        results = [
+            session.submit("flip_vector", vec_1),
+            session.submit("add_vectors", vec_1, vec_2, vec_1),
+            session.submit("multiply_vectors", vec_1, vec_2),
+            session.submit("add_matrices", mat_1, mat_2),
+            session.submit("multiply_matrices", mat_1, mat_2),
+        ]
+
+        np.testing.assert_allclose(results[0].result(), vec_1[::-1])
+        np.testing.assert_allclose(results[1].result(), 2 * vec_1 + vec_2)
+        np.testing.assert_allclose(results[2].result(), [np.dot(vec_1, vec_2)])
+        np.testing.assert_allclose(results[3].result(), mat_1 + mat_2)
+        np.testing.assert_allclose(results[4].result(), np.matmul(mat_1, mat_2))
+
+        # Check that the blocking methods are available as well
+        np.testing.assert_allclose(session.add_vectors(vec_1, vec_2), vec_1 + vec_2)
+
+    # Operands of a session are sent within a single message: the chunk size tuner (which
+    # would never measure these requests) is not involved
+    client = DemoGRPCClient(chunk_size="auto", test=grpc_stub)
+    client._tuner.select = None
+    with client.session() as session:
+        np.testing.assert_allclose(session.add_vectors(vec_1, vec_2), vec_1 + vec_2)
+        np.testing.assert_allclose(session.add_matrices(mat_1, mat_2), mat_1 + mat_2)
+
+
+def test_session_errors_grpc(grpc_stub):
+    """Unit test to verify the error conditions of the operations within a session."""
+
+    client = DemoGRPCClient(test=grpc_stub)
+
+    with client.session() as session:
+        # Test 1: Check that only the known operations are allowed
+        with pytest.raises(RuntimeError, match="Unknown session operation: subtract"):
+            session.submit("subtract", np.ones(3), np.ones(3))
+
+        # Test 2: Check that the operands must fit in a single message
+        with pytest.raises(
+            RuntimeError, match="Operands of a session operation are limited"
+        ):
+            session.submit("add_vectors", np.ones(300000), np.ones(300000))
+
+        # Test 3: Check that the errors of the server do not end the session
+        with pytest.raises(RuntimeError, match="Only square matrices are allowed"):
+            session.multiply_matrices(np.ones((2, 3)), np.ones((2, 3)))
+        np.testing.assert_allclose(session.flip_vector(np.arange(3.0)), [2, 1, 0])
+
+    # Test 4: Check that no operations are allowed once the session is closed
+    with pytest.raises(RuntimeError, match="Session closed"):
+        session.submit("flip_vector", np.ones(3))
+    session.close()
+
+    # Test 5: Check that requests without operands are reported... without ending the
+    # session either
+    requests = [
+        grpcdemo_pb2.SessionRequest(request_id=1, operation="add_vectors"),
+        grpcdemo_pb2.SessionRequest(request_id=2, operation="multiply_matrices"),
+        client._generate_session_request(3, "flip_vector", np.arange(3.0)),
+    ]
+    responses = list(grpc_stub.Session(iter(requests)))
+
+    assert [response.request_id for response in responses] == [1, 2, 3]
+    for response in responses[:2]:
+        assert "No operands provided" in response.error
+    np.testing.assert_allclose(client._read_session_response(responses[2]), [2, 1, 0])
+
+
+def test_unary_calls_grpc(capsys, grpc_stub):
+    """Unit test to verify that the client performs the operations with small
+    operands by unary calls, and the rest of them by streaming calls."""
+
+    client = DemoGRPCClient(test=grpc_stub)
+
+    # Small operands are sent within a single message
+    mat = mat_generator(4)
+    np.testing.assert_allclose(client.multiply_matrices(mat, mat), np.matmul(mat, mat))
+    assert "Unary matrix multiplication requested." in capsys.readouterr().out
+
+    # Operands above the size of a chunk are streamed
+    vec = np.ones(constants.MAX_CHUNKSIZE // 8)
+    np.testing.assert_allclose(client.add_vectors(vec, vec), 2 * vec)
+    captured = capsys.readouterr()
+    assert "Vector addition requested." in captured.out
+    assert "Unary" not in captured.out
+
+    # Small operands with a larger result (as computed, in float64) are streamed too
+    vec = np.ones(constants.MAX_CHUNKSIZE // 4 - 1, dtype=np.float32)
+    assert not client._use_unary_call(vec)
+    np.testing.assert_allclose(client.flip_vector(vec), vec[::-1])
+
+    assert "Unary" not in capsys.readouterr().out
+
+    # ... unless the result is a scalar
+    assert client._use_unary_call(vec, result_shape=(1,))
+
+    # ... since the server refuses to answer them within a single message
+    with pytest.raises(grpc.RpcError) as error:
+        grpc_stub.FlipVectorUnary(client._generate_unary_request("vectors", vec))
+    assert "exceeds a single message" in error.value.details()
+
+
+class _NoUnaryStub:
+    """Stub of a server which does not provide the unary calls."""
+
+    def __init__(self, stub):
+        self._stub = stub
+
+    def __getattr__(self, name):
+        if name.endswith("Unary"):
+            return self._unimplemented
+
+        return getattr(self._stub, name)
+
+    class _Unimplemented:
+        """Unary call which the server does not provide."""
+
+        def __call__(self, request, metadata=None):
+            error = grpc.RpcError()
+            error.code = lambda: grpc.StatusCode.UNIMPLEMENTED
+            raise error
+
+        def with_call(self, request, metadata=None):
+            return self(request, metadata)
+
+    _unimplemented = _Unimplemented()
+
+
+def test_unary_calls_fallback_grpc(grpc_stub):
+    """Unit test to verify that the client performs all operations by streaming
+    calls if the server does not provide the unary calls."""
+
+    client = DemoGRPCClient(test=_NoUnaryStub(grpc_stub))
+    vec = vec_generator(4)
+
+    np.testing.assert_allclose(client.flip_vector(vec), vec[::-1])
+    assert not client._unary_calls
+    np.testing.assert_allclose(client.add_vectors(vec, vec), 2 * vec)
+
+
+@pytest.mark.parametrize("version", constants.PROTOCOL_VERSIONS)
+def test_protocol_versions_grpc(grpc_stub, version):
+    """Unit test to verify that streamed operations are performed with each version
+    of the streaming protocol, including operands decomposed in several chunks."""
+
+    client = DemoGRPCClient(protocol_version=version, test=grpc_stub)
+    client._unary_calls = False
+
+    vec = vec_generator(4)
+    np.testing.assert_allclose(client.flip_vector(vec), vec[::-1])
+
+    large_vec = np.arange(1_000_000, dtype=np.float64)
+    np.testing.assert_allclose(client.add_vectors(large_vec, large_vec), 2 * large_vec)
+
+    mat = mat_generator(3)
+    np.testing.assert_allclose(client.multiply_matrices(mat, mat), mat @ mat)
+
+    handle = client.upload(mat)
+    np.testing.assert_allclose(client.operate_matrices("add", handle, mat), 2 * mat)
+    assert client.release(handle)
+
+
+def test_protocol_header_grpc(grpc_stub):
+    """Unit test to verify that, with protocol version 2, the stream starts with a
+    header describing all operands, followed by payload-only chunk messages."""
+
+    client = DemoGRPCClient(protocol_version=2, test=grpc_stub)
+    vec = np.arange(1_000_000, dtype=np.float64)
+    mat = mat_generator(3)
+
+    md, chunks = client._generate_md("vectors", "vec", vec, vec[:5])
+    assert md == [
+        ("protocol-version", "2"),
+        ("chunk-size", str(constants.MAX_CHUNKSIZE)),
+    ]
+
+    header, *messages = client._generate_vector_stream(chunks, vec, vec[:5])
+    assert constants.read_stream_header(header, 1, "test") == [
+        (grpcdemo_pb2.DataType.Value("DOUBLE"), (1_000_000,), len(chunks[0])),
+        (grpcdemo_pb2.DataType.Value("DOUBLE"), (5,), 1),
+    ]
+    assert len(messages) == len(chunks[0]) + 1
+    for msg in messages:
+        assert not msg.HasField("header")
+        assert msg.ListFields()[0][0].name == "vector_as_chunk"
+        assert len(msg.ListFields()) == 1
+
+    _, chunks = client._generate_md("matrices", "mat", mat)
+    header, msg = client._generate_matrix_stream(chunks, mat)
+    assert header.header.operands[0].shape == [3, 3]
+    assert len(msg.ListFields()) == 1
+
+    # Single-message requests (unary calls) carry self-described operands instead
+    request = client._generate_unary_request("matrices", mat)
+    assert request.matrices[0].matrix_rows == 3
+
+    with pytest.raises(RuntimeError, match="Missing header"):
+        constants.read_stream_header(msg, 2, "test")
+
+    with pytest.raises(RuntimeError, match="Invalid protocol version"):
+        DemoGRPCClient(protocol_version=3, test=grpc_stub)
+
+
+def test_add_many_operands_grpc(grpc_stub, grpc_servicer):
+    """Unit test to verify that the server accumulates the sum of many operands
+    (decomposed in several chunks) as they are received."""
+
+    client = DemoGRPCClient(test=grpc_stub)
+    client._unary_calls = False
+
+    vecs = [np.random.default_rng(i).random(1_000_000) for i in range(5)]
+    np.testing.assert_allclose(client.add_vectors(*vecs), np.sum(vecs, axis=0))
+
+    mats = [np.random.default_rng(i).random((700, 700)) for i in range(5)]
+    np.testing.assert_allclose(client.add_matrices(*mats), np.sum(mats, axis=0))
+
+    int_vecs = [np.arange(10, dtype=np.int32)] * 3
+    int_sum = client.add_vectors(*int_vecs)
+    assert int_sum.dtype == np.int32
+    np.testing.assert_array_equal(int_sum, 3 * int_vecs[0])
+
+    # Only the sum is kept in memory by the server
+    md = {"full-vectors": "2", "vec1-messages": "1", "vec2-messages": "1"}
+    msgs = [
+        grpcdemo_pb2.Vector(
+            data_type=grpcdemo_pb2.DataType.Value("DOUBLE"),
+            vector_size=3,
+            vector_as_chunk=np.ones(3).tobytes(),
+        )
+    ] * 2
+    _, _, vector_list = grpc_servicer._get_vectors(iter(msgs), md, accumulate=True)
+    assert len(vector_list) == 1
+    np.testing.assert_array_equal(vector_list[0], 2 * np.ones(3))
+
+    with pytest.raises(grpc.RpcError, match="different sizes"):
+        client.add_vectors(vecs[0], vecs[1][:10], vecs[2])
+
+
+@pytest.mark.parametrize("version", constants.PROTOCOL_VERSIONS)
+def test_multiply_matrices_row_blocks_grpc(grpc_stub, grpc_servicer, version):
+    """Unit test to verify that the product of two matrices is computed and sent
+    by row blocks, each one being computed right before its chunk is sent."""
+
+    client = DemoGRPCClient(protocol_version=version, test=grpc_stub)
+    client._unary_calls = False
+
+    # Use sizes which require several chunks (above constants.MAX_CHUNKSIZE)
+    mat_1 = np.random.default_rng(1).random((1000, 1000))
+    mat_2 = np.random.default_rng(2).random((1000, 1000))
+    np.testing.assert_allclose(client.multiply_matrices(mat_1, mat_2), mat_1 @ mat_2)
+
+    int_mat = np.arange(9, dtype=np.int32).reshape(3, 3)
+    int_mult = client.multiply_matrices(int_mat, int_mat)
+    assert int_mult.dtype == np.int32
+    np.testing.assert_array_equal(int_mult, int_mat @ int_mat)
+
+    # Chunks made of partial rows compute all the rows they involve
+    result = np.full((3, 3), np.nan)
+    messages = grpc_servicer._matrix_product_messages(
+        [[4, 9]], result, mat_1[:3, :3], mat_2[:3, :3], version=version
+    )
+    if version == 2:
+        assert next(messages).HasField("header")
+
+    next(messages)
+    np.testing.assert_allclose(result[:2], mat_1[:2, :3] @ mat_2[:3, :3])
+    assert np.isnan(result[2]).all()
+
+    next(messages)
+    np.testing.assert_allclose(result, mat_1[:3, :3] @ mat_2[:3, :3])
+    assert next(messages, None) is None
+
+
+def test_select_compression():
+    """Unit test to verify that compression is skipped for small or incompressible
+    vectors and matrices."""
+
+    compressible = np.zeros((1000, 1000), dtype=np.int32)
+    incompressible = np.random.default_rng(1).random((1000, 1000))
+
+    for compression in ("gzip", "deflate"):
+        assert constants.select_compression(compression, compressible) == compression
+        assert constants.select_compression(compression, np.zeros(10)) == "none"
+        assert constants.select_compression(compression, incompressible) == "none"
+
+    # The largest array is the one sampled
+    assert constants.select_compression("gzip", compressible, np.ones(10)) == "gzip"
+    assert constants.select_compression("none", compressible) == "none"
+
+    with pytest.raises(RuntimeError, match="Invalid compression"):
+        constants.select_compression("zstd", compressible)
+
+
+@pytest.mark.parametrize("compression", list(constants.COMPRESSIONS))
+def test_compression_grpc(grpc_stub, compression):
+    """Unit test to verify that operations are performed with compressed messages,
+    as requested by the client."""
+
+    client = DemoGRPCClient(compression=compression, test=grpc_stub)
+    assert client.compression == compression
+
+    mat = np.tile(np.arange(1000, dtype=np.int32), (1000, 1))
+    np.testing.assert_array_equal(client.add_matrices(mat, mat), 2 * mat)
+
+    vec = np.random.default_rng(1).random(1_000_000)
+    np.testing.assert_allclose(client.flip_vector(vec), vec[::-1])
+
+    md, _ = client._generate_md("matrices", "mat", mat)
+    assert ("compression", compression) in md
+
+    with pytest.raises(RuntimeError, match="Invalid compression"):
+        client.compression = "zstd"
+
+
+def test_server_compression_grpc():
+    """Unit test to verify that the server compresses its responses as requested by
+    the client, or by default otherwise (if worth it)."""
+    from ansys.eigen.python.grpc.server import GRPCDemoServicer
+
+    class Context:
+        def set_compression(self, compression):
+            self.compression = compression
+
+    servicer = GRPCDemoServicer(compression="gzip")
+    context = Context()
+    mat = np.zeros((1000, 1000), dtype=np.int32)
+
+    servicer._set_compression(context, {}, mat)
+    assert context.compression == grpc.Compression.Gzip
+
+    servicer._set_compression(context, {"compression": "deflate"}, mat)
+    assert context.compression == grpc.Compression.Deflate
+
+    servicer._set_compression(context, {}, mat[:10, :10])
+    assert context.compression == grpc.Compression.NoCompression
+
+    with pytest.raises(RuntimeError, match="Invalid compression"):
+        GRPCDemoServicer(compression="zstd")
+
+
+def test_chunk_size_grpc(grpc_stub):
+    """Unit test to verify that the chunk size is requested by the client, and used
+    by the server for its response."""
+
+    client = DemoGRPCClient(
+        protocol_version=1, chunk_size=constants.MIN_CHUNKSIZE, test=grpc_stub
+    )
+    vec = np.random.default_rng(1).random(1_000_000)
+    np.testing.assert_allclose(client.flip_vector(vec), vec[::-1])
+
+    md, chunks = client._generate_md("vectors", "vec", vec)
+    assert ("chunk-size", str(constants.MIN_CHUNKSIZE)) in md
+    assert len(chunks[0]) == -(-vec.nbytes // constants.MIN_CHUNKSIZE)
+
+    call = grpc_stub.FlipVector(
+        client._generate_vector_stream(chunks, vec), metadata=md
+    )
+    response_md = dict(call.initial_metadata())
+    assert response_md["vec1-messages"] == str(len(chunks[0]))
+    assert response_md["max-message-length"] == str(constants.MAX_MESSAGE_LENGTH)
+    np.testing.assert_allclose(client._read_nparray_from_vector(call)[0], vec[::-1])
+
+    with pytest.raises(RuntimeError, match="Invalid chunk size"):
+        DemoGRPCClient(chunk_size=1024, test=grpc_stub)
+
+    with pytest.raises(RuntimeError, match="Invalid chunk size"):
+        DemoGRPCClient(chunk_size=constants.MAX_MESSAGE_LENGTH, test=grpc_stub)
+
+
+def test_chunk_size_tuner(grpc_stub):
+    """Unit test to verify that the tuner tries every chunk size, and then selects the
+    one with the best throughput (besides trying its neighbours every few calls)."""
+    from ansys.eigen.python.grpc.client import ChunkSizeTuner
+
+    tuner = ChunkSizeTuner(explore=3)
+    limit = constants.MIN_CHUNKSIZE * 5
+    candidates = [constants.MIN_CHUNKSIZE * n for n in (1, 2, 4, 5)]
+
+    for candidate in candidates:
+        assert tuner.select(limit) == candidate
+        tuner.record(candidate, 1000, 1.0 if candidate != candidates[2] else 0.5)
+
+    assert tuner.select(limit) == candidates[2]
+    assert tuner.select(limit) == candidates[2]
+    assert tuner.select(limit) in (candidates[1], candidates[3])
+
+    # Recent measurements prevail
+    for _ in range(8):
+        tuner.record(candidates[2], 1000, 2.0)
+    assert tuner.select(limit) != candidates[2]
+
+    # Chunk sizes holding the largest operand are equivalent... so only the smallest
+    # of them is a candidate
+    tuner = ChunkSizeTuner(explore=3)
+    nbytes = constants.MIN_CHUNKSIZE * 3
+    for candidate in candidates[:3]:
+        assert tuner.select(limit, nbytes) == candidate
+        tuner.record(candidate, 1000, 1.0 if candidate != candidates[1] else 0.5)
+
+    assert tuner.select(limit, nbytes) == candidates[1]
+    assert tuner.select(limit, nbytes) == candidates[1]
+
+    client = DemoGRPCClient(chunk_size="auto", test=grpc_stub)
+    md, _ = client._generate_md("vectors", "vec", np.ones(10))
+    assert int(dict(md)["chunk-size"]) == constants.MIN_CHUNKSIZE
+
+
+def test_chunk_size_auto_grpc(grpc_stub):
+    """Unit test to verify that the client settles on the best chunk size measured,
+    even when its operands are smaller than the largest chunk size allowed."""
+
+    # Operands of 3 MB, while chunks of up to 4 MB are allowed
+    client = DemoGRPCClient(chunk_size="auto", test=grpc_stub)
+    mat = np.random.default_rng(1).random((3, 1024 * 128))
+    limit = client._max_chunk_size()
+    assert mat.nbytes < limit
+
+    # Every candidate (up to the first one holding the operands) is measured
+    for _ in range(7):
+        np.testing.assert_allclose(client.add_matrices(mat, mat), 2 * mat)
+
+    tuner = client._tuner
+    assert sorted(tuner._throughputs) == tuner._candidates(limit, mat.nbytes)
+    assert len(tuner._throughputs) == 7
+
+    # ... and the best of them is selected afterwards
+    best = max(tuner._throughputs, key=tuner._mean_throughput)
+    assert tuner.select(limit, mat.nbytes) == best
+
+    # Small operands, sent within a single message (unary calls), do not involve the
+    # tuner (which would never measure these calls)
+    small = mat[:, :16]
+    tuner.select = None
+    np.testing.assert_allclose(client.add_matrices(small, small), 2 * small)
+    np.testing.assert_allclose(client.flip_vector(small[0]), small[0][::-1])
+
+
+def test_max_message_length_grpc():
+    """Unit test to verify that larger operands are sent within a single message, once
+    both the client and the server allow for longer messages."""
+    from concurrent import futures
+
+    from ansys.eigen.python.grpc.generated.grpcdemo_pb2_grpc import (
+        add_GRPCDemoServicer_to_server,
+    )
+    from ansys.eigen.python.grpc.server import GRPCDemoServicer, _server_options
+
+    max_message_length = constants.MAX_MESSAGE_LENGTH * 4
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=2),
+        options=_server_options(max_message_length),
+    )
+    add_GRPCDemoServicer_to_server(
+        GRPCDemoServicer(max_message_length=max_message_length), server
+    )
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+
+    try:
+        client = DemoGRPCClient(port=port, max_message_length=max_message_length)
+        vec = np.random.default_rng(1).random(1_000_000)
+
+        # Until the server states its limit, the default one is assumed
+        assert not client._use_unary_call(vec)
+        np.testing.assert_allclose(client.add_vectors(vec, vec), 2 * vec)
+        assert client._server_max_message_length == max_message_length
+
+        assert client._use_unary_call(vec, vec)
+        np.testing.assert_allclose(client.add_vectors(vec, vec), 2 * vec)
+        np.testing.assert_allclose(client.flip_vector(vec), vec[::-1])
+    finally:
+        server.stop(None)
+
+
+@pytest.mark.parametrize("compute_dtype", ["float64", "float32"])
+@pytest.mark.parametrize("transport_dtype", ["float32", "float16"])
+def test_transport_dtype_grpc(grpc_stub, transport_dtype, compute_dtype):
+    """Unit test to verify that operands and results are transmitted with a reduced
+    precision, as requested by the client, and that the error introduced is reported."""
+
+    client = DemoGRPCClient(
+        transport_dtype=transport_dtype, compute_dtype=compute_dtype, test=grpc_stub
+    )
+    assert client.transport_error is None
+
+    # Keep the values within the normal range of float16
+    rng = np.random.default_rng(1)
+    mat_1 = rng.random((500, 500)) + 0.5
+    mat_2 = rng.random((500, 500)) + 0.5
+    eps = np.finfo(constants.TRANSPORT_DTYPES[transport_dtype]).eps
+
+    # Streamed (and unary) calls
+    for unary_calls in (False, True):
+        client._unary_calls = unary_calls
+
+        mat_add = client.add_matrices(mat_1, mat_2)
+        assert mat_add.dtype == np.float64
+        np.testing.assert_allclose(mat_add, mat_1 + mat_2, rtol=4 * eps)
+        assert 0 < client.transport_error <= eps / 2
+
+        mat_mult = client.multiply_matrices(mat_1, mat_2)
+        # (float32 products accumulate their own rounding errors)
+        np.testing.assert_allclose(
+            mat_mult, np.matmul(mat_1, mat_2), rtol=max(4 * eps, 1e-5)
+        )
+        assert 0 < client.transport_error <= eps / 2
+
+    # Unary calls compute (and transmit the result) with the requested precisions too
+    mat_s = rng.random((20, 20)) + 0.5
+    client._unary_calls = True
+    assert client._use_unary_call(mat_s, mat_s)
+    mat_unary = client.multiply_matrices(mat_s, mat_s)
+    assert 0 < client.transport_error <= eps / 2
+    client._unary_calls = False
+    np.testing.assert_array_equal(mat_unary, client.multiply_matrices(mat_s, mat_s))
+
+    # Integer operands are transmitted as such
+    vec = np.arange(10, dtype=np.int32)
+    np.testing.assert_array_equal(client.add_vectors(vec, vec), 2 * vec)
+    assert client.transport_error == 0
+
+    # Uploads and sessions report the error introduced on their operands as well
+    client.upload(mat_1)
+    assert 0 < client.transport_error <= eps / 2
+
+    client.add_vectors(vec, vec)
+    with client.session() as session:
+        vec_add = session.add_vectors(mat_1[0], mat_2[0])
+    np.testing.assert_allclose(vec_add, mat_1[0] + mat_2[0], rtol=4 * eps)
+    assert 0 < client.transport_error <= eps / 2
+
+    # Each thread sees the error of its own operations
+    thread_errors = []
+
+    def add_integers():
+        client.add_vectors(vec, vec)
+        thread_errors.append(client.transport_error)
+
+    thread = threading.Thread(target=add_integers)
+    thread.start()
+    thread.join()
+    assert thread_errors == [0]
+    assert 0 < client.transport_error <= eps / 2
+
+    md, chunks = client._generate_md("vectors", "vec", np.ones(1_000_000))
+    assert ("transport-dtype", transport_dtype) in md
+    assert ("compute-dtype", compute_dtype) in md
+    assert len(chunks[0]) == 1 if transport_dtype == "float16" else 2
+
+
+def test_transport_dtype_errors(grpc_stub):
+    """Unit test to verify the checks of the reduced precisions, and the measurement of
+    the error introduced (which is infinite on overflows)."""
+
+    with pytest.raises(RuntimeError, match="Invalid transport precision"):
+        DemoGRPCClient(transport_dtype="bfloat16", test=grpc_stub)
+
+    with pytest.raises(RuntimeError, match="Invalid compute precision"):
+        DemoGRPCClient(
+            transport_dtype="float16", compute_dtype="float16", test=grpc_stub
+        )
+
+    exact = np.array([0.0, 1.0, 1.0 + 2**-20, np.inf])
+    assert constants.max_relative_error(exact, exact.astype(np.float32)) == 0
+    assert constants.max_relative_error(exact, exact.astype(np.float16)) > 0
+
+    with np.errstate(over="ignore"):
+        exact = np.array([1.0, 1e6])
+        assert constants.max_relative_error(exact, exact.astype(np.float16)) == np.inf
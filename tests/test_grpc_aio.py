@@ -0,0 +1,501 @@
+import asyncio
+import threading
+
+import grpc
+import numpy as np
+import pytest
+
+from ansys.eigen.python.grpc.client import AsyncDemoGRPCClient, DemoGRPCClient
+from ansys.eigen.python.testing.test_tools import (
+    SIZES,
+    SIZES_IDS,
+    mat_generator,
+    vec_generator,
+)
+
+# ================================================================================
+# Deploy the asyncio-based server to test the client-server interaction
+#
+# The server runs on an event loop in a background thread, and the (blocking)
+# client connects to it through an actual channel. This verifies that both
+# server implementations are compatible with the same client. The asyncio-based
+# client runs its own event loop (in the main thread) against the same server.
+# ================================================================================
+
+
+@pytest.fixture(scope="module")
+def aio_server_port():
+    from ansys.eigen.python.grpc.generated.grpcdemo_pb2_grpc import (
+        add_GRPCDemoServicer_to_server,
+    )
+    from ansys.eigen.python.grpc.server import AsyncGRPCDemoServicer
+
+    # Run an event loop in a background thread
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    # Deploy the server within the event loop (on any available port)
+    async def start_server():
+        server = grpc.aio.server()
+        add_GRPCDemoServicer_to_server(AsyncGRPCDemoServicer(), server)
+        port = server.add_insecure_port("127.0.0.1:0")
+        await server.start()
+        return server, port
+
+    server, port = asyncio.run_coroutine_threadsafe(start_server(), loop).result()
+
+    yield port
+
+    # Stop the server and the event loop
+    asyncio.run_coroutine_threadsafe(server.stop(None), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+
+
+@pytest.fixture(scope="module")
+def aio_client(aio_server_port):
+    return DemoGRPCClient(ip="127.0.0.1", port=aio_server_port, timeout=5)
+
+
+# ================================================================================
+# Unit tests for client-server interaction
+# ================================================================================
+
+
+def test_greeting_grpc_aio(capsys, aio_client):
+    """Unit test to verify that the client gets the expected response
+    when performing a simple greeting request."""
+
+    aio_client.request_greeting("Michael")
+
+    captured = capsys.readouterr()
+    assert "The server answered: Hello, Michael!\n" in captured.out
+
+
+@pytest.mark.parametrize("sz", SIZES, ids=SIZES_IDS)
+def test_flip_vector_grpc_aio(aio_client, sz):
+    """Unit test to verify that the client gets the expected response
+    when performing a simple vector-flipping request."""
+
+    vec_1 = vec_generator(sz)
+
+    vec_flip = aio_client.flip_vector(vec_1)
+
+    np.testing.assert_allclose(vec_flip, np.flip(vec_1))
+
+
+@pytest.mark.parametrize("sz", SIZES, ids=SIZES_IDS)
+def test_add_vectors_grpc_aio(aio_client, sz):
+    """Unit test to verify that the client gets the expected response
+    when performing the addition of four numpy arrays (as vectors)."""
+
+    vec_1 = vec_generator(sz)
+    vec_2 = vec_generator(sz)
+    vec_3 = vec_generator(sz)
+    vec_4 = vec_generator(sz)
+
+    vec_add = aio_client.add_vectors(vec_1, vec_2, vec_3, vec_4)
+    np.testing.assert_allclose(vec_add, vec_1 + vec_2 + vec_3 + vec_4)
+
+
+@pytest.mark.parametrize("sz", SIZES, ids=SIZES_IDS)
+def test_multiply_vectors_grpc_aio(aio_client, sz):
+    """Unit test to verify that the client gets the expected response
+    when performing the multiplication of two numpy arrays (as vectors)."""
+
+    vec_1 = vec_generator(sz)
+    vec_2 = vec_generator(sz)
+
+    vec_mult = aio_client.multiply_vectors(vec_1, vec_2)
+    np.testing.assert_allclose(vec_mult, vec_1.dot(vec_2))
+
+
+@pytest.mark.parametrize("sz", SIZES, ids=SIZES_IDS)
+def test_add_matrices_grpc_aio(aio_client, sz):
+    """Unit test to verify that the client gets the expected response
+    when performing the addition of two numpy arrays (as matrices)."""
+
+    mat_1 = mat_generator(sz)
+    mat_2 = mat_generator(sz)
+
+    mat_add = aio_client.add_matrices(mat_1, mat_2)
+
+    np.testing.assert_allclose(mat_add, mat_1 + mat_2)
+
+
+@pytest.mark.parametrize("sz", SIZES, ids=SIZES_IDS)
+def test_multiply_matrices_grpc_aio(aio_client, sz):
+    """Unit test to verify that the client gets the expected response
+    when performing the multiplication of two numpy arrays (as matrices)."""
+
+    mat_1 = mat_generator(sz)
+    mat_2 = mat_generator(sz)
+
+    mat_mult = aio_client.multiply_matrices(mat_1, mat_2)
+
+    np.testing.assert_allclose(mat_mult, np.matmul(mat_1, mat_2))
+
+
+def test_multiply_large_matrices_grpc_aio(aio_client):
+    """Unit test to verify that the asyncio-based server computes and sends the
+    product of two matrices by row blocks."""
+
+    # Use sizes which require several chunks (above constants.MAX_CHUNKSIZE)
+    mat_1 = np.random.default_rng(1).random((1000, 1000))
+    mat_2 = np.random.default_rng(2).random((1000, 1000))
+
+    mat_mult = aio_client.multiply_matrices(mat_1, mat_2)
+
+    np.testing.assert_allclose(mat_mult, mat_1 @ mat_2)
+
+
+# ================================================================================
+# Unit tests for the asyncio-based client
+# ================================================================================
+
+
+@pytest.mark.parametrize("sz", SIZES, ids=SIZES_IDS)
+def test_concurrent_ops_grpc_aio_client(aio_server_port, sz):
+    """Unit test to verify that the asyncio-based client gets the expected responses
+    when performing all operations concurrently over the same channel."""
+
+    vec_1 = vec_generator(sz)
+    vec_2 = vec_generator(sz)
+    mat_1 = mat_generator(sz)
+    mat_2 = mat_generator(sz)
+
+    async def run_ops():
+        async with AsyncDemoGRPCClient(port=aio_server_port, timeout=5) as client:
+            return await asyncio.gather(
+                client.flip_vector(vec_1),
+                client.add_vectors(vec_1, vec_2),
+                client.multiply_vectors(vec_1, vec_2),
+                client.add_matrices(mat_1, mat_2),
+                client.multiply_matrices(mat_1, mat_2),
+            )
+
+    vec_flip, vec_add, vec_mult, mat_add, mat_mult = asyncio.run(run_ops())
+
+    np.testing.assert_allclose(vec_flip, np.flip(vec_1))
+    np.testing.assert_allclose(vec_add, vec_1 + vec_2)
+    np.testing.assert_allclose(vec_mult, vec_1.dot(vec_2))
+    np.testing.assert_allclose(mat_add, mat_1 + mat_2)
+    np.testing.assert_allclose(mat_mult, np.matmul(mat_1, mat_2))
+
+
+def test_max_in_flight_grpc_aio_client(aio_server_port):
+    """Unit test to verify that the asyncio-based client never has more operations
+    in flight than allowed."""
+
+    vectors = [vec_generator(100000) for _ in range(8)]
+    in_flight = {"now": 0, "peak": 0}
+
+    async def run_ops():
+        async with AsyncDemoGRPCClient(
+            port=aio_server_port, timeout=5, max_in_flight=2
+        ) as client:
+            # Track the calls whose responses are being read
+            parse_vectors = client._parse_vectors
+
+            def tracked_parse_vectors(response_md):
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+                try:
+                    return (yield from parse_vectors(response_md))
+                finally:
+                    in_flight["now"] -= 1
+
+            client._parse_vectors = tracked_parse_vectors
+
+            return await asyncio.gather(*[client.flip_vector(vec) for vec in vectors])
+
+    results = asyncio.run(run_ops())
+
+    assert in_flight["peak"] <= 2
+    for vec, vec_flip in zip(vectors, results):
+        np.testing.assert_allclose(vec_flip, np.flip(vec))
+
+
+def test_errors_grpc_aio_client():
+    """Unit test to verify the asyncio-based client error conditions."""
+
+    async def connect():
+        async with AsyncDemoGRPCClient(port=1, timeout=0.5):
+            pass
+
+    # Test 1: Check that an unreachable server raises an IOError
+    with pytest.raises(IOError, match="Unable to connect to server at 127.0.0.1:1"):
+        asyncio.run(connect())
+
+    # Test 2: Check that at least one operation in flight is required
+    with pytest.raises(RuntimeError, match="Invalid max_in_flight value"):
+        AsyncDemoGRPCClient(max_in_flight=0, test=object())
+
+    # Test 3: Check that clients of test stubs (without channel) can be closed
+    async def close():
+        async with AsyncDemoGRPCClient(test=object()) as client:
+            assert client.channel is None
+        await client.close()
+
+    asyncio.run(close())
+
+
+def test_batched_operation_grpc_aio_client(aio_server_port):
+    """Unit test to verify that the asyncio-based client gets the expected response
+    when performing an operation over two stacks of matrices."""
+
+    stack_1 = np.random.default_rng(1).random((100, 3, 3))
+    stack_2 = np.random.default_rng(2).random((100, 3, 3))
+
+    async def run_op():
+        async with AsyncDemoGRPCClient(port=aio_server_port, timeout=5) as client:
+            return await client.batched_operation("multiply_matrices", stack_1, stack_2)
+
+    np.testing.assert_allclose(asyncio.run(run_op()), np.matmul(stack_1, stack_2))
+
+
+def test_resident_arrays_grpc_aio_client(aio_server_port):
+    """Unit test to verify that the asyncio-based client gets the expected response
+    when operating matrices stored on the server side."""
+
+    mat_1 = np.random.default_rng(1).random((20, 20))
+    mat_2 = np.random.default_rng(2).random((20, 20))
+
+    async def run_ops():
+        async with AsyncDemoGRPCClient(port=aio_server_port, timeout=5) as client:
+            handle = await client.upload(mat_1)
+            results = await asyncio.gather(
+                client.operate_matrices("multiply", handle, mat_2),
+                client.operate_matrices("add", handle, handle),
+            )
+            released = await client.release(handle)
+
+            # Once released, the handle is unknown to the server
+            with pytest.raises(grpc.RpcError, match="Unknown handle"):
+                await client.operate_matrices("add", handle, mat_2)
+
+            return results, released
+
+    (mat_mult, mat_add), released = asyncio.run(run_ops())
+
+    assert released
+    np.testing.assert_allclose(mat_mult, np.matmul(mat_1, mat_2))
+    np.testing.assert_allclose(mat_add, 2 * mat_1)
+
+
+def test_pipeline_grpc_aio_client(aio_server_port):
+    """Unit test to verify that the asyncio-based client gets the expected response
+    when evaluating a pipeline of operations on the server side."""
+
+    mat_a = np.random.default_rng(1).random((10, 10))
+    mat_b = np.random.default_rng(2).random((10, 10))
+
+    async def run_pipeline():
+        async with AsyncDemoGRPCClient(port=aio_server_port, timeout=5) as client:
+            pipe = client.pipeline()
+            a, b = pipe.operand(mat_a), pipe.operand(mat_b)
+            return await pipe.evaluate(
+                pipe.add_matrices(pipe.multiply_matrices(a, b), a)
+            )
+
+    (result,) = asyncio.run(run_pipeline())
+
+    np.testing.assert_allclose(result, np.matmul(mat_a, mat_b) + mat_a)
+
+
+def test_session_grpc_aio_client(aio_server_port):
+    """Unit test to verify that the asyncio-based client gets the expected responses
+    when performing several (pipelined) operations within a session."""
+
+    vecs = [np.random.default_rng(seed).random(32) for seed in range(10)]
+
+    async def run_session():
+        async with AsyncDemoGRPCClient(port=aio_server_port, timeout=5) as client:
+            async with client.session() as session:
+                results = await asyncio.gather(
+                    *[session.multiply_vectors(vec, vecs[0]) for vec in vecs],
+                    session.multiply_matrices(np.ones((2, 3)), np.ones((2, 3))),
+                    return_exceptions=True,
+                )
+
+        return results
+
+    results = asyncio.run(run_session())
+
+    for vec, result in zip(vecs, results):
+        np.testing.assert_allclose(result, [np.dot(vec, vecs[0])])
+
+    # The failed operation does not affect the rest
+    assert isinstance(results[-1], RuntimeError)
+    assert "Only square matrices are allowed" in str(results[-1])
+
+    # No operations are allowed once the session is closed
+    async def closed_session():
+        async with AsyncDemoGRPCClient(port=aio_server_port, timeout=5) as client:
+            async with client.session() as session:
+                pass
+            await session.submit("flip_vector", np.ones(3))
+
+    with pytest.raises(RuntimeError, match="Session closed"):
+        asyncio.run(closed_session())
+
+
+@pytest.mark.parametrize("version", [1, 2])
+def test_protocol_versions_grpc_aio_client(aio_server_port, version):
+    """Unit test to verify that the asyncio-based client and server perform streamed
+    operations with each version of the streaming protocol."""
+
+    mat_1 = np.random.default_rng(1).random((700, 700))
+    mat_2 = np.random.default_rng(2).random((700, 700))
+
+    async def run_ops():
+        async with AsyncDemoGRPCClient(
+            port=aio_server_port, timeout=5, protocol_version=version
+        ) as client:
+            client._unary_calls = False
+            return await asyncio.gather(
+                client.multiply_matrices(mat_1, mat_2),
+                client.add_vectors(mat_1[0], mat_1[1]),
+            )
+
+    mat_mult, vec_add = asyncio.run(run_ops())
+
+    np.testing.assert_allclose(mat_mult, np.matmul(mat_1, mat_2))
+    np.testing.assert_allclose(vec_add, mat_1[0] + mat_1[1])
+
+
+@pytest.mark.parametrize("compression", ["gzip", "deflate"])
+def test_compression_grpc_aio_client(aio_server_port, compression):
+    """Unit test to verify that the asyncio-based client and server perform streamed
+    operations with compressed messages."""
+
+    mat = np.tile(np.arange(700, dtype=np.int32), (700, 1))
+
+    async def run_ops():
+        async with AsyncDemoGRPCClient(
+            port=aio_server_port, timeout=5, compression=compression
+        ) as client:
+            handle = await client.upload(mat)
+            return await asyncio.gather(
+                client.add_matrices(mat, mat),
+                client.operate_matrices("add", handle, mat),
+            )
+
+    mat_add, mat_operate = asyncio.run(run_ops())
+
+    np.testing.assert_array_equal(mat_add, 2 * mat)
+    np.testing.assert_array_equal(mat_operate, 2 * mat)
+
+
+def test_chunk_size_auto_grpc_aio_client(aio_server_port):
+    """Unit test to verify that the asyncio-based client tunes the chunk size from the
+    throughput of its streamed operations."""
+
+    mats = [np.random.default_rng(i).random((700, 700)) for i in range(2)]
+
+    async def run_ops():
+        async with AsyncDemoGRPCClient(
+            port=aio_server_port, timeout=5, chunk_size="auto"
+        ) as client:
+            results = [await client.add_matrices(*mats) for _ in range(3)]
+            return results, client._tuner
+
+    results, tuner = asyncio.run(run_ops())
+
+    for mat_add in results:
+        np.testing.assert_allclose(mat_add, mats[0] + mats[1])
+    assert len(tuner._throughputs) == 3
+
+
+def test_transport_dtype_grpc_aio_client(aio_server_port):
+    """Unit test to verify that the asyncio-based client and server transmit operands
+    and results with a reduced precision (with both protocol versions)."""
+
+    rng = np.random.default_rng(1)
+    mat_1 = rng.random((600, 600)) + 0.5
+    mat_2 = rng.random((600, 600)) + 0.5
+
+    async def run_ops(version):
+        async with AsyncDemoGRPCClient(
+            port=aio_server_port,
+            timeout=5,
+            protocol_version=version,
+            transport_dtype="float32",
+        ) as client:
+            mat_mult = await client.multiply_matrices(mat_1, mat_2)
+            return mat_mult, client.transport_error
+
+    for version in (1, 2):
+        mat_mult, error = asyncio.run(run_ops(version))
+
+        np.testing.assert_allclose(mat_mult, np.matmul(mat_1, mat_2), rtol=1e-6)
+        assert 0 < error <= np.finfo(np.float32).eps / 2
+
+    # Concurrent operations report their own error (integers are transmitted as such)
+    mat_3 = np.arange(360000, dtype=np.int32).reshape(600, 600)
+
+    async def run_concurrent_ops():
+        async with AsyncDemoGRPCClient(
+            port=aio_server_port, timeout=5, transport_dtype="float32"
+        ) as client:
+
+            async def add(mat):
+                await client.add_matrices(mat, mat)
+                await asyncio.sleep(0.1)
+                return client.transport_error
+
+            return await asyncio.gather(add(mat_1), add(mat_3), client.upload(mat_1))
+
+    error_float, error_int, _ = asyncio.run(run_concurrent_ops())
+
+    assert 0 < error_float <= np.finfo(np.float32).eps / 2
+    assert error_int == 0
+
+    # Unary calls compute (and transmit the result) with the requested precisions too
+    mat_s = rng.random((20, 20)) + 0.5
+
+    async def run_unary_and_streamed_ops():
+        async with AsyncDemoGRPCClient(
+            port=aio_server_port,
+            timeout=5,
+            transport_dtype="float32",
+            compute_dtype="float32",
+        ) as client:
+            mat_unary = await client.multiply_matrices(mat_s, mat_s)
+            error = client.transport_error
+            client._unary_calls = False
+            return mat_unary, error, await client.multiply_matrices(mat_s, mat_s)
+
+    mat_unary, error, mat_streamed = asyncio.run(run_unary_and_streamed_ops())
+
+    np.testing.assert_array_equal(mat_unary, mat_streamed)
+    assert 0 < error <= np.finfo(np.float32).eps / 2
+
+
+def test_stream_parsing_grpc_aio_server():
+    """Unit test to verify that the asyncio-based server parses the received messages
+    outside the event loop, so that other calls can progress during large transfers."""
+    from ansys.eigen.python.grpc.server import AsyncGRPCDemoServicer
+
+    threads = []
+
+    def parser():
+        # Record the thread parsing each message... and return them all once done
+        messages = []
+        while len(messages) < 3:
+            messages.append((yield))
+            threads.append(threading.get_ident())
+        return messages
+
+    async def requests():
+        for msg in ("a", "b", "c", "d"):
+            yield msg
+
+    async def consume():
+        servicer = AsyncGRPCDemoServicer()
+        return await servicer._aconsume_stream(parser(), requests())
+
+    assert asyncio.run(consume()) == ["a", "b", "c"]
+    assert len(threads) == 3
+    assert threading.get_ident() not in threads
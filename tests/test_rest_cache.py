@@ -0,0 +1,77 @@
+import os
+
+import numpy as np
+import pytest
+
+from ansys.eigen.python.rest.restdb.cache import ArrayCache
+
+
+def test_array_cache():
+    """Unit test to verify that the cache keeps the most recently used arrays
+    within its budget, counting its hits and misses."""
+    cache = ArrayCache(budget=3 * 80)
+
+    arrays = {id: np.full(10, id, dtype=np.float64) for id in range(1, 5)}
+    for id in (1, 2, 3):
+        assert cache.put(id, arrays[id])
+
+    assert len(cache) == 3
+    assert cache.nbytes == 240
+
+    # Cached arrays are no longer writable
+    assert not arrays[1].flags.writeable
+
+    # Using the first array makes the second one the least recently used... and evicted
+    np.testing.assert_array_equal(cache.get(1), arrays[1])
+    assert cache.put(4, arrays[4])
+    assert cache.get(2) is None
+    np.testing.assert_array_equal(cache.get(4), arrays[4])
+
+    assert len(cache) == 3
+    assert cache.nbytes == 240
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    # Caching an array again replaces the previous one
+    assert cache.put(4, np.zeros(5))
+    assert cache.nbytes == 200
+
+    # Arrays exceeding the budget are not cached
+    assert not cache.put(5, np.zeros(31))
+    assert cache.get(5) is None
+    assert len(cache) == 3
+
+    # Clearing the cache evicts all its arrays
+    cache.clear()
+    assert (len(cache), cache.nbytes) == (0, 0)
+    assert cache.get(1) is None
+
+    # Disabled caches do not keep anything
+    disabled = ArrayCache(budget=0)
+    assert not disabled.put(1, np.zeros(1))
+    assert disabled.get(1) is None
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork")
+def test_array_cache_fork():
+    """Unit test to verify that a forked process keeps a copy of the cached arrays,
+    with its own lock and counters."""
+    cache = ArrayCache(budget=1024)
+    cache.put(1, np.ones(4))
+    cache.get(1)
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # Child process: report whether the cache was reset as expected
+        os.close(read_fd)
+        ok = (cache.hits, cache.misses) == (0, 0) and cache.get(1) is not None
+        os.write(write_fd, b"1" if ok and cache.hits == 1 else b"0")
+        os._exit(0)
+
+    os.close(write_fd)
+    result = os.read(read_fd, 1)
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+
+    assert result == b"1"
+    assert (cache.hits, cache.misses) == (1, 0)
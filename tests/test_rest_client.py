@@ -206,3 +206,42 @@ def test_client_errors_rest(testing_client):
             str(e_info.value)
             == "Could not connect to server... Check server status or connection details."
         )
+
+
+@pytest.mark.parametrize("store_operands", [False, True])
+@pytest.mark.parametrize("payload_format", ["binary", "npy", "json"])
+def test_client_payload_formats_rest_cli(
+    testing_client, payload_format, store_operands
+):
+    """Unit test to verify that the client gets the expected response
+    when exchanging the arrays in each of the handled payload formats, either
+    storing the operands in the server or not."""
+    client = DemoRESTClient(
+        None,
+        None,
+        client=testing_client,
+        payload_format=payload_format,
+        store_operands=store_operands,
+    )
+
+    vec_1 = vec_generator(8)
+    vec_2 = vec_generator(8)
+    mat_1 = mat_generator(8)
+    mat_2 = mat_generator(8)
+
+    np.testing.assert_allclose(client.add(vec_1, vec_2), vec_1 + vec_2)
+    np.testing.assert_allclose(client.multiply(vec_1, vec_2), vec_1.dot(vec_2))
+    np.testing.assert_allclose(client.add(mat_1, mat_2), mat_1 + mat_2)
+    np.testing.assert_allclose(client.multiply(mat_1, mat_2), np.matmul(mat_1, mat_2))
+
+    # The format is kept, since the server handles all of them (as well as the
+    # stateless operations)
+    assert client._payload_format == payload_format
+    assert client._use_compute
+
+    # Check that only the handled formats are allowed
+    with pytest.raises(RuntimeError) as e_info:
+        DemoRESTClient(None, None, client=testing_client, payload_format="xml")
+    assert (
+        str(e_info.value) == "Invalid payload format. Options are: binary, npy, json."
+    )
@@ -0,0 +1,225 @@
+import json
+import sqlite3
+
+import numpy as np
+import pytest
+
+import ansys.eigen.python.rest.restdb.db as db_module
+from ansys.eigen.python.rest.restdb.db import (
+    SCHEMA_VERSION,
+    array_metadata,
+    get_db,
+    get_generation,
+    insert_array,
+    load_array,
+    migrate_db,
+)
+from ansys.eigen.python.rest.server import create_app
+
+# Schema of the database before storing the arrays as raw bytes (version 0)
+LEGACY_SCHEMA = """
+CREATE TABLE types (
+  eigen_type TEXT NOT NULL,
+  PRIMARY KEY (eigen_type)
+);
+
+CREATE TABLE eigen_db (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  eigen_type TEXT NOT NULL,
+  eigen_value TEXT NOT NULL,
+  FOREIGN KEY (eigen_type) REFERENCES types (eigen_type)
+);
+
+INSERT INTO types (eigen_type) VALUES ('VECTOR');
+INSERT INTO types (eigen_type) VALUES ('MATRIX');
+"""
+
+# Schema of the database before memoizing the results of the operations (version 1)
+V1_SCHEMA = """
+CREATE TABLE types (
+  eigen_type TEXT NOT NULL,
+  PRIMARY KEY (eigen_type)
+);
+
+CREATE TABLE eigen_db (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  eigen_type TEXT NOT NULL,
+  dtype TEXT NOT NULL,
+  rows INTEGER NOT NULL,
+  cols INTEGER,
+  nbytes INTEGER NOT NULL,
+  eigen_value BLOB NOT NULL,
+  FOREIGN KEY (eigen_type) REFERENCES types (eigen_type)
+);
+
+INSERT INTO types (eigen_type) VALUES ('VECTOR');
+INSERT INTO types (eigen_type) VALUES ('MATRIX');
+
+PRAGMA user_version = 1;
+"""
+
+
+@pytest.fixture(scope="module")
+def app():
+    # Create the app
+    app = create_app()
+    app.testing = True
+
+    # Establish an application context
+    with app.app_context():
+        yield app
+
+
+def test_db_arrays(app):
+    """Unit test to verify that the arrays are stored and loaded back as raw bytes,
+    keeping their dtype and shape."""
+    db = get_db()
+
+    vec = np.array([1, 2, 3, 4], dtype=np.float32)
+    mat = np.arange(6, dtype=np.float64).reshape(2, 3)
+
+    id_vec = insert_array(db, "VECTOR", vec)
+    id_mat = insert_array(db, "MATRIX", mat)
+
+    # Check the metadata of the arrays
+    metadata = array_metadata(db, id_vec)
+    assert tuple(metadata) == ("VECTOR", "<f4", 4, None, 16)
+    metadata = array_metadata(db, id_mat)
+    assert tuple(metadata) == ("MATRIX", "<f8", 2, 3, 48)
+
+    # Check the values of the arrays
+    loaded = load_array(db, id_vec, "VECTOR")
+    assert loaded.dtype == np.float32
+    np.testing.assert_array_equal(loaded, vec)
+    loaded = load_array(db, id_mat, "MATRIX")
+    np.testing.assert_array_equal(loaded, mat)
+
+    # Check that there is no array for unknown IDs (or types)
+    assert load_array(db, id_vec, "MATRIX") is None
+    assert load_array(db, 0, "VECTOR") is None
+    assert array_metadata(db, 0) is None
+
+
+def test_db_migration(app, tmp_path):
+    """Unit test to verify that a database storing the arrays as JSON text is migrated
+    to the current schema, keeping its arrays (and their IDs)."""
+    db = sqlite3.connect(tmp_path / "legacy.sqlite")
+    db.row_factory = sqlite3.Row
+    db.executescript(LEGACY_SCHEMA)
+    db.execute(
+        "INSERT INTO eigen_db(id, eigen_type, eigen_value) VALUES (?, ?, ?)",
+        (3, "VECTOR", json.dumps([1.0, 2.5])),
+    )
+    db.execute(
+        "INSERT INTO eigen_db(id, eigen_type, eigen_value) VALUES (?, ?, ?)",
+        (7, "MATRIX", json.dumps([[1.0, 2.0], [3.0, 4.0]])),
+    )
+    db.commit()
+
+    migrate_db(db)
+
+    assert db.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    np.testing.assert_array_equal(load_array(db, 3, "VECTOR"), [1.0, 2.5])
+    np.testing.assert_array_equal(load_array(db, 7, "MATRIX"), [[1.0, 2.0], [3.0, 4.0]])
+
+    # New arrays are inserted after the migrated ones
+    assert insert_array(db, "VECTOR", np.ones(2)) == 8
+
+    # Migrating a database in the current schema does nothing
+    migrate_db(db)
+    np.testing.assert_array_equal(load_array(db, 3, "VECTOR"), [1.0, 2.5])
+    db.close()
+
+    # Empty databases are initialized
+    db = sqlite3.connect(tmp_path / "empty.sqlite")
+    db.row_factory = sqlite3.Row
+    migrate_db(db)
+    assert db.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    assert insert_array(db, "MATRIX", np.ones((2, 2))) == 1
+    db.close()
+
+
+def test_db_migration_legacy_values(app, tmp_path, monkeypatch):
+    """Unit test to verify that the scalars stored by the legacy schema are converted,
+    while values which are not numeric vectors or matrices are skipped (all within a
+    single transaction)."""
+    db = sqlite3.connect(tmp_path / "legacy.sqlite")
+    db.row_factory = sqlite3.Row
+    db.executescript(LEGACY_SCHEMA)
+    for id, eigen_type, value in [
+        (1, "VECTOR", 2.5),
+        (2, "MATRIX", 4.0),
+        (3, "VECTOR", [[1.0], [2.0, 3.0]]),
+        (4, "MATRIX", [[[1.0]]]),
+        (5, "VECTOR", [1.0, 2.0]),
+    ]:
+        db.execute(
+            "INSERT INTO eigen_db(id, eigen_type, eigen_value) VALUES (?, ?, ?)",
+            (id, eigen_type, json.dumps(value)),
+        )
+    db.execute(
+        "INSERT INTO eigen_db(id, eigen_type, eigen_value) VALUES (?, ?, ?)",
+        (6, "VECTOR", "not json"),
+    )
+    db.commit()
+
+    migrate_db(db)
+
+    assert db.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    assert not db.execute(
+        "SELECT name FROM sqlite_master WHERE name = 'eigen_db_v0'"
+    ).fetchall()
+    np.testing.assert_array_equal(load_array(db, 1, "VECTOR"), [2.5])
+    np.testing.assert_array_equal(load_array(db, 2, "MATRIX"), [[4.0]])
+    np.testing.assert_array_equal(load_array(db, 5, "VECTOR"), [1.0, 2.0])
+    ids = [row["id"] for row in db.execute("SELECT id FROM eigen_db ORDER BY id")]
+    assert ids == [1, 2, 5]
+    db.close()
+
+    # A migration failing halfway leaves the database untouched (in the legacy schema)
+    db = sqlite3.connect(tmp_path / "failed.sqlite")
+    db.row_factory = sqlite3.Row
+    db.executescript(LEGACY_SCHEMA)
+    for id in (1, 2):
+        db.execute(
+            "INSERT INTO eigen_db(id, eigen_type, eigen_value) VALUES (?, ?, ?)",
+            (id, "VECTOR", json.dumps([1.0, 2.0])),
+        )
+    db.commit()
+
+    array_columns = getattr(db_module, "__array_columns")
+
+    def failing_array_columns(array):
+        if db.execute("SELECT COUNT(*) FROM eigen_db").fetchone()[0]:
+            raise MemoryError()
+        return array_columns(array)
+
+    monkeypatch.setattr(db_module, "__array_columns", failing_array_columns)
+    with pytest.raises(MemoryError):
+        migrate_db(db)
+
+    assert db.execute("PRAGMA user_version").fetchone()[0] == 0
+    tables = [
+        row["name"]
+        for row in db.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    ]
+    assert "eigen_db_v0" not in tables and "eigen_results" not in tables
+    assert db.execute("SELECT COUNT(*) FROM eigen_db").fetchone()[0] == 2
+    db.close()
+
+
+def test_db_migration_results(app, tmp_path):
+    """Unit test to verify that a database without memoized results is migrated to the
+    current schema, keeping its arrays."""
+    db = sqlite3.connect(tmp_path / "v1.sqlite")
+    db.row_factory = sqlite3.Row
+    db.executescript(V1_SCHEMA)
+    id = insert_array(db, "MATRIX", np.eye(2))
+
+    migrate_db(db)
+
+    assert db.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    assert len(get_generation(db)) == 32
+    np.testing.assert_array_equal(load_array(db, id, "MATRIX"), np.eye(2))
+    assert db.execute("SELECT COUNT(*) FROM eigen_results").fetchone()[0] == 0
+    db.close()
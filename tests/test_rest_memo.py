@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from ansys.eigen.python.rest.restdb.db import get_db, get_generation
+from ansys.eigen.python.rest.restdb.memo import ResultMemo
+from ansys.eigen.python.rest.server import create_app
+
+
+@pytest.fixture(scope="module")
+def app():
+    # Create the app
+    app = create_app()
+    app.testing = True
+
+    # Establish an application context
+    with app.app_context():
+        yield app
+
+
+def test_result_memo_keys():
+    """Unit test to verify the keys of the memoized results."""
+    assert ResultMemo.key("0", "MATRIX", "multiplication", 2, 1) == (
+        "0",
+        "MATRIX",
+        "multiplication",
+        2,
+        1,
+    )
+    assert ResultMemo.key("0", "MATRIX", "addition", 2, 1, commutative=True) == (
+        "0",
+        "MATRIX",
+        "addition",
+        1,
+        2,
+    )
+
+
+def test_result_memo(app):
+    """Unit test to verify that results are memoized in memory, counting the hits
+    and misses of the memo."""
+    memo = ResultMemo(budget=1024)
+    generation = get_generation(get_db())
+    key = ResultMemo.key(generation, "VECTOR", "addition", 1, 2)
+
+    assert memo.get(key) is None
+    memo.put(key, np.ones(4))
+    np.testing.assert_array_equal(memo.get(key), np.ones(4))
+
+    # Scalar results are memoized as 0-d arrays
+    key = ResultMemo.key(generation, "VECTOR", "multiplication", 1, 2)
+    memo.put(key, np.float64(4))
+    assert memo.get(key) == 4
+
+    assert (memo.hits, memo.misses) == (2, 1)
+
+    # Results are not persisted unless requested
+    count = get_db().execute("SELECT COUNT(*) FROM eigen_results").fetchone()[0]
+    assert count == 0
+
+
+def test_result_memo_persistence(app):
+    """Unit test to verify that results are persisted into the database within
+    its budget, evicting the least recently used ones."""
+    memo = ResultMemo(budget=0, db_budget=3 * 80)
+    generation = get_generation(get_db())
+    keys = [
+        ResultMemo.key(generation, "MATRIX", "addition", id, id) for id in range(1, 5)
+    ]
+
+    for id, key in enumerate(keys[:3], start=1):
+        memo.put(key, np.full((2, 5), id, dtype=np.float64))
+
+    # Using the first result makes the second one the least recently used... and evicted
+    np.testing.assert_array_equal(memo.get(keys[0]), np.full((2, 5), 1))
+    memo.put(keys[3], np.full((2, 5), 4, dtype=np.float64))
+
+    assert memo.get(keys[1]) is None
+    np.testing.assert_array_equal(memo.get(keys[2]), np.full((2, 5), 3))
+    np.testing.assert_array_equal(memo.get(keys[3]), np.full((2, 5), 4))
+    assert (memo.hits, memo.misses) == (3, 1)
+
+    nbytes = get_db().execute("SELECT SUM(nbytes) FROM eigen_results").fetchone()[0]
+    assert nbytes == 240
+
+    # Another memo (for example, of another process) finds the persisted results
+    other = ResultMemo(budget=1024, db_budget=3 * 80)
+    np.testing.assert_array_equal(other.get(keys[0]), np.full((2, 5), 1))
+
+    # ... unless they are of another generation of the database (i.e. it has been reset)
+    key = ResultMemo.key("0", "MATRIX", "addition", 1, 1)
+    assert other.get(key) is None
+    other.put(key, np.ones((2, 5)))
+    count = get_db().execute("SELECT COUNT(*) FROM eigen_results").fetchone()[0]
+    assert count == 3
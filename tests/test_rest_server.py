@@ -3,6 +3,13 @@ import json
 import numpy as np
 import pytest
 
+from ansys.eigen.python.rest.payloads import (
+    BINARY_MIMETYPE,
+    DTYPE_HEADER,
+    NPY_MIMETYPE,
+    decode_array,
+    encode_array,
+)
 from ansys.eigen.python.rest.server import create_app
 
 
@@ -58,7 +65,8 @@ def test_server_ops_vectors(testing_client):
 
 def test_server_ops_matrices(testing_client):
     """Unit test to verify that the server returns the expected response
-    when performing the addition and multiplication of two numpy arrays (as matrices)."""
+    when performing the addition and multiplication of two numpy arrays (as matrices).
+    """
 
     # Define your matrices
     mat_1 = np.array([[1, 2], [3, 4]], dtype=np.float64)
@@ -170,3 +178,324 @@ def test_server_main_error_cases(testing_client):
         json.loads(response.text)["message"]
         == "Unexpected error... No values in the database for ID 0 and type Matrix."
     )
+
+    # Test 7: in case the given IDs are not integers...
+    response = testing_client.get("/add/Matrices", json={"id1": "a", "id2": id_2})
+    assert response.status_code == 400
+    assert json.loads(response.text)["message"] == (
+        "The IDs of the objects must be integers (got 'a' and " + repr(id_2) + ")."
+    )
+
+    response = testing_client.get("/add/Matrices", json={"id1": id_1, "id2": [1]})
+    assert response.status_code == 400
+    assert json.loads(response.text)["message"] == (
+        "The IDs of the objects must be integers (got " + repr(id_1) + " and [1])."
+    )
+
+    # ... although numeric strings are accepted
+    response = testing_client.get(
+        "/add/Matrices", json={"id1": str(id_1), "id2": str(id_2)}
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("mimetype", [BINARY_MIMETYPE, NPY_MIMETYPE])
+def test_server_ops_binary(testing_client, mimetype):
+    """Unit test to verify that the server handles binary payloads, both when posting
+    the objects and when returning the result of the operations."""
+
+    # Define your matrices (and a vector) and post them as binary payloads
+    mat_1 = np.array([[1, 2], [3, 4]], dtype=np.float64)
+    mat_2 = np.array([[5, 4], [2, 0]], dtype=np.float64)
+    vec_1 = np.array([1, 2, 3, 4], dtype=np.float32)
+
+    ids = []
+    for resource, value in [
+        ("Matrices", mat_1),
+        ("Matrices", mat_2),
+        ("Vectors", vec_1),
+    ]:
+        body, headers = encode_array(value, mimetype)
+        response = testing_client.post("/" + resource, data=body, headers=headers)
+        assert response.status_code == 201
+        ids.append(list(json.loads(response.text).values())[0]["id"])
+
+    # Results are returned in JSON unless another format is accepted...
+    response = testing_client.get("/add/Matrices", json={"id1": ids[0], "id2": ids[1]})
+    assert response.status_code == 200
+    value = json.loads(response.text)["matrix-addition"]["result"]
+    np.testing.assert_allclose(value, np.array([[6, 6], [5, 4]]))
+
+    # ... in which case they are decoded straight into numpy.ndarrays
+    response = testing_client.get(
+        "/multiply/Matrices",
+        json={"id1": ids[0], "id2": ids[1]},
+        headers={"Accept": mimetype},
+    )
+    assert response.status_code == 200
+    assert response.mimetype == mimetype
+    value = decode_array(response.data, response.mimetype, response.headers)
+    np.testing.assert_allclose(value, np.array([[9, 4], [23, 12]]))
+
+    # Scalar results are handled as well (as 0-d arrays)
+    response = testing_client.get(
+        "/multiply/Vectors",
+        json={"id1": ids[2], "id2": ids[2]},
+        headers={"Accept": mimetype},
+    )
+    assert response.status_code == 200
+    value = decode_array(response.data, response.mimetype, response.headers)
+    assert value.shape == ()
+    assert value == 30
+
+
+def test_server_binary_error_cases(testing_client):
+    """Testing of error-case scenarios when posting binary payloads to the server."""
+    mat = np.array([[1, 2], [3, 4]], dtype=np.float64)
+    body, headers = encode_array(mat, BINARY_MIMETYPE)
+
+    # Test 1: check that the shape of a raw payload is provided
+    response = testing_client.post(
+        "/Matrices", data=body, headers={"Content-Type": BINARY_MIMETYPE}
+    )
+    assert response.status_code == 400
+    assert json.loads(response.text)["message"] == (
+        "Error encountered when decoding the binary body into numpy.ndarray: "
+        + "No shape provided. Expected header: 'X-Eigen-Shape'."
+    )
+
+    # Test 2: check that the size of a raw payload matches its shape and dtype
+    response = testing_client.post("/Matrices", data=body[:-8], headers=headers)
+    assert response.status_code == 400
+    assert json.loads(response.text)["message"] == (
+        "Error encountered when decoding the binary body into numpy.ndarray: "
+        + "Size of the binary payload does not match its shape and dtype."
+    )
+
+    # Test 3: check that big-endian payloads are rejected
+    response = testing_client.post(
+        "/Matrices",
+        data=mat.astype(">f8").tobytes(),
+        headers=dict(headers, **{DTYPE_HEADER: ">f8"}),
+    )
+    assert response.status_code == 400
+    assert json.loads(response.text)["message"] == (
+        "Error encountered when decoding the binary body into numpy.ndarray: "
+        + "Only little-endian numeric dtypes are allowed."
+    )
+
+    # Test 4: check that the .npy payloads are valid files
+    response = testing_client.post(
+        "/Matrices", data=b"not a npy file", headers={"Content-Type": NPY_MIMETYPE}
+    )
+    assert response.status_code == 400
+
+
+def test_server_shape_error_cases(testing_client):
+    """Testing of error-case scenarios related to the shapes of the objects."""
+    # Test 1: check that the dimensions of the posted objects match their type
+    response = testing_client.post("/Matrices", json={"value": [1, 2, 3]})
+    assert response.status_code == 400
+    assert (
+        json.loads(response.text)["message"]
+        == "Matrix values must have 2 dimension(s)."
+    )
+
+    # Test 2: check that the shapes of the objects are compatible with the operation
+    response_1 = testing_client.post(
+        "/Matrices", json={"value": [[1, 2, 3], [4, 5, 6]]}
+    )
+    response_2 = testing_client.post("/Matrices", json={"value": [[1, 2], [3, 4]]})
+    id_1 = json.loads(response_1.text)["matrix"]["id"]
+    id_2 = json.loads(response_2.text)["matrix"]["id"]
+
+    response = testing_client.get("/add/Matrices", json={"id1": id_1, "id2": id_2})
+    assert response.status_code == 400
+    assert json.loads(response.text)["message"] == (
+        "The shapes of the objects with IDs "
+        + str(id_1)
+        + " and "
+        + str(id_2)
+        + " are not compatible with the addition operation."
+    )
+
+    response = testing_client.get("/multiply/Matrices", json={"id1": id_1, "id2": id_2})
+    assert response.status_code == 400
+
+    # ... while the product of the 2x2 and the 2x3 matrices is
+    response = testing_client.get("/multiply/Matrices", json={"id1": id_2, "id2": id_1})
+    assert response.status_code == 200
+    value = json.loads(response.text)["matrix-multiplication"]["result"]
+    np.testing.assert_allclose(value, [[9, 12, 15], [19, 26, 33]])
+
+
+def test_server_compute(testing_client):
+    """Unit test to verify that the server performs the operations on the objects
+    provided within the request, without storing them."""
+    mat_1 = np.array([[1, 2], [3, 4]], dtype=np.float64)
+    mat_2 = np.array([[5, 4], [2, 0]], dtype=np.float64)
+    vec_1 = np.array([1, 2, 3, 4], dtype=np.float64)
+    vec_2 = np.array([5, 4, 2, 0], dtype=np.float64)
+
+    # Check the JSON-formatted requests
+    response = testing_client.post(
+        "/compute/add/Vectors", json={"value": [vec_1.tolist(), vec_2.tolist()]}
+    )
+    assert response.status_code == 200
+    value = json.loads(response.text)["vector-addition"]["result"]
+    np.testing.assert_allclose(value, np.array([6, 6, 5, 4]))
+
+    response = testing_client.post(
+        "/compute/multiply/Vectors", json={"value": [vec_1.tolist(), vec_2.tolist()]}
+    )
+    assert response.status_code == 200
+    assert json.loads(response.text)["vector-multiplication"]["result"] == 19
+
+    # Check the binary requests
+    body, headers = encode_array(np.stack((mat_1, mat_2)), BINARY_MIMETYPE)
+    headers["Accept"] = BINARY_MIMETYPE
+    response = testing_client.post("/compute/add/Matrices", data=body, headers=headers)
+    assert response.status_code == 200
+    value = decode_array(response.data, response.mimetype, response.headers)
+    np.testing.assert_allclose(value, np.array([[6, 6], [5, 4]]))
+
+    response = testing_client.post(
+        "/compute/multiply/Matrices", data=body, headers=headers
+    )
+    assert response.status_code == 200
+    value = decode_array(response.data, response.mimetype, response.headers)
+    np.testing.assert_allclose(value, np.array([[9, 4], [23, 12]]))
+
+    # Test 1: check that exactly two objects are provided
+    response = testing_client.post(
+        "/compute/add/Vectors", json={"value": [vec_1.tolist()] * 3}
+    )
+    assert response.status_code == 400
+    assert (
+        json.loads(response.text)["message"]
+        == "Two vector values (stacked along the first dimension) must be provided."
+    )
+
+    response = testing_client.post(
+        "/compute/add/Matrices", json={"value": vec_1.tolist()}
+    )
+    assert response.status_code == 400
+
+    # Test 2: check that the shapes of the objects are compatible with the operation
+    response = testing_client.post(
+        "/compute/multiply/Matrices", json={"value": np.ones((2, 2, 3)).tolist()}
+    )
+    assert response.status_code == 400
+    assert (
+        json.loads(response.text)["message"]
+        == "The shapes of the objects provided are not compatible with the multiplication operation."
+    )
+
+
+def test_server_array_cache(testing_client):
+    """Unit test to verify that repeated operations on the same objects use the
+    cache of decoded arrays instead of the database."""
+    cache = testing_client.application.extensions["array_cache"]
+
+    response_1 = testing_client.post("/Vectors", json={"value": [1, 2, 3, 4]})
+    response_2 = testing_client.post("/Vectors", json={"value": [5, 4, 2, 0]})
+    id_1 = json.loads(response_1.text)["vector"]["id"]
+    id_2 = json.loads(response_2.text)["vector"]["id"]
+
+    # Posted objects are already cached
+    hits, misses = cache.hits, cache.misses
+    for _ in range(3):
+        response = testing_client.get(
+            "/multiply/Vectors", json={"id1": id_1, "id2": id_2}
+        )
+        assert json.loads(response.text)["vector-multiplication"]["result"] == 19
+    assert (cache.hits - hits, cache.misses - misses) == (6, 0)
+
+    # Cached objects of another type are not considered
+    response = testing_client.get("/add/Matrices", json={"id1": id_1, "id2": id_2})
+    assert response.status_code == 400
+    assert (
+        json.loads(response.text)["message"]
+        == "Unexpected error... No values in the database for ID "
+        + str(id_1)
+        + " and type Matrix."
+    )
+
+    # Evicted objects are loaded from the database (and cached again)
+    cache.put(-1, np.zeros(cache.budget // 8))
+    hits, misses = cache.hits, cache.misses
+    for _ in range(2):
+        response = testing_client.get("/add/Vectors", json={"id1": id_1, "id2": id_2})
+        value = json.loads(response.text)["vector-addition"]["result"]
+        np.testing.assert_allclose(value, np.array([6, 6, 5, 4]))
+    assert (cache.hits - hits, cache.misses - misses) == (2, 2)
+
+
+def test_server_result_memo(testing_client):
+    """Unit test to verify that the results of the operations are memoized, and that
+    clients holding a result (i.e. its ETag) get a "not modified" response."""
+    memo = testing_client.application.extensions["result_memo"]
+
+    response_1 = testing_client.post("/Matrices", json={"value": [[1, 2], [3, 4]]})
+    response_2 = testing_client.post("/Matrices", json={"value": [[5, 4], [2, 0]]})
+    id_1 = json.loads(response_1.text)["matrix"]["id"]
+    id_2 = json.loads(response_2.text)["matrix"]["id"]
+    ids = {"id1": id_1, "id2": id_2}
+
+    # The first request performs the operation... and the following ones reuse it
+    hits, misses = memo.hits, memo.misses
+    response = testing_client.get("/multiply/Matrices", json=ids)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    for _ in range(2):
+        response = testing_client.get("/multiply/Matrices", json=ids)
+        assert response.headers["ETag"] == etag
+        value = json.loads(response.text)["matrix-multiplication"]["result"]
+        np.testing.assert_allclose(value, np.array([[9, 4], [23, 12]]))
+    assert (memo.hits - hits, memo.misses - misses) == (2, 1)
+
+    # Clients holding the result get a "not modified" response (without the result)
+    hits, misses = memo.hits, memo.misses
+    response = testing_client.get(
+        "/multiply/Matrices", json=ids, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.data == b""
+    assert (memo.hits - hits, memo.misses - misses) == (0, 0)
+
+    # The ETag depends on the operands (and their order, for matrix products)...
+    response = testing_client.get(
+        "/multiply/Matrices",
+        json={"id1": id_2, "id2": id_1},
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    value = json.loads(response.text)["matrix-multiplication"]["result"]
+    np.testing.assert_allclose(value, np.array([[17, 26], [2, 4]]))
+
+    # ... and on the format of the result
+    response = testing_client.get(
+        "/multiply/Matrices",
+        json=ids,
+        headers={"If-None-Match": etag, "Accept": BINARY_MIMETYPE},
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+    # Additions are commutative... so both orders share their result
+    response = testing_client.get("/add/Matrices", json=ids)
+    response = testing_client.get(
+        "/add/Matrices",
+        json={"id1": id_2, "id2": id_1},
+        headers={"If-None-Match": response.headers["ETag"]},
+    )
+    assert response.status_code == 304
+
+    # Unknown objects are still reported, whatever the ETag
+    response = testing_client.get(
+        "/multiply/Matrices",
+        json={"id1": 0, "id2": id_2},
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 400
@@ -0,0 +1,75 @@
+import json
+
+import numpy as np
+
+from ansys.eigen.python.rest.server import create_app
+
+
+def test_server_reset_by_another_worker():
+    """Unit test to verify that a server does not return stale objects once the database
+    is reset by another server (i.e. another worker) sharing it, which reuses its IDs.
+    """
+    # Both workers share the same database... but not their cache of decoded arrays
+    worker_1 = create_app(memo_budget=0)
+    worker_1.testing = True
+    client_1 = worker_1.test_client()
+
+    response = client_1.post("/Vectors", json={"value": [1, 2]})
+    id_1 = json.loads(response.text)["vector"]["id"]
+    response = client_1.get("/add/Vectors", json={"id1": id_1, "id2": id_1})
+    value = json.loads(response.text)["vector-addition"]["result"]
+    np.testing.assert_allclose(value, [2, 4])
+
+    # The second worker resets the database... and stores another vector with the same ID
+    worker_2 = create_app(reset_db=True, memo_budget=0)
+    worker_2.testing = True
+    client_2 = worker_2.test_client()
+
+    response = client_2.post("/Vectors", json={"value": [10, 20]})
+    assert json.loads(response.text)["vector"]["id"] == id_1
+
+    # The first worker operates on the new vector (and no longer caches the previous one)
+    response = client_1.get("/add/Vectors", json={"id1": id_1, "id2": id_1})
+    value = json.loads(response.text)["vector-addition"]["result"]
+    np.testing.assert_allclose(value, [20, 40])
+    assert len(worker_1.extensions["array_cache"]) == 1
+
+
+def test_server_results_reset_by_another_worker():
+    """Unit test to verify that a server does not return stale results (nor ETags) once
+    the database is reset by another server (i.e. another worker) sharing it."""
+    worker_1 = create_app(memo_db_budget=1024)
+    worker_1.testing = True
+    client_1 = worker_1.test_client()
+
+    response = client_1.post("/Vectors", json={"value": [1, 2]})
+    id_1 = json.loads(response.text)["vector"]["id"]
+    ids = {"id1": id_1, "id2": id_1}
+    response = client_1.get("/add/Vectors", json=ids)
+    etag = response.headers["ETag"]
+    value = json.loads(response.text)["vector-addition"]["result"]
+    np.testing.assert_allclose(value, [2, 4])
+
+    # The second worker resets the database... and stores another vector with the same ID
+    worker_2 = create_app(reset_db=True)
+    worker_2.testing = True
+    client_2 = worker_2.test_client()
+
+    response = client_2.post("/Vectors", json={"value": [10, 20]})
+    assert json.loads(response.text)["vector"]["id"] == id_1
+
+    # Clients holding the previous result no longer get a "not modified" response...
+    response = client_1.get("/add/Vectors", json=ids, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    value = json.loads(response.text)["vector-addition"]["result"]
+    np.testing.assert_allclose(value, [20, 40])
+
+    # ... and both workers agree on the new result
+    response = client_2.get("/add/Vectors", json=ids)
+    assert (
+        response.headers["ETag"]
+        == client_1.get("/add/Vectors", json=ids).headers["ETag"]
+    )
+    value = json.loads(response.text)["vector-addition"]["result"]
+    np.testing.assert_allclose(value, [20, 40])